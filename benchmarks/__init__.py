@@ -0,0 +1,11 @@
+"""
+Performance benchmarks for the KiCad MCP Server.
+
+Run individual benchmarks as modules from the repository root, e.g.::
+
+    python -m benchmarks.bench_schematic_parser
+
+or the whole suite, which writes its results as JSON::
+
+    python -m benchmarks.suite --size medium --output results.json
+"""
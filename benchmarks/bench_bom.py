@@ -0,0 +1,81 @@
+"""
+Benchmark: BOM analysis, streaming column store versus pandas DataFrame.
+
+Generates a CSV BOM and analyzes it once with read_bom_table/analyze_bom_table
+and once the way the server used to: csv.DictReader into a list of dicts,
+then a pandas DataFrame. The pandas import time is reported separately; the
+server no longer pays it unless a CSV export is requested.
+
+Usage:
+    python -m benchmarks.bench_bom [--rows 200000]
+"""
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.fixtures import write_bom_csv
+from kicad_mcp.utils.bom_table import analyze_bom_table, read_bom_table
+
+
+def _pandas_analysis(path: str, pd) -> dict:
+    with open(path, "r", encoding="utf-8-sig") as f:
+        components = [dict(row) for row in csv.DictReader(f)]
+    df = pd.DataFrame(components)
+    df.columns = [str(col).strip().lower() for col in df.columns]
+    df["quantity"] = pd.to_numeric(df["quantity"], errors="coerce").fillna(1)
+    cost = pd.to_numeric(df["cost"].astype(str).str.replace("$", "").str.replace(",", ""), errors="coerce")
+    return {
+        "total_component_count": int(df["quantity"].sum()),
+        "categories": df["footprint"].value_counts().to_dict(),
+        "total_cost": round(float((cost * df["quantity"]).sum()), 2),
+    }
+
+
+def _measure(label: str, run):
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+
+    # Memory in a second run; tracing slows the timed one down
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:>9}: {elapsed:7.3f} s  peak {peak / 1e6:7.1f} MB")
+    return result, elapsed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200000, help="Number of BOM rows")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "bench_bom.csv")
+        write_bom_csv(path, args.rows)
+        print(f"{args.rows} rows, {os.path.getsize(path) / 1e6:.1f} MB\n")
+
+        streaming, streaming_time = _measure("streaming", lambda: analyze_bom_table(read_bom_table(path)[0]))
+
+        start = time.perf_counter()
+        try:
+            import pandas as pd
+        except ImportError:
+            print("\npandas is not installed; skipping the DataFrame comparison")
+            return 0
+        print(f"   import pandas: {time.perf_counter() - start:7.3f} s")
+        dataframe, pandas_time = _measure("pandas", lambda: _pandas_analysis(path, pd))
+
+    if streaming["total_component_count"] != dataframe["total_component_count"]:
+        print("component counts differ!")
+        return 1
+    print(f"\nspeed-up: {pandas_time / streaming_time:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
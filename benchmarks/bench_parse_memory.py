@@ -0,0 +1,106 @@
+"""
+Benchmark: peak memory of parsing large schematic and board files.
+
+Parses a generated .kicad_sch and .kicad_pcb in fresh processes and compares
+the peak resident memory during the parse with the memory still held once it
+returns (the parsed model). The files are memory-mapped and tokenized as raw
+bytes, so the difference should stay well below the file size; the benchmark
+fails if it exceeds ``--max-overhead`` times the file size for schematics, or
+a quarter of that for boards (the board reader keeps no per-file transients).
+
+Resident memory is read from ``/proc``, so the benchmark only runs on Linux.
+
+Usage:
+    python -m benchmarks.bench_parse_memory [--size-mb 50] [--max-overhead 1.5]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict
+
+from benchmarks.bench_startup import REPO_ROOT
+from benchmarks.fixtures import generate_board, generate_schematic, write_board, write_schematic
+
+# Runs in the child: parse, then report peak and retained RSS in kilobytes
+_MEASURE = """
+import gc, json, sys, time
+from kicad_mcp.utils.netlist_parser import SchematicParser
+from kicad_mcp.utils.pcb_reader import PcbBoard
+
+def status_kb(field):
+    # VmHWM rather than ru_maxrss, which includes the parent's RSS before exec
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+
+kind, path = sys.argv[1], sys.argv[2]
+gc.collect()
+before = status_kb("VmRSS")
+start = time.perf_counter()
+model = SchematicParser(path).parse() if kind == "schematic" else PcbBoard(path)
+seconds = time.perf_counter() - start
+gc.collect()
+print(json.dumps({"before_kb": before, "peak_kb": status_kb("VmHWM"), "after_kb": status_kb("VmRSS"),
+                  "seconds": seconds}))
+"""
+
+
+def measure(kind: str, path: str) -> Dict[str, float]:
+    """Parse ``path`` in a fresh process and return its memory figures in megabytes."""
+    output = subprocess.run([sys.executable, "-c", _MEASURE, kind, path], cwd=REPO_ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    figures = json.loads(output.strip().splitlines()[-1])
+    peak = (figures["peak_kb"] - figures["before_kb"]) / 1024
+    retained = (figures["after_kb"] - figures["before_kb"]) / 1024
+    return {
+        "file_mb": os.path.getsize(path) / (1024 * 1024),
+        "peak_mb": peak,
+        "retained_mb": retained,
+        "overhead_mb": max(0.0, peak - retained),
+        "seconds": figures["seconds"],
+    }
+
+
+def _count_for(size_mb: float, generate) -> int:
+    per_item = len(generate(200).encode("utf-8")) / 200
+    return max(1, int(size_mb * 1024 * 1024 / per_item))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-mb", type=float, default=50.0, help="Size of each generated file in MB")
+    parser.add_argument("--max-overhead", type=float, default=1.5,
+                        help="Allowed peak memory above the parsed model, as a multiple of the schematic size")
+    args = parser.parse_args(argv)
+
+    if not sys.platform.startswith("linux"):
+        print("Peak memory is only measured on Linux")
+        return 0
+
+    budgets = {"schematic": args.max_overhead, "board": args.max_overhead / 4}
+    failed = False
+    with tempfile.TemporaryDirectory() as temp_dir:
+        schematic = os.path.join(temp_dir, "bench.kicad_sch")
+        board = os.path.join(temp_dir, "bench.kicad_pcb")
+        write_schematic(schematic, _count_for(args.size_mb, generate_schematic))
+        write_board(board, _count_for(args.size_mb, generate_board))
+
+        print(f"{'file':>10} {'size MB':>8} {'peak MB':>8} {'model MB':>9} {'overhead':>9} {'seconds':>8}")
+        for kind, path in (("schematic", schematic), ("board", board)):
+            row = measure(kind, path)
+            print(f"{kind:>10} {row['file_mb']:8.1f} {row['peak_mb']:8.1f} {row['retained_mb']:9.1f} "
+                  f"{row['overhead_mb']:9.1f} {row['seconds']:8.2f}")
+            limit = budgets[kind] * row["file_mb"]
+            if row["overhead_mb"] > limit:
+                print(f"REGRESSION: {kind} parse peaks {row['overhead_mb']:.1f} MB above its model "
+                      f"(limit {limit:.1f} MB)")
+                failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Benchmark: circuit pattern recognition on a large synthetic design.
+
+Times building the ComponentIndex (the single classification pass), the
+NetlistIndex (component/net adjacency) and each identifier on a generated
+netlist, and compares the classification pass with the old approach of
+running every family pattern with ``re.search`` on every component's value
+and lib_id.
+
+Usage:
+    python -m benchmarks.bench_pattern_recognition [--components 20000] [--repeat 3]
+"""
+import argparse
+import re
+import sys
+import time
+from typing import Callable, Dict, List
+
+from benchmarks.fixtures import generate_netlist
+from kicad_mcp.utils import pattern_recognition
+from kicad_mcp.utils.netlist_index import NetlistIndex
+from kicad_mcp.utils.pattern_recognition import (
+    COMPONENT_RULES,
+    ComponentIndex,
+    identify_amplifiers,
+    identify_digital_interfaces,
+    identify_filters,
+    identify_microcontrollers,
+    identify_oscillators,
+    identify_power_supplies,
+    identify_sensor_interfaces,
+)
+
+IDENTIFIERS: Dict[str, Callable] = {
+    "power_supplies": identify_power_supplies,
+    "amplifiers": identify_amplifiers,
+    "filters": identify_filters,
+    "oscillators": identify_oscillators,
+    "digital_interfaces": identify_digital_interfaces,
+    "microcontrollers": lambda components, nets: identify_microcontrollers(components),
+    "sensor_interfaces": identify_sensor_interfaces,
+}
+
+
+def naive_classify(components: Dict[str, dict]) -> int:
+    """Match every rule pattern against every component, uncached."""
+    matches = 0
+    for component in components.values():
+        value = component.get('value', '').upper()
+        lib = component.get('lib_id', '').upper()
+        for _, pattern, check_lib in COMPONENT_RULES:
+            if re.search(pattern.pattern, value, re.IGNORECASE) or \
+                    (check_lib and re.search(pattern.pattern, lib, re.IGNORECASE)):
+                matches += 1
+    return matches
+
+
+def _best(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(components: Dict[str, dict], nets: Dict[str, list], repeat: int) -> List[Dict[str, float]]:
+    """Time classification and identifiers on one netlist.
+
+    Args:
+        components: Components as returned by extract_netlist
+        nets: Nets as returned by extract_netlist
+        repeat: Number of timed runs (the fastest is kept)
+
+    Returns:
+        One result row per measured step
+    """
+
+    def cold_index():
+        pattern_recognition.classify_component.cache_clear()
+        return ComponentIndex(components)
+
+    rows = [
+        {"step": "naive re.search per component", "seconds": _best(lambda: naive_classify(components), repeat)},
+        {"step": "ComponentIndex (cold memo)", "seconds": _best(cold_index, repeat)},
+        {"step": "ComponentIndex (warm memo)", "seconds": _best(lambda: ComponentIndex(components), repeat)},
+        {"step": "NetlistIndex", "seconds": _best(lambda: NetlistIndex(nets), repeat)},
+    ]
+    for name, identify in IDENTIFIERS.items():
+        rows.append({"step": f"identify_{name}", "seconds": _best(lambda: identify(components, nets), repeat)})
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--components", type=int, default=20000, help="Components in the design")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per step")
+    args = parser.parse_args(argv)
+
+    components, nets = generate_netlist(args.components)
+    rows = run(components, nets, args.repeat)
+
+    print(f"{len(components)} components, {len(nets)} nets\n")
+    print(f"{'step':<34} {'ms':>9}")
+    for row in rows:
+        print(f"{row['step']:<34} {row['seconds'] * 1000:9.1f}")
+
+    speedup = rows[0]["seconds"] / rows[1]["seconds"]
+    print(f"\nClassification speed-up over per-component re.search: {speedup:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
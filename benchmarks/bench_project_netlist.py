@@ -0,0 +1,53 @@
+"""
+Benchmark: hierarchical project netlist resolution, serial versus process pool.
+
+Generates a root sheet with many sub-sheets and resolves the flat netlist
+once with a single parser process and once with the default process pool.
+Both runs start cold: the parse cache is cleared before each run and the
+on-disk parse cache is disabled, so neither run is served from the other's
+results.
+
+Usage:
+    python -m benchmarks.bench_project_netlist [--sheets 40] [--resistors 400]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.fixtures import write_project
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sheets", type=int, default=40, help="Number of sub-sheets")
+    parser.add_argument("--resistors", type=int, default=400, help="Resistors per sub-sheet")
+    parser.add_argument("--shared", action="store_true", help="Reuse one sheet file for every instance")
+    args = parser.parse_args(argv)
+
+    # Read when the disk cache is created, in this process and in pool workers
+    os.environ["KICAD_MCP_DISK_CACHE_MB"] = "0"
+    from kicad_mcp.utils.parse_cache import get_parse_cache
+    from kicad_mcp.utils.project_netlist import resolve_project_netlist, shutdown_sheet_pool
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = write_project(temp_dir, args.sheets, args.resistors, shared_sheet=args.shared)
+
+        timings = {}
+        for label, workers in (("serial", 1), ("pool", None)):
+            get_parse_cache().clear()
+            start = time.perf_counter()
+            result = resolve_project_netlist(root, max_workers=workers)
+            timings[label] = time.perf_counter() - start
+            print(f"{label:>6}: {timings[label]:7.3f} s  "
+                  f"({result['sheet_files_parsed']} files, {result['component_count']} components, "
+                  f"{result['net_count']} nets)")
+
+    shutdown_sheet_pool()
+    print(f"\nspeed-up with {os.cpu_count()} CPUs: {timings['serial'] / timings['pool']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
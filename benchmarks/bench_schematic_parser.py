@@ -0,0 +1,91 @@
+"""
+Benchmark: schematic parse time versus file size.
+
+Generates synthetic schematics of increasing size and times
+``SchematicParser.parse``. With the single-pass tokenizer the time per
+megabyte should stay flat as the file grows; the benchmark fails if the
+largest file is parsed more than ``--max-ratio`` times slower per megabyte
+than the smallest one.
+
+Usage:
+    python -m benchmarks.bench_schematic_parser [--sizes 0.5 1 2 4 8] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from benchmarks.fixtures import generate_schematic
+from kicad_mcp.utils.netlist_parser import SchematicParser
+
+
+def _bytes_per_resistor() -> float:
+    sample = generate_schematic(200)
+    return len(sample.encode("utf-8")) / 200
+
+
+def run(sizes_mb: List[float], repeat: int) -> List[Dict[str, float]]:
+    """Time the parser on one synthetic schematic per requested size.
+
+    Args:
+        sizes_mb: Target file sizes in megabytes
+        repeat: Number of timed runs per size (the fastest is kept)
+
+    Returns:
+        One result row per size
+    """
+    per_resistor = _bytes_per_resistor()
+    rows = []
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size_mb in sizes_mb:
+            count = max(1, int(size_mb * 1024 * 1024 / per_resistor))
+            path = os.path.join(temp_dir, f"bench_{count}.kicad_sch")
+            content = generate_schematic(count)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            size = os.path.getsize(path)
+
+            best = float("inf")
+            result = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = SchematicParser(path).parse()
+                best = min(best, time.perf_counter() - start)
+
+            rows.append({
+                "size_mb": size / (1024 * 1024),
+                "components": result["component_count"],
+                "wires": len(result["wires"]),
+                "seconds": best,
+                "ms_per_mb": best * 1000 / (size / (1024 * 1024)),
+            })
+
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=float, nargs="+", default=[0.5, 1, 2, 4, 8],
+                        help="Schematic sizes in MB")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per size")
+    parser.add_argument("--max-ratio", type=float, default=2.0,
+                        help="Allowed growth of ms/MB between smallest and largest file")
+    args = parser.parse_args(argv)
+
+    rows = run(sorted(args.sizes), args.repeat)
+
+    print(f"{'size MB':>8} {'symbols':>8} {'wires':>8} {'seconds':>9} {'ms/MB':>8}")
+    for row in rows:
+        print(f"{row['size_mb']:8.2f} {row['components']:8d} {row['wires']:8d} "
+              f"{row['seconds']:9.3f} {row['ms_per_mb']:8.1f}")
+
+    ratio = rows[-1]["ms_per_mb"] / rows[0]["ms_per_mb"]
+    print(f"\nms/MB growth from smallest to largest file: {ratio:.2f}x (limit {args.max_ratio:.2f}x)")
+    return 0 if ratio <= args.max_ratio else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
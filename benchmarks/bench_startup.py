@@ -0,0 +1,124 @@
+"""
+Benchmark: server cold start, from launching main.py to the first MCP reply.
+
+Starts ``main.py`` with the stdio transport, sends an ``initialize`` request
+and measures the time until the response arrives. Fails (exit status 1) if
+the median exceeds the budget, or if importing the server pulls in modules
+that tools are supposed to load on first use.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 5] [--budget 3.0]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Heavy dependencies only some tools need; none of them may load at startup
+DEFERRED_MODULES = ("pandas", "PyPDF2", "sexpdata")
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-03-26",
+        "capabilities": {},
+        "clientInfo": {"name": "bench_startup", "version": "1.0"},
+    },
+}
+
+
+def _server_env(work_dir: str) -> dict:
+    """Environment for a server process run from ``work_dir``, with its logs kept there."""
+    env = dict(os.environ, KICAD_MCP_LOG_FILE=os.path.join(work_dir, "kicad-mcp.log"))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [REPO_ROOT, env.get("PYTHONPATH")]))
+    return env
+
+
+def time_to_ready(timeout: float) -> float:
+    """Launch main.py and return the seconds until it answers ``initialize``.
+
+    The server runs in a temporary directory, so the log files it writes
+    never end up in the repository.
+    """
+    with tempfile.TemporaryDirectory() as work_dir:
+        return _time_to_ready(timeout, work_dir)
+
+
+def _time_to_ready(timeout: float, work_dir: str) -> float:
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, os.path.join(REPO_ROOT, "main.py")], cwd=work_dir,
+                               env=_server_env(work_dir), stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                               stderr=subprocess.DEVNULL)
+    timer = threading.Timer(timeout, process.kill)
+    timer.start()
+    try:
+        process.stdin.write((json.dumps(INITIALIZE) + "\n").encode())
+        process.stdin.flush()
+        for line in process.stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if message.get("id") == 1:
+                if "error" in message:
+                    raise RuntimeError(f"initialize failed: {message['error']}")
+                return time.perf_counter() - start
+        raise RuntimeError(f"server exited (status {process.poll()}) or timed out before replying")
+    finally:
+        timer.cancel()
+        process.stdin.close()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def deferred_modules_loaded() -> list:
+    """Return the deferred modules that importing the server loads."""
+    code = ("import sys; from kicad_mcp.server import create_server; create_server(); "
+            f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))")
+    with tempfile.TemporaryDirectory() as work_dir:
+        output = subprocess.run([sys.executable, "-c", code], cwd=work_dir, env=_server_env(work_dir),
+                                capture_output=True, text=True, check=True).stdout.strip()
+    return output.split(",") if output else []
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold starts")
+    parser.add_argument("--budget", type=float, default=3.0, help="Allowed median time-to-ready in seconds")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds before a start is abandoned")
+    args = parser.parse_args(argv)
+
+    timings = []
+    for run in range(args.runs):
+        timings.append(time_to_ready(args.timeout))
+        print(f"run {run + 1}: {timings[-1]:7.3f} s")
+
+    median = statistics.median(timings)
+    print(f"\nmin {min(timings):.3f} s, median {median:.3f} s, budget {args.budget:.3f} s")
+
+    failed = False
+    if median > args.budget:
+        print(f"REGRESSION: median time-to-ready exceeds the budget by {median - args.budget:.3f} s")
+        failed = True
+
+    loaded = deferred_modules_loaded()
+    if loaded:
+        print(f"REGRESSION: imported at startup: {', '.join(loaded)}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
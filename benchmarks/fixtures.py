@@ -0,0 +1,467 @@
+"""
+Synthetic KiCad fixtures of parameterized size for benchmarks.
+
+The generated files follow the KiCad 8 file format closely enough for the
+server's own parsers; no KiCad installation is needed.
+"""
+import os
+import uuid as _uuid
+from typing import List, Optional, Tuple
+
+_UUID_NAMESPACE = _uuid.UUID("6c0b6c9e-2f8e-4a55-9d3f-5b0e2f6d1a11")
+
+RESISTOR_VALUES = ["10k", "4k7", "100R", "1k", "47k", "220R"]
+
+
+def _uid(*parts) -> str:
+    """Deterministic UUID so repeated runs produce identical files."""
+    return str(_uuid.uuid5(_UUID_NAMESPACE, "/".join(str(p) for p in parts)))
+
+
+def _effects() -> str:
+    return "(effects (font (size 1.27 1.27)))"
+
+
+def _lib_symbols() -> str:
+    return f"""	(lib_symbols
+		(symbol "Device:R"
+			(pin_numbers hide)
+			(pin_names (offset 0))
+			(exclude_from_sim no)
+			(in_bom yes)
+			(on_board yes)
+			(property "Reference" "R" (at 2.032 0 90) {_effects()})
+			(property "Value" "R" (at 0 0 90) {_effects()})
+			(property "Footprint" "" (at -1.778 0 90) (effects (font (size 1.27 1.27)) hide))
+			(symbol "R_0_1"
+				(rectangle (start -1.016 -2.54) (end 1.016 2.54)
+					(stroke (width 0.254) (type default))
+					(fill (type none))
+				)
+			)
+			(symbol "R_1_1"
+				(pin passive line (at 0 3.81 270) (length 1.27)
+					(name "~" {_effects()})
+					(number "1" {_effects()})
+				)
+				(pin passive line (at 0 -3.81 90) (length 1.27)
+					(name "~" {_effects()})
+					(number "2" {_effects()})
+				)
+			)
+		)
+		(symbol "power:GND"
+			(power)
+			(pin_names (offset 0))
+			(property "Reference" "#PWR" (at 0 -6.35 0) (effects (font (size 1.27 1.27)) hide))
+			(property "Value" "GND" (at 0 -3.81 0) {_effects()})
+			(symbol "GND_1_1"
+				(pin power_in line (at 0 0 270) (length 0) hide
+					(name "GND" {_effects()})
+					(number "1" {_effects()})
+				)
+			)
+		)
+	)
+"""
+
+
+def _instances(project: str, instances: List[Tuple[str, str]]) -> str:
+    paths = "".join(
+        f'\t\t\t\t(path "{path}" (reference "{ref}") (unit 1))\n' for path, ref in instances
+    )
+    return f"""		(instances
+			(project "{project}"
+{paths}			)
+		)
+"""
+
+
+def _resistor(index: int, x: float, y: float, instances: List[Tuple[str, str]], project: str,
+              key: str = "") -> str:
+    ref = instances[0][1]
+    value = RESISTOR_VALUES[index % len(RESISTOR_VALUES)]
+    return f"""	(symbol (lib_id "Device:R") (at {x:g} {y:g} 0) (unit 1)
+		(exclude_from_sim no) (in_bom yes) (on_board yes) (dnp no)
+		(uuid "{_uid('sym', key, index)}")
+		(property "Reference" "{ref}" (at {x + 2.54:g} {y:g} 0) {_effects()})
+		(property "Value" "{value}" (at {x + 2.54:g} {y + 2.54:g} 0) {_effects()})
+		(property "Footprint" "Resistor_SMD:R_0603_1608Metric" (at {x:g} {y:g} 90) (effects (font (size 1.27 1.27)) hide))
+		(property "Datasheet" "~" (at {x:g} {y:g} 0) (effects (font (size 1.27 1.27)) hide))
+		(pin "1" (uuid "{_uid('pin', key, index, 1)}"))
+		(pin "2" (uuid "{_uid('pin', key, index, 2)}"))
+{_instances(project, instances)}	)
+"""
+
+
+def _wire(x1: float, y1: float, x2: float, y2: float, key) -> str:
+    return f"""	(wire (pts (xy {x1:g} {y1:g}) (xy {x2:g} {y2:g}))
+		(stroke (width 0) (type default))
+		(uuid "{_uid('wire', key)}")
+	)
+"""
+
+
+def _label(text: str, x: float, y: float, key, kind: str = "label") -> str:
+    shape = " (shape input)" if kind == "hierarchical_label" else ""
+    return f"""	({kind} "{text}"{shape} (at {x:g} {y:g} 0) (fields_autoplaced yes)
+		(effects (font (size 1.27 1.27)) (justify left bottom))
+		(uuid "{_uid('label', key)}")
+	)
+"""
+
+
+def _gnd(index: int, x: float, y: float, instances: List[Tuple[str, str]], project: str,
+         key: str = "") -> str:
+    ref = instances[0][1]
+    return f"""	(symbol (lib_id "power:GND") (at {x:g} {y:g} 0) (unit 1)
+		(exclude_from_sim no) (in_bom yes) (on_board yes) (dnp no)
+		(uuid "{_uid('pwr', key, index)}")
+		(property "Reference" "{ref}" (at {x:g} {y + 6.35:g} 0) (effects (font (size 1.27 1.27)) hide))
+		(property "Value" "GND" (at {x:g} {y + 3.81:g} 0) {_effects()})
+		(pin "1" (uuid "{_uid('pwrpin', key, index)}"))
+{_instances(project, instances)}	)
+"""
+
+
+def _header(sheet_uuid: str) -> List[str]:
+    return [
+        "(kicad_sch\n",
+        "\t(version 20231120)\n",
+        '\t(generator "eeschema")\n',
+        '\t(generator_version "8.0")\n',
+        f'\t(uuid "{sheet_uuid}")\n',
+        '\t(paper "A0")\n',
+        _lib_symbols(),
+    ]
+
+
+def _footer(parts: List[str]) -> str:
+    parts.append("\t(sheet_instances\n")
+    parts.append('\t\t(path "/" (page "1"))\n')
+    parts.append("\t)\n")
+    parts.append(")\n")
+    return "".join(parts)
+
+
+def _chains(parts: List[str], resistor_count: int, chain_length: int, project: str,
+            instance_paths: List[Tuple[str, int]], key: str = "",
+            input_label_kind: str = "label") -> None:
+    """Append vertical resistor chains to ``parts``.
+
+    ``instance_paths`` lists (instance path, reference offset) pairs; each
+    instance numbers the resistors from its own offset.
+    """
+    pitch_x, pitch_y = 10.16, 12.7
+    for index in range(1, resistor_count + 1):
+        chain, position = divmod(index - 1, chain_length)
+        x = 25.4 + chain * pitch_x
+        y = 25.4 + position * pitch_y
+        refs = [(path, f"R{offset + index}") for path, offset in instance_paths]
+        parts.append(_resistor(index, x, y, refs, project, key))
+
+        top = y - 3.81
+        bottom = y + 3.81
+        if position == 0:
+            parts.append(_wire(x, top - 5.08, x, top, (key, "top", chain)))
+            if chain == 0 and input_label_kind == "hierarchical_label":
+                parts.append(_label("IN", x, top - 5.08, (key, chain), input_label_kind))
+            else:
+                parts.append(_label(f"CHAIN{chain}_IN", x, top - 5.08, (key, chain)))
+        if position == chain_length - 1 or index == resistor_count:
+            parts.append(_wire(x, bottom, x, bottom + 2.54, (key, "gnd", chain)))
+            pwr = [(path, f"#PWR{offset + chain + 1:04d}") for path, offset in instance_paths]
+            parts.append(_gnd(chain + 1, x, bottom + 2.54, pwr, project, key))
+        else:
+            parts.append(_wire(x, bottom, x, bottom + pitch_y - 7.62, (key, "link", index)))
+
+
+def generate_schematic(resistor_count: int, chain_length: int = 8, project: str = "bench") -> str:
+    """Generate a flat schematic made of vertical resistor chains.
+
+    Each chain of ``chain_length`` resistors is wired pin 2 to pin 1, the top of
+    the chain carries a local label and the bottom is tied to GND, so every
+    chain yields ``chain_length`` named or unnamed nets plus the shared GND.
+
+    Args:
+        resistor_count: Number of resistors to place
+        chain_length: Resistors per vertical chain
+        project: Project name written into the symbol instances
+
+    Returns:
+        Schematic file content
+    """
+    root_uuid = _uid("root", project)
+    parts = _header(root_uuid)
+    _chains(parts, resistor_count, chain_length, project, [(f"/{root_uuid}", 0)])
+    return _footer(parts)
+
+
+def _sheet(index: int, file_name: str, x: float, y: float) -> str:
+    return f"""	(sheet (at {x:g} {y:g}) (size 20.32 10.16)
+		(fields_autoplaced yes)
+		(stroke (width 0.1524) (type solid))
+		(fill (color 0 0 0 0.0000))
+		(uuid "{_uid('sheet', index)}")
+		(property "Sheetname" "S{index}" (at {x:g} {y - 0.7:g} 0) (effects (font (size 1.27 1.27)) (justify left bottom)))
+		(property "Sheetfile" "{file_name}" (at {x:g} {y + 10.8:g} 0) (effects (font (size 1.27 1.27)) (justify left top)))
+		(pin "IN" input (at {x:g} {y + 5.08:g} 180)
+			(effects (font (size 1.27 1.27)) (justify left))
+			(uuid "{_uid('sheetpin', index)}")
+		)
+	)
+"""
+
+
+def write_project(directory: str, sheet_count: int, resistors_per_sheet: int,
+                  shared_sheet: bool = False, chain_length: int = 8,
+                  project: str = "bench") -> str:
+    """Write a hierarchical project: a root sheet with ``sheet_count`` sub-sheets.
+
+    Every sheet pin ``IN`` is tied to the root label ``VIN`` and to the
+    hierarchical label ``IN`` at the top of the sub-sheet's first chain.
+
+    Args:
+        directory: Output directory
+        sheet_count: Number of sub-sheet instances
+        resistors_per_sheet: Resistors on each sub-sheet
+        shared_sheet: Use one sheet file for every instance (reused sheet)
+        chain_length: Resistors per vertical chain
+        project: Project name (file name stem)
+
+    Returns:
+        Path to the root .kicad_sch file
+    """
+    os.makedirs(directory, exist_ok=True)
+    root_uuid = _uid("root", project)
+    root = _header(root_uuid)
+
+    files = {}
+    for index in range(sheet_count):
+        file_name = "shared.kicad_sch" if shared_sheet else f"sheet{index}.kicad_sch"
+        files.setdefault(file_name, []).append((f"/{root_uuid}/{_uid('sheet', index)}", index * resistors_per_sheet))
+
+        x, y = 50.8 + (index % 10) * 30.48, 50.8 + (index // 10) * 20.32
+        root.append(_sheet(index, file_name, x, y))
+        root.append(_label("VIN", x, y + 5.08, ("vin", index)))
+
+    for file_name, instance_paths in files.items():
+        parts = _header(_uid("file", file_name))
+        _chains(parts, resistors_per_sheet, chain_length, project, instance_paths,
+                key=file_name, input_label_kind="hierarchical_label")
+        with open(os.path.join(directory, file_name), "w", encoding="utf-8") as f:
+            f.write(_footer(parts))
+
+    with open(os.path.join(directory, f"{project}.kicad_pro"), "w", encoding="utf-8") as f:
+        f.write("{}\n")
+
+    root_path = os.path.join(directory, f"{project}.kicad_sch")
+    with open(root_path, "w", encoding="utf-8") as f:
+        f.write(_footer(root))
+    return root_path
+
+
+def write_schematic(path: str, resistor_count: int, **kwargs) -> int:
+    """Write a synthetic schematic to ``path`` and return its size in bytes."""
+    content = generate_schematic(resistor_count, **kwargs)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return len(content.encode("utf-8"))
+
+
+# (reference prefix, value, lib_id) of the IC in each generated netlist block
+BLOCK_ICS = [
+    ("U", "LM7805", "Regulator_Linear:L7805"),
+    ("U", "TL072", "Amplifier_Operational:TL072"),
+    ("U", "ATmega328P-AU", "MCU_Microchip_ATmega:ATmega328P-AU"),
+    ("U", "BME280", "Sensor:BME280"),
+    ("U", "TPS5430", "Regulator_Switching:TPS5430DDA"),
+    ("U", "CH340G", "Interface_USB:CH340G"),
+    ("U", "74HC595", "74xx:74HC595"),
+    ("U", "NE555", "Timer:NE555P"),
+]
+
+# (reference prefix, value, lib_id) of the passives repeated in every block
+BLOCK_PARTS = (
+    [("R", value, "Device:R") for value in RESISTOR_VALUES]
+    + [("C", value, "Device:C") for value in ["100n", "10u", "1u", "22p", "4u7"]]
+    + [("D", "LED", "Device:LED"), ("Q", "BC547", "Transistor_BJT:BC547"),
+       ("Y", "16MHz", "Device:Crystal"), ("RV", "10k", "Device:R_Potentiometer"),
+       ("J", "Conn_01x04", "Connector:Conn_01x04")]
+)
+
+
+def generate_netlist(component_count: int) -> Tuple[dict, dict]:
+    """Generate components and nets shaped like ``extract_netlist`` output.
+
+    The design is made of identical blocks: one IC (cycling through
+    BLOCK_ICS), the BLOCK_PARTS passives and, in every fourth block, an
+    inductor. Each block has its own signal nets and shares GND and +3V3.
+
+    Args:
+        component_count: Approximate number of components
+
+    Returns:
+        Tuple of (components, nets)
+    """
+    components = {}
+    nets = {"GND": [], "+3V3": []}
+    counters = {}
+    block = 0
+
+    while len(components) < component_count:
+        parts = [BLOCK_ICS[block % len(BLOCK_ICS)]] + BLOCK_PARTS
+        if block % 4 == 0:
+            parts.append(("L", "10u", "Device:L"))
+
+        refs = []
+        for prefix, value, lib_id in parts:
+            counters[prefix] = counters.get(prefix, 0) + 1
+            ref = f"{prefix}{counters[prefix]}"
+            components[ref] = {"lib_id": lib_id, "reference": ref, "value": value}
+            refs.append(ref)
+
+        # Chain the block's parts pin 2 to pin 1, first and last part on the rails
+        nets["+3V3"].append({"component": refs[0], "pin": "1"})
+        for index in range(len(refs) - 1):
+            nets[f"/B{block}/N{index}"] = [
+                {"component": refs[index], "pin": "2"},
+                {"component": refs[index + 1], "pin": "1"},
+            ]
+        nets["GND"].append({"component": refs[-1], "pin": "2"})
+        block += 1
+
+    return components, nets
+
+
+BOM_PARTS = [
+    ("R", "10k", "Resistor_SMD:R_0603_1608Metric", "0.01"),
+    ("C", "100n", "Capacitor_SMD:C_0603_1608Metric", "0.02"),
+    ("U", "LM358", "Package_SO:SOIC-8_3.9x4.9mm_P1.27mm", "0.45"),
+    ("D", "1N4148", "Diode_SMD:D_SOD-123", "0.03"),
+    ("J", "Conn_01x04", "Connector_PinHeader_2.54mm:PinHeader_1x04_P2.54mm_Vertical", "0.30"),
+]
+
+
+def write_bom_csv(path: str, row_count: int) -> None:
+    """Write a KiCad-style CSV BOM with one row per component."""
+    import csv
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Reference", "Value", "Footprint", "Quantity", "Cost", "Description"])
+        for index in range(row_count):
+            prefix, value, footprint, cost = BOM_PARTS[index % len(BOM_PARTS)]
+            writer.writerow([f"{prefix}{index + 1}", value, footprint, 1 + index % 3, f"${cost}",
+                             f"{value} {footprint.split(':')[0]}"])
+
+
+def generate_symbol_library(symbol_count: int, pins_per_symbol: int = 8) -> str:
+    """Generate a .kicad_sym library of ``symbol_count`` IC symbols.
+
+    Args:
+        symbol_count: Number of symbols
+        pins_per_symbol: Pins on each symbol, split between the left and right side
+
+    Returns:
+        Symbol library content
+    """
+    parts = ['(kicad_symbol_lib (version 20231120) (generator "kicad_symbol_editor") (generator_version "8.0")']
+    for index in range(symbol_count):
+        name = f"BENCH{index}"
+        parts.append(f'\t(symbol "{name}" (in_bom yes) (on_board yes)')
+        for field, value, y in (("Reference", "U", 7.62), ("Value", name, -7.62), ("Footprint", "", -10.16)):
+            parts.append(f'\t\t(property "{field}" "{value}" (at 0 {y:g} 0) {_effects()})')
+        parts.append(f'\t\t(symbol "{name}_0_1" (rectangle (start -5.08 5.08) (end 5.08 -5.08) '
+                     '(stroke (width 0.254) (type default)) (fill (type background))))')
+        parts.append(f'\t\t(symbol "{name}_1_1"')
+        for pin in range(pins_per_symbol):
+            side, row = divmod(pin, (pins_per_symbol + 1) // 2)
+            x, angle = (-7.62, 0) if side == 0 else (7.62, 180)
+            parts.append(f'\t\t\t(pin passive line (at {x:g} {2.54 * (1 - row):g} {angle}) (length 2.54) '
+                         f'(name "P{pin + 1}" {_effects()}) (number "{pin + 1}" {_effects()}))')
+        parts.append("\t\t)\n\t)")
+    parts.append(")")
+    return "\n".join(parts) + "\n"
+
+
+_PCB_LAYERS = [(0, "F.Cu", "signal"), (31, "B.Cu", "signal"), (36, "B.SilkS", "user", "B.Silkscreen"),
+               (37, "F.SilkS", "user", "F.Silkscreen"), (44, "Edge.Cuts", "user")]
+
+
+def generate_board(resistor_count: int, columns: int = 50) -> str:
+    """Generate a routed .kicad_pcb with ``resistor_count`` 0603 resistors.
+
+    Every resistor sits on its own net between GND and a chain net, with a
+    track to its neighbour, a via to the back layer and a GND zone on B.Cu.
+
+    Args:
+        resistor_count: Number of resistor footprints
+        columns: Resistors per row
+
+    Returns:
+        Board file content
+    """
+    parts = ['(kicad_pcb (version 20240108) (generator "pcbnew") (generator_version "8.0")',
+             '\t(general (thickness 1.6) (legacy_teardrops no))', '\t(paper "A4")', '\t(layers']
+    for layer in _PCB_LAYERS:
+        parts.append("\t\t(" + " ".join([str(layer[0])] + [f'"{item}"' if index != 1 else item
+                                                          for index, item in enumerate(layer[1:])]) + ")")
+    parts.append("\t)")
+    parts.append('\t(net 0 "")')
+    parts.append('\t(net 1 "GND")')
+    for index in range(resistor_count):
+        parts.append(f'\t(net {index + 2} "/N{index}")')
+
+    rows = (resistor_count + columns - 1) // columns
+    width, height = columns * 5.0 + 10, rows * 5.0 + 10
+    parts.append(f'\t(gr_rect (start 0 0) (end {width:g} {height:g}) (stroke (width 0.1) (type default)) '
+                 f'(fill none) (layer "Edge.Cuts") (uuid "{_uid("edge")}"))')
+
+    for index in range(resistor_count):
+        row, column = divmod(index, columns)
+        x, y = 10 + column * 5.0, 10 + row * 5.0
+        angle = 90 if index % 4 == 1 else 0
+        net = index + 2
+        parts.append(f'\t(footprint "Resistor_SMD:R_0603_1608Metric" (layer "F.Cu") (uuid "{_uid("fp", index)}") '
+                     f'(at {x:g} {y:g}{f" {angle}" if angle else ""})')
+        parts.append(f'\t\t(property "Reference" "R{index + 1}" (at 0 -1.43 {angle}) (layer "F.SilkS") '
+                     f'(uuid "{_uid("ref", index)}") {_effects()})')
+        parts.append(f'\t\t(property "Value" "{RESISTOR_VALUES[index % len(RESISTOR_VALUES)]}" (at 0 1.43 {angle}) '
+                     f'(layer "F.Fab") (uuid "{_uid("val", index)}") {_effects()})')
+        parts.append('\t\t(fp_line (start -0.8 -0.4) (end 0.8 -0.4) (stroke (width 0.1) (type solid)) (layer "F.SilkS"))')
+        for number, (pad_x, pad_net) in enumerate(((-0.775, (1, "GND")), (0.775, (net, f"/N{index}"))), 1):
+            parts.append(f'\t\t(pad "{number}" smd roundrect (at {pad_x:g} 0{f" {angle}" if angle else ""}) '
+                         f'(size 0.9 0.95) (layers "F.Cu" "F.Paste" "F.Mask") (roundrect_rratio 0.25) '
+                         f'(net {pad_net[0]} "{pad_net[1]}") (uuid "{_uid("pad", index, number)}"))')
+        parts.append("\t)")
+
+    for index in range(resistor_count):
+        row, column = divmod(index, columns)
+        x, y = 10 + column * 5.0, 10 + row * 5.0
+        net = index + 2
+        if column + 1 < columns and index + 1 < resistor_count:
+            parts.append(f'\t(segment (start {x + 0.775:g} {y:g}) (end {x + 4.225:g} {y:g}) (width 0.25) '
+                         f'(layer "F.Cu") (net {net}) (uuid "{_uid("seg", index)}"))')
+        parts.append(f'\t(arc (start {x + 0.775:g} {y:g}) (mid {x + 1.5:g} {y + 0.725:g}) (end {x + 2.225:g} {y:g}) '
+                     f'(width 0.2) (layer "B.Cu") (net {net}) (uuid "{_uid("arc", index)}"))')
+        parts.append(f'\t(via (at {x + 0.775:g} {y + 1.5:g}) (size 0.6) (drill 0.3) (layers "F.Cu" "B.Cu") '
+                     f'(net {net}) (uuid "{_uid("via", index)}"))')
+
+    parts.append(f'\t(zone (net 1) (net_name "GND") (layer "B.Cu") (uuid "{_uid("zone")}") (name "GND_FILL") '
+                 '(hatch edge 0.5) (connect_pads (clearance 0.5)) (min_thickness 0.25) (filled_areas_thickness no) '
+                 '(fill yes (thermal_gap 0.5) (thermal_bridge_width 0.5))')
+    outline = f"(xy 1 1) (xy {width - 1:g} 1) (xy {width - 1:g} {height - 1:g}) (xy 1 {height - 1:g})"
+    parts.append(f'\t\t(polygon (pts {outline}))')
+    parts.append(f'\t\t(filled_polygon (layer "B.Cu") (pts {outline}))')
+    parts.append("\t)")
+    parts.append(")")
+    return "\n".join(parts) + "\n"
+
+
+def write_board(path: str, resistor_count: int, **kwargs) -> int:
+    """Write a generated board to ``path`` and return its size in bytes."""
+    content = generate_board(resistor_count, **kwargs)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return len(content.encode("utf-8"))
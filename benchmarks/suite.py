@@ -0,0 +1,276 @@
+"""
+Benchmark suite: cold start, per-tool latency and peak memory, as JSON.
+
+Runs every case on synthetic fixtures (no KiCad installation needed) and
+writes one JSON document, so results of two releases can be compared:
+
+- cold_start: launching main.py until it answers ``initialize``
+- netlist_extraction: parsing a generated schematic (and a repeat served from the parse cache)
+- board_read: reading a generated board with the in-process .kicad_pcb reader (pads, tracks, zones)
+- pattern_recognition: all circuit identifiers on a generated netlist
+- bom_analysis: reading and analyzing a generated CSV BOM
+- symbol_validation: validating a generated symbol library
+
+Each case reports the best and median of ``--repeat`` runs and the peak
+Python memory (tracemalloc) of one extra run. With ``--baseline`` the
+results are compared with an earlier JSON file, and the exit status is 1 if
+a case got slower by more than ``--max-regression``.
+
+Usage:
+    python -m benchmarks.suite [--size small|medium|large] [--scale 1.0] [--repeat 3]
+                               [--only bom_analysis ...] [--output results.json]
+                               [--baseline previous.json] [--max-regression 1.25]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import kicad_mcp
+from benchmarks.bench_startup import REPO_ROOT, time_to_ready
+from benchmarks.fixtures import generate_netlist, generate_symbol_library, write_board, write_bom_csv, write_schematic
+
+# Fixture sizes per preset; --scale multiplies them
+SIZES: Dict[str, Dict[str, int]] = {
+    "small": {"resistors": 500, "components": 1000, "bom_rows": 2000, "symbols": 50, "footprints": 500},
+    "medium": {"resistors": 5000, "components": 10000, "bom_rows": 20000, "symbols": 500, "footprints": 5000},
+    "large": {"resistors": 25000, "components": 50000, "bom_rows": 200000, "symbols": 2500, "footprints": 25000},
+}
+
+# A case prepares its fixture in the temporary directory and returns the
+# function to time and the parameters to report
+Case = Callable[[str, Dict[str, int]], Tuple[Callable[[], Any], Dict[str, Any]]]
+
+
+def _netlist_case(cached: bool) -> Case:
+    def prepare(temp_dir: str, size: Dict[str, int]):
+        from kicad_mcp.utils.netlist_parser import SchematicParser, extract_netlist
+        from kicad_mcp.utils.parse_cache import get_parse_cache
+
+        path = os.path.join(temp_dir, "bench.kicad_sch")
+        file_size = write_schematic(path, size["resistors"])
+        params = {"resistors": size["resistors"], "file_mb": round(file_size / 1e6, 2)}
+
+        def parse(schematic_path: str):
+            # Bypasses the on-disk cache, which would turn repeated runs into cache reads
+            return SchematicParser(schematic_path).parse()
+
+        if not cached:
+            return lambda: parse(path), params
+        get_parse_cache().get_or_parse(path, parse)
+        return lambda: extract_netlist(path), params
+    return prepare
+
+
+def _board_case(temp_dir: str, size: Dict[str, int]):
+    from kicad_mcp.utils.pcb_reader import PcbBoard
+
+    path = os.path.join(temp_dir, "bench.kicad_pcb")
+    file_size = write_board(path, size["footprints"])
+
+    def run():
+        # Parses the file each time instead of using the board parse cache
+        board = PcbBoard(path)
+        return board.get_footprints_pads(), board.get_tracks_vias(), board.get_zones()
+    return run, {"footprints": size["footprints"], "file_mb": round(file_size / 1e6, 2)}
+
+
+def _pattern_case(temp_dir: str, size: Dict[str, int]):
+    from kicad_mcp.utils import pattern_recognition
+    from kicad_mcp.utils.pattern_executor import identify_all_patterns
+
+    components, nets = generate_netlist(size["components"])
+
+    def run():
+        # Fresh dicts and a cleared memo, so the indexes are rebuilt as for a new schematic
+        pattern_recognition.classify_component.cache_clear()
+        return asyncio.run(identify_all_patterns(dict(components), dict(nets)))
+    return run, {"components": len(components), "nets": len(nets)}
+
+
+def _bom_case(temp_dir: str, size: Dict[str, int]):
+    from kicad_mcp.utils.bom_table import analyze_bom_table, read_bom_table
+
+    path = os.path.join(temp_dir, "bench_bom.csv")
+    write_bom_csv(path, size["bom_rows"])
+    return (lambda: analyze_bom_table(read_bom_table(path)[0]),
+            {"rows": size["bom_rows"], "file_mb": round(os.path.getsize(path) / 1e6, 2)})
+
+
+def _symbol_case(temp_dir: str, size: Dict[str, int]):
+    from kicad_mcp.utils.create_foodprint_symbol_utils import validate_kicad_symbol
+
+    content = generate_symbol_library(size["symbols"])
+    return (lambda: validate_kicad_symbol(content),
+            {"symbols": size["symbols"], "file_mb": round(len(content) / 1e6, 2)})
+
+
+CASES: Dict[str, Case] = {
+    "netlist_extraction": _netlist_case(cached=False),
+    "netlist_extraction_cached": _netlist_case(cached=True),
+    "board_read": _board_case,
+    "pattern_recognition": _pattern_case,
+    "bom_analysis": _bom_case,
+    "symbol_validation": _symbol_case,
+}
+
+
+def _summary(timings: List[float]) -> Dict[str, float]:
+    return {
+        "runs": len(timings),
+        "seconds_best": round(min(timings), 6),
+        "seconds_median": round(statistics.median(timings), 6),
+    }
+
+
+def measure(run: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """Time ``run`` and record its peak Python memory.
+
+    Args:
+        run: Function to measure
+        repeat: Number of timed runs
+
+    Returns:
+        Best and median seconds and peak memory in megabytes
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    # Memory in a separate run; tracing slows the timed ones down
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return dict(_summary(timings), peak_memory_mb=round(peak / 1e6, 2))
+
+
+def measure_cold_start(repeat: int) -> Dict[str, Any]:
+    """Time server start-up in fresh processes (peak RSS where the OS reports it)."""
+    result = _summary([time_to_ready(timeout=60) for _ in range(repeat)])
+    try:
+        import resource
+    except ImportError:
+        return result
+    max_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    result["peak_rss_mb"] = round(max_rss / (1e6 if sys.platform == "darwin" else 1e3), 2)
+    return result
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(size_name: str, scale: float, repeat: int, only: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Run the selected cases and return the JSON document.
+
+    Args:
+        size_name: Fixture size preset (key of SIZES)
+        scale: Multiplier applied to the preset sizes
+        repeat: Timed runs per case
+        only: Case names to run (default: all, including cold_start)
+
+    Returns:
+        Dictionary with environment information and one entry per case
+    """
+    size = {name: max(1, int(value * scale)) for name, value in SIZES[size_name].items()}
+    selected = only or ["cold_start"] + list(CASES)
+
+    results = {}
+    if "cold_start" in selected:
+        print("cold_start ...", file=sys.stderr)
+        results["cold_start"] = measure_cold_start(repeat)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name, prepare in CASES.items():
+            if name not in selected:
+                continue
+            print(f"{name} ...", file=sys.stderr)
+            run, params = prepare(temp_dir, size)
+            results[name] = dict(params=params, **measure(run, repeat))
+
+    from kicad_mcp.utils.pattern_executor import shutdown_pattern_executor
+    shutdown_pattern_executor()
+
+    return {
+        "suite": "kicad-mcp",
+        "version": kicad_mcp.__version__,
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "size": size_name,
+        "scale": scale,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], max_regression: float) -> List[str]:
+    """Return a message for every case whose best time grew by more than ``max_regression``."""
+    regressions = []
+    for name, result in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous.get("seconds_best"):
+            continue
+        ratio = result["seconds_best"] / previous["seconds_best"]
+        result["vs_baseline"] = round(ratio, 3)
+        if ratio > max_regression:
+            regressions.append(f"{name}: {ratio:.2f}x slower than baseline "
+                               f"({previous['seconds_best']:.4f} s -> {result['seconds_best']:.4f} s)")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", choices=sorted(SIZES), default="small", help="Fixture size preset")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier for the preset sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case")
+    parser.add_argument("--only", nargs="+", choices=["cold_start"] + list(CASES), help="Cases to run")
+    parser.add_argument("--output", help="Write the JSON results to this file (default: stdout)")
+    parser.add_argument("--baseline", help="Earlier JSON results to compare with")
+    parser.add_argument("--max-regression", type=float, default=1.25,
+                        help="Allowed slow-down against the baseline (best time ratio)")
+    args = parser.parse_args(argv)
+
+    document = run_suite(args.size, args.scale, args.repeat, args.only)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(document, json.load(f), args.max_regression)
+        document["regressions"] = regressions
+
+    output = json.dumps(document, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    for message in regressions:
+        print(f"REGRESSION: {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,6 +12,8 @@ system = platform.system()
 if system == "Darwin":  # macOS
     KICAD_USER_DIR = os.path.expanduser("~/Documents/KiCad")
     KICAD_APP_PATH = "/Applications/KiCad/KiCad.app"
+    KICAD_TABLE_PATH = os.path.expanduser("~/Library/Preferences/kicad")
+    DATASHEET_PATH = os.path.expanduser("~/KiCadProjects")
 elif system == "Windows":
     #Edit
     KICAD_USER_DIR = os.path.expanduser("~/Documents/KiCad")
@@ -22,10 +24,14 @@ elif system == "Windows":
 elif system == "Linux":
     KICAD_USER_DIR = os.path.expanduser("~/KiCad")
     KICAD_APP_PATH = "/usr/share/kicad"
+    KICAD_TABLE_PATH = os.path.join(os.environ.get("XDG_CONFIG_HOME", os.path.expanduser("~/.config")), "kicad")
+    DATASHEET_PATH = os.path.expanduser("~/KiCadProjects")
 else:
     # Default to macOS paths if system is unknown
     KICAD_USER_DIR = os.path.expanduser("~/Documents/KiCad")
     KICAD_APP_PATH = "/Applications/KiCad/KiCad.app"
+    KICAD_TABLE_PATH = os.path.expanduser("~/Library/Preferences/kicad")
+    DATASHEET_PATH = os.path.expanduser("~/KiCadProjects")
 
 # Additional search paths from environment variable
 ADDITIONAL_SEARCH_PATHS = []
@@ -75,3 +81,6 @@ DATA_EXTENSIONS = [
     ".csv",  # BOM or other data
     ".pos",  # Component position file
 ]
+
+# Persistent cache of parse results (reused across server restarts)
+CACHE_DIR = os.path.expanduser(os.environ.get("KICAD_MCP_CACHE_DIR", "~/.kicad_mcp/cache"))
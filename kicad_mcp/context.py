@@ -9,6 +9,12 @@ import os # Added for PID
 
 from mcp.server.fastmcp import FastMCP
 
+from kicad_mcp.utils.cache_registry import cache_registry
+from kicad_mcp.utils.parse_cache import get_parse_cache
+
+# Prefix of thumbnail entries in the lifespan cache (see export_tools)
+THUMBNAIL_KEY_PREFIX = "thumbnail_cli_"
+
 # Get PID for logging
 # _PID = os.getpid()
 
@@ -45,6 +51,19 @@ async def kicad_lifespan(server: FastMCP, kicad_modules_available: bool = False)
     
     # Create in-memory cache for expensive operations
     cache: Dict[str, Any] = {}
+
+    # Parsed schematics are shared with tools that call extract_netlist directly
+    cache["schematic_parses"] = get_parse_cache()
+
+    def invalidate_thumbnails(path: str) -> None:
+        # Keys are "thumbnail_cli_<pcb path>_<mtime>"
+        target = os.path.normcase(os.path.abspath(path))
+        for key in [key for key in list(cache) if key.startswith(THUMBNAIL_KEY_PREFIX)]:
+            pcb_file = key[len(THUMBNAIL_KEY_PREFIX):].rsplit("_", 1)[0]
+            if os.path.normcase(os.path.abspath(pcb_file)) == target:
+                cache.pop(key, None)
+
+    cache_registry.register("thumbnails", invalidate_thumbnails, (".kicad_pcb",))
     
     # Initialize any other resources that need cleanup later
     created_temp_dirs = [] # Assuming this is managed elsewhere or not needed for now
@@ -69,6 +88,8 @@ async def kicad_lifespan(server: FastMCP, kicad_modules_available: bool = False)
         logging.info(f"Shutting down KiCad MCP server")
         
         # Clear the cache
+        cache_registry.unregister("thumbnails")
+        cache["schematic_parses"].clear()
         if cache:
             logging.info(f"Clearing cache with {len(cache)} entries")
             cache.clear()
@@ -4,7 +4,6 @@ Bill of Materials (BOM) resources for KiCad projects.
 import os
 import csv
 import json
-import pandas as pd
 from typing import Dict, List, Any, Optional
 from mcp.server.fastmcp import FastMCP
 import logging
@@ -12,7 +11,7 @@ import logging
 from kicad_mcp.utils.file_utils import get_project_files
 
 # Import the helper functions from bom_tools.py to avoid code duplication
-from kicad_mcp.tools.bom_tools import parse_bom_file, analyze_bom_data 
+from kicad_mcp.utils.bom_table import analyze_bom_table, read_bom_table
 
 logging.basicConfig(
     level=logging.DEBUG,
@@ -67,13 +66,13 @@ def register_bom_resources(mcp: FastMCP) -> None:
         for file_type, file_path in bom_files.items():
             try:
                 # Parse and analyze the BOM
-                bom_data, format_info = parse_bom_file(file_path)
+                bom_table, format_info = read_bom_table(file_path)
                 
-                if not bom_data:
+                if not len(bom_table):
                     report += f"## {file_type}\n\nFailed to parse BOM file: {os.path.basename(file_path)}\n\n"
                     continue
                 
-                analysis = analyze_bom_data(bom_data, format_info)
+                analysis = analyze_bom_table(bom_table)
                 
                 # Add file section
                 report += f"## {file_type.capitalize()}\n\n"
@@ -114,7 +113,7 @@ def register_bom_resources(mcp: FastMCP) -> None:
                     report += "\n"
                 
                 # Add component table (first 20 items)
-                if bom_data:
+                if len(bom_table):
                     report += "### Component List\n\n"
                     
                     # Try to identify key columns
@@ -141,7 +140,7 @@ def register_bom_resources(mcp: FastMCP) -> None:
                         report += "| " + " | ".join(["---"] * len(columns)) + " |\n"
                         
                         # Add rows (limit to first 20 for readability)
-                        for i, component in enumerate(bom_data[:20]):
+                        for i, component in enumerate(bom_table.records(limit=20)):
                             row = []
                             for col in columns:
                                 value = component.get(col, "")
@@ -152,8 +151,8 @@ def register_bom_resources(mcp: FastMCP) -> None:
                             report += "| " + " | ".join(row) + " |\n"
                         
                         # Add note if there are more components
-                        if len(bom_data) > 20:
-                            report += f"\n*...and {len(bom_data) - 20} more components*\n"
+                        if len(bom_table) > 20:
+                            report += f"\n*...and {len(bom_table) - 20} more components*\n"
                     else:
                         report += "*Component table could not be generated - column headers not recognized*\n"
                 
@@ -213,13 +212,14 @@ def register_bom_resources(mcp: FastMCP) -> None:
                     return f.read()
 
             # Otherwise, try to parse and convert to CSV
-            bom_data, format_info = parse_bom_file(file_path)
+            bom_table, format_info = read_bom_table(file_path)
 
-            if not bom_data:
+            if not len(bom_table):
                 return f"Failed to parse BOM file: {file_path}"
 
-            # Convert to DataFrame and then to CSV
-            df = pd.DataFrame(bom_data)
+            # Convert to DataFrame and then to CSV; pandas is only needed here
+            import pandas as pd
+            df = pd.DataFrame(bom_table.records())
             return df.to_csv(index=False)
 
         except Exception as e:
@@ -270,15 +270,15 @@ def register_bom_resources(mcp: FastMCP) -> None:
                             pass
 
                 # Otherwise parse with our utility
-                bom_data, format_info = parse_bom_file(file_path)
+                bom_table, format_info = read_bom_table(file_path)
 
-                if bom_data:
-                    analysis = analyze_bom_data(bom_data, format_info)
+                if len(bom_table):
+                    analysis = analyze_bom_table(bom_table)
                     result["bom_files"][file_type] = {
                         "file": os.path.basename(file_path),
                         "format": format_info,
                         "analysis": analysis,
-                        "components": bom_data
+                        "components": list(bom_table.records())
                     }
 
             return json.dumps(result, indent=2, default=str)
@@ -7,7 +7,7 @@ from mcp.server.fastmcp import FastMCP
 
 from kicad_mcp.utils.file_utils import get_project_files
 from kicad_mcp.utils.drc_history import get_drc_history
-from kicad_mcp.tools.drc_impl.cli_drc import run_drc_via_cli
+from kicad_mcp.utils.drc_store import get_drc_results
 import logging
 
 
@@ -147,9 +147,12 @@ def register_drc_resources(mcp: FastMCP) -> None:
         return report
     
     @mcp.resource("kicad://drc/{project_path}")
-    def get_drc_report(project_path: str) -> str:
+    async def get_drc_report(project_path: str) -> str:
         """Get a formatted DRC report for a KiCad project.
         
+        Served from the DRC result store when the board has not changed
+        since the last check.
+        
         Args:
             project_path: Path to the KiCad project file (.kicad_pro)
             
@@ -169,8 +172,8 @@ def register_drc_resources(mcp: FastMCP) -> None:
         pcb_file = files["pcb"]
         logging.debug(f"Found PCB file: {pcb_file}")
         
-        # Try to run DRC via command line
-        drc_results = run_drc_via_cli(pcb_file)
+        # Use the stored result, or run DRC via command line
+        drc_results = await get_drc_results(pcb_file, project_path=project_path)
         
         if not drc_results["success"]:
             error_message = drc_results.get("error", "Unknown error")
@@ -202,6 +202,18 @@ def create_server() -> FastMCP:
                 logging.error(f"Error cleaning up temporary directory {temp_dir}: {str(e)}")
     
     add_cleanup_handler(cleanup_temp_dirs)
+
+    # Stop long-lived KiCad worker processes
+    from kicad_mcp.utils.kicad_bridge import shutdown_worker_pools
+    add_cleanup_handler(shutdown_worker_pools)
+
+    # Stop the pattern recognition executor
+    from kicad_mcp.utils.pattern_executor import shutdown_pattern_executor
+    add_cleanup_handler(shutdown_pattern_executor)
+
+    # Stop watching project directories
+    from kicad_mcp.utils.file_watcher import stop_file_watcher
+    add_cleanup_handler(stop_file_watcher)
     
     logging.info(f"Server initialization complete")
     return mcp
@@ -2,14 +2,17 @@
 Analysis and validation tools for KiCad projects.
 """
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from mcp.server.fastmcp import FastMCP, Context, Image
 import logging
 import asyncio
 
 
 from kicad_mcp.utils.file_utils import get_project_files
-from kicad_mcp.utils.kicad_bridge import KiCadBridge
+from kicad_mcp.utils.geometry_columns import GEOMETRY_KINDS, geometry_stats
+from kicad_mcp.utils.kicad_bridge import get_kicad_bridge
+from kicad_mcp.utils.list_snapshots import FilterFields, get_page
+from kicad_mcp.utils.pcb_reader import read_board_sections
 
 
 logging.basicConfig(
@@ -20,15 +23,60 @@ logging.basicConfig(
     ]
 )
 
-try:
-    kicad_subprocess = KiCadBridge()
-    logging.info("KiCadBridge initialized successfully")
-except Exception as e:
-    logging.error(f"Failed to initialize KiCadBridge: {e}")
-    kicad_subprocess = None
 
 
 
+# Item values matched by the "net", "layer" and "reference" filters of each list
+PAD_FILTERS: FilterFields = {
+    "net": lambda pad: (pad.get("net_name"),),
+    "layer": lambda pad: (pad.get("layer_name"),),
+    "reference": lambda pad: (pad.get("reference"),),
+}
+NESTED_PAD_FILTERS: FilterFields = {
+    "net": lambda component: [pad.get("net_name") for pad in component.get("pads", ())],
+    "layer": lambda component: (component.get("layer_name"),),
+    "reference": lambda component: (component.get("reference"),),
+}
+ROUTE_FILTERS: FilterFields = {
+    "net": lambda item: (item.get("net_name"),),
+    "layer": lambda item: item.get("layers") or (item.get("layer_name"),),
+}
+ZONE_FILTERS: FilterFields = {
+    "net": lambda zone: (zone.get("net_name"),),
+    "layer": lambda zone: (zone.get("layer_name"),),
+}
+
+
+def _pad_items(data: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Flatten a pad extraction into one item per pad (normalized) or per footprint (nested)."""
+    if data.get("layout") == "nested":
+        return {"layout": "nested"}, data["components"]
+
+    net_names = {net["code"]: net["name"] for net in data["nets"]}
+    footprints = data["footprints"]
+    pads = [
+        dict(pad,
+             reference=footprints[pad["footprint"]].get("reference"),
+             layer_name=footprints[pad["footprint"]].get("layer_name"),
+             net_name=net_names.get(pad["net_code"], ""))
+        for pad in data["pads"]
+    ]
+    summary = {
+        "layout": "normalized",
+        "footprint_count": len(footprints),
+        "pad_count": len(pads),
+        "net_count": len(net_names),
+    }
+    return summary, pads
+
+
+def _route_items(data: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Merge tracks and vias into one list of items tagged with their type."""
+    items = [dict(track, type="track") for track in data["tracks"]]
+    items.extend(dict(via, type="via") for via in data["vias"])
+    return {"track_count": len(data["tracks"]), "via_count": len(data["vias"])}, items
+
+
 def register_analysis_tools(mcp: FastMCP) -> None:
     """Register analysis and validation tools with the MCP server.
     
@@ -87,17 +135,13 @@ def register_analysis_tools(mcp: FastMCP) -> None:
             
         """
 
-        # Check if KiCadBridge is available
-        if (err := ensure_kicad_ready()):
-            return err
-
         pcb_path = resolve_pcb_path(project_path)
 
 
         try:
             logging.info("Starting extracting information...")
 
-            result = kicad_subprocess.extract_basic_info(pcb_path)
+            result = board_section(pcb_path, "basic_info")
 
             if result.get("success"):
                     logging.info(f"Info extracted successfully")
@@ -152,7 +196,7 @@ def register_analysis_tools(mcp: FastMCP) -> None:
         try:
             logging.info("Starting extracting information...")
 
-            result = kicad_subprocess.extract_designRules(pcb_path)
+            result = get_kicad_bridge().extract_designRules(pcb_path)
 
             if result.get("success"):
                     logging.info(f"Info extracted successfully")
@@ -197,10 +241,6 @@ def register_analysis_tools(mcp: FastMCP) -> None:
             dict: Dictionary listing enabled PCB layers or an error message.
         """
 
-        # Check if KiCadBridge is available
-        if (err := ensure_kicad_ready()):
-            return err
-
         pcb_path = resolve_pcb_path(project_path)
 
 
@@ -208,7 +248,7 @@ def register_analysis_tools(mcp: FastMCP) -> None:
         try:
             logging.info("Starting extracting information...")
 
-            result = kicad_subprocess.extract_layers(pcb_path)
+            result = board_section(pcb_path, "layers")
 
             if result.get("success"):
                     logging.info(f"Info extracted successfully")
@@ -239,170 +279,241 @@ def register_analysis_tools(mcp: FastMCP) -> None:
 
         
     @mcp.tool()
-    def pcb_tracks_vias(project_path: str) -> Dict[str, Any]:
+    def pcb_tracks_vias(project_path: str, fields: Optional[List[str]] = None,
+                        filter: Optional[Dict[str, str]] = None, limit: Optional[int] = None,
+                        cursor: Optional[str] = None) -> Dict[str, Any]:
 
         """
         Tool: Extract all tracks and vias from the PCB layout.
 
-        Differentiates between routed tracks and via connections.
+        Differentiates between routed tracks and via connections. Tracks and
+        vias are returned as one paged list of items with a "type" of "track"
+        or "via". Later pages are served from the first extraction.
 
         Args:
             project_path (str): Path to the KiCad project or PCB file.
+            fields (list, optional): Item keys to return, e.g. ["type", "net_name", "length"].
+            filter (dict, optional): "net" and "layer" glob patterns, e.g. {"net": "USB_*", "layer": "F.Cu"}.
+            limit (int, optional): Items per page (default 200, 0 for all).
+            cursor (str, optional): "next_cursor" of the previous page.
 
         Returns:
-            dict: Dictionary with lists of tracks and vias or an error message.
+            dict: Dictionary with a page of tracks and vias or an error message.
         """
-        # Check if KiCadBridge is available
-        if (err := ensure_kicad_ready()):
-            return err
+        return paged_board_query("tracks_vias", project_path, {},
+                                 _route_items, ROUTE_FILTERS, filter, fields, limit, cursor)
 
-        pcb_path = resolve_pcb_path(project_path)
+        
+    @mcp.tool()
+    def pcb_pads(project_path: str, layout: str = "normalized", fields: Optional[List[str]] = None,
+                 filter: Optional[Dict[str, str]] = None, limit: Optional[int] = None,
+                 cursor: Optional[str] = None) -> Dict[str, Any]:
 
+        """
+        Tool: Extract pad and footprint data from the PCB.
 
-        try:
-            logging.info("Starting extracting information...")
+        Collects information about each component, including pad geometry, position, and net connections.
 
-            result = kicad_subprocess.extract_track_vias(pcb_path)
+        The default "normalized" layout pages through the pads; each pad carries
+        the reference and layer of its footprint and its net code and name, so
+        all pads of a net are the pads matching {"net": name}. The "nested"
+        layout pages through the footprints with their pads inside and lists,
+        for every pad, all other pads on its net; it is only available for
+        small boards. Later pages are served from the first extraction.
 
-            if result.get("success"):
-                    logging.info(f"Info extracted successfully")
-            else:
-                logging.error(f"Failed to extract info")
-                    
-                return(result or {
-                    "success": False,
-                    "error": "Failed to extract info",
-                    "routes": result
-                })
-                
-            return {
-                "success": True,
-                "message": "Info extracted",
-                "routes": result
-            }
+        Args:
+            project_path (str): Path to the KiCad project or PCB file.
+            layout (str, optional): "normalized" (default) or "nested".
+            fields (list, optional): Item keys to return, e.g. ["reference", "number", "net_name"].
+            filter (dict, optional): "net" and "layer" glob patterns and a "reference"
+                prefix, e.g. {"reference": "U", "net": "GND"}.
+            limit (int, optional): Items per page (default 200, 0 for all).
+            cursor (str, optional): "next_cursor" of the previous page.
 
-        except asyncio.TimeoutError:
-            error_msg = "Info extraction timed out"
-            logging.error(error_msg)
-            return {"success": False, "error": error_msg}
-                
-        except Exception as e:
-            error_msg = f"Unexpected error during info extraction: {str(e)}"
-            logging.error(error_msg)
-            return {"success": False, "error": error_msg}
+        Returns:
+            dict: Dictionary with a page of pads (or nested components) or an error message.
+        """
+        if layout not in ("normalized", "nested"):
+            return {"success": False, "error": f"Unknown pad layout '{layout}', use 'normalized' or 'nested'"}
+
+        return paged_board_query("pads", project_path, {"layout": layout},
+                                 _pad_items, PAD_FILTERS if layout == "normalized" else NESTED_PAD_FILTERS,
+                                 filter, fields, limit, cursor)
 
         
     @mcp.tool()
-    def pcb_pads(project_path: str) -> Dict[str, Any]:
-
+    def pcb_zones(project_path: str, fields: Optional[List[str]] = None,
+                  filter: Optional[Dict[str, str]] = None, limit: Optional[int] = None,
+                  cursor: Optional[str] = None) -> Dict[str, Any]:
         """
-        Tool: Extract pad and footprint data from the PCB.
+        Tool: Extract copper zones from the PCB.
 
-        Collects information about each component, including pad geometry, position, and net connections.
+        Includes zone geometry, layer, thermal relief settings, and associated net.
+        Later pages are served from the first extraction.
 
         Args:
             project_path (str): Path to the KiCad project or PCB file.
+            fields (list, optional): Item keys to return, e.g. ["net_name", "layer_name", "area"].
+            filter (dict, optional): "net" and "layer" glob patterns, e.g. {"net": "GND"}.
+            limit (int, optional): Items per page (default 200, 0 for all).
+            cursor (str, optional): "next_cursor" of the previous page.
 
         Returns:
-            dict: Dictionary with components and their associated pads or an error message.
+            dict: Dictionary with a page of zone metadata or an error message.
         """
+        return paged_board_query("zones", project_path, {},
+                                 lambda data: ({}, data), ZONE_FILTERS, filter, fields, limit, cursor)
+        
 
-        # Check if KiCadBridge is available
-        if (err := ensure_kicad_ready()):
-            return err
+    @mcp.tool()
+    async def pcb_geometry_stats(project_path: str, ctx: Context, kinds: Optional[List[str]] = None,
+                                 top_nets: int = 10) -> Dict[str, Any]:
+        """
+        Tool: Summarize pad, track and via geometry of the PCB.
 
-        pcb_path = resolve_pcb_path(project_path)
+        The geometry is extracted as compact typed columns instead of one
+        record per item, and only aggregates are returned: counts, bounding
+        boxes, track length per layer, width and drill distributions, and the
+        nets with the longest routing, most vias and most pads.
+
+        Args:
+            project_path (str): Path to the KiCad project or PCB file.
+            kinds (list, optional): Any of "pads", "tracks", "vias". Defaults to all of them.
+            top_nets (int, optional): Number of nets listed per ranking (default 10).
 
+        Returns:
+            dict: Dictionary with statistics per geometry kind or an error message.
+        """
+        unknown = [kind for kind in kinds or () if kind not in GEOMETRY_KINDS]
+        if unknown:
+            return {"success": False, "error": f"Unknown geometry kinds: {', '.join(unknown)}",
+                    "available": list(GEOMETRY_KINDS)}
+
+        pcb_path = resolve_pcb_path(project_path)
 
         try:
-            logging.info("Starting extracting information...")
+            await ctx.info(f"Extracting board geometry: {', '.join(kinds or GEOMETRY_KINDS)}")
+            result = await asyncio.to_thread(board_section, pcb_path, "geometry", kinds=kinds)
 
-            result = kicad_subprocess.extract_pads(pcb_path)
+            if not result.get("success"):
+                logging.error(f"Failed to extract geometry")
+                return result or {"success": False, "error": "Failed to extract geometry"}
 
-            if result.get("success"):
-                    logging.info(f"Info extracted successfully")
-            else:
-                logging.error(f"Failed to extract info")
-                    
-                return(result or {
-                    "success": False,
-                    "error": "Failed to extract info",
-                    "routes": result
-                })
-                
+            stats = geometry_stats(result["data"], top=top_nets)
+            await ctx.info(", ".join(f"{section['count']} {kind}" for kind, section in stats.items()))
             return {
                 "success": True,
-                "message": "Info extracted",
-                "routes": result
+                "message": "Geometry statistics computed",
+                "stats": stats
             }
 
-        except asyncio.TimeoutError:
-            error_msg = "Info extraction timed out"
-            logging.error(error_msg)
-            return {"success": False, "error": error_msg}
-                
         except Exception as e:
-            error_msg = f"Unexpected error during info extraction: {str(e)}"
+            error_msg = f"Unexpected error during geometry extraction: {str(e)}"
             logging.error(error_msg)
             return {"success": False, "error": error_msg}
 
-        
+
     @mcp.tool()
-    def pcb_zones(project_path: str) -> Dict[str, Any]:
+    def pcb_snapshot(project_path: str, include: Optional[List[str]] = None,
+                     pad_layout: str = "normalized") -> Dict[str, Any]:
         """
-        Tool: Extract copper zones from the PCB.
+        Tool: Describe the PCB in one call.
 
-        Includes zone geometry, layer, thermal relief settings, and associated net.
+        Loads the board once and returns the results of several extractions
+        together, instead of calling pcb_basicInfo, pcb_designRules, pcb_layers,
+        pcb_pads, pcb_tracks_vias and pcb_zones one after another.
 
         Args:
             project_path (str): Path to the KiCad project or PCB file.
+            include (list, optional): Sections to extract. Any of "basic_info",
+                "design_rules", "layers", "pads", "tracks_vias", "zones", "nets",
+                "geometry" (statistics as in pcb_geometry_stats). Defaults to all of them.
+            pad_layout (str, optional): Layout of the "pads" section, "normalized"
+                (default) or "nested" (see pcb_pads).
 
         Returns:
-            dict: Dictionary with list of zone me
-            tadata or an error message.
+            dict: Dictionary with one result per section under "results", or an error message.
         """
-        # Check if KiCadBridge is available
-        if (err := ensure_kicad_ready()):
-            return err
-        
         pcb_path = resolve_pcb_path(project_path)
 
         try:
-            logging.info("Starting extracting information...")
+            logging.info(f"Starting board snapshot: {include or 'all sections'}")
 
-            result = kicad_subprocess.extract_zones(pcb_path)
+            result = read_board_sections(pcb_path, include, {"pads": {"layout": pad_layout}})
 
-            if result.get("success"):
-                    logging.info(f"Info extracted successfully")
-            else:
-                logging.error(f"Failed to extract info")
-                    
+            if "results" not in result:
+                logging.error(f"Failed to take board snapshot")
                 return(result or {
                     "success": False,
-                    "error": "Failed to extract info",
-                    "routes": result
+                    "error": "Failed to take board snapshot"
                 })
-                
+
+            geometry = result["results"].get("geometry")
+            if geometry and geometry.get("success"):
+                # The encoded columns are only useful to the server; return their statistics
+                geometry["data"] = geometry_stats(geometry["data"])
+
+            failed = [name for name, section in result["results"].items() if not section.get("success")]
+            if failed:
+                logging.warning(f"Snapshot sections failed: {failed}")
+
             return {
                 "success": True,
-                "message": "Info extracted",
-                "routes": result
+                "message": "Board snapshot extracted",
+                "failed_sections": failed,
+                "board_info": result.get("board_info", {}),
+                "results": result["results"]
             }
 
+        except Exception as e:
+            error_msg = f"Unexpected error during board snapshot: {str(e)}"
+            logging.error(error_msg)
+            return {"success": False, "error": error_msg}
+
+
+    def paged_board_query(section: str, project_path: str, options: Dict[str, Any],
+                          to_items: Callable[[Any], Tuple[Dict[str, Any], List[Dict[str, Any]]]],
+                          filter_fields: FilterFields, filter: Optional[Dict[str, str]],
+                          fields: Optional[List[str]], limit: Optional[int],
+                          cursor: Optional[str]) -> Dict[str, Any]:
+        """Return one page of a board section, extracting only if no snapshot is cached."""
+        pcb_path = resolve_pcb_path(project_path)
+        kind = ":".join([section, *map(str, options.values())])
+
+        def build() -> Dict[str, Any]:
+            logging.info(f"Starting extracting {kind}...")
+            result = board_section(pcb_path, section, **options)
+            if not result.get("success"):
+                logging.error(f"Failed to extract {kind}")
+                return result or {"success": False, "error": f"Failed to extract {kind}"}
+            summary, items = to_items(result["data"])
+            return {"success": True, "summary": summary, "items": items}
+
+        try:
+            page = get_page(f"{kind}:{os.path.normcase(os.path.abspath(pcb_path))}", [pcb_path], build,
+                            filter_fields, filter, fields, limit, cursor)
+            if page.get("success"):
+                page["message"] = "Info extracted"
+            return page
+
         except asyncio.TimeoutError:
             error_msg = "Info extraction timed out"
             logging.error(error_msg)
             return {"success": False, "error": error_msg}
-                
+
         except Exception as e:
             error_msg = f"Unexpected error during info extraction: {str(e)}"
             logging.error(error_msg)
             return {"success": False, "error": error_msg}
-        
+
+    def board_section(pcb_path: str, section: str, **options) -> Dict[str, Any]:
+        """Run one read-only board getter, in-process unless it needs pcbnew (see pcb_reader)."""
+        result = read_board_sections(pcb_path, [section], {section: options})
+        return result["results"][section] if "results" in result else result
 
     def ensure_kicad_ready() -> Optional[Dict[str, Any]]:
         """Check if KiCadBridge is available."""
-        if kicad_subprocess is None:
+        if get_kicad_bridge() is None:
             return {"success": False, "error": "KiCadBridge not initialized"}
         return None
     
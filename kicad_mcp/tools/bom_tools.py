@@ -4,12 +4,14 @@ Bill of Materials (BOM) processing tools for KiCad projects.
 import os
 import csv
 import json
-import pandas as pd
+import asyncio
 from typing import Dict, List, Any, Optional, Tuple
 from mcp.server.fastmcp import FastMCP, Context, Image
 import logging 
 
+from kicad_mcp.utils.bom_table import BomTable, analyze_bom_table, read_bom_table
 from kicad_mcp.utils.file_utils import get_project_files
+from kicad_mcp.utils.kicad_cli import find_kicad_cli, run_kicad_cli
 
 logging.basicConfig(
     level=logging.DEBUG,
@@ -100,14 +102,14 @@ def register_bom_tools(mcp: FastMCP) -> None:
                 ctx.info(f"Analyzing {os.path.basename(file_path)}")
                 
                 # Parse the BOM file
-                bom_data, format_info = parse_bom_file(file_path)
+                bom_table, format_info = await asyncio.to_thread(read_bom_table, file_path)
                 
-                if not bom_data or len(bom_data) == 0:
+                if not len(bom_table):
                     logging.debug(f"Failed to parse BOM file: {file_path}")
                     continue
                 
                 # Analyze the BOM data
-                analysis = analyze_bom_data(bom_data, format_info)
+                analysis = analyze_bom_table(bom_table)
                 
                 # Add to results
                 results["bom_files"][file_type] = {
@@ -268,123 +270,8 @@ def parse_bom_file(file_path: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]
             - List of component dictionaries
             - Dictionary with format information
     """
-    logging.debug(f"Parsing BOM file: {file_path}")
-    
-    # Check file extension
-    _, ext = os.path.splitext(file_path)
-    ext = ext.lower()
-    
-    # Dictionary to store format detection info
-    format_info = {
-        "file_type": ext,
-        "detected_format": "unknown",
-        "header_fields": []
-    }
-    
-    # Empty list to store component data
-    components = []
-    
-    try:
-        if ext == '.csv':
-            # Try to parse as CSV
-            with open(file_path, 'r', encoding='utf-8-sig') as f:
-                # Read a few lines to analyze the format
-                sample = ''.join([f.readline() for _ in range(10)])
-                f.seek(0)  # Reset file pointer
-                
-                # Try to detect the delimiter
-                if ',' in sample:
-                    delimiter = ','
-                elif ';' in sample:
-                    delimiter = ';'
-                elif '\t' in sample:
-                    delimiter = '\t'
-                else:
-                    delimiter = ','  # Default
-                
-                format_info["delimiter"] = delimiter
-                
-                # Read CSV
-                reader = csv.DictReader(f, delimiter=delimiter)
-                format_info["header_fields"] = reader.fieldnames if reader.fieldnames else []
-                
-                # Detect BOM format based on header fields
-                header_str = ','.join(format_info["header_fields"]).lower()
-                
-                if 'reference' in header_str and 'value' in header_str:
-                    format_info["detected_format"] = "kicad"
-                elif 'designator' in header_str:
-                    format_info["detected_format"] = "altium"
-                elif 'part number' in header_str or 'manufacturer part' in header_str:
-                    format_info["detected_format"] = "generic"
-                
-                # Read components
-                for row in reader:
-                    components.append(dict(row))
-        
-        elif ext == '.xml':
-            # Basic XML parsing
-            import xml.etree.ElementTree as ET
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            format_info["detected_format"] = "xml"
-            
-            # Try to extract components based on common XML BOM formats
-            component_elements = root.findall('.//component') or root.findall('.//Component')
-            
-            if component_elements:
-                for elem in component_elements:
-                    component = {}
-                    for attr in elem.attrib:
-                        component[attr] = elem.attrib[attr]
-                    for child in elem:
-                        component[child.tag] = child.text
-                    components.append(component)
-        
-        elif ext == '.json':
-            # Parse JSON
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            
-            format_info["detected_format"] = "json"
-            
-            # Try to find components array in common JSON formats
-            if isinstance(data, list):
-                components = data
-            elif 'components' in data:
-                components = data['components']
-            elif 'parts' in data:
-                components = data['parts']
-        
-        else:
-            # Unknown format, try generic CSV parsing as fallback
-            try:
-                with open(file_path, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.DictReader(f)
-                    format_info["header_fields"] = reader.fieldnames if reader.fieldnames else []
-                    format_info["detected_format"] = "unknown_csv"
-                    
-                    for row in reader:
-                        components.append(dict(row))
-            except:
-                print(f"Failed to parse unknown file format: {file_path}")
-                return [], {"detected_format": "unsupported"}
-    
-    except Exception as e:
-        logging.debug(f"Error parsing BOM file: {str(e)}", exc_info=True)
-        return [], {"error": str(e)}
-    
-    # Check if we actually got components
-    if not components:
-       logging.debug(f"No components found in BOM file: {file_path}")
-    else:
-        logging.debug(f"Successfully parsed {len(components)} components from {file_path}")
-        # Add a sample of the fields found
-        if components:
-            format_info["sample_fields"] = list(components[0].keys())
-    
-    return components, format_info
+    table, format_info = read_bom_table(file_path)
+    return list(table.records()), format_info
 
 
 def analyze_bom_data(components: List[Dict[str, Any]], format_info: Dict[str, Any]) -> Dict[str, Any]:
@@ -397,197 +284,7 @@ def analyze_bom_data(components: List[Dict[str, Any]], format_info: Dict[str, An
     Returns:
         Dictionary with analysis results
     """
-    logging.debug(f"Analyzing {len(components)} components")
-    
-    # Initialize results
-    results = {
-        "unique_component_count": 0,
-        "total_component_count": 0,
-        "categories": {},
-        "has_cost_data": False
-    }
-    
-    if not components:
-        return results
-    
-    # Try to convert to pandas DataFrame for easier analysis
-    try:
-        df = pd.DataFrame(components)
-        
-        # Clean up column names
-        df.columns = [str(col).strip().lower() for col in df.columns]
-        
-        # Try to identify key columns based on format
-        ref_col = None
-        value_col = None
-        quantity_col = None
-        footprint_col = None
-        cost_col = None
-        category_col = None
-        
-        # Check for reference designator column
-        for possible_col in ['reference', 'designator', 'references', 'designators', 'refdes', 'ref']:
-            if possible_col in df.columns:
-                ref_col = possible_col
-                break
-        
-        # Check for value column
-        for possible_col in ['value', 'component', 'comp', 'part', 'component value', 'comp value']:
-            if possible_col in df.columns:
-                value_col = possible_col
-                break
-        
-        # Check for quantity column
-        for possible_col in ['quantity', 'qty', 'count', 'amount']:
-            if possible_col in df.columns:
-                quantity_col = possible_col
-                break
-        
-        # Check for footprint column
-        for possible_col in ['footprint', 'package', 'pattern', 'pcb footprint']:
-            if possible_col in df.columns:
-                footprint_col = possible_col
-                break
-        
-        # Check for cost column
-        for possible_col in ['cost', 'price', 'unit price', 'unit cost', 'cost each']:
-            if possible_col in df.columns:
-                cost_col = possible_col
-                break
-        
-        # Check for category column
-        for possible_col in ['category', 'type', 'group', 'component type', 'lib']:
-            if possible_col in df.columns:
-                category_col = possible_col
-                break
-        
-        # Count total components
-        if quantity_col:
-            # Try to convert quantity to numeric
-            df[quantity_col] = pd.to_numeric(df[quantity_col], errors='coerce').fillna(1)
-            results["total_component_count"] = int(df[quantity_col].sum())
-        else:
-            # If no quantity column, assume each row is one component
-            results["total_component_count"] = len(df)
-        
-        # Count unique components
-        results["unique_component_count"] = len(df)
-        
-        # Calculate categories
-        if category_col:
-            # Use provided category column
-            categories = df[category_col].value_counts().to_dict()
-            results["categories"] = {str(k): int(v) for k, v in categories.items()}
-        elif footprint_col:
-            # Use footprint as category
-            categories = df[footprint_col].value_counts().to_dict()
-            results["categories"] = {str(k): int(v) for k, v in categories.items()}
-        elif ref_col:
-            # Try to extract categories from reference designators (R=resistor, C=capacitor, etc.)
-            def extract_prefix(ref):
-                if isinstance(ref, str):
-                    import re
-                    match = re.match(r'^([A-Za-z]+)', ref)
-                    if match:
-                        return match.group(1)
-                return "Other"
-            
-            if isinstance(df[ref_col].iloc[0], str) and ',' in df[ref_col].iloc[0]:
-                # Multiple references in one cell
-                all_refs = []
-                for refs in df[ref_col]:
-                    all_refs.extend([r.strip() for r in refs.split(',')])
-                
-                categories = {}
-                for ref in all_refs:
-                    prefix = extract_prefix(ref)
-                    categories[prefix] = categories.get(prefix, 0) + 1
-                
-                results["categories"] = categories
-            else:
-                # Single reference per row
-                categories = df[ref_col].apply(extract_prefix).value_counts().to_dict()
-                results["categories"] = {str(k): int(v) for k, v in categories.items()}
-        
-        # Map common reference prefixes to component types
-        category_mapping = {
-            'R': 'Resistors',
-            'C': 'Capacitors',
-            'L': 'Inductors',
-            'D': 'Diodes',
-            'Q': 'Transistors',
-            'U': 'ICs',
-            'SW': 'Switches',
-            'J': 'Connectors',
-            'K': 'Relays',
-            'Y': 'Crystals/Oscillators',
-            'F': 'Fuses',
-            'T': 'Transformers'
-        }
-        
-        mapped_categories = {}
-        for cat, count in results["categories"].items():
-            if cat in category_mapping:
-                mapped_name = category_mapping[cat]
-                mapped_categories[mapped_name] = mapped_categories.get(mapped_name, 0) + count
-            else:
-                mapped_categories[cat] = count
-        
-        results["categories"] = mapped_categories
-        
-        # Calculate cost if available
-        if cost_col:
-            try:
-                # Try to extract numeric values from cost field
-                df[cost_col] = df[cost_col].astype(str).str.replace('$', '').str.replace(',', '')
-                df[cost_col] = pd.to_numeric(df[cost_col], errors='coerce')
-                
-                # Remove NaN values
-                df_with_cost = df.dropna(subset=[cost_col])
-                
-                if not df_with_cost.empty:
-                    results["has_cost_data"] = True
-                    
-                    if quantity_col:
-                        total_cost = (df_with_cost[cost_col] * df_with_cost[quantity_col]).sum()
-                    else:
-                        total_cost = df_with_cost[cost_col].sum()
-                    
-                    results["total_cost"] = round(float(total_cost), 2)
-                    
-                    # Try to determine currency
-                    # Check first row that has cost for currency symbols
-                    for _, row in df.iterrows():
-                        cost_str = str(row.get(cost_col, ''))
-                        if '$' in cost_str:
-                            results["currency"] = "USD"
-                            break
-                        elif '€' in cost_str:
-                            results["currency"] = "EUR"
-                            break
-                        elif '£' in cost_str:
-                            results["currency"] = "GBP"
-                            break
-                    
-                    if "currency" not in results:
-                        results["currency"] = "USD"  # Default
-            except:
-                print("Failed to parse cost data")
-        
-        # Add extra insights
-        if ref_col and value_col:
-            # Check for common components by value
-            value_counts = df[value_col].value_counts()
-            most_common = value_counts.head(5).to_dict()
-            results["most_common_values"] = {str(k): int(v) for k, v in most_common.items()}
-    
-    except Exception as e:
-        logging.debug(f"Error analyzing BOM data: {str(e)}", exc_info=True)
-        # Fallback to basic analysis
-        results["unique_component_count"] = len(components)
-        results["total_component_count"] = len(components)
-    
-    return results
+    return analyze_bom_table(BomTable().extend(components))
 
 
 async def export_bom_with_cli(schematic_file: str, output_dir: str, project_name: str, ctx: Context) -> Dict[str, Any]:
@@ -602,91 +299,35 @@ async def export_bom_with_cli(schematic_file: str, output_dir: str, project_name
     Returns:
         Dictionary with export results
     """
-    import subprocess
-    import platform
-    
-    system = platform.system()
-    logging.debug(f"Exporting BOM using CLI tools on {system}")
+    logging.debug("Exporting BOM using CLI tools")
     await ctx.report_progress(40, 100)
     
     # Output file path
     output_file = os.path.join(output_dir, f"{project_name}_bom.csv")
     
-    # Define the command based on operating system
-    if system == "Darwin":  # macOS
-        from kicad_mcp.config import KICAD_APP_PATH
-        
-        # Path to KiCad command-line tools on macOS
-        kicad_cli = os.path.join(KICAD_APP_PATH, "Contents/MacOS/kicad-cli")
-        
-        if not os.path.exists(kicad_cli):
-            return {
-                "success": False,
-                "error": f"KiCad CLI tool not found at {kicad_cli}",
-                "schematic_file": schematic_file
-            }
-        
-        # Command to generate BOM
-        cmd = [
-            kicad_cli,
-            "sch",
-            "export",
-            "bom",
-            "--output", output_file,
-            schematic_file
-        ]
-    
-    elif system == "Windows":
-        from kicad_mcp.config import KICAD_APP_PATH
-        
-        # Path to KiCad command-line tools on Windows
-        test_kicad_cli = os.path.join(KICAD_APP_PATH, "bin", "kicad-cli.exe")
-        kicad_cli = os.path.normpath(test_kicad_cli)
-        
-        if not os.path.exists(kicad_cli):
-            return {
-                "success": False,
-                "error": f"KiCad CLI tool not found at {kicad_cli}",
-                "schematic_file": schematic_file
-            }
-        
-        # Command to generate BOM
-        cmd = [
-            kicad_cli,
-            "sch",
-            "export",
-            "bom",
-            "--output", output_file,
-            schematic_file
-        ]
-    
-    elif system == "Linux":
-        # Assume kicad-cli is in the PATH
-        kicad_cli = "kicad-cli"
-        
-        # Command to generate BOM
-        cmd = [
-            kicad_cli,
-            "sch",
-            "export",
-            "bom",
-            "--output", output_file,
-            schematic_file
-        ]
-    
-    else:
+    kicad_cli = find_kicad_cli()
+    if not kicad_cli:
         return {
             "success": False,
-            "error": f"Unsupported operating system: {system}",
+            "error": "KiCad CLI tool not found",
             "schematic_file": schematic_file
         }
     
+    # Command to generate BOM
+    cmd = [
+        "sch",
+        "export",
+        "bom",
+        "--output", output_file,
+        schematic_file
+    ]
+    
     try:
-        logging.debug(f"Running command: {' '.join(cmd)}")
+        logging.debug(f"Running command: {kicad_cli} {' '.join(cmd)}")
         await ctx.report_progress(60, 100)
         
         # Run the command
-        process = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        process = await run_kicad_cli(cmd, ctx, timeout=30, kicad_cli=kicad_cli)
         
         # Check if the command was successful
         if process.returncode != 0:
@@ -697,7 +338,7 @@ async def export_bom_with_cli(schematic_file: str, output_dir: str, project_name
                 "success": False,
                 "error": f"BOM export command failed: {process.stderr}",
                 "schematic_file": schematic_file,
-                "command": ' '.join(cmd)
+                "command": ' '.join([kicad_cli] + cmd)
             }
         
         # Check if the output file was created
@@ -731,7 +372,7 @@ async def export_bom_with_cli(schematic_file: str, output_dir: str, project_name
             "message": "BOM exported successfully"
         }
     
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         logging.debug("BOM export command timed out after 30 seconds")
         return {
             "success": False,
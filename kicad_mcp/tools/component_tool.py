@@ -17,14 +17,8 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-from kicad_mcp.utils.kicad_bridge import KiCadBridge
+from kicad_mcp.utils.kicad_bridge import get_kicad_bridge
 
-try:
-    kicad_subprocess = KiCadBridge()
-    logger.info("KiCadBridge initialized successfully")
-except Exception as e:
-    logger.error(f"Failed to initialize KiCadBridge: {e}")
-    kicad_subprocess = None
 
 def register_component_tools(mcp: FastMCP) -> None:
     """Register component placement tools using direct pcbnew API."""
@@ -54,7 +48,7 @@ def register_component_tools(mcp: FastMCP) -> None:
         try:
             ctx.info("Starting board load operation...")
             
-            result = kicad_subprocess.load_board(pcb_path)
+            result = get_kicad_bridge().load_board(pcb_path)
 
             await ctx.report_progress(100, 100)
             
@@ -121,7 +115,7 @@ def register_component_tools(mcp: FastMCP) -> None:
         
         try:
             
-            result = kicad_subprocess.place_component(
+            result = get_kicad_bridge().place_component(
                 project_path=pcb_path,
                 component_id=component_id,
                 position=position,
@@ -195,7 +189,7 @@ def register_component_tools(mcp: FastMCP) -> None:
             if rotation is not None and not isinstance(rotation, (int, float)):
                 raise ValueError("Rotation must be a number")
             
-            result = kicad_subprocess.move_component(
+            result = get_kicad_bridge().move_component(
                 project_path=pcb_path,
                 reference=reference,
                 position=position,
@@ -219,9 +213,66 @@ def register_component_tools(mcp: FastMCP) -> None:
             return {"success": False, "error": error_msg, "reference": reference}
 
 
+    @mcp.tool()
+    async def apply_board_edits(
+        project_path: str,
+        operations: List[Dict[str, Any]],
+        output_path: Optional[str] = None,
+        ctx: Context = None
+    ) -> Dict[str, Any]:
+        """Apply many place/move/rotate/route edits to the PCB and save once.
+
+        Operations are applied in order to one in-memory board. If any of them
+        fails, nothing is saved and the PCB file is left unchanged.
+
+        Args:
+            project_path: Path to the .kicad_pro file
+            operations: Ordered list of operation dicts, each with an "op" key:
+                - {"op": "place", "component_id", "library", "position", "reference"?, "value"?, "rotation"?, "layer"?}
+                - {"op": "move", "reference", "position", "rotation"?}
+                - {"op": "rotate", "reference", "rotation", "relative"?}
+                - {"op": "route", "start", "end", "width", "net", "layer"?}
+            output_path: Optional output path for saving
+
+        Returns:
+            Dict with success status and one result per operation
+        """
+        if (err := ensure_kicad_ready()):
+            return err
+
+        if not isinstance(operations, list) or not operations:
+            return {"success": False, "error": "Operations must be a non-empty list"}
+
+        pcb_path = resolve_pcb_path(project_path)
+        logger.info(f"Applying {len(operations)} board edits to {pcb_path}")
+
+        try:
+            result = get_kicad_bridge().apply_transaction(
+                project_path=pcb_path,
+                operations=operations,
+                output_path=output_path
+            )
+
+            if ctx:
+                await ctx.report_progress(100, 100)
+                if result.get("success"):
+                    await ctx.info(f"Applied {len(operations)} edits and saved the board")
+                else:
+                    await ctx.error(f"Board edits rolled back: {result.get('error')}")
+
+            return result
+
+        except Exception as e:
+            error_msg = f"Error applying board edits: {str(e)}"
+            if ctx:
+                await ctx.error(error_msg)
+            logger.error(error_msg)
+            return {"success": False, "error": error_msg}
+
+
     def ensure_kicad_ready() -> Optional[Dict[str, Any]]:
         """Check if KiCadBridge is available."""
-        if kicad_subprocess is None:
+        if get_kicad_bridge() is None:
             return {"success": False, "error": "KiCadBridge not initialized"}
         return None
     
@@ -12,7 +12,11 @@ logging.basicConfig(
     ]
 )
 
-from kicad_mcp.utils.create_foodprint_symbol_utils import *
+
+def _library_utils():
+    """Import the library helpers (sexpdata, PyPDF2) on first use, not at server start."""
+    from kicad_mcp.utils import create_foodprint_symbol_utils
+    return create_foodprint_symbol_utils
 
 def register_footprint_symbol_tools(mcp: FastMCP) -> None:
     """
@@ -41,7 +45,7 @@ def register_footprint_symbol_tools(mcp: FastMCP) -> None:
         """
 
         logging.info("Executing list_pdfs tool...")
-        return find_pdfs()
+        return _library_utils().find_pdfs()
 
     @mcp.tool()
     def save_footprint_mod(mod_data: str, footprint_name: str, lib_name: str) -> Dict[str, Any]:
@@ -57,7 +61,7 @@ def register_footprint_symbol_tools(mcp: FastMCP) -> None:
             A dictionary with a success flag: { "success": True } or { "success": False }
         """
 
-        return save_kicad_footprint(mod_data, footprint_name, lib_name)
+        return _library_utils().save_kicad_footprint(mod_data, footprint_name, lib_name)
 
 
     @mcp.tool()
@@ -79,7 +83,7 @@ def register_footprint_symbol_tools(mcp: FastMCP) -> None:
 
         type = "footprint" #differentiate between footprint and symbol
 
-        return save_kicad_footprint_symbol_to_table(lib_name, description, type)
+        return _library_utils().save_kicad_footprint_symbol_to_table(lib_name, description, type)
     
 
     @mcp.tool()
@@ -95,7 +99,7 @@ def register_footprint_symbol_tools(mcp: FastMCP) -> None:
         Returns:
             A dictionary with a success flag.
         """
-        return save_kicad_symbol(file_data, symbol_name, lib_name)
+        return _library_utils().save_kicad_symbol(file_data, symbol_name, lib_name)
 
     @mcp.tool()
     def add_symbol_to_Lib(lib_name: str, description: str) -> Dict[str, Any]:
@@ -115,7 +119,7 @@ def register_footprint_symbol_tools(mcp: FastMCP) -> None:
 
         type = "symbol" #differentiate between footprint and symbol
 
-        return save_kicad_footprint_symbol_to_table(lib_name, description, type)
+        return _library_utils().save_kicad_footprint_symbol_to_table(lib_name, description, type)
     
     
     
@@ -134,7 +138,7 @@ def register_footprint_symbol_tools(mcp: FastMCP) -> None:
             A dictionary containing validation status and any errors or warnings.
             
         """
-        return validate_kicad_symbol(symbol_content)
+        return _library_utils().validate_kicad_symbol(symbol_content)
     
 
     @mcp.tool()
@@ -150,7 +154,7 @@ def register_footprint_symbol_tools(mcp: FastMCP) -> None:
         Returns:
             A dictionary with validation results.
         """
-        return validate_kicad_footprint(footprint_content)
+        return _library_utils().validate_kicad_footprint(footprint_content)
     
 
     @mcp.tool()
@@ -167,7 +171,7 @@ def register_footprint_symbol_tools(mcp: FastMCP) -> None:
                             including a message and optionally an error detail.
         """
 
-        return accessFiles(content, filename, filetype)
+        return _library_utils().accessFiles(content, filename, filetype)
     
 
     @mcp.tool()
@@ -183,7 +187,7 @@ def register_footprint_symbol_tools(mcp: FastMCP) -> None:
             Dict[str, Any]: A dictionary containing the success status and either
                             the file content or an error message.
         """
-        return readFileContent(filename, filetype)
+        return _library_utils().readFileContent(filename, filetype)
     
     @mcp.tool()
     def make_pdf_smaller(input_pdf_path: str, output_dir: str, pages_per_split: int, filename: str) -> Dict[str, Any]:
@@ -198,5 +202,5 @@ def register_footprint_symbol_tools(mcp: FastMCP) -> None:
         Returns:
             Dict
         """
-        return split_pdf(input_pdf_path, output_dir, pages_per_split, filename)
+        return _library_utils().split_pdf(input_pdf_path, output_dir, pages_per_split, filename)
 
@@ -3,19 +3,19 @@ Design Rule Check (DRC) implementation using KiCad command-line interface.
 """
 import os
 import json
-import subprocess
+import asyncio
 import tempfile
 from typing import Dict, Any, Optional
 from mcp.server.fastmcp import Context
 
-from kicad_mcp.config import system
+from kicad_mcp.utils.kicad_cli import find_kicad_cli, run_kicad_cli
 
-async def run_drc_via_cli(pcb_file: str, ctx: Context) -> Dict[str, Any]:
+async def run_drc_via_cli(pcb_file: str, ctx: Optional[Context] = None) -> Dict[str, Any]:
     """Run DRC using KiCad command line tools.
     
     Args:
         pcb_file: Path to the PCB file (.kicad_pcb)
-        ctx: MCP context for progress reporting
+        ctx: MCP context for progress reporting (optional)
         
     Returns:
         Dictionary with DRC results
@@ -33,9 +33,7 @@ async def run_drc_via_cli(pcb_file: str, ctx: Context) -> Dict[str, Any]:
             output_file = os.path.join(temp_dir, "drc_report.json")
             
             # Find kicad-cli executable
-            #kicad_cli = find_kicad_cli()
-            from kicad_mcp.config import KICAD_APP_PATH
-            kicad_cli = os.path.join(KICAD_APP_PATH, "bin", "kicad-cli.exe")
+            kicad_cli = find_kicad_cli()
             
             if not kicad_cli:
                 print("kicad-cli not found in PATH or common installation locations")
@@ -43,12 +41,12 @@ async def run_drc_via_cli(pcb_file: str, ctx: Context) -> Dict[str, Any]:
                 return results
             
             # Report progress 
-            await ctx.report_progress(50, 100)
-            ctx.info("Running DRC using KiCad CLI...")
+            if ctx:
+                await ctx.report_progress(50, 100)
+                await ctx.info("Running DRC using KiCad CLI...")
             
             # Build the DRC command
             cmd = [
-                kicad_cli, 
                 "pcb", 
                 "drc",
                 "--format", "json",
@@ -56,8 +54,11 @@ async def run_drc_via_cli(pcb_file: str, ctx: Context) -> Dict[str, Any]:
                 pcb_file
             ]
             
-            #print(f"Running command: {' '.join(cmd)}")
-            process = subprocess.run(cmd, capture_output=True, text=True)
+            try:
+                process = await run_kicad_cli(cmd, ctx, kicad_cli=kicad_cli)
+            except asyncio.TimeoutError:
+                results["error"] = "DRC command timed out"
+                return results
             
             # Check if the command was successful
             if process.returncode != 0:
@@ -85,8 +86,9 @@ async def run_drc_via_cli(pcb_file: str, ctx: Context) -> Dict[str, Any]:
             violations = drc_report.get("violations", [])
             violation_count = len(violations)
             #print(f"DRC completed with {violation_count} violations")
-            await ctx.report_progress(70, 100)
-            ctx.info(f"DRC completed with {violation_count} violations")
+            if ctx:
+                await ctx.report_progress(70, 100)
+                await ctx.info(f"DRC completed with {violation_count} violations")
             
             # Categorize violations by type
             error_types = {}
@@ -106,7 +108,8 @@ async def run_drc_via_cli(pcb_file: str, ctx: Context) -> Dict[str, Any]:
                 "violations": violations
             }
             
-            await ctx.report_progress(90, 100)
+            if ctx:
+                await ctx.report_progress(90, 100)
             return results
             
     except Exception as e:
@@ -114,55 +117,3 @@ async def run_drc_via_cli(pcb_file: str, ctx: Context) -> Dict[str, Any]:
         results["error"] = f"Error in CLI DRC: {str(e)}"
         return results
 
-
-def find_kicad_cli() -> Optional[str]:
-    """Find the kicad-cli executable in the system PATH.
-    
-    Returns:
-        Path to kicad-cli if found, None otherwise
-    """
-    # Check if kicad-cli is in PATH
-    try:
-        if system == "Windows": 
-            # On Windows, check for kicad-cli.exe
-            result = subprocess.run(["where", "kicad-cli.exe"], capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip().split("\n")[0]
-        else:
-            # On Unix-like systems, use which
-            result = subprocess.run(["which", "kicad-cli"], capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip()
-    
-    except Exception as e:
-        print(f"Error finding kicad-cli: {str(e)}")
-    
-    # If we get here, kicad-cli is not in PATH
-    # Try common installation locations
-    if system == "Windows":
-        # Common Windows installation path
-        potential_paths = [
-            r"C:\Program Files\KiCad\bin\kicad-cli.exe",
-            r"C:\Program Files (x86)\KiCad\bin\kicad-cli.exe"
-        ]
-    elif system == "Darwin":  # macOS
-        # Common macOS installation paths
-        potential_paths = [
-            "/Applications/KiCad/KiCad.app/Contents/MacOS/kicad-cli",
-            "/Applications/KiCad/kicad-cli"
-        ]
-    else:  # Linux and other Unix-like systems
-        # Common Linux installation paths
-        potential_paths = [
-            "/usr/bin/kicad-cli",
-            "/usr/local/bin/kicad-cli",
-            "/opt/kicad/bin/kicad-cli"
-        ]
-    
-    # Check each potential path
-    for path in potential_paths:
-        if os.path.exists(path) and os.access(path, os.X_OK):
-            return path
-    
-    # If still not found, return None
-    return None
@@ -7,10 +7,9 @@ from typing import Dict, Any
 from mcp.server.fastmcp import FastMCP, Context
 
 from kicad_mcp.utils.file_utils import get_project_files
-from kicad_mcp.utils.drc_history import save_drc_result, get_drc_history, compare_with_previous
+from kicad_mcp.utils.drc_history import save_drc_result, get_drc_history, compare_with_previous, is_latest_run
 
-# Import implementations
-from kicad_mcp.tools.drc_impl.cli_drc import run_drc_via_cli
+from kicad_mcp.utils.drc_store import get_drc_results
 
 def register_drc_tools(mcp: FastMCP) -> None:
     """Register DRC tools with the MCP server.
@@ -63,12 +62,16 @@ def register_drc_tools(mcp: FastMCP) -> None:
         }
     
     @mcp.tool()
-    async def run_drc_check(project_path: str, ctx: Context) -> Dict[str, Any]:
+    async def run_drc_check(project_path: str, ctx: Context, force: bool = False) -> Dict[str, Any]:
         """Run a Design Rule Check on a KiCad PCB file.
         
+        The result is stored per board content; checking an unchanged board
+        returns the stored result without running DRC again.
+        
         Args:
             project_path: Path to the KiCad project file (.kicad_pro)
             ctx: MCP context for progress reporting
+            force: Run DRC even if the board has not changed since the last check
             
         Returns:
             Dictionary with DRC results and statistics
@@ -90,34 +93,37 @@ def register_drc_tools(mcp: FastMCP) -> None:
         
         # Report progress to user
         await ctx.report_progress(10, 100)
-        ctx.info(f"Starting DRC check on {os.path.basename(pcb_file)}")
+        await ctx.info(f"Starting DRC check on {os.path.basename(pcb_file)}")
         
         # Run DRC using the appropriate approach
         drc_results = None
         
         #print("Using kicad-cli for DRC")
-        ctx.info("Using KiCad CLI for DRC check...")
+        await ctx.info("Using KiCad CLI for DRC check...")
         # logging.info(f"[DRC] Calling run_drc_via_cli for {pcb_file}") # <-- Remove log
-        drc_results = await run_drc_via_cli(pcb_file, ctx)
+        drc_results = await get_drc_results(pcb_file, ctx, project_path, force=force)
         # logging.info(f"[DRC] run_drc_via_cli finished for {pcb_file}") # <-- Remove log
         
         # Process and save results if successful
         if drc_results and drc_results.get("success", False):
             # logging.info(f"[DRC] DRC check successful for {pcb_file}. Saving results.") # <-- Remove log
-            # Save results to history
-            save_drc_result(project_path, drc_results)
-            
-            # Add comparison with previous run
+            # Compare with the previous run before this one is added to the history
             comparison = compare_with_previous(project_path, drc_results)
+            
+            # Save results to history, also when served from the store (e.g. a board
+            # reverted to an earlier state); only a repeat of the latest run is skipped
+            if not is_latest_run(project_path, drc_results):
+                save_drc_result(project_path, drc_results)
+            
             if comparison:
                 drc_results["comparison"] = comparison
                 
                 if comparison["change"] < 0:
-                    ctx.info(f"Great progress! You've fixed {abs(comparison['change'])} DRC violations since the last check.")
+                    await ctx.info(f"Great progress! You've fixed {abs(comparison['change'])} DRC violations since the last check.")
                 elif comparison["change"] > 0:
-                    ctx.info(f"Found {comparison['change']} new DRC violations since the last check.")
+                    await ctx.info(f"Found {comparison['change']} new DRC violations since the last check.")
                 else:
-                    ctx.info(f"No change in the number of DRC violations since the last check.")
+                    await ctx.info(f"No change in the number of DRC violations since the last check.")
         elif drc_results:
              # logging.warning(f"[DRC] DRC check reported failure for {pcb_file}: {drc_results.get('error')}") # <-- Remove log
              # Pass or print a warning if needed
@@ -3,16 +3,15 @@ Export tools for KiCad projects.
 """
 import os
 import tempfile
-import subprocess
-import shutil
 import asyncio
 from typing import Dict, Any, Optional
 from mcp.server.fastmcp import FastMCP, Context, Image
 from pydantic import BaseModel
 
 
+from kicad_mcp.context import THUMBNAIL_KEY_PREFIX
 from kicad_mcp.utils.file_utils import get_project_files
-from kicad_mcp.config import KICAD_APP_PATH, system
+from kicad_mcp.utils.kicad_cli import find_kicad_cli, run_kicad_cli
 
 class ImageWrapper(BaseModel):
     image: Image
@@ -62,7 +61,7 @@ def register_export_tools(mcp: FastMCP) -> None:
             #print(f"Found PCB file: {pcb_file}")
 
             # Check cache
-            cache_key = f"thumbnail_cli_{pcb_file}_{os.path.getmtime(pcb_file)}"
+            cache_key = f"{THUMBNAIL_KEY_PREFIX}{pcb_file}_{os.path.getmtime(pcb_file)}"
             if hasattr(app_context, 'cache') and cache_key in app_context.cache:
                 print(f"Using cached CLI thumbnail for {pcb_file}")
                 return app_context.cache[cache_key]
@@ -125,35 +124,9 @@ async def generate_thumbnail_with_cli(pcb_file: str, ctx: Context) -> Optional[I
         output_file = os.path.join(project_dir, f"{project_name}_thumbnail.svg")
         # --------------------------- 
 
-        # Check for required command-line tools based on OS
-        kicad_cli = None
-        if system == "Darwin":  # macOS
-            kicad_cli_path = os.path.join(KICAD_APP_PATH, "Contents/MacOS/kicad-cli")
-            if os.path.exists(kicad_cli_path):
-                 kicad_cli = kicad_cli_path
-            elif shutil.which("kicad-cli") is not None:
-                kicad_cli = "kicad-cli"  # Try to use from PATH
-            else:
-                print(f"kicad-cli not found at {kicad_cli_path} or in PATH")
-                return None
-        elif system == "Windows":
-            kicad_cli_path = os.path.join(KICAD_APP_PATH, "bin", "kicad-cli.exe")
-            if os.path.exists(kicad_cli_path):
-                 kicad_cli = kicad_cli_path
-            elif shutil.which("kicad-cli.exe") is not None:
-                 kicad_cli = "kicad-cli.exe"
-            elif shutil.which("kicad-cli") is not None:
-                kicad_cli = "kicad-cli"  # Try to use from PATH (without .exe)
-            else:
-                print(f"kicad-cli not found at {kicad_cli_path} or in PATH")
-                return None
-        elif system == "Linux":
-            kicad_cli = shutil.which("kicad-cli")
-            if not kicad_cli:
-                print("kicad-cli not found in PATH")
-                return None
-        else:
-            print(f"Unsupported operating system: {system}")
+        kicad_cli = find_kicad_cli()
+        if not kicad_cli:
+            print("kicad-cli not found in the KiCad installation or in PATH")
             return None
 
         await ctx.report_progress(30, 100)
@@ -161,7 +134,6 @@ async def generate_thumbnail_with_cli(pcb_file: str, ctx: Context) -> Optional[I
 
         # Build command for generating SVG from PCB using kicad-cli (changed from PNG)
         cmd = [
-            kicad_cli,
             "pcb",
             "export",
             "svg", # <-- Changed format to svg
@@ -176,7 +148,13 @@ async def generate_thumbnail_with_cli(pcb_file: str, ctx: Context) -> Optional[I
 
         # Run the command
         try:
-            process = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
+            process = await run_kicad_cli(cmd, ctx, timeout=30, kicad_cli=kicad_cli)
+            if process.returncode != 0:
+                print(f"Command '{' '.join(cmd)}' failed with code {process.returncode}")
+                print(f"Stderr: {process.stderr}")
+                print(f"Stdout: {process.stdout}")
+                await ctx.info(f"KiCad CLI command failed: {process.stderr or process.stdout}")
+                return None
             print(f"Command successful: {process.stdout}")
 
             await ctx.report_progress(70, 100)
@@ -196,13 +174,7 @@ async def generate_thumbnail_with_cli(pcb_file: str, ctx: Context) -> Optional[I
             await ctx.info(f"Thumbnail saved to: {output_file}")
             return Image(data=img_data, format="svg") # <-- Changed format to svg
 
-        except subprocess.CalledProcessError as e:
-            print(f"Command '{' '.join(e.cmd)}' failed with code {e.returncode}")
-            print(f"Stderr: {e.stderr}")
-            print(f"Stdout: {e.stdout}")
-            await ctx.info(f"KiCad CLI command failed: {e.stderr or e.stdout}")
-            return None
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             print(f"Command timed out after 30 seconds: {' '.join(cmd)}")
             await ctx.info("KiCad CLI command timed out")
             return None
@@ -2,11 +2,88 @@
 Netlist extraction and analysis tools for KiCad schematics.
 """
 import os
-from typing import Dict, Any
+import asyncio
+from typing import Dict, Any, List, Optional
 from mcp.server.fastmcp import FastMCP, Context
 
 from kicad_mcp.utils.file_utils import get_project_files
-from kicad_mcp.utils.netlist_parser import extract_netlist, analyze_netlist
+from kicad_mcp.utils.kicad_utils import get_project_name_from_path
+from kicad_mcp.utils.list_snapshots import FilterFields, get_page
+from kicad_mcp.utils.netlist_index import get_netlist_index
+from kicad_mcp.utils.netlist_parser import extract_netlist, analyze_netlist, schematic_disk_cache
+from kicad_mcp.utils.parse_cache import get_parse_cache
+from kicad_mcp.utils.project_netlist import resolve_project_netlist
+
+# Item values matched by the "net" and "reference" filters of each section
+NETLIST_FILTERS: Dict[str, FilterFields] = {
+    "components": {
+        "net": lambda component: component.get("nets", ()),
+        "reference": lambda component: (component.get("reference"),),
+    },
+    "nets": {
+        "net": lambda net: (net["name"],),
+        "reference": lambda net: [pin.get("component") for pin in net["pins"]],
+    },
+}
+
+
+def _netlist_items(netlist: Dict[str, Any], section: str) -> List[Dict[str, Any]]:
+    """List the components (with the nets they are on) or the nets of a netlist."""
+    if section == "nets":
+        return [{"name": name, "pins": pins} for name, pins in netlist["nets"].items()]
+
+    component_nets: Dict[str, set] = {}
+    for name, pins in netlist["nets"].items():
+        for pin in pins:
+            component_nets.setdefault(pin.get("component"), set()).add(name)
+    return [
+        dict(component, reference=reference, nets=sorted(component_nets.get(reference, ())))
+        for reference, component in netlist["components"].items()
+    ]
+
+
+def _merge_sheet_netlists(schematic_paths: List[str]) -> Dict[str, Any]:
+    """Merge the netlists of separate sheets by component reference and net name.
+
+    Used when a project has no root schematic to follow the hierarchy from.
+    """
+    all_components = {}
+    all_nets = {}
+    placed_units = set()
+    duplicates = []
+
+    for schematic_path in schematic_paths:
+        result = extract_netlist(schematic_path)
+        if "error" in result:
+            return {"error": f"Failed to extract netlist from {schematic_path}: {result['error']}"}
+
+        for ref, comp in result.get("components", {}).items():
+            # Units of one multi-unit symbol may sit on different sheets
+            unit = (ref, comp.get("unit", 1))
+            if unit in placed_units:
+                # Duplicate reference in several schematics: the first occurrence is kept
+                duplicates.append(ref)
+                continue
+            placed_units.add(unit)
+            all_components.setdefault(ref, comp)
+
+        for net_name, pins in result.get("nets", {}).items():
+            if net_name not in all_nets:
+                # Copy: the parsed pin lists are shared through the parse cache
+                all_nets[net_name] = list(pins)
+            else:
+                all_nets[net_name].extend(pins)
+
+    return {
+        "components": all_components,
+        "nets": all_nets,
+        "component_count": len(all_components),
+        "net_count": len(all_nets),
+        "duplicate_references": sorted(set(duplicates)),
+        "errors": [],
+        "files": [os.path.abspath(path) for path in schematic_paths],
+    }
+
 
 def register_netlist_tools(mcp: FastMCP) -> None:
     """Register netlist-related tools with the MCP server.
@@ -16,90 +93,103 @@ def register_netlist_tools(mcp: FastMCP) -> None:
     """
     
     @mcp.tool()
-    async def extract_schematic_netlist(schematic_path: str, ctx: Context) -> Dict[str, Any]:
+    async def extract_schematic_netlist(schematic_path: str, ctx: Context, section: str = "components",
+                                        fields: Optional[List[str]] = None,
+                                        filter: Optional[Dict[str, str]] = None,
+                                        limit: Optional[int] = None,
+                                        cursor: Optional[str] = None) -> Dict[str, Any]:
         """Extract netlist information from a KiCad schematic.
         
         This tool parses a KiCad schematic file and extracts comprehensive
         netlist information including components, connections, and labels.
+        Components or nets are returned one page at a time; later pages are
+        served from the first extraction.
         
         Args:
             schematic_path: Path to the KiCad schematic file (.kicad_sch)
             ctx: MCP context for progress reporting
+            section: List to page through, "components" (default) or "nets"
+            fields: Item keys to return, e.g. ["reference", "value", "nets"]
+            filter: "net" glob pattern and "reference" prefix, e.g. {"net": "GND"}
+            limit: Items per page (default 200, 0 for all)
+            cursor: "next_cursor" of the previous page
             
         Returns:
-            Dictionary with netlist information
+            Dictionary with netlist counts, analysis and a page of components or nets
         """
-        print(f"Extracting netlist from schematic: {schematic_path}")
-        
         if not os.path.exists(schematic_path):
-            ctx.info(f"Schematic file not found: {schematic_path}")
+            await ctx.info(f"Schematic file not found: {schematic_path}")
             return {"success": False, "error": f"Schematic file not found: {schematic_path}"}
+
+        if section not in NETLIST_FILTERS:
+            return {"success": False, "error": f"Unknown section '{section}', use 'components' or 'nets'"}
         
-        # Report progress
         await ctx.report_progress(10, 100)
-        ctx.info(f"Loading schematic file: {os.path.basename(schematic_path)}")
-        
-        # Extract netlist information
-        try:
-            await ctx.report_progress(20, 100)
-            ctx.info("Parsing schematic structure...")
-            
+        await ctx.info(f"Loading schematic file: {os.path.basename(schematic_path)}")
+
+        def build() -> Dict[str, Any]:
             netlist_data = extract_netlist(schematic_path)
-            
             if "error" in netlist_data:
-                ctx.info(f"Error extracting netlist: {netlist_data['error']}")
-                return {"success": False, "error": netlist_data['error']}
-            
-            await ctx.report_progress(60, 100)
-            ctx.info(f"Extracted {netlist_data['component_count']} components and {netlist_data['net_count']} nets")
-            
-            # Analyze the netlist
-            await ctx.report_progress(70, 100)
-            ctx.info("Analyzing netlist data...")
-            
-            analysis_results = analyze_netlist(netlist_data)
-            
-            await ctx.report_progress(90, 100)
-            
-            # Build result
-            result = {
-                "success": True,
+                return {"success": False, "error": netlist_data["error"]}
+            summary = {
                 "schematic_path": schematic_path,
                 "component_count": netlist_data["component_count"],
                 "net_count": netlist_data["net_count"],
-                "components": netlist_data["components"],
-                "nets": netlist_data["nets"],
-                "analysis": analysis_results
+                "analysis": analyze_netlist(netlist_data),
+                "section": section,
             }
-            
-            # Complete progress
+            return {"success": True, "summary": summary, "items": _netlist_items(netlist_data, section)}
+
+        try:
+            key = f"schematic_netlist:{section}:{os.path.normcase(os.path.abspath(schematic_path))}"
+            page = await asyncio.to_thread(get_page, key, [schematic_path], build, NETLIST_FILTERS[section],
+                                           filter, fields, limit, cursor)
+            if not page.get("success"):
+                await ctx.info(f"Error extracting netlist: {page.get('error')}")
+                return page
+
             await ctx.report_progress(100, 100)
-            ctx.info("Netlist extraction complete")
-            
-            return result
+            await ctx.info(f"Returning {page['page']['returned']} of {page['page']['total']} {section} "
+                           f"({page['component_count']} components, {page['net_count']} nets)")
+            return page
             
         except Exception as e:
-            ctx.info(f"Error extracting netlist: {str(e)}")
+            await ctx.info(f"Error extracting netlist: {str(e)}")
             return {"success": False, "error": str(e)}
 
     @mcp.tool()
-    async def extract_project_netlist(project_path: str, ctx: Context) -> Dict[str, Any]:
+    async def extract_project_netlist(project_path: str, ctx: Context, section: str = "components",
+                                      fields: Optional[List[str]] = None,
+                                      filter: Optional[Dict[str, str]] = None,
+                                      limit: Optional[int] = None,
+                                      cursor: Optional[str] = None) -> Dict[str, Any]:
         """Extract netlist from a KiCad project's schematic.
         
-        This tool finds the schematic associated with a KiCad project
-        and extracts its netlist information.
+        This tool finds the root schematic of a KiCad project, follows its
+        hierarchical sheets and returns one flat netlist. Reused sheets get
+        per-instance references and sheet pins are joined to the matching
+        hierarchical labels. Components or nets are returned one page at a
+        time; later pages are served from the first extraction.
         
         Args:
             project_path: Path to the KiCad project file (.kicad_pro)
             ctx: MCP context for progress reporting
+            section: List to page through, "components" (default) or "nets"
+            fields: Item keys to return, e.g. ["reference", "value", "nets"]
+            filter: "net" glob pattern and "reference" prefix, e.g. {"reference": "U"}
+            limit: Items per page (default 200, 0 for all)
+            cursor: "next_cursor" of the previous page
             
         Returns:
-            Dictionary with netlist information
+            Dictionary with netlist counts, hierarchy information and a page of components or nets
         """
         
         if not os.path.exists(project_path):
-            ctx.info(f"Project not found: {project_path}")
+            await ctx.info(f"Project not found: {project_path}")
             return {"success": False, "error": f"Project not found: {project_path}"}
+
+        if section not in NETLIST_FILTERS:
+            return {"success": False, "error": f"Unknown section '{section}', use 'components' or 'nets'"}
         
         # Report progress
         await ctx.report_progress(10, 100)
@@ -109,7 +199,7 @@ def register_netlist_tools(mcp: FastMCP) -> None:
             files = get_project_files(project_path)
             
             if "schematic" not in files:
-                ctx.info("Schematic file not found in project")
+                await ctx.info("Schematic file not found in project")
                 return {"success": False, "error": "Schematic file not found in project"}
             
             schematic_paths = files["schematic"]
@@ -117,47 +207,49 @@ def register_netlist_tools(mcp: FastMCP) -> None:
             if isinstance(schematic_paths, str):
                 schematic_paths = [schematic_paths]
             
-            all_components = {}
-            all_nets = {}
+            root_schematic = os.path.join(
+                os.path.dirname(project_path),
+                f"{get_project_name_from_path(project_path)}.kicad_sch"
+            )
 
-            # Extract netlist
-            await ctx.report_progress(20, 100)
+            def build() -> Dict[str, Any]:
+                if os.path.exists(root_schematic):
+                    # Sheets are parsed in a process pool
+                    netlist = resolve_project_netlist(root_schematic)
+                else:
+                    netlist = _merge_sheet_netlists(schematic_paths)
+                    if "error" in netlist:
+                        return {"success": False, "error": netlist["error"]}
+                summary = {key: value for key, value in netlist.items() if key not in ("components", "nets", "files")}
+                summary.update(project_path=project_path, section=section)
+                # Every sheet read, including sub-sheets in other directories, validates the snapshot
+                return {"success": True, "summary": summary, "items": _netlist_items(netlist, section),
+                        "files": netlist["files"]}
 
             await ctx.report_progress(20, 100)
-            ctx.info(f"Extracting netlist from {len(schematic_paths)} schematic file(s)...")
+            await ctx.info(f"Extracting netlist from {os.path.basename(root_schematic)}..."
+                           if os.path.exists(root_schematic)
+                           else f"Extracting netlist from {len(schematic_paths)} schematic file(s)...")
 
-            for schematic_path in schematic_paths:
-                ctx.info(f"Processing: {os.path.basename(schematic_path)}")
-                result = await extract_schematic_netlist(schematic_path, ctx)
-
-                if not result.get("success"):
-                    ctx.info(f"Error extracting netlist from {schematic_path}: {result.get('error', 'Unknown error')}")
-                    return {"success": False, "error": f"Failed to extract netlist from {schematic_path}: {result.get('error')}"}
-
-                for ref, comp in result.get("components", {}).items():
-                    if ref not in all_components:
-                        all_components[ref] = comp
-                    else:
-                        ctx.info(f"Duplicate component reference '{ref}' found in multiple schematics. Using first occurrence.")
-
-                # Merge nets
-                for net_name, pins in result.get("nets", {}).items():
-                    if net_name not in all_nets:
-                        all_nets[net_name] = pins
-                    else:
-                        all_nets[net_name].extend(pins)
+            key = f"project_netlist:{section}:{os.path.normcase(os.path.abspath(project_path))}"
+            # Keep the event loop free while the sheets are parsed
+            page = await asyncio.to_thread(get_page, key, [project_path, *schematic_paths], build,
+                                           NETLIST_FILTERS[section], filter, fields, limit, cursor)
+            if not page.get("success"):
+                await ctx.info(f"Error extracting project netlist: {page.get('error')}")
+                return page
 
-            await ctx.report_progress(100, 100)
+            if not cursor:
+                for error in page.get("errors", []):
+                    await ctx.info(f"{os.path.basename(error['file'])}: {error['error']}")
+                if page.get("duplicate_references"):
+                    await ctx.info(f"Duplicate component references: {', '.join(page['duplicate_references'])}")
 
-            return {
-                "success": True,
-                "project_path": project_path,
-                "components": all_components,
-                "nets": all_nets
-            }
+            await ctx.report_progress(100, 100)
+            return page
             
         except Exception as e:
-            ctx.info(f"Error extracting project netlist: {str(e)}")
+            await ctx.info(f"Error extracting project netlist: {str(e)}")
             return {"success": False, "error": str(e)}
 
     @mcp.tool()
@@ -336,8 +428,9 @@ def register_netlist_tools(mcp: FastMCP) -> None:
                 ctx.info("Finding connections...")
             
 
-                for net_name, pins in nets.items():
-                    # Check if any pin belongs to our component
+                for net_name in get_netlist_index(nets).nets_of(component_ref):
+                    pins = nets[net_name]
+                    # Pins of our component on this net
                     component_pins = []
                     for pin in pins:
                         if pin.get('component') == component_ref:
@@ -436,3 +529,16 @@ def register_netlist_tools(mcp: FastMCP) -> None:
 
 
 
+
+    @mcp.tool()
+    def get_netlist_cache_stats() -> Dict[str, Any]:
+        """Report hit/miss counters and size of the schematic parse caches.
+
+        Returns:
+            Dictionary with in-memory and on-disk cache statistics
+        """
+        return {
+            "success": True,
+            **get_parse_cache().stats(),
+            "disk": schematic_disk_cache.stats()
+        }
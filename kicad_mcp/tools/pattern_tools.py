@@ -2,21 +2,14 @@
 Circuit pattern recognition tools for KiCad schematics.
 """
 import os
+import asyncio
 from typing import Dict, List, Any, Optional
 from mcp.server.fastmcp import FastMCP, Context
 import logging
 
 from kicad_mcp.utils.file_utils import get_project_files
 from kicad_mcp.utils.netlist_parser import extract_netlist, analyze_netlist
-from kicad_mcp.utils.pattern_recognition import (
-    identify_power_supplies,
-    identify_amplifiers,
-    identify_filters,
-    identify_oscillators,
-    identify_digital_interfaces,
-    identify_microcontrollers,
-    identify_sensor_interfaces
-)
+from kicad_mcp.utils.pattern_executor import identify_all_patterns
 
 def register_pattern_tools(mcp: FastMCP) -> None:
     """Register circuit pattern recognition tools with the MCP server.
@@ -57,7 +50,7 @@ def register_pattern_tools(mcp: FastMCP) -> None:
             await ctx.report_progress(20, 100)
             ctx.info("Parsing schematic structure...")
             
-            netlist_data = extract_netlist(schematic_path)
+            netlist_data = await asyncio.to_thread(extract_netlist, schematic_path)
             logging.debug("Extracted Netlist")
             
             if "error" in netlist_data:
@@ -75,46 +68,13 @@ def register_pattern_tools(mcp: FastMCP) -> None:
             await ctx.report_progress(50, 100)
             ctx.info("Identifying circuit patterns...")
             
-            identified_patterns = {
-                "power_supply_circuits": [],
-                "amplifier_circuits": [],
-                "filter_circuits": [],
-                "oscillator_circuits": [],
-                "digital_interface_circuits": [],
-                "microcontroller_circuits": [],
-                "sensor_interface_circuits": [],
-                "other_patterns": []
-            }
+            # Run the identifiers concurrently; progress follows their completion
+            async def report_completion(category: str, finished: int, total: int) -> None:
+                logging.debug(f"Identified {category} ({finished}/{total})")
+                await ctx.report_progress(50 + 45 * finished // total, 100)
 
-            logging.debug("After identified patterns")
-            
-            # Identify power supply circuits
-            await ctx.report_progress(60, 100)
-            identified_patterns["power_supply_circuits"] = identify_power_supplies(components, nets)
-            
-            # Identify amplifier circuits
-            await ctx.report_progress(70, 100)
-            identified_patterns["amplifier_circuits"] = identify_amplifiers(components, nets)
-            
-            # Identify filter circuits
-            await ctx.report_progress(75, 100)
-            identified_patterns["filter_circuits"] = identify_filters(components, nets)
-            
-            # Identify oscillator circuits
-            await ctx.report_progress(80, 100)
-            identified_patterns["oscillator_circuits"] = identify_oscillators(components, nets)
-            
-            # Identify digital interface circuits
-            await ctx.report_progress(85, 100)
-            identified_patterns["digital_interface_circuits"] = identify_digital_interfaces(components, nets)
-            
-            # Identify microcontroller circuits
-            await ctx.report_progress(90, 100)
-            identified_patterns["microcontroller_circuits"] = identify_microcontrollers(components)
-            
-            # Identify sensor interface circuits
-            await ctx.report_progress(95, 100)
-            identified_patterns["sensor_interface_circuits"] = identify_sensor_interfaces(components, nets)
+            identified_patterns = await identify_all_patterns(components, nets, report_completion)
+            identified_patterns["other_patterns"] = []
             
             # Build result
             result = {
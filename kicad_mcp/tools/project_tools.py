@@ -8,6 +8,8 @@ from mcp.server.fastmcp import FastMCP
 
 from kicad_mcp.utils.kicad_utils import find_kicad_projects, open_kicad_project
 from kicad_mcp.utils.file_utils import get_project_files, load_project_json
+from kicad_mcp.utils.cache_registry import cache_registry
+from kicad_mcp.utils.file_watcher import get_file_watcher
 
 # Get PID for logging
 # _PID = os.getpid()
@@ -57,3 +59,16 @@ def register_project_tools(mcp: FastMCP) -> None:
     def open_project(project_path: str) -> Dict[str, Any]:
         """Open a KiCad project in KiCad."""
         return open_kicad_project(project_path)
+
+    @mcp.tool()
+    def get_cache_stats() -> Dict[str, Any]:
+        """Report the server's caches and the file watcher that invalidates them.
+
+        Returns:
+            Dictionary with per-cache statistics and invalidation counts
+        """
+        return {
+            "success": True,
+            "caches": cache_registry.stats(),
+            "watcher": get_file_watcher().stats()
+        }
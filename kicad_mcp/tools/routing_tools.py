@@ -6,14 +6,8 @@ from typing import Dict, List, Any, Optional
 import asyncio
 
 
-from kicad_mcp.utils.kicad_bridge import KiCadBridge
+from kicad_mcp.utils.kicad_bridge import get_kicad_bridge
 
-try:
-    kicad_subprocess = KiCadBridge()
-    logging.info("KiCadBridge initialized successfully")
-except Exception as e:
-    logging.error(f"Failed to initialize KiCadBridge: {e}")
-    kicad_subprocess = None
 
 def register_routing_tools(mcp: FastMCP) -> None:
     """
@@ -46,7 +40,7 @@ def register_routing_tools(mcp: FastMCP) -> None:
         try:
             logging.info("Starting load net operation...")
             
-            result = kicad_subprocess.get_net_pcb(pcb_path)
+            result = get_kicad_bridge().get_net_pcb(pcb_path)
             
             if result.get("success"):
                 logging.info("Nets extracted successfully")
@@ -102,7 +96,7 @@ def register_routing_tools(mcp: FastMCP) -> None:
             logging.info("Starting routing operation...")
 
             # Route each track
-            result = kicad_subprocess.track_pcb_routes(pcb_path, routes)
+            result = get_kicad_bridge().track_pcb_routes(pcb_path, routes)
 
             if result.get("success"):
                 logging.info(f"Routes placed successfully: {routes}")
@@ -134,7 +128,7 @@ def register_routing_tools(mcp: FastMCP) -> None:
      
     def ensure_kicad_ready() -> Optional[Dict[str, Any]]:
         """Check if KiCadBridge is available."""
-        if kicad_subprocess is None:
+        if get_kicad_bridge() is None:
             return {"success": False, "error": "KiCadBridge not initialized"}
         return None
     
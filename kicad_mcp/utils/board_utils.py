@@ -4,9 +4,12 @@ Board-related utility functions for KiCad operations.
 import os
 import sys
 import logging
-from typing import Dict, Any, Optional, Tuple
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
+from .geometry_columns import GEOMETRY_KINDS, encode_columns, new_columns
+
 try:
     import pcbnew
     PCBNEW_AVAILABLE = True
@@ -14,12 +17,120 @@ except ImportError:
     PCBNEW_AVAILABLE = False
     pcbnew = None
 
+# Memory ceiling for cached boards, in MB
+DEFAULT_BOARD_CACHE_MB = 512
+
+# A loaded BOARD takes roughly this many times its .kicad_pcb file size in memory
+BOARD_MEMORY_FACTOR = 8
+
+# Largest board (in pads) returned with per-pad connected_items lists
+MAX_NESTED_PADS = 2000
+
+
+@dataclass
+class CachedBoard:
+    """A loaded board together with the file state it was loaded from."""
+    board: Any
+    mtime_ns: int
+    size: int
+    cost: int
+
+
+def _cache_key(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+class BoardCache:
+    """LRU cache of loaded boards keyed by path and validated by mtime and size.
+
+    The memory ceiling is enforced on an estimate of each board's in-memory
+    size (file size times BOARD_MEMORY_FACTOR).
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        if max_bytes is None:
+            try:
+                max_mb = int(os.environ.get("KICAD_MCP_BOARD_CACHE_MB", DEFAULT_BOARD_CACHE_MB))
+            except ValueError:
+                max_mb = DEFAULT_BOARD_CACHE_MB
+            max_bytes = max_mb * 1024 * 1024
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[str, CachedBoard]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: str) -> Optional[Any]:
+        """Return the cached board if the file is unchanged on disk."""
+        key = _cache_key(path)
+        entry = self.entries.get(key)
+        if entry is not None:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                stat = None
+            if stat is not None and (stat.st_mtime_ns, stat.st_size) == (entry.mtime_ns, entry.size):
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry.board
+            self.invalidate(path)
+
+        self.misses += 1
+        return None
+
+    def put(self, path: str, board: Any) -> None:
+        """Store a board that matches the current file on disk."""
+        self.invalidate(path)
+        if self.max_bytes <= 0:
+            return
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+
+        cost = stat.st_size * BOARD_MEMORY_FACTOR
+        if cost > self.max_bytes:
+            logging.debug(f"Board too large to cache: {path}")
+            return
+
+        while self.entries and self.total_bytes + cost > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.total_bytes -= evicted.cost
+
+        self.entries[_cache_key(path)] = CachedBoard(board, stat.st_mtime_ns, stat.st_size, cost)
+        self.total_bytes += cost
+
+    def invalidate(self, path: str) -> None:
+        entry = self.entries.pop(_cache_key(path), None)
+        if entry is not None:
+            self.total_bytes -= entry.cost
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "boards": len(self.entries),
+            "estimated_bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Shared by every BoardManager in the process (one per KiCad worker)
+board_cache = BoardCache()
+
+
 class BoardManager:
     """Utility class for KiCad board operations."""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[BoardCache] = None):
         self.board = None
         self.project_path = None
+        self.cache = cache if cache is not None else board_cache
 
     
     def load_board(self, project_path: str) -> Dict[str, Any]:
@@ -42,11 +153,16 @@ class BoardManager:
         
         try:
 
-            try:
-                self.board = pcbnew.LoadBoard(project_path)
-            except Exception as e:
-                return {"success": False, "error": f"Failed to load board: {str(e)}"}
+            board = self.cache.get(project_path)
+            cached = board is not None
+            if not cached:
+                try:
+                    board = pcbnew.LoadBoard(project_path)
+                except Exception as e:
+                    return {"success": False, "error": f"Failed to load board: {str(e)}"}
+                self.cache.put(project_path, board)
 
+            self.board = board
             self.project_path = project_path
             
             return {
@@ -54,6 +170,7 @@ class BoardManager:
                 "message": f"Board loaded successfully: {project_path}",
                 "board_info": {
                     "pcb_path": project_path,
+                    "cached": cached,
                 }
             }
             
@@ -82,6 +199,13 @@ class BoardManager:
         try:
             save_path = output_path or self.board.GetFileName()
             self.board.Save(save_path)
+
+            # Write-through: the in-memory board now matches save_path on disk.
+            # The source file was not updated if the board was saved elsewhere.
+            if self.project_path and _cache_key(save_path) != _cache_key(self.project_path):
+                self.cache.invalidate(self.project_path)
+            else:
+                self.cache.put(save_path, self.board)
             
             return {
                 "success": True,
@@ -89,12 +213,21 @@ class BoardManager:
             }
             
         except Exception as e:
+            self.discard_board()
             return {
                 "success": False,
                 "message": "Failed to save board",
                 "error": str(e)
             }
     
+    def discard_board(self) -> None:
+        """Drop the cached copy of the current board, e.g. after a failed edit.
+
+        The next load_board call then reads the file from disk again.
+        """
+        if self.project_path:
+            self.cache.invalidate(self.project_path)
+
     def get_board(self) -> Optional['pcbnew.BOARD']:
         """Get current board object."""
         return self.board
@@ -215,7 +348,7 @@ class BoardManager:
             }
                 
         
-    def _find_net_by_name(self, net_name: str) -> Optional[pcbnew.NETINFO_ITEM]:
+    def _find_net_by_name(self, net_name: str) -> Optional['pcbnew.NETINFO_ITEM']:
         """Find a net by name"""
         netinfo = self.board.GetNetInfo()
         for net_code in range(netinfo.GetNetCount()):
@@ -225,7 +358,7 @@ class BoardManager:
         return None
     
 
-    def _parse_position(self, pos_dict: dict) -> Optional[pcbnew.VECTOR2I]:
+    def _parse_position(self, pos_dict: dict) -> Optional['pcbnew.VECTOR2I']:
         """Parse position from dictionary to KiCad coordinates"""
         try:
             if "pad" in pos_dict:
@@ -242,7 +375,7 @@ class BoardManager:
         except Exception:
             return None
         
-    def _find_pad(self, pad_ref: str) -> Optional[pcbnew.PAD]:
+    def _find_pad(self, pad_ref: str) -> Optional['pcbnew.PAD']:
         """Find a pad by reference (format: 'R1.1' for component R1, pad 1)"""
         try:
             parts = pad_ref.split('.')
@@ -342,9 +475,45 @@ class BoardManager:
             return {"success": False, "message": str(e)}
 
 
-    def get_footprints_pads(self):
+    def _footprint_info(self, footprint) -> Dict[str, Any]:
+        pos = footprint.GetPosition()
+        return {
+            "reference": footprint.GetReference(),
+            "value": footprint.GetValue(),
+            "footprint_id": str(footprint.GetFPID()),
+            "position": {"x": pos.x / 1e6, "y": pos.y / 1e6},
+            "layer": footprint.GetLayer(),
+            "layer_name": self.board.GetLayerName(footprint.GetLayer()),
+        }
+
+    @staticmethod
+    def _pad_info(pad) -> Dict[str, Any]:
+        pad_pos = pad.GetPosition()
+        pad_size = pad.GetSize()
+        return {
+            "number": pad.GetNumber(),
+            "position": {"x": pad_pos.x / 1e6, "y": pad_pos.y / 1e6},
+            "size": {"x": pad_size.x / 1e6, "y": pad_size.y / 1e6},
+            "shape": pad.GetShape(),
+            "drill_size": pad.GetDrillSize().x / 1e6,
+            "net_code": pad.GetNetCode(),
+        }
+
+    def get_footprints_pads(self, layout: str = "normalized", max_nested_pads: int = MAX_NESTED_PADS):
         """
         Get Pads of pcb Layout
+
+        The normalized layout lists footprints, pads and nets once each, with
+        integer IDs: footprints hold the IDs of their pads, pads the ID of
+        their footprint and their net code, and nets the IDs of their pads.
+        The nested layout repeats, for every pad, every other pad on its net
+        ("connected_items"), so its size grows with the square of the
+        largest net; it is refused for boards with more than
+        ``max_nested_pads`` pads.
+
+        Args:
+            layout: "normalized" (default) or "nested"
+            max_nested_pads: Largest board, in pads, returned in the nested layout
         """
 
         if not self.board:
@@ -353,67 +522,102 @@ class BoardManager:
                 "message": "Board not loaded"
             }
 
+        if layout not in ("normalized", "nested"):
+            return {"success": False, "message": f"Unknown pad layout '{layout}', use 'normalized' or 'nested'"}
+
         try:
-            net_to_pads = {}
-            for pad in self.board.GetPads():
-                net = pad.GetNet()
-                if net:
-                    netname = net.GetNetname()
-                    net_to_pads.setdefault(netname, []).append(pad)
+            if layout == "nested":
+                pad_count = len(self.board.GetPads())
+                if pad_count > max_nested_pads:
+                    return {
+                        "success": False,
+                        "message": f"Board has {pad_count} pads; the nested layout is limited to "
+                                   f"{max_nested_pads}. Use the normalized layout."
+                    }
+                return self._nested_pads()
+            return self._normalized_pads()
 
-            components = []
+        except Exception as e:
+            logging.warning(f"General components error: {str(e)}")
+            return {"success": False, "message": str(e)}
 
-            for footprint in self.board.GetFootprints():
-                try:
-                    pos = footprint.GetPosition()
-                    component = {
-                        "reference": footprint.GetReference(),
-                        "value": footprint.GetValue(),
-                        "footprint_id": str(footprint.GetFPID()),
-                        "position": {"x": pos.x / 1e6, "y": pos.y / 1e6},
-                        "layer": footprint.GetLayer(),
-                        "layer_name": self.board.GetLayerName(footprint.GetLayer()),
-                        "pads": []
-                    }
+    def _normalized_pads(self) -> Dict[str, Any]:
+        footprints = []
+        pads = []
+        nets: Dict[int, Dict[str, Any]] = {}
 
-                    for pad in footprint.Pads():
-                        pad_pos = pad.GetPosition()
-                        pad_size = pad.GetSize()
-                        pad_net = pad.GetNet()
-                        netname = pad_net.GetNetname() if pad_net else None
-
-                        connected = []
-                        if netname and netname in net_to_pads:
-                            for other_pad in net_to_pads[netname]:
-                                if other_pad != pad:
-                                    connected.append({
-                                        "pad_number": other_pad.GetNumber(),
-                                        "net_name": netname
-                                    })
-
-                        pad_info = {
-                            "number": pad.GetNumber(),
-                            "position": {"x": pad_pos.x / 1e6, "y": pad_pos.y / 1e6},
-                            "size": {"x": pad_size.x / 1e6, "y": pad_size.y / 1e6},
-                            "shape": pad.GetShape(),
-                            "drill_size": pad.GetDrillSize().x / 1e6,
-                            "net_name": pad.GetNetname(),
-                            "net_code": pad.GetNetCode(),
-                            "connected_items": connected
-                        }
-
-                        component["pads"].append(pad_info)
-                    components.append(component)
+        for footprint in self.board.GetFootprints():
+            try:
+                component = self._footprint_info(footprint)
+                footprint_pads = [self._pad_info(pad) for pad in footprint.Pads()]
+            except Exception as e:
+                logging.warning(f"Component error: {str(e)}")
+                footprints.append({"id": len(footprints), "error": str(e), "pads": []})
+                continue
 
-                except Exception as e:
-                    logging.warning(f"Component error: {str(e)}")
-                    components.append({"error": str(e)})
+            footprint_id = len(footprints)
+            pad_ids = []
+            for pad_info in footprint_pads:
+                pad_id = len(pads)
+                pads.append({"id": pad_id, "footprint": footprint_id, **pad_info})
+                pad_ids.append(pad_id)
+                if pad_info["net_code"] > 0:  # net code 0 is "no net"
+                    nets.setdefault(pad_info["net_code"], []).append(pad_id)
 
-            return {"success": True, "data": {"components": components}}
+            footprints.append({"id": footprint_id, **component, "pads": pad_ids})
 
-        except Exception as e:
-            logging.warning(f"General components error: {str(e)}")
-            return {"success": False, "message": str(e)}
+        netinfo = self.board.GetNetInfo()
+        net_list = []
+        for net_code, pad_ids in sorted(nets.items()):
+            net = netinfo.GetNetItem(net_code)
+            net_list.append({
+                "code": net_code,
+                "name": net.GetNetname() if net else "",
+                "pads": pad_ids
+            })
+
+        return {
+            "success": True,
+            "data": {
+                "layout": "normalized",
+                "footprints": footprints,
+                "pads": pads,
+                "nets": net_list
+            }
+        }
+
+    def _nested_pads(self) -> Dict[str, Any]:
+        # One entry per pad and net, built once instead of re-read for every pad pair
+        net_members: Dict[str, list] = {}
+        for pad in self.board.GetPads():
+            net = pad.GetNet()
+            if net and net.GetNetname():
+                netname = net.GetNetname()
+                net_members.setdefault(netname, []).append(
+                    (pad, {"pad_number": pad.GetNumber(), "net_name": netname}))
+
+        components = []
+
+        for footprint in self.board.GetFootprints():
+            try:
+                component = self._footprint_info(footprint)
+                component["pads"] = []
+
+                for pad in footprint.Pads():
+                    netname = pad.GetNetname()
+                    pad_info = self._pad_info(pad)
+                    pad_info["net_name"] = netname
+                    pad_info["net_code"] = pad_info.pop("net_code")
+                    pad_info["connected_items"] = [item for other_pad, item in net_members.get(netname, ())
+                                                   if other_pad != pad]
+                    component["pads"].append(pad_info)
+                components.append(component)
+
+            except Exception as e:
+                logging.warning(f"Component error: {str(e)}")
+                components.append({"error": str(e)})
+
+        return {"success": True, "data": {"layout": "nested", "components": components}}
 
     def get_tracks_vias(self):
         """
@@ -436,7 +640,11 @@ class BoardManager:
                     vias.append({
                         "position": {"x": pos.x / 1e6, "y": pos.y / 1e6},
                         "drill": item.GetDrillValue() / 1e6,
+                        "width": item.GetWidth() / 1e6,
+                        "layers": [self.board.GetLayerName(item.TopLayer()),
+                                   self.board.GetLayerName(item.BottomLayer())],
                         "net_name": item.GetNetname(),
+                        "net_code": item.GetNetCode(),
                     })
                 else:
                     start = item.GetStart()
@@ -445,7 +653,10 @@ class BoardManager:
                         "start": {"x": start.x / 1e6, "y": start.y / 1e6},
                         "end": {"x": end.x / 1e6, "y": end.y / 1e6},
                         "length": item.GetLength() / 1e6,
+                        "width": item.GetWidth() / 1e6,
+                        "layer_name": self.board.GetLayerName(item.GetLayer()),
                         "net_name": item.GetNetname(),
+                        "net_code": item.GetNetCode(),
                     })
 
             return {
@@ -460,6 +671,101 @@ class BoardManager:
             return {"success": False, "message": str(e)}
 
 
+    def get_geometry_columns(self, kinds: Optional[List[str]] = None):
+        """
+        Get pad, track and via geometry as typed columns
+
+        Values are appended to arrays as KiCad reports them (integer
+        nanometres, layer IDs and net codes) instead of being converted and
+        wrapped in one dict per item; see geometry_columns for the columns
+        and the payload format.
+
+        Args:
+            kinds: Any of "pads", "tracks" and "vias" (default: all three)
+        """
+        if not self.board:
+            return {"success": False, "message": "Board not loaded"}
+
+        kinds = list(kinds or GEOMETRY_KINDS)
+        unknown = [kind for kind in kinds if kind not in GEOMETRY_KINDS]
+        if unknown:
+            return {"success": False, "message": f"Unknown geometry kinds: {', '.join(unknown)}"}
+
+        try:
+            data: Dict[str, Any] = {}
+            net_codes = set()
+
+            if "pads" in kinds:
+                pads = new_columns(GEOMETRY_KINDS["pads"])
+                x, y, size_x, size_y, drill = (pads[name].append for name in ("x", "y", "size_x", "size_y", "drill"))
+                layer, net_code, footprint_id = (pads[name].append for name in ("layer", "net_code", "footprint"))
+                for index, footprint in enumerate(self.board.GetFootprints()):
+                    # Pads are recorded on the side of their footprint
+                    footprint_layer = footprint.GetLayer()
+                    for pad in footprint.Pads():
+                        pos = pad.GetPosition()
+                        size = pad.GetSize()
+                        x(pos.x)
+                        y(pos.y)
+                        size_x(size.x)
+                        size_y(size.y)
+                        drill(pad.GetDrillSize().x)
+                        layer(footprint_layer)
+                        net_code(pad.GetNetCode())
+                        footprint_id(index)
+                net_codes.update(pads["net_code"])
+                data["pads"] = encode_columns(pads)
+
+            if "tracks" in kinds or "vias" in kinds:
+                tracks = new_columns(GEOMETRY_KINDS["tracks"])
+                vias = new_columns(GEOMETRY_KINDS["vias"])
+                start_x, start_y, end_x, end_y = (tracks[name].append for name in ("start_x", "start_y", "end_x", "end_y"))
+                width, length, layer, net_code = (tracks[name].append for name in ("width", "length", "layer", "net_code"))
+                via_x, via_y, via_width, via_drill, via_net = (
+                    vias[name].append for name in ("x", "y", "width", "drill", "net_code"))
+                for item in self.board.GetTracks():
+                    if isinstance(item, pcbnew.PCB_VIA):
+                        pos = item.GetPosition()
+                        via_x(pos.x)
+                        via_y(pos.y)
+                        via_width(item.GetWidth())
+                        via_drill(item.GetDrillValue())
+                        via_net(item.GetNetCode())
+                    else:
+                        start = item.GetStart()
+                        end = item.GetEnd()
+                        start_x(start.x)
+                        start_y(start.y)
+                        end_x(end.x)
+                        end_y(end.y)
+                        width(item.GetWidth())
+                        length(item.GetLength())
+                        layer(item.GetLayer())
+                        net_code(item.GetNetCode())
+                if "tracks" in kinds:
+                    net_codes.update(tracks["net_code"])
+                    data["tracks"] = encode_columns(tracks)
+                if "vias" in kinds:
+                    net_codes.update(vias["net_code"])
+                    data["vias"] = encode_columns(vias)
+
+            # Names only for the nets and layers the columns refer to
+            netinfo = self.board.GetNetInfo()
+            data["nets"] = {}
+            for code in sorted(net_codes):
+                net = netinfo.GetNetItem(code)
+                data["nets"][str(code)] = net.GetNetname() if net else ""
+            data["layers"] = {
+                str(layer_id): self.board.GetLayerName(layer_id)
+                for layer_id in range(pcbnew.PCB_LAYER_ID_COUNT)
+                if self.board.IsLayerEnabled(layer_id)
+            }
+
+            return {"success": True, "data": data}
+        except Exception as e:
+            logging.warning(f"Could not extract geometry columns: {str(e)}")
+            return {"success": False, "message": str(e)}
+
     def get_zones(self):
         """
         Get Zones of pcb layout
@@ -0,0 +1,420 @@
+"""
+Streaming Bill of Materials reader and analysis.
+
+BOM files are read row by row (``csv.reader``, ``ElementTree.iterparse``)
+into a BomTable, which keeps one list per column instead of one dict per
+row, and shares repeated cell strings (footprints, values, categories).
+The analysis then walks only the columns it needs once, without building a
+pandas DataFrame.
+"""
+import os
+import re
+import csv
+import json
+import logging
+import xml.etree.ElementTree as ET
+from itertools import repeat
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Column names recognised by the analysis, in order of preference (lowercase)
+REFERENCE_COLUMNS = ('reference', 'designator', 'references', 'designators', 'refdes', 'ref')
+VALUE_COLUMNS = ('value', 'component', 'comp', 'part', 'component value', 'comp value')
+QUANTITY_COLUMNS = ('quantity', 'qty', 'count', 'amount')
+FOOTPRINT_COLUMNS = ('footprint', 'package', 'pattern', 'pcb footprint')
+COST_COLUMNS = ('cost', 'price', 'unit price', 'unit cost', 'cost each')
+CATEGORY_COLUMNS = ('category', 'type', 'group', 'component type', 'lib')
+
+# Map common reference prefixes to component types
+CATEGORY_MAPPING = {
+    'R': 'Resistors',
+    'C': 'Capacitors',
+    'L': 'Inductors',
+    'D': 'Diodes',
+    'Q': 'Transistors',
+    'U': 'ICs',
+    'SW': 'Switches',
+    'J': 'Connectors',
+    'K': 'Relays',
+    'Y': 'Crystals/Oscillators',
+    'F': 'Fuses',
+    'T': 'Transformers'
+}
+
+CURRENCY_SYMBOLS = (('$', 'USD'), ('€', 'EUR'), ('£', 'GBP'))
+
+_PREFIX_RE = re.compile(r'^([A-Za-z]+)')
+
+# Marks a cell the row did not have (distinct from an empty or None value)
+_MISSING = object()
+
+
+class BomTable:
+    """Column-oriented store of BOM rows.
+
+    Rows may have different keys (XML and JSON BOMs); a column a row lacks
+    holds a marker, and ``records()`` rebuilds each row with its own keys.
+    """
+
+    def __init__(self, columns: Sequence[Any] = ()):
+        self.columns: List[Any] = []
+        self.data: Dict[Any, List[Any]] = {}
+        self.length = 0
+        self._strings: Dict[str, str] = {}
+        for column in columns:
+            self._add_column(column)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def _add_column(self, column: Any) -> List[Any]:
+        values = [_MISSING] * self.length
+        self.columns.append(column)
+        self.data[column] = values
+        return values
+
+    def append(self, row: Dict[Any, Any]) -> None:
+        """Add one row."""
+        strings = self._strings
+        for column, value in row.items():
+            values = self.data.get(column)
+            if values is None:
+                values = self._add_column(column)
+            if isinstance(value, str):
+                value = strings.setdefault(value, value)
+            values.append(value)
+        self.length += 1
+        for values in self.data.values():
+            if len(values) < self.length:
+                values.append(_MISSING)
+
+    def extend(self, rows: Iterable[Dict[Any, Any]]) -> "BomTable":
+        for row in rows:
+            self.append(row)
+        return self
+
+    def extend_csv(self, reader: Iterator[List[str]], fieldnames: Sequence[str]) -> "BomTable":
+        """Add the rows of a ``csv.reader`` positioned after the header.
+
+        Rows are mapped to ``fieldnames`` the way ``csv.DictReader`` maps them,
+        but complete rows go straight into the column lists.
+        """
+        for column in fieldnames:
+            if column not in self.data:
+                self._add_column(column)
+        width = len(fieldnames)
+        columns = [self.data[column] for column in fieldnames]
+        fast = len(set(fieldnames)) == width
+        strings = self._strings.setdefault
+        for row in reader:
+            if not row:
+                continue
+            if fast and len(row) == width and len(self.data) == width:
+                for values, value in zip(columns, row):
+                    values.append(strings(value, value))
+                self.length += 1
+                continue
+            # Short rows get None, extra cells are listed under the key None
+            record = dict(zip(fieldnames, row))
+            if len(row) > width:
+                record[None] = row[width:]
+            for column in fieldnames[len(row):]:
+                record[column] = None
+            self.append(record)
+        return self
+
+    def find_column(self, candidates: Sequence[str]) -> Optional[Any]:
+        """Return the first column whose stripped, lowercased name is in ``candidates``."""
+        normalized = {}
+        for column in self.columns:
+            normalized.setdefault(str(column).strip().lower(), column)
+        for candidate in candidates:
+            if candidate in normalized:
+                return normalized[candidate]
+        return None
+
+    def column(self, column: Any) -> List[Any]:
+        """Return the values of one column, with None for rows that lack it."""
+        return [None if value is _MISSING else value for value in self.data[column]]
+
+    def records(self, limit: Optional[int] = None) -> Iterator[Dict[Any, Any]]:
+        """Rebuild the rows as dictionaries.
+
+        Args:
+            limit: Maximum number of rows (default: all)
+        """
+        count = self.length if limit is None else min(limit, self.length)
+        columns = [(column, self.data[column]) for column in self.columns]
+        for index in range(count):
+            yield {column: values[index] for column, values in columns
+                   if values[index] is not _MISSING}
+
+
+def _read_xml_components(file_path: str) -> BomTable:
+    """Stream the ``component`` (else ``Component``) elements of an XML BOM.
+
+    Elements are cleared once read, so the document is never held in full.
+    """
+    found = {"component": BomTable(), "Component": BomTable()}
+    depth = 0  # nesting level inside component elements
+    for event, elem in ET.iterparse(file_path, events=("start", "end")):
+        is_component = elem.tag in found
+        if event == "start":
+            depth += is_component
+            continue
+        if is_component:
+            component = dict(elem.attrib)
+            for child in elem:
+                component[child.tag] = child.text
+            found[elem.tag].append(component)
+            depth -= 1
+        if depth == 0:
+            # Children of a component are needed until the component ends
+            elem.clear()
+    return found["component"] if len(found["component"]) else found["Component"]
+
+
+def read_bom_table(file_path: str) -> Tuple[BomTable, Dict[str, Any]]:
+    """Read a BOM file into a BomTable and detect its format.
+
+    Args:
+        file_path: Path to the BOM file (.csv, .xml, .json; others are tried as CSV)
+
+    Returns:
+        Tuple containing:
+            - BomTable with one row per BOM line
+            - Dictionary with format information
+    """
+    logging.debug(f"Parsing BOM file: {file_path}")
+
+    # Check file extension
+    _, ext = os.path.splitext(file_path)
+    ext = ext.lower()
+
+    format_info = {
+        "file_type": ext,
+        "detected_format": "unknown",
+        "header_fields": []
+    }
+    table = BomTable()
+
+    try:
+        if ext == '.csv':
+            with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+                # Read a few lines to detect the delimiter
+                sample = ''.join([f.readline() for _ in range(10)])
+                f.seek(0)
+
+                if ',' in sample:
+                    delimiter = ','
+                elif ';' in sample:
+                    delimiter = ';'
+                elif '\t' in sample:
+                    delimiter = '\t'
+                else:
+                    delimiter = ','  # Default
+
+                format_info["delimiter"] = delimiter
+
+                reader = csv.reader(f, delimiter=delimiter)
+                format_info["header_fields"] = next(reader, [])
+
+                # Detect BOM format based on header fields
+                header_str = ','.join(format_info["header_fields"]).lower()
+
+                if 'reference' in header_str and 'value' in header_str:
+                    format_info["detected_format"] = "kicad"
+                elif 'designator' in header_str:
+                    format_info["detected_format"] = "altium"
+                elif 'part number' in header_str or 'manufacturer part' in header_str:
+                    format_info["detected_format"] = "generic"
+
+                table = BomTable().extend_csv(reader, format_info["header_fields"])
+
+        elif ext == '.xml':
+            format_info["detected_format"] = "xml"
+            table = _read_xml_components(file_path)
+
+        elif ext == '.json':
+            # The json module has no incremental parser; rows are moved into
+            # the table and the parsed document is released
+            with open(file_path, 'r') as f:
+                data = json.load(f)
+
+            format_info["detected_format"] = "json"
+
+            # Try to find components array in common JSON formats
+            rows = []
+            if isinstance(data, list):
+                rows = data
+            elif 'components' in data:
+                rows = data['components']
+            elif 'parts' in data:
+                rows = data['parts']
+            del data
+            table.extend(row for row in rows if isinstance(row, dict))
+
+        else:
+            # Unknown format, try generic CSV parsing as fallback
+            try:
+                with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+                    reader = csv.reader(f)
+                    format_info["header_fields"] = next(reader, [])
+                    format_info["detected_format"] = "unknown_csv"
+                    table = BomTable().extend_csv(reader, format_info["header_fields"])
+            except Exception:
+                logging.debug(f"Failed to parse unknown file format: {file_path}")
+                return BomTable(), {"detected_format": "unsupported"}
+
+    except Exception as e:
+        logging.debug(f"Error parsing BOM file: {str(e)}", exc_info=True)
+        return BomTable(), {"error": str(e)}
+
+    if not len(table):
+        logging.debug(f"No components found in BOM file: {file_path}")
+    else:
+        logging.debug(f"Successfully parsed {len(table)} components from {file_path}")
+        # Add a sample of the fields found
+        format_info["sample_fields"] = list(next(table.records(limit=1)).keys())
+
+    return table, format_info
+
+
+def _to_number(value: Any) -> Optional[float]:
+    """Convert a cell to a number, or None if it is not one (like pandas.to_numeric(errors='coerce'))."""
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        number = float(value)
+    elif isinstance(value, str):
+        try:
+            number = float(value)
+        except ValueError:
+            return None
+    else:
+        return None
+    return None if number != number else number  # NaN
+
+
+def _ref_prefix(ref: Any) -> str:
+    if isinstance(ref, str):
+        match = _PREFIX_RE.match(ref)
+        if match:
+            return match.group(1)
+    return "Other"
+
+
+def _by_count(counts: Dict[Any, int], limit: Optional[int] = None) -> Dict[str, int]:
+    """Sort counts descending (ties keep first-seen order), keyed by string."""
+    ranked = sorted(counts.items(), key=lambda item: -item[1])
+    if limit is not None:
+        ranked = ranked[:limit]
+    return {str(key): count for key, count in ranked}
+
+
+def analyze_bom_table(table: BomTable) -> Dict[str, Any]:
+    """Analyze the components of a BOM in one pass over the needed columns.
+
+    Args:
+        table: BomTable from read_bom_table
+
+    Returns:
+        Dictionary with analysis results
+    """
+    logging.debug(f"Analyzing {len(table)} components")
+
+    results: Dict[str, Any] = {
+        "unique_component_count": 0,
+        "total_component_count": 0,
+        "categories": {},
+        "has_cost_data": False
+    }
+
+    if not len(table):
+        return results
+
+    try:
+        ref_col = table.find_column(REFERENCE_COLUMNS)
+        value_col = table.find_column(VALUE_COLUMNS)
+        quantity_col = table.find_column(QUANTITY_COLUMNS)
+        footprint_col = table.find_column(FOOTPRINT_COLUMNS)
+        cost_col = table.find_column(COST_COLUMNS)
+        category_col = table.find_column(CATEGORY_COLUMNS)
+
+        def values(column: Any) -> Iterable[Any]:
+            return table.column(column) if column is not None else repeat(None, len(table))
+
+        # Categories come from the category column, else the footprint,
+        # else the reference designator prefixes (R=resistor, C=capacitor, ...)
+        category_source = category_col if category_col is not None else footprint_col
+        refs = values(ref_col) if category_source is None and ref_col is not None else None
+        multi_ref = bool(refs) and isinstance(refs[0], str) and ',' in refs[0]
+        count_values = ref_col is not None and value_col is not None
+
+        total = 0.0
+        categories: Dict[Any, int] = {}
+        value_counts: Dict[Any, int] = {}
+        total_cost = 0.0
+        has_cost = False
+        currency = None
+
+        for quantity, category, ref, value, cost in zip(
+                values(quantity_col), values(category_source), refs or repeat(None, len(table)),
+                values(value_col), values(cost_col)):
+            if quantity_col is not None:
+                quantity = _to_number(quantity)
+                if quantity is None:
+                    quantity = 1.0
+            else:
+                quantity = 1.0
+            total += quantity
+
+            if category_source is not None:
+                if category is not None:
+                    categories[category] = categories.get(category, 0) + 1
+            elif refs is not None:
+                # Several references in one cell if the first row has them
+                for single in ([r.strip() for r in ref.split(',')] if multi_ref else [ref]):
+                    prefix = _ref_prefix(single)
+                    categories[prefix] = categories.get(prefix, 0) + 1
+
+            if count_values and value is not None:
+                value_counts[value] = value_counts.get(value, 0) + 1
+
+            if cost_col is not None:
+                cost_str = str(cost)
+                if currency is None:
+                    currency = next((code for symbol, code in CURRENCY_SYMBOLS if symbol in cost_str), None)
+                number = _to_number(cost_str.replace('$', '').replace(',', ''))
+                if number is not None:
+                    has_cost = True
+                    total_cost += number * quantity
+
+        results["total_component_count"] = int(total)
+        results["unique_component_count"] = len(table)
+
+        mapped_categories: Dict[str, int] = {}
+        counted = categories if multi_ref else _by_count(categories)
+        for cat, count in counted.items():
+            name = CATEGORY_MAPPING.get(cat, cat)
+            mapped_categories[name] = mapped_categories.get(name, 0) + count
+        results["categories"] = mapped_categories
+
+        if has_cost:
+            results["has_cost_data"] = True
+            results["total_cost"] = round(total_cost, 2)
+            results["currency"] = currency or "USD"  # Default
+
+        if count_values:
+            results["most_common_values"] = _by_count(value_counts, limit=5)
+
+    except Exception as e:
+        logging.debug(f"Error analyzing BOM data: {str(e)}", exc_info=True)
+        # Fallback to basic analysis
+        results = {
+            "unique_component_count": len(table),
+            "total_component_count": len(table),
+            "categories": {},
+            "has_cost_data": False
+        }
+
+    return results
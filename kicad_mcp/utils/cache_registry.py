@@ -0,0 +1,115 @@
+"""
+Central registry of the server's caches.
+
+Each cache registers a callback that drops what it holds for a file, and the
+file extensions it cares about. The file watcher reports changed paths to
+the registry, which forwards each one to the matching caches.
+"""
+import os
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+@dataclass
+class CacheSubscription:
+    name: str
+    invalidate: Callable[[str], None]
+    extensions: Sequence[str]
+    clear: Optional[Callable[[], None]] = None
+    stats: Optional[Callable[[], Dict[str, Any]]] = None
+    invalidations: int = 0
+
+    def matches(self, path: str) -> bool:
+        return not self.extensions or path.lower().endswith(tuple(self.extensions))
+
+
+class CacheRegistry:
+    """Routes file change notifications to the caches that depend on the file."""
+
+    def __init__(self):
+        self.subscriptions: Dict[str, CacheSubscription] = {}
+        self.lock = threading.Lock()
+
+    def register(self, name: str, invalidate: Callable[[str], None], extensions: Sequence[str] = (),
+                 clear: Optional[Callable[[], None]] = None,
+                 stats: Optional[Callable[[], Dict[str, Any]]] = None) -> None:
+        """Subscribe a cache to file changes (re-registering a name replaces it).
+
+        Args:
+            name: Name of the cache, e.g. "schematic_parses"
+            invalidate: Called with the absolute path of each changed file
+            extensions: File extensions the cache depends on (empty: every file)
+            clear: Drops everything the cache holds
+            stats: Returns the cache's statistics
+        """
+        with self.lock:
+            self.subscriptions[name] = CacheSubscription(name, invalidate, tuple(e.lower() for e in extensions),
+                                                         clear, stats)
+
+    def unregister(self, name: str) -> None:
+        with self.lock:
+            self.subscriptions.pop(name, None)
+
+    @property
+    def extensions(self) -> Optional[set]:
+        """Extensions any cache depends on, or None if one depends on every file."""
+        with self.lock:
+            subscriptions = list(self.subscriptions.values())
+        extensions = set()
+        for subscription in subscriptions:
+            if not subscription.extensions:
+                return None
+            extensions.update(subscription.extensions)
+        return extensions
+
+    def invalidate_path(self, path: str) -> List[str]:
+        """Tell every interested cache that ``path`` changed.
+
+        Args:
+            path: Changed, created or deleted file
+
+        Returns:
+            Names of the caches that were notified
+        """
+        path = os.path.abspath(path)
+        with self.lock:
+            subscriptions = [s for s in self.subscriptions.values() if s.matches(path)]
+
+        notified = []
+        for subscription in subscriptions:
+            try:
+                subscription.invalidate(path)
+            except Exception as e:
+                logging.error(f"Cache {subscription.name} failed to invalidate {path}: {e}")
+                continue
+            subscription.invalidations += 1
+            notified.append(subscription.name)
+        if notified:
+            logging.debug(f"{path} changed; invalidated {', '.join(notified)}")
+        return notified
+
+    def clear_all(self) -> None:
+        with self.lock:
+            subscriptions = list(self.subscriptions.values())
+        for subscription in subscriptions:
+            if subscription.clear is not None:
+                subscription.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            subscriptions = list(self.subscriptions.values())
+        result = {}
+        for subscription in subscriptions:
+            entry = {"extensions": list(subscription.extensions), "invalidations": subscription.invalidations}
+            if subscription.stats is not None:
+                try:
+                    entry.update(subscription.stats())
+                except Exception as e:
+                    entry["error"] = str(e)
+            result[subscription.name] = entry
+        return result
+
+
+cache_registry = CacheRegistry()
@@ -0,0 +1,139 @@
+"""
+Geometric connectivity helpers for schematic netlist building.
+
+Coordinates are snapped to integer grid units (``COORD_SCALE`` per mm) so
+points can be compared exactly and used as dictionary keys.
+"""
+import math
+from collections import defaultdict
+from typing import Dict, Iterator, List, Tuple
+
+# KiCad stores schematic coordinates with 1e-4 mm resolution
+COORD_SCALE = 10000
+
+# Edge length of a spatial hash cell (10.16 mm, four 100 mil grid steps)
+CELL_SIZE = 101600
+
+Point = Tuple[int, int]
+
+
+def snap(x: float, y: float) -> Point:
+    """Convert a coordinate in mm to integer grid units."""
+    return (int(round(x * COORD_SCALE)), int(round(y * COORD_SCALE)))
+
+
+def transform_pin(px: float, py: float, x: float, y: float, angle: float = 0.0,
+                  mirror: str = "") -> Tuple[float, float]:
+    """Place a library pin on the sheet.
+
+    Library coordinates are Y-up while sheet coordinates are Y-down. The symbol
+    is rotated counter-clockwise by ``angle`` and then mirrored (``"x"`` flips
+    vertically, ``"y"`` flips horizontally), matching KiCad's symbol transform.
+
+    Args:
+        px, py: Pin position in the library symbol
+        x, y: Symbol position on the sheet
+        angle: Symbol rotation in degrees
+        mirror: Mirror axis, if any
+
+    Returns:
+        The pin's (x, y) position on the sheet
+    """
+    dx, dy = px, -py
+    quarter = int(round(angle / 90.0)) % 4
+    if angle % 90 == 0:
+        # Exact integer rotation for the usual orthogonal placements
+        for _ in range(quarter):
+            dx, dy = dy, -dx
+    else:
+        rad = math.radians(angle)
+        cos_a, sin_a = math.cos(rad), math.sin(rad)
+        dx, dy = dx * cos_a + dy * sin_a, -dx * sin_a + dy * cos_a
+
+    if mirror == "x":
+        dy = -dy
+    elif mirror == "y":
+        dx = -dx
+
+    return x + dx, y + dy
+
+
+class UnionFind:
+    """Disjoint-set forest with path halving and union by size."""
+
+    def __init__(self):
+        self.parent: List[int] = []
+        self.size: List[int] = []
+
+    def add(self) -> int:
+        """Create a new singleton set and return its id."""
+        item = len(self.parent)
+        self.parent.append(item)
+        self.size.append(1)
+        return item
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> int:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return root_a
+        if self.size[root_a] < self.size[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        self.size[root_a] += self.size[root_b]
+        return root_a
+
+    def groups(self) -> Dict[int, List[int]]:
+        """Map each root to the items in its set."""
+        result: Dict[int, List[int]] = defaultdict(list)
+        for item in range(len(self.parent)):
+            result[self.find(item)].append(item)
+        return result
+
+
+class SegmentGrid:
+    """Spatial hash of line segments for point-on-segment queries.
+
+    Each segment is registered in every cell its bounding box overlaps, so a
+    point query only tests the few segments sharing the point's cell.
+    """
+
+    def __init__(self, cell_size: int = CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells: Dict[Point, List[int]] = defaultdict(list)
+        self.segments: List[Tuple[Point, Point]] = []
+
+    def add(self, start: Point, end: Point) -> int:
+        """Register a segment and return its index."""
+        index = len(self.segments)
+        self.segments.append((start, end))
+        size = self.cell_size
+        x0, x1 = sorted((start[0] // size, end[0] // size))
+        y0, y1 = sorted((start[1] // size, end[1] // size))
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self.cells[(cx, cy)].append(index)
+        return index
+
+    def at(self, point: Point) -> Iterator[int]:
+        """Yield the indices of segments that contain ``point``."""
+        size = self.cell_size
+        px, py = point
+        for index in self.cells.get((px // size, py // size), ()):
+            (ax, ay), (bx, by) = self.segments[index]
+            if not (min(ax, bx) <= px <= max(ax, bx) and min(ay, by) <= py <= max(ay, by)):
+                continue
+            if ax == bx or ay == by:
+                # Axis-aligned: the bounding box test is exact
+                yield index
+                continue
+            cross = (bx - ax) * (py - ay) - (by - ay) * (px - ax)
+            # Allow one grid unit of rounding error for diagonal wires
+            if abs(cross) <= math.hypot(bx - ax, by - ay):
+                yield index
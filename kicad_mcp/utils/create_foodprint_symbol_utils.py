@@ -4,7 +4,6 @@ from typing import Dict, List, Any, Optional
 import pathlib
 from pathlib import Path
 import sexpdata
-from PyPDF2 import PdfReader, PdfWriter
 
 from kicad_mcp.config import KICAD_USER_DIR, KICAD_APP_PATH, KICAD_EXTENSIONS, ADDITIONAL_SEARCH_PATHS, DATASHEET_PATH, KICAD_TABLE_PATH
 
@@ -561,6 +560,9 @@ def readFileContent(filename: str, filetype: str):
 
 
 def split_pdf(input_pdf_path: str, output_dir: str, pages_per_split: int, dirname: str):
+    # PyPDF2 is only needed here; importing it with the module slows server start
+    from PyPDF2 import PdfReader, PdfWriter
+
     try:
         # Check that the input file exists
         if not os.path.isfile(input_pdf_path):
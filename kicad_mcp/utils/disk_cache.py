@@ -0,0 +1,196 @@
+"""
+Persistent on-disk cache for parse results.
+
+Entries are pickled (protocol 5) under ``CACHE_DIR/<namespace>-v<version>/``
+and keyed by the SHA-256 of the source content, so an edited file simply maps
+to a new entry and a parser change (new version) never reads old data.
+Writes go to a temporary file that is renamed into place, so a crash or a
+concurrent writer cannot leave a half-written entry behind.
+"""
+import os
+import glob
+import time
+import shutil
+import pickle
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+from kicad_mcp.config import CACHE_DIR
+
+# Default size limit of the cache directory
+DEFAULT_DISK_CACHE_MB = 256
+
+# Number of writes between size checks
+PRUNE_INTERVAL = 64
+
+# Age after which a leftover temporary file is considered abandoned
+STALE_TEMP_SECONDS = 3600
+
+
+def content_hash(content: bytes) -> str:
+    """Return the hex SHA-256 digest used as a cache key."""
+    return hashlib.sha256(content).hexdigest()
+
+
+class DiskCache:
+    """Versioned pickle store for one kind of parse result.
+
+    Args:
+        namespace: Name of the result kind, e.g. "schematic"
+        version: Parser version; entries written by other versions are dropped
+        root: Cache directory (default: CACHE_DIR)
+        max_bytes: Size limit for this namespace (default: KICAD_MCP_DISK_CACHE_MB)
+    """
+
+    def __init__(self, namespace: str, version: int, root: Optional[str] = None,
+                 max_bytes: Optional[int] = None):
+        if max_bytes is None:
+            try:
+                max_mb = int(os.environ.get("KICAD_MCP_DISK_CACHE_MB", DEFAULT_DISK_CACHE_MB))
+            except ValueError:
+                max_mb = DEFAULT_DISK_CACHE_MB
+            max_bytes = max_mb * 1024 * 1024
+        self.namespace = namespace
+        self.version = version
+        self.root = root or CACHE_DIR
+        self.directory = os.path.join(self.root, f"{namespace}-v{version}")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.lock = threading.Lock()
+        self._prepared = False
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.pickle")
+
+    def _prepare(self) -> None:
+        """Create the cache directory and remove entries of other parser versions."""
+        if self._prepared:
+            return
+        self._prepared = True
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        for stale in glob.glob(os.path.join(glob.escape(self.root), f"{self.namespace}-v*")):
+            if os.path.normcase(stale) != os.path.normcase(self.directory):
+                logging.info(f"Removing stale parse cache: {stale}")
+                shutil.rmtree(stale, ignore_errors=True)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the stored value for ``key``, or None on a miss."""
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            with self.lock:
+                self._prepare()
+            with open(path, "rb") as f:
+                version, value = pickle.load(f)
+            if version != self.version:
+                raise ValueError(f"entry written by parser version {version}")
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            # Truncated, corrupt or foreign entry: drop it and parse again
+            logging.warning(f"Discarding unreadable cache entry {path}: {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self.misses += 1
+            return None
+
+        try:
+            # Refresh the mtime so pruning removes the least recently used entries
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key`` (errors are logged and ignored)."""
+        if not self.enabled:
+            return
+
+        path = self._path(key)
+        try:
+            with self.lock:
+                self._prepare()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump((self.version, value), f, protocol=5)
+                os.replace(temp_path, path)
+            except BaseException:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                raise
+        except Exception as e:
+            logging.warning(f"Could not write cache entry {path}: {e}")
+            return
+
+        with self.lock:
+            self.writes += 1
+            due = self.writes % PRUNE_INTERVAL == 1
+        if due:
+            self.prune()
+
+    def _entries(self):
+        for path in glob.glob(os.path.join(glob.escape(self.directory), "*", "*")):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            yield path, stat
+
+    def prune(self) -> int:
+        """Delete least recently used entries until the namespace fits its limit.
+
+        Returns:
+            Number of files removed
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime)
+        total = sum(stat.st_size for _, stat in entries)
+        cutoff = time.time() - STALE_TEMP_SECONDS
+        removed = 0
+        for path, stat in entries:
+            if path.endswith(".tmp"):
+                # Another writer may still be filling this file
+                if stat.st_mtime > cutoff:
+                    continue
+            elif total <= self.max_bytes:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= stat.st_size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self._prepared = False
+
+    def stats(self) -> Dict[str, Any]:
+        entries = list(self._entries())
+        return {
+            "directory": self.directory,
+            "entries": len(entries),
+            "bytes": sum(stat.st_size for _, stat in entries),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -2,13 +2,23 @@
 Utilities for tracking DRC history for KiCad projects.
 
 This will allow users to compare DRC results over time.
+
+History is an append-only JSON-lines file per project. Each distinct
+violation is written once as a ``violation`` record under a key derived from
+its type, description and items; each DRC run is a ``run`` record listing
+the keys of its violations. Saving a run only appends the new violations and
+one line, and comparing two runs is a set difference of their keys.
 """
 import os
 import json
+import hashlib
 import platform
+import tempfile
+import threading
 import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 
 # Directory for storing DRC history
@@ -19,6 +29,26 @@ else:
     # macOS/Linux: Use ~/.kicad_mcp/drc_history
     DRC_HISTORY_DIR = os.path.expanduser("~/.kicad_mcp/drc_history")
 
+# Runs kept per project by compaction (0 = keep every run)
+DEFAULT_MAX_RUNS = 0
+
+# Individual violations listed in a comparison (counts are always complete)
+MAX_DIFF_VIOLATIONS = 100
+
+
+@dataclass
+class DrcHistory:
+    """Parsed contents of a project's history file."""
+    violations: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    runs: List[Dict[str, Any]] = field(default_factory=list)
+    bad_lines: int = 0
+
+
+# history path -> ((size, mtime_ns), DrcHistory), so unchanged files are parsed once
+_loaded: Dict[str, Tuple[Tuple[int, int], DrcHistory]] = {}
+_lock = threading.RLock()
+
+
 def ensure_history_dir() -> None:
     """Ensure the DRC history directory exists."""
     os.makedirs(DRC_HISTORY_DIR, exist_ok=True)
@@ -26,138 +56,319 @@ def ensure_history_dir() -> None:
 
 def get_project_history_path(project_path: str) -> str:
     """Get the path to the DRC history file for a project.
-    
+
     Args:
         project_path: Path to the KiCad project file
-        
+
     Returns:
         Path to the project's DRC history file
     """
-    # Create a safe filename from the project path
-    project_hash = hash(project_path) & 0xffffffff  # Ensure positive hash
+    # Stable across processes, unlike hash()
+    normalized = os.path.normcase(os.path.abspath(project_path))
+    project_hash = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
     basename = os.path.basename(project_path)
-    history_filename = f"{basename}_{project_hash}_drc_history.json"
-    
+    history_filename = f"{basename}_{project_hash}_drc_history.jsonl"
+
     return os.path.join(DRC_HISTORY_DIR, history_filename)
 
 
+def violation_key(violation: Dict[str, Any]) -> str:
+    """Identify a violation across DRC runs.
+
+    Two runs report the same violation when its type, description and the
+    items involved (by UUID, or by description and position) are the same.
+
+    Args:
+        violation: Violation as reported by kicad-cli
+
+    Returns:
+        Short hex key
+    """
+    items = []
+    for item in violation.get("items", []):
+        pos = item.get("pos", {})
+        items.append((
+            item.get("uuid", ""),
+            item.get("description", ""),
+            round(pos.get("x", 0), 4),
+            round(pos.get("y", 0), 4)
+        ))
+    identity = [
+        violation.get("type", ""),
+        violation.get("message", violation.get("description", "")),
+        sorted(items)
+    ]
+    return hashlib.sha1(json.dumps(identity).encode("utf-8")).hexdigest()[:16]
+
+
+def _max_runs() -> int:
+    try:
+        return int(os.environ.get("KICAD_MCP_DRC_HISTORY_MAX_RUNS", DEFAULT_MAX_RUNS))
+    except ValueError:
+        return DEFAULT_MAX_RUNS
+
+
+def _signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _load(history_path: str) -> DrcHistory:
+    """Parse a history file, reusing the last parse while the file is unchanged."""
+    with _lock:
+        signature = _signature(history_path)
+        if signature is None:
+            return DrcHistory()
+        cached = _loaded.get(history_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        history = DrcHistory()
+        with open(history_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    kind = record["record"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    # A line cut short by a crash; compaction drops it
+                    history.bad_lines += 1
+                    continue
+                if kind == "violation":
+                    history.violations[record["key"]] = record["violation"]
+                elif kind == "run":
+                    history.runs.append(record)
+        _loaded[history_path] = (signature, history)
+        return history
+
+
+def _run_summary(run: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "timestamp": run.get("timestamp", 0),
+        "datetime": run.get("datetime", ""),
+        "total_violations": run.get("total_violations", 0),
+        "violation_categories": run.get("violation_categories", {})
+    }
+
+
 def save_drc_result(project_path: str, drc_result: Dict[str, Any]) -> None:
     """Save a DRC result to the project's history.
-    
+
     Args:
         project_path: Path to the KiCad project file
         drc_result: DRC result dictionary
     """
     ensure_history_dir()
     history_path = get_project_history_path(project_path)
-    
+
     # Create a history entry
     timestamp = time.time()
     formatted_time = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
-    
-    history_entry = {
+
+    violations = drc_result.get("violations", [])
+    keys = [violation_key(violation) for violation in violations]
+
+    run = {
+        "record": "run",
         "timestamp": timestamp,
         "datetime": formatted_time,
-        "total_violations": drc_result.get("total_violations", 0),
-        "violation_categories": drc_result.get("violation_categories", {})
+        "total_violations": drc_result.get("total_violations", len(violations)),
+        "violation_categories": drc_result.get("violation_categories", {}),
+        "violations": keys
     }
-    
-    # Load existing history or create new
-    if os.path.exists(history_path):
-        try:
-            with open(history_path, 'r') as f:
-                history = json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            #print(f"Error loading DRC history: {str(e)}")
-            history = {"project_path": project_path, "entries": []}
-    else:
-        history = {"project_path": project_path, "entries": []}
-    
-    # Add new entry and save
-    history["entries"].append(history_entry)
-    
-    # Keep only the last 10 entries to avoid excessive storage
-    if len(history["entries"]) > 10:
-        history["entries"] = sorted(
-            history["entries"], 
-            key=lambda x: x["timestamp"], 
-            reverse=True
-        )[:10]
-    
+    if drc_result.get("drc_inputs_hash"):
+        # Contents of the checked files, so a repeat check of them is recognized
+        run["drc_inputs_hash"] = drc_result["drc_inputs_hash"]
+
     try:
-        with open(history_path, 'w') as f:
-            json.dump(history, f, indent=2)
-    except IOError as e:
+        with _lock:
+            history = _load(history_path)
+            lines = []
+            new_violations = {}
+            for key, violation in zip(keys, violations):
+                if key not in history.violations and key not in new_violations:
+                    new_violations[key] = violation
+                    lines.append(json.dumps({"record": "violation", "key": key, "violation": violation}))
+            lines.append(json.dumps(run))
+
+            # One append per save: readers never see a run before its violations
+            with open(history_path, "a+b") as f:
+                if f.tell() > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        # Terminate a line left unfinished by a crash
+                        lines.insert(0, "")
+                f.write(("\n".join(lines) + "\n").encode("utf-8"))
+
+            history.violations.update(new_violations)
+            history.runs.append(run)
+            signature = _signature(history_path)
+            if signature is not None:
+                _loaded[history_path] = (signature, history)
+
+            max_runs = _max_runs()
+            if history.bad_lines or (max_runs and len(history.runs) > max_runs):
+                compact_drc_history(project_path, max_runs)
+    except (IOError, OSError, UnicodeDecodeError) as e:
         logging.error(f"Error saving DRC history: {str(e)}")
 
 
-def get_drc_history(project_path: str) -> List[Dict[str, Any]]:
+def compact_drc_history(project_path: str, max_runs: Optional[int] = None) -> Dict[str, int]:
+    """Rewrite a project's history without damaged lines or expired runs.
+
+    Args:
+        project_path: Path to the KiCad project file
+        max_runs: Runs to keep, newest first (default: KICAD_MCP_DRC_HISTORY_MAX_RUNS; 0 keeps all)
+
+    Returns:
+        Dictionary with the number of runs and violations kept and removed
+    """
+    if max_runs is None:
+        max_runs = _max_runs()
+    history_path = get_project_history_path(project_path)
+
+    with _lock:
+        history = _load(history_path)
+        runs = history.runs[-max_runs:] if max_runs else list(history.runs)
+        referenced = {key for run in runs for key in run.get("violations", [])}
+        violations = {key: value for key, value in history.violations.items() if key in referenced}
+
+        if os.path.exists(history_path):
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(history_path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    for key, violation in violations.items():
+                        f.write(json.dumps({"record": "violation", "key": key, "violation": violation}) + "\n")
+                    for run in runs:
+                        f.write(json.dumps(run) + "\n")
+                os.replace(temp_path, history_path)
+            except BaseException:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                raise
+            _loaded.pop(history_path, None)
+
+    return {
+        "runs_kept": len(runs),
+        "runs_removed": len(history.runs) - len(runs),
+        "violations_kept": len(violations),
+        "violations_removed": len(history.violations) - len(violations),
+        "damaged_lines_removed": history.bad_lines
+    }
+
+
+def get_drc_history(project_path: str, include_violations: bool = False) -> List[Dict[str, Any]]:
     """Get the DRC history for a project.
-    
+
     Args:
         project_path: Path to the KiCad project file
-        
+        include_violations: Include the full violation records of each run
+
     Returns:
         List of DRC history entries, sorted by timestamp (newest first)
     """
     history_path = get_project_history_path(project_path)
-    
+
     if not os.path.exists(history_path):
-        print(f"No DRC history found for {project_path}")
+        logging.debug(f"No DRC history found for {project_path}")
         return []
-    
+
     try:
-        with open(history_path, 'r') as f:
-            history = json.load(f)
-        
-        # Sort entries by timestamp (newest first)
-        entries = sorted(
-            history.get("entries", []),
-            key=lambda x: x.get("timestamp", 0),
-            reverse=True
-        )
-        
-        return entries
-    except (json.JSONDecodeError, IOError) as e:
-        print(f"Error reading DRC history: {str(e)}")
+        history = _load(history_path)
+    except (IOError, OSError, UnicodeDecodeError) as e:
+        logging.error(f"Error reading DRC history: {str(e)}")
         return []
 
+    entries = []
+    for run in history.runs:
+        entry = _run_summary(run)
+        if include_violations:
+            entry["violations"] = [history.violations[key] for key in run.get("violations", [])
+                                   if key in history.violations]
+        entries.append(entry)
+
+    # Sort entries by timestamp (newest first)
+    entries.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
+    return entries
+
+
+def _is_repeat(run: Dict[str, Any], drc_result: Dict[str, Any]) -> bool:
+    """Whether ``run`` checked the same file contents as ``drc_result``."""
+    inputs_hash = drc_result.get("drc_inputs_hash")
+    return bool(inputs_hash) and run.get("drc_inputs_hash") == inputs_hash
+
+
+def _sorted_runs(project_path: str) -> Tuple[Optional[DrcHistory], List[Dict[str, Any]]]:
+    try:
+        history = _load(get_project_history_path(project_path))
+    except (IOError, OSError, UnicodeDecodeError) as e:
+        logging.error(f"Error reading DRC history: {str(e)}")
+        return None, []
+    return history, sorted(history.runs, key=lambda run: run.get("timestamp", 0))
+
+
+def is_latest_run(project_path: str, drc_result: Dict[str, Any]) -> bool:
+    """Check whether the most recent history entry checked the same files as ``drc_result``.
+
+    Such a result is a repeat check of an unchanged board and is not saved again.
+
+    Args:
+        project_path: Path to the KiCad project file
+        drc_result: DRC result dictionary with its "drc_inputs_hash"
+
+    Returns:
+        True if the latest run recorded the same DRC inputs hash
+    """
+    _, runs = _sorted_runs(project_path)
+    return bool(runs) and _is_repeat(runs[-1], drc_result)
+
 
 def compare_with_previous(project_path: str, current_result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Compare current DRC result with the previous one.
-    
+
+    Call this before saving the current result, so the most recent history
+    entry is the previous run. If that entry checked the same file contents
+    (a repeat check, see is_latest_run), the run before it is used instead.
+
     Args:
         project_path: Path to the KiCad project file
         current_result: Current DRC result dictionary
-        
+
     Returns:
-        Comparison dictionary or None if no history exists
+        Comparison dictionary or None if no previous run exists
     """
-    history = get_drc_history(project_path)
-    
-    if not history or len(history) < 2:  # Need at least one previous entry
+    history, runs = _sorted_runs(project_path)
+    if runs and _is_repeat(runs[-1], current_result):
+        runs = runs[:-1]
+    if not runs:  # Need at least one previous entry
         return None
-    
-    previous = history[0]  # Most recent entry
+
+    previous = runs[-1]  # Most recent entry
     current_violations = current_result.get("total_violations", 0)
     previous_violations = previous.get("total_violations", 0)
-    
+
     # Compare violation categories
     current_categories = current_result.get("violation_categories", {})
     previous_categories = previous.get("violation_categories", {})
-    
+
     # Find new categories
     new_categories = {}
     for category, count in current_categories.items():
         if category not in previous_categories:
             new_categories[category] = count
-    
+
     # Find resolved categories
     resolved_categories = {}
     for category, count in previous_categories.items():
         if category not in current_categories:
             resolved_categories[category] = count
-    
+
     # Find changed categories
     changed_categories = {}
     for category, count in current_categories.items():
@@ -167,7 +378,16 @@ def compare_with_previous(project_path: str, current_result: Dict[str, Any]) ->
                 "previous": previous_categories[category],
                 "change": count - previous_categories[category]
             }
-    
+
+    # Compare individual violations by key
+    current_by_key = {violation_key(violation): violation for violation in current_result.get("violations", [])}
+    previous_keys = set(previous.get("violations", []))
+    new_violations = [violation for key, violation in current_by_key.items() if key not in previous_keys]
+    resolved_violations = [history.violations[key] for key in previous.get("violations", [])
+                           if key not in current_by_key and key in history.violations]
+    # A run can report the same violation more than once; list it once
+    resolved_violations = list({violation_key(v): v for v in resolved_violations}.values())
+
     comparison = {
         "current_violations": current_violations,
         "previous_violations": previous_violations,
@@ -175,7 +395,12 @@ def compare_with_previous(project_path: str, current_result: Dict[str, Any]) ->
         "previous_datetime": previous.get("datetime", "unknown"),
         "new_categories": new_categories,
         "resolved_categories": resolved_categories,
-        "changed_categories": changed_categories
+        "changed_categories": changed_categories,
+        "new_violation_count": len(new_violations),
+        "resolved_violation_count": len(resolved_violations),
+        "unchanged_violation_count": len(current_by_key) - len(new_violations),
+        "new_violations": new_violations[:MAX_DIFF_VIOLATIONS],
+        "resolved_violations": resolved_violations[:MAX_DIFF_VIOLATIONS]
     }
-    
+
     return comparison
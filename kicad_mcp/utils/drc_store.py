@@ -0,0 +1,146 @@
+"""
+Stored DRC results keyed by the content of the checked files.
+
+A DRC result only depends on the board, the project settings (rule severities
+and constraints) and the custom rules file, so the result for one combination
+of their contents can be reused until any of them changes. Results are kept
+in a DiskCache, so they also survive server restarts.
+"""
+import os
+import asyncio
+import hashlib
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from mcp.server.fastmcp import Context
+
+from kicad_mcp.tools.drc_impl.cli_drc import run_drc_via_cli
+from kicad_mcp.utils.cache_registry import cache_registry
+from kicad_mcp.utils.disk_cache import DiskCache
+from kicad_mcp.utils.file_watcher import watch_file_directory
+from kicad_mcp.utils.kicad_cli import find_kicad_cli
+
+# Bump when the stored result format changes
+DRC_STORE_VERSION = 1
+
+drc_store = DiskCache("drc", DRC_STORE_VERSION)
+
+# (normalized path) -> ((mtime_ns, size), sha256), so unchanged files are not re-read
+_file_hashes: Dict[str, Tuple[Tuple[int, int], str]] = {}
+_file_hashes_lock = threading.Lock()
+
+# DRC runs in progress per event loop, so identical concurrent checks share one run
+_in_flight: Dict[Tuple[int, str], "asyncio.Future"] = {}
+
+
+def _file_hash(path: str) -> str:
+    """Return the SHA-256 of a file, reusing the last digest while mtime and size are unchanged."""
+    key = os.path.normcase(os.path.abspath(path))
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _file_hashes_lock:
+        cached = _file_hashes.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    value = digest.hexdigest()
+    with _file_hashes_lock:
+        _file_hashes[key] = (signature, value)
+    return value
+
+
+def forget_file_hash(path: str) -> None:
+    """Drop the memoized digest of a changed file."""
+    with _file_hashes_lock:
+        _file_hashes.pop(os.path.normcase(os.path.abspath(path)), None)
+
+
+def _clear_file_hashes() -> None:
+    with _file_hashes_lock:
+        _file_hashes.clear()
+
+
+# Stored results are keyed by content and never stale; only the digest memo depends on the files
+cache_registry.register("drc_results", forget_file_hash, (".kicad_pcb", ".kicad_pro", ".kicad_dru"),
+                        clear=_clear_file_hashes, stats=drc_store.stats)
+
+
+def drc_inputs_hash(pcb_file: str, project_path: Optional[str] = None) -> str:
+    """Return the store key for a DRC run.
+
+    Args:
+        pcb_file: Path to the PCB file (.kicad_pcb)
+        project_path: Path to the KiCad project file (default: next to the PCB)
+
+    Returns:
+        Hex digest over the board, project settings and custom rules contents
+        and the kicad-cli executable
+    """
+    base = os.path.splitext(pcb_file)[0]
+    inputs = [
+        ("pcb", pcb_file),
+        ("project", project_path or f"{base}.kicad_pro"),
+        ("design_rules", f"{base}.kicad_dru"),
+    ]
+
+    digest = hashlib.sha256()
+    for name, path in inputs:
+        content = _file_hash(path) if os.path.exists(path) else "missing"
+        digest.update(f"{name}:{content}\n".encode())
+    digest.update(f"cli:{find_kicad_cli() or ''}\n".encode())
+    return digest.hexdigest()
+
+
+async def _run_and_store(pcb_file: str, ctx: Optional[Context], key: str) -> Dict[str, Any]:
+    results = await run_drc_via_cli(pcb_file, ctx)
+    if results.get("success"):
+        results["drc_inputs_hash"] = key
+        await asyncio.to_thread(drc_store.put, key, results)
+    return results
+
+
+async def get_drc_results(pcb_file: str, ctx: Optional[Context] = None,
+                          project_path: Optional[str] = None, force: bool = False) -> Dict[str, Any]:
+    """Return DRC results for a board, running kicad-cli only if the inputs changed.
+
+    Args:
+        pcb_file: Path to the PCB file (.kicad_pcb)
+        ctx: MCP context for progress reporting (optional)
+        project_path: Path to the KiCad project file (default: next to the PCB)
+        force: Run DRC even if a stored result exists
+
+    Returns:
+        Dictionary with DRC results (as returned by run_drc_via_cli) and a
+        "cached" flag telling whether the result came from the store
+    """
+    watch_file_directory(pcb_file)
+    try:
+        key = await asyncio.to_thread(drc_inputs_hash, pcb_file, project_path)
+    except OSError as e:
+        return {"success": False, "method": "cli", "pcb_file": pcb_file,
+                "error": f"Could not read DRC inputs: {str(e)}"}
+
+    if not force:
+        stored = await asyncio.to_thread(drc_store.get, key)
+        if stored is not None:
+            logging.debug(f"Serving stored DRC result for {pcb_file}")
+            if ctx:
+                await ctx.info("Board unchanged since the last DRC run, using the stored result")
+            return dict(stored, pcb_file=pcb_file, cached=True)
+
+    in_flight_key = (id(asyncio.get_running_loop()), key)
+    pending = _in_flight.get(in_flight_key)
+    if pending is None:
+        pending = asyncio.ensure_future(_run_and_store(pcb_file, ctx, key))
+        _in_flight[in_flight_key] = pending
+        pending.add_done_callback(lambda _: _in_flight.pop(in_flight_key, None))
+    elif ctx:
+        await ctx.info("Waiting for the DRC run already in progress on this board")
+
+    results = await asyncio.shield(pending)
+    return dict(results, cached=False)
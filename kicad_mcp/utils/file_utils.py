@@ -6,6 +6,7 @@ import json
 from typing import Dict, List, Any, Optional
 
 from kicad_mcp.utils.kicad_utils import get_project_name_from_path
+from kicad_mcp.utils.file_watcher import watch_file_directory
 
 
 def get_project_files(project_path: str) -> Dict[str, str]:
@@ -19,6 +20,9 @@ def get_project_files(project_path: str) -> Dict[str, str]:
     """
     from kicad_mcp.config import KICAD_EXTENSIONS, DATA_EXTENSIONS
     
+    # Caches built from these files are invalidated when they change
+    watch_file_directory(project_path)
+    
     project_dir = os.path.dirname(project_path)
     project_name = get_project_name_from_path(project_path)
     
@@ -0,0 +1,252 @@
+"""
+Watches the directories the tools touch and reports changed files to the
+cache registry.
+
+With the optional ``watchdog`` package the operating system's change
+notifications (inotify, FSEvents, ReadDirectoryChangesW) are used; without it
+a background thread polls the watched directories every
+``KICAD_MCP_WATCH_INTERVAL`` seconds. ``KICAD_MCP_FILE_WATCHER`` selects
+``auto`` (default), ``events``, ``poll`` or ``off``.
+
+Caches still validate entries against the file on disk: change notifications
+are not delivered for edits made by other machines on network mounts.
+"""
+import os
+import atexit
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from kicad_mcp.utils.cache_registry import CacheRegistry, cache_registry
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Seconds between polls of the watched directories
+DEFAULT_WATCH_INTERVAL = 2.0
+
+# Event types that mean a file's content or existence changed (not opened/read)
+CHANGE_EVENTS = {"created", "deleted", "modified", "moved", "closed"}
+
+
+def _watch_mode() -> str:
+    mode = os.environ.get("KICAD_MCP_FILE_WATCHER", "auto").strip().lower()
+    if mode not in ("auto", "events", "poll", "off"):
+        logging.warning(f"Unknown KICAD_MCP_FILE_WATCHER '{mode}', using auto")
+        mode = "auto"
+    if mode in ("auto", "events"):
+        if WATCHDOG_AVAILABLE:
+            return "events"
+        if mode == "events":
+            logging.warning("watchdog is not installed; polling for file changes instead")
+        return "poll"
+    return mode
+
+
+if WATCHDOG_AVAILABLE:
+    class _EventHandler(FileSystemEventHandler):
+        def __init__(self, watcher: "FileWatcher"):
+            self.watcher = watcher
+
+        def on_any_event(self, event):
+            if event.event_type not in CHANGE_EVENTS:
+                return
+            for path in (event.src_path, getattr(event, "dest_path", "")):
+                if path:
+                    self.watcher.notify(os.fsdecode(path))
+
+
+class FileWatcher:
+    """Directory watcher feeding a CacheRegistry.
+
+    Args:
+        registry: Registry receiving changed paths (default: the shared registry)
+        mode: "events", "poll" or "off" (default: from KICAD_MCP_FILE_WATCHER)
+        interval: Seconds between polls (default: KICAD_MCP_WATCH_INTERVAL)
+    """
+
+    def __init__(self, registry: Optional[CacheRegistry] = None, mode: Optional[str] = None,
+                 interval: Optional[float] = None):
+        if interval is None:
+            try:
+                interval = float(os.environ.get("KICAD_MCP_WATCH_INTERVAL", DEFAULT_WATCH_INTERVAL))
+            except ValueError:
+                interval = DEFAULT_WATCH_INTERVAL
+        self.registry = registry or cache_registry
+        self.mode = mode or _watch_mode()
+        self.interval = max(0.1, interval)
+        self.watched: Dict[str, bool] = {}  # directory -> recursive
+        self.snapshots: Dict[str, Dict[str, Tuple[int, int]]] = {}
+        self.lock = threading.Lock()
+        self.observer = None
+        self.watches: Dict[str, Any] = {}
+        self.poll_thread: Optional[threading.Thread] = None
+        self.stop_event = threading.Event()
+        self.events = 0
+
+    @property
+    def live(self) -> bool:
+        """Whether changes are reported by the operating system as they happen."""
+        return self.mode == "events"
+
+    def _covered(self, directory: str) -> bool:
+        if directory in self.watched:
+            return True
+        return any(recursive and directory.startswith(root.rstrip(os.sep) + os.sep)
+                   for root, recursive in self.watched.items())
+
+    def watch(self, directory: str, recursive: bool = False) -> bool:
+        """Start reporting changes to files in ``directory``.
+
+        Args:
+            directory: Directory to watch
+            recursive: Include subdirectories (only with change notifications)
+
+        Returns:
+            True if the directory is watched
+        """
+        if self.mode == "off" or (recursive and not self.live):
+            return False
+
+        directory = os.path.normcase(os.path.abspath(directory))
+        with self.lock:
+            if self._covered(directory) and (not recursive or self.watched.get(directory)):
+                return True
+            if not os.path.isdir(directory):
+                return False
+
+            try:
+                if self.live:
+                    if self.observer is None:
+                        self.observer = Observer()
+                        self.observer.daemon = True
+                        self.observer.start()
+                    if directory in self.watches:
+                        self.observer.unschedule(self.watches.pop(directory))
+                    self.watches[directory] = self.observer.schedule(_EventHandler(self), directory,
+                                                                     recursive=recursive)
+                else:
+                    self.snapshots[directory] = self._snapshot(directory)
+                    if self.poll_thread is None:
+                        self.stop_event.clear()
+                        self.poll_thread = threading.Thread(target=self._poll, name="kicad-file-watcher",
+                                                            daemon=True)
+                        self.poll_thread.start()
+            except Exception as e:
+                logging.warning(f"Cannot watch {directory}: {e}")
+                return False
+
+            self.watched[directory] = recursive
+        logging.debug(f"Watching {directory} ({self.mode})")
+        return True
+
+    def unwatch(self, directory: str) -> None:
+        directory = os.path.normcase(os.path.abspath(directory))
+        with self.lock:
+            self.watched.pop(directory, None)
+            self.snapshots.pop(directory, None)
+            watch = self.watches.pop(directory, None)
+            if watch is not None and self.observer is not None:
+                self.observer.unschedule(watch)
+
+    def notify(self, path: str) -> None:
+        """Forward one changed path to the registry."""
+        self.events += 1
+        self.registry.invalidate_path(path)
+
+    def _snapshot(self, directory: str) -> Dict[str, Tuple[int, int]]:
+        extensions = self.registry.extensions
+        suffixes = tuple(extensions) if extensions is not None else None
+        snapshot = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if suffixes is not None and not entry.name.lower().endswith(suffixes):
+                        continue
+                    try:
+                        if entry.is_file():
+                            stat = entry.stat()
+                            snapshot[entry.path] = (stat.st_mtime_ns, stat.st_size)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        return snapshot
+
+    def _poll(self) -> None:
+        while not self.stop_event.wait(self.interval):
+            with self.lock:
+                directories = list(self.snapshots)
+            for directory in directories:
+                current = self._snapshot(directory)
+                with self.lock:
+                    if directory not in self.snapshots:
+                        continue
+                    previous, self.snapshots[directory] = self.snapshots[directory], current
+                for path in set(previous) | set(current):
+                    if previous.get(path) != current.get(path):
+                        self.notify(path)
+
+    def stop(self) -> None:
+        """Stop watching every directory."""
+        self.stop_event.set()
+        with self.lock:
+            observer, self.observer = self.observer, None
+            poll_thread, self.poll_thread = self.poll_thread, None
+            self.watched.clear()
+            self.snapshots.clear()
+            self.watches.clear()
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=5)
+        if poll_thread is not None:
+            poll_thread.join(timeout=5)
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "mode": self.mode,
+                "directories": len(self.watched),
+                "events": self.events,
+            }
+
+
+_file_watcher: Optional[FileWatcher] = None
+_file_watcher_lock = threading.Lock()
+
+
+def get_file_watcher() -> FileWatcher:
+    """Return the shared file watcher."""
+    global _file_watcher
+    with _file_watcher_lock:
+        if _file_watcher is None:
+            _file_watcher = FileWatcher()
+        return _file_watcher
+
+
+def watch_file_directory(path: str) -> bool:
+    """Watch the directory containing ``path`` (a project, schematic or board file).
+
+    Args:
+        path: File whose directory should be watched
+
+    Returns:
+        True if the directory is watched
+    """
+    return get_file_watcher().watch(os.path.dirname(os.path.abspath(path)))
+
+
+def stop_file_watcher() -> None:
+    """Stop the shared file watcher (a new one is created on next use)."""
+    global _file_watcher
+    with _file_watcher_lock:
+        watcher, _file_watcher = _file_watcher, None
+    if watcher is not None:
+        watcher.stop()
+
+
+atexit.register(stop_file_watcher)
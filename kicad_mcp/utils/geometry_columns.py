@@ -0,0 +1,201 @@
+"""
+Columnar board geometry: pads, tracks and vias as typed arrays.
+
+Extracting geometry as one dict per item (with every coordinate divided by
+1e6 on its own) dominates the time and the JSON size on large boards. The
+KiCad worker instead appends raw values to ``array`` columns (coordinates
+and sizes in KiCad's integer nanometres), and the columns cross the bridge
+as zlib-compressed base64 blobs. Statistics are computed directly on the
+decoded arrays.
+
+This module only uses the standard library, so it is also imported inside
+KiCad's Python by the worker.
+"""
+import sys
+import math
+import zlib
+import base64
+from array import array
+from typing import Any, Dict, Iterable, List, Optional
+
+# Column name -> array typecode ("q": int64 nanometres or IDs, "d": float64)
+PAD_COLUMNS = {
+    "x": "q", "y": "q", "size_x": "q", "size_y": "q", "drill": "q",
+    "layer": "i", "net_code": "i", "footprint": "i",
+}
+TRACK_COLUMNS = {
+    "start_x": "q", "start_y": "q", "end_x": "q", "end_y": "q", "width": "q",
+    "length": "d", "layer": "i", "net_code": "i",
+}
+VIA_COLUMNS = {
+    "x": "q", "y": "q", "width": "q", "drill": "q", "net_code": "i",
+}
+
+GEOMETRY_KINDS = {"pads": PAD_COLUMNS, "tracks": TRACK_COLUMNS, "vias": VIA_COLUMNS}
+
+# KiCad internal units per millimetre
+NM_PER_MM = 1e6
+
+
+def new_columns(spec: Dict[str, str]) -> Dict[str, array]:
+    """Return empty arrays for a column spec such as TRACK_COLUMNS."""
+    return {name: array(typecode) for name, typecode in spec.items()}
+
+
+def encode_columns(columns: Dict[str, array]) -> Dict[str, Any]:
+    """Pack columns into a JSON-serializable payload.
+
+    Args:
+        columns: Arrays of equal length
+
+    Returns:
+        Dictionary with the row count, byte order and one compressed base64
+        blob per column
+    """
+    count = len(next(iter(columns.values()))) if columns else 0
+    return {
+        "encoding": "zlib+base64",
+        "byteorder": sys.byteorder,
+        "count": count,
+        "columns": {
+            name: {
+                "type": values.typecode,
+                "data": base64.b64encode(zlib.compress(values.tobytes(), 1)).decode("ascii"),
+            }
+            for name, values in columns.items()
+        },
+    }
+
+
+def decode_columns(payload: Dict[str, Any]) -> Dict[str, array]:
+    """Unpack a payload built by encode_columns.
+
+    Args:
+        payload: Encoded columns
+
+    Returns:
+        Dictionary of column name to array
+    """
+    if payload.get("encoding") != "zlib+base64":
+        raise ValueError(f"Unsupported column encoding: {payload.get('encoding')}")
+    swap = payload.get("byteorder", sys.byteorder) != sys.byteorder
+    columns = {}
+    for name, column in payload.get("columns", {}).items():
+        values = array(column["type"])
+        values.frombytes(zlib.decompress(base64.b64decode(column["data"])))
+        if swap:
+            values.byteswap()
+        if len(values) != payload["count"]:
+            raise ValueError(f"Column {name} has {len(values)} values, expected {payload['count']}")
+        columns[name] = values
+    return columns
+
+
+def _mm(value: float) -> float:
+    return round(value / NM_PER_MM, 6)
+
+
+def _bounding_box(xs: Iterable[int], ys: Iterable[int]) -> Optional[Dict[str, float]]:
+    xs, ys = list(xs), list(ys)
+    if not xs:
+        return None
+    return {"min_x": _mm(min(xs)), "min_y": _mm(min(ys)), "max_x": _mm(max(xs)), "max_y": _mm(max(ys))}
+
+
+def _histogram(values: array) -> Dict[str, int]:
+    counts: Dict[int, int] = {}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    return {str(_mm(value)): count for value, count in sorted(counts.items())}
+
+
+def _top_nets(totals: Dict[int, float], counts: Dict[int, int], net_names: Dict[int, str],
+              top: int, total_key: Optional[str] = None) -> List[Dict[str, Any]]:
+    ranking = totals if total_key else counts
+    ranked = sorted(ranking, key=lambda code: -ranking[code])
+    result = []
+    for code in ranked[:top]:
+        entry = {"net_code": code, "net_name": net_names.get(code, ""), "count": counts[code]}
+        if total_key:
+            entry[total_key] = _mm(totals[code])
+        result.append(entry)
+    return result
+
+
+def track_stats(columns: Dict[str, array], net_names: Dict[int, str], layer_names: Dict[int, str],
+                top: int = 10) -> Dict[str, Any]:
+    """Aggregate track columns: total length, length per layer, widths and longest nets."""
+    length_by_layer: Dict[int, float] = {}
+    length_by_net: Dict[int, float] = {}
+    segments_by_net: Dict[int, int] = {}
+    for length, layer, net_code in zip(columns["length"], columns["layer"], columns["net_code"]):
+        length_by_layer[layer] = length_by_layer.get(layer, 0.0) + length
+        length_by_net[net_code] = length_by_net.get(net_code, 0.0) + length
+        segments_by_net[net_code] = segments_by_net.get(net_code, 0) + 1
+
+    return {
+        "count": len(columns["length"]),
+        "total_length_mm": _mm(math.fsum(columns["length"])),
+        "length_by_layer_mm": {layer_names.get(layer, str(layer)): _mm(length)
+                               for layer, length in sorted(length_by_layer.items())},
+        "width_mm_counts": _histogram(columns["width"]),
+        "longest_nets": _top_nets(length_by_net, segments_by_net, net_names, top, "length_mm"),
+        "bounding_box_mm": _bounding_box(list(columns["start_x"]) + list(columns["end_x"]),
+                                         list(columns["start_y"]) + list(columns["end_y"])),
+    }
+
+
+def via_stats(columns: Dict[str, array], net_names: Dict[int, str], top: int = 10) -> Dict[str, Any]:
+    """Aggregate via columns: drill and diameter distribution and nets with most vias."""
+    vias_by_net: Dict[int, int] = {}
+    for net_code in columns["net_code"]:
+        vias_by_net[net_code] = vias_by_net.get(net_code, 0) + 1
+    return {
+        "count": len(columns["net_code"]),
+        "drill_mm_counts": _histogram(columns["drill"]),
+        "diameter_mm_counts": _histogram(columns["width"]),
+        "nets_with_most_vias": _top_nets({}, vias_by_net, net_names, top),
+        "bounding_box_mm": _bounding_box(columns["x"], columns["y"]),
+    }
+
+
+def pad_stats(columns: Dict[str, array], net_names: Dict[int, str], top: int = 10) -> Dict[str, Any]:
+    """Aggregate pad columns: SMD/through-hole split, unconnected pads and largest nets."""
+    pads_by_net: Dict[int, int] = {}
+    through_hole = 0
+    for net_code, drill in zip(columns["net_code"], columns["drill"]):
+        pads_by_net[net_code] = pads_by_net.get(net_code, 0) + 1
+        through_hole += drill > 0
+    unconnected = pads_by_net.pop(0, 0)  # net code 0 is "no net"
+    return {
+        "count": len(columns["net_code"]),
+        "through_hole": through_hole,
+        "smd": len(columns["net_code"]) - through_hole,
+        "without_net": unconnected,
+        "footprints": len(set(columns["footprint"])),
+        "largest_nets": _top_nets({}, pads_by_net, net_names, top),
+        "bounding_box_mm": _bounding_box(columns["x"], columns["y"]),
+    }
+
+
+def geometry_stats(data: Dict[str, Any], top: int = 10) -> Dict[str, Any]:
+    """Compute statistics for every geometry kind in a worker result.
+
+    Args:
+        data: "data" of BoardManager.get_geometry_columns (encoded columns,
+            net names and layer names)
+        top: Number of nets listed per ranking
+
+    Returns:
+        Dictionary with one statistics entry per geometry kind
+    """
+    net_names = {int(code): name for code, name in data.get("nets", {}).items()}
+    layer_names = {int(layer): name for layer, name in data.get("layers", {}).items()}
+    stats = {}
+    if "tracks" in data:
+        stats["tracks"] = track_stats(decode_columns(data["tracks"]), net_names, layer_names, top)
+    if "vias" in data:
+        stats["vias"] = via_stats(decode_columns(data["vias"]), net_names, top)
+    if "pads" in data:
+        stats["pads"] = pad_stats(decode_columns(data["pads"]), net_names, top)
+    return stats
@@ -1,40 +1,37 @@
 import subprocess
 import json
 import os
+import queue
+import threading
+import time
+import atexit
+import zlib
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 
+from kicad_mcp.utils.file_watcher import watch_file_directory
 
-class KiCadBridge:
-    """Bridge between MCP server and KiCad Python environment."""
-    
-    def __init__(self):
-        self.kicad_python = self._find_kicad_python()
-        self.script_path = self._create_subprocess_script()
-    
-    def _find_kicad_python(self) -> str:
-        """Find KiCad Python executable."""
-        paths = [
-            #Edit
-            os.path.join(os.getenv('ProgramFiles'), 'KiCad', '9.0', 'bin', 'python.exe'),
-            os.path.join(os.getenv('LOCALAPPDATA'), 'Programs', 'KiCad', '9.0', 'bin', 'python.exe')
-        ]
-        
-        for path in paths:
-            if os.path.exists(path):
-                return path
-        
-        raise FileNotFoundError("KiCad Python not found")
-    
-    def _create_subprocess_script(self) -> str:
-        """Create the subprocess script that uses your existing files."""
-        
-        # Get current directory
-        current_dir = Path(__file__).parent
-        
-        # Create subprocess script
-        script_content = '''
+
+# Number of long-lived KiCad Python workers (0 disables the pool and spawns one process per call)
+DEFAULT_WORKER_COUNT = 2
+
+# Seconds a single request may run before its worker is killed and restarted
+DEFAULT_REQUEST_TIMEOUT = 60
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back to ``default``."""
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        logging.warning(f"Ignoring invalid value for {name}: {os.environ.get(name)!r}")
+        return default
+
+
+# Script executed by KiCad's Python interpreter. ``{project_root}`` is substituted
+# with str.replace (not str.format), so braces below are plain Python.
+SUBPROCESS_SCRIPT = r'''
 
 import sys
 import json
@@ -62,531 +59,590 @@ try:
     from utils.set_components_utils import ComponentManager
     from utils.board_utils import BoardManager
     UTILS_AVAILABLE = True
-except ImportError as e:
-    print(json.dumps({{"success": False, "error": f"Utils import failed: {{str(e)}}"}}, indent=2))
+    UTILS_ERROR = None
+except Exception as e:
     UTILS_AVAILABLE = False
+    UTILS_ERROR = f"Utils import failed: {str(e)}"
+    logging.error(UTILS_ERROR)
 
-# Global instances
+# Global instances, kept alive between requests in worker mode
 if UTILS_AVAILABLE:
     board_manager = BoardManager()
     component_manager = ComponentManager()
 
-if __name__ == "__main__":
+
+def load_board(params):
+    """Load the board named in params and hand it to the component manager."""
+    logging.debug("DEBUG: Loading board...")
+    result = board_manager.load_board(params["project_path"])
+    if result["success"]:
+        component_manager.set_board(board_manager.get_board())
+        logging.debug("DEBUG: Board loaded successfully")
+    return result
+
+
+def place_component_full(params):
+    load_result = load_board(params)
+    if not load_result["success"]:
+        return load_result
+
+    logging.debug("DEBUG: Placing component...")
+    footprint = component_manager.create_footprint(
+        component_id=params["component_id"],
+        position=params["position"],
+        library=params["library"],
+        reference=params.get("reference"),
+        value=params.get("value"),
+        rotation=params.get("rotation", 0),
+        layer=params.get("layer", "F.Cu"),
+    )
+    component_info = component_manager.place_footprint(footprint)
+    logging.debug("DEBUG: Component placed successfully")
+
+    logging.debug("DEBUG: Saving board...")
+    save_result = board_manager.save_board(params.get("output_path"))
+    if not save_result["success"]:
+        return save_result
+    logging.debug("DEBUG: Board saved successfully")
+
+    return {
+        "success": True,
+        "message": f"Component placed and saved: {params['component_id']}",
+        "component": {
+            "reference": component_info.reference,
+            "value": component_info.value,
+            "footprint": component_info.footprint,
+            "position": component_info.position,
+            "rotation": component_info.rotation,
+            "layer": component_info.layer,
+        },
+        "board_info": load_result.get("board_info", {}),
+        "save_info": save_result
+    }
+
+
+def move_component(params):
+    reference = params.get("reference")
+    position = params["position"]
+    rotation = params.get("rotation")
+
+    load_result = load_board(params)
+    if not load_result["success"]:
+        return load_result
+
+    logging.debug("DEBUG: Moving component ...")
     try:
-        if not UTILS_AVAILABLE:
-            print(json.dumps({{"success": False, "error": "Utils not available"}}))
-            sys.exit(1)
-            
-        method_name = sys.argv[1]
-        params = json.loads(sys.argv[2]) if len(sys.argv) > 2 else {{}}
-        
-        if method_name == "load_board":
-            result = board_manager.load_board(params["project_path"])
-            if result["success"]:
-                component_manager.set_board(board_manager.get_board())
-                logging.debug(json.dumps(result))
-
-            print(json.dumps(result))
-           
-        
-        elif method_name == "place_component_full":
-            project_path = params["project_path"]
-            
-            # Step 1: Load board
-            logging.debug("DEBUG: Loading board...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
-            
-            # Step 2: Place component
-            logging.debug("DEBUG: Placing component...")
-            footprint = component_manager.create_footprint(
-                component_id=params["component_id"],
-                position=params["position"],
-                library=params["library"],
-                reference=params.get("reference"),
-                value=params.get("value"),
-                rotation=params.get("rotation", 0),
-                layer=params.get("layer", "F.Cu"),
-            )
-            component_info = component_manager.place_footprint(footprint)
-            logging.debug("DEBUG: Component placed successfully")
-            
-            # Step 3: Save board
-            logging.debug("DEBUG: Saving board...")
-            save_result = board_manager.save_board(params.get("output_path"))
-            if not save_result["success"]:
-                print(json.dumps(save_result))
-                sys.exit(1)
-            
-            logging.debug("DEBUG: Board saved successfully")
-            
-            result = {{
-                "success": True,
-                "message": f"Component placed and saved: {{params['component_id']}}",
-                "component": {{
-                    "reference": component_info.reference,
-                    "value": component_info.value,
-                    "footprint": component_info.footprint,
-                    "position": component_info.position,
-                    "rotation": component_info.rotation,
-                    "layer": component_info.layer,
-                }},
-                "board_info": load_result.get("board_info", {{}}),
-                "save_info": save_result
-            }}
-            logging.debug(json.dumps(result))
-            print(json.dumps(result))
-
-        elif method_name == "move_component":
-            project_path = params["project_path"]
-            reference = params.get("reference")
-            position = params["position"]
-            rotation = params.get("rotation")
-            
-            # Step 1: Load board
-            logging.debug("DEBUG: Loading board for move operation...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
-            
-            # Step 2: Move component
-            logging.debug("DEBUG: Moving component ...")
-            try:
-                move_result = component_manager.move_component(
-                    reference=reference,
-                    position=position,
-                    rotation=rotation
-                )
-                
-                logging.debug(move_result.reference)    
-                logging.debug("DEBUG: Component moved successfully")
-                
-                # Step 3: Save board
-                logging.debug("DEBUG: Saving board...")
-                save_result = board_manager.save_board()
-                if not save_result["success"]:
-                    print(json.dumps(save_result))
-                    sys.exit(1)
-                
-                logging.debug("DEBUG: Board saved successfully")
-                
-                # Return combined result
-                result = {{
-                    "success": True,
-                    "message": "Component moved successfully",
-                    "component": {{
-                        "reference": reference,
-                        "position": position,
-                        "rotation": rotation
-                    }},
-                    "board_info": load_result.get("board_info", {{}}),
-                    "save_info": save_result
-                }}
-                logging.debug(json.dumps(result))
-                print(json.dumps(result))
-                
-            except Exception as e:
-                error_result = {{
-                    "success": False,
-                    "error": f"Failed to move component: {{str(e)}}"
-                }}
-                logging.error(json.dumps(error_result))
-                print(json.dumps(error_result))
-
-        elif method_name == "get_net_pcb":
-            project_path = params["project_path"]
-
-            logging.debug("DEBUG: Loading board...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
-
-            logging.debug("DEBUG: Extracting Nets ...")
-            
-            try:
-                net_extract = board_manager.get_net_list()
-                
-                if net_extract["success"]:
-                    logging.debug("DEBUG: Nets extracted successfully")
-                    print(json.dumps(net_extract))
-                else:
-                    print(json.dumps(net_extract))
-                    sys.exit(1)
-                    
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during net extraction",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during net extraction: {str(e)}")
-                print(json.dumps(error_result))
-                sys.exit(1)
-
-        elif method_name == "track_pcb_routes":
-            project_path = params["project_path"]
-        
-            logging.debug("DEBUG: Loading board...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
-
-            #Set track 
-            all_results = [] 
-            try:
-                routes = params["route"]
-
-                for route in routes:
-                    start = route.get("start")
-                    end = route.get("end")
-                    layer = route.get("layer")
-                    width = route.get("width")
-                    net = route.get("net")
-
-                    # Validate the route parameters
-                    if not all([start, end, layer, width, net]):
-                        error_result = {
-                            "success": False,
-                            "message": "Missing required route parameters",
-                            "route": route
-                        }
-                        logging.error(f"ERROR: Missing required parameters for route: {route}")
-                        all_results.append(error_result)
-                        continue
-
-                    # Trace track for this route
-                    trace_track = board_manager.trace_routes(start=start, end=end, layer=layer, width=width, net=net)
-
-                    if not trace_track["success"]:
-                        logging.error(f"ERROR: Failed to route: {trace_track.get('message', 'Unknown error')}")
-                        all_results.append(trace_track)
-                        continue
-
-                    all_results.append(trace_track)
-
-
-                # Step 3: Save board
-                logging.debug("DEBUG: Saving board...")
-                save_result = board_manager.save_board()
-                
-                if not save_result["success"]:
-                    print(json.dumps(save_result))
-                    sys.exit(1)
-
-                logging.debug("DEBUG: Board saved successfully")
-
-                result = {
-                    "success": True,
-                    "message": "Routing operation completed",
-                    "routes": all_results,  # Include the results for each route
-                    "save_info": save_result
-                }
+        move_result = component_manager.move_component(
+            reference=reference,
+            position=position,
+            rotation=rotation
+        )
+        logging.debug(move_result.reference)
+        logging.debug("DEBUG: Component moved successfully")
+    except Exception as e:
+        error_result = {
+            "success": False,
+            "error": f"Failed to move component: {str(e)}"
+        }
+        logging.error(json.dumps(error_result))
+        return error_result
+
+    logging.debug("DEBUG: Saving board...")
+    save_result = board_manager.save_board()
+    if not save_result["success"]:
+        return save_result
+    logging.debug("DEBUG: Board saved successfully")
+
+    return {
+        "success": True,
+        "message": "Component moved successfully",
+        "component": {
+            "reference": reference,
+            "position": position,
+            "rotation": rotation
+        },
+        "board_info": load_result.get("board_info", {}),
+        "save_info": save_result
+    }
+
+
+def track_pcb_routes(params):
+    load_result = load_board(params)
+    if not load_result["success"]:
+        return load_result
+
+    all_results = []
+    for route in params["route"]:
+        start = route.get("start")
+        end = route.get("end")
+        layer = route.get("layer")
+        width = route.get("width")
+        net = route.get("net")
+
+        # Validate the route parameters
+        if not all([start, end, layer, width, net]):
+            logging.error(f"ERROR: Missing required parameters for route: {route}")
+            all_results.append({
+                "success": False,
+                "message": "Missing required route parameters",
+                "route": route
+            })
+            continue
+
+        trace_track = board_manager.trace_routes(start=start, end=end, layer=layer, width=width, net=net)
+        if not trace_track["success"]:
+            logging.error(f"ERROR: Failed to route: {trace_track.get('message', 'Unknown error')}")
+        all_results.append(trace_track)
+
+    logging.debug("DEBUG: Saving board...")
+    save_result = board_manager.save_board()
+    if not save_result["success"]:
+        return save_result
+    logging.debug("DEBUG: Board saved successfully")
+
+    return {
+        "success": True,
+        "message": "Routing operation completed",
+        "routes": all_results,  # Include the results for each route
+        "save_info": save_result
+    }
+
+
+def apply_transaction(params):
+    """Apply a list of edits to one in-memory board and save once.
+
+    If any operation fails nothing is saved and the edited board is dropped
+    from the cache, so the file on disk is left exactly as it was.
+    """
+    load_result = load_board(params)
+    if not load_result["success"]:
+        return load_result
+
+    applied = component_manager.apply_operations(
+        params.get("operations") or [],
+        route_handler=board_manager.trace_routes
+    )
+    if not applied["success"]:
+        board_manager.discard_board()
+        applied["rolled_back"] = True
+        return applied
+
+    logging.debug("DEBUG: Saving board...")
+    save_result = board_manager.save_board(params.get("output_path"))
+    if not save_result["success"]:
+        return save_result
+    logging.debug("DEBUG: Board saved successfully")
+
+    return {
+        "success": True,
+        "message": f"Applied {len(applied['results'])} operations and saved once",
+        "results": applied["results"],
+        "board_info": load_result.get("board_info", {}),
+        "save_info": save_result
+    }
+
+
+def board_getter(getter_name):
+    """Build a handler that loads the board and returns one BoardManager getter."""
+    def handler(params):
+        load_result = load_board(params)
+        if not load_result["success"]:
+            return load_result
+        result = getattr(board_manager, getter_name)(**(params.get("options") or {}))
+        if result["success"]:
+            logging.debug(f"DEBUG: {getter_name} extracted successfully")
+        return result
+    return handler
+
+
+# Read-only BoardManager getters that can be combined in one batch call
+BATCH_GETTERS = {
+    "basic_info": "basic_board_info",
+    "design_rules": "get_design_rules",
+    "layers": "get_layers",
+    "pads": "get_footprints_pads",
+    "tracks_vias": "get_tracks_vias",
+    "zones": "get_zones",
+    "nets": "get_net_list",
+    "geometry": "get_geometry_columns",
+}
+
+
+def batch(params):
+    """Load the board once and run several getters against it."""
+    methods = params.get("methods") or list(BATCH_GETTERS)
+    unknown = [name for name in methods if name not in BATCH_GETTERS]
+    if unknown:
+        return {
+            "success": False,
+            "error": f"Unknown batch methods: {', '.join(unknown)}",
+            "available": list(BATCH_GETTERS)
+        }
+
+    load_result = load_board(params)
+    if not load_result["success"]:
+        return load_result
+
+    options = params.get("options") or {}
+    results = {}
+    for name in methods:
+        try:
+            results[name] = getattr(board_manager, BATCH_GETTERS[name])(**(options.get(name) or {}))
+        except Exception as e:
+            logging.exception(f"ERROR: batch getter {name} failed")
+            results[name] = {"success": False, "error": str(e)}
+
+    return {
+        "success": all(result.get("success") for result in results.values()),
+        "board_info": load_result.get("board_info", {}),
+        "results": results
+    }
+
+
+METHODS = {
+    "load_board": load_board,
+    "batch": batch,
+    "place_component_full": place_component_full,
+    "move_component": move_component,
+    "track_pcb_routes": track_pcb_routes,
+    "apply_transaction": apply_transaction,
+    "get_net_pcb": board_getter("get_net_list"),
+    "extract_basic_info": board_getter("basic_board_info"),
+    "extract_designRules": board_getter("get_design_rules"),
+    "extract_layers": board_getter("get_layers"),
+    "extract_pads": board_getter("get_footprints_pads"),
+    "extract_track_vias": board_getter("get_tracks_vias"),
+    "extract_zones": board_getter("get_zones"),
+    "extract_geometry": board_getter("get_geometry_columns"),
+    "board_cache_stats": lambda params: {"success": True, "data": board_manager.cache.stats()},
+}
+
+# Methods that mutate the board; a failure leaves the cached board out of sync with disk
+WRITE_METHODS = {"place_component_full", "move_component", "track_pcb_routes", "apply_transaction"}
+
+
+def dispatch(method_name, params):
+    """Run one method and always return a JSON-serializable result dict."""
+    if not UTILS_AVAILABLE:
+        return {"success": False, "error": UTILS_ERROR or "Utils not available"}
+
+    handler = METHODS.get(method_name)
+    if handler is None:
+        return {"success": False, "error": f"Unknown method: {method_name}"}
 
-                logging.debug(json.dumps(result))
-                print(json.dumps(result))
+    try:
+        result = handler(params)
+    except Exception as e:
+        logging.exception(f"ERROR: {method_name} failed")
+        result = {"success": False, "error": str(e)}
 
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during routing",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during routing: {str(e)}")
-                all_results.append(error_result)
-                logging.debug(json.dumps(result))
-                print(json.dumps(result))
-
-        elif method_name == "extract_basic_info":
-            project_path = params["project_path"]
-        
-            logging.debug("DEBUG: Loading board for...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
+    if method_name in WRITE_METHODS and not result.get("success"):
+        board_manager.discard_board()
+    return result
 
-            try:
-                pcb_info = board_manager.basic_board_info()
-                
-                if pcb_info["success"]:
-                    logging.debug("DEBUG: Info extracted successfully")
-                    print(json.dumps(pcb_info))
-                else:
-                    print(json.dumps(pcb_info))
-                    sys.exit(1)
 
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during info extraction",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during info extraction: {str(e)}")
-                print(json.dumps(error_result))
-                sys.exit(1)
-
-        elif method_name == "extract_designRules":
-            project_path = params["project_path"]
-        
-            #load current board
-            logging.debug("DEBUG: Loading board for...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
+def claim_stdout():
+    """Return a private handle on the real stdout and point fd 1 at stderr.
 
-            try:
-                pcb_info = board_manager.get_design_rules()
-                
-                if pcb_info["success"]:
-                    logging.debug("DEBUG: Info extracted successfully")
-                    print(json.dumps(pcb_info))
-                else:
-                    print(json.dumps(pcb_info))
-                    sys.exit(1)
+    Prints from pcbnew or the utils then land on stderr and can never corrupt
+    the JSON written back to the bridge.
+    """
+    responses = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    return responses
 
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during info extraction",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during info extraction: {str(e)}")
-                print(json.dumps(error_result))
-                sys.exit(1)
-
-        elif method_name == "extract_layers":
-            project_path = params["project_path"]
-        
-            #load current board
-            logging.debug("DEBUG: Loading board for...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
 
-            try:
-                pcb_info = board_manager.get_layers()
-                
-                if pcb_info["success"]:
-                    logging.debug("DEBUG: Info extracted successfully")
-                    print(json.dumps(pcb_info))
-                else:
-                    print(json.dumps(pcb_info))
-                    sys.exit(1)
+def serve():
+    """Worker mode: answer one JSON request per stdin line until EOF or shutdown.
 
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during info extraction",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during info extraction: {str(e)}")
-                print(json.dumps(error_result))
-                sys.exit(1)
-
-        elif method_name == "extract_pads":
-            project_path = params["project_path"]
-        
-            #load current board
-            logging.debug("DEBUG: Loading board for...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
+    Requests are ``{"id": ..., "method": ..., "params": {...}}`` and each
+    response is written as a single line ``{"id": ..., "result": {...}}``.
+    """
+    responses = claim_stdout()
 
-            try:
-                pcb_info = board_manager.get_footprints_pads()
-                
-                if pcb_info["success"]:
-                    logging.debug("DEBUG: Info extracted successfully")
-                    print(json.dumps(pcb_info))
-                else:
-                    print(json.dumps(pcb_info))
-                    sys.exit(1)
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
 
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during info extraction",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during info extraction: {str(e)}")
-                print(json.dumps(error_result))
-                sys.exit(1)
-
-
-        elif method_name == "extract_track_vias":
-            project_path = params["project_path"]
-        
-            logging.debug("DEBUG: Loading board for...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            response = {"id": None, "result": {"success": False, "error": f"Invalid request: {str(e)}"}}
+        else:
+            if request.get("method") == "shutdown":
+                break
+            result = dispatch(request.get("method"), request.get("params") or {})
+            response = {"id": request.get("id"), "result": result}
 
-            try:
-                pcb_info = board_manager.get_tracks_vias()
-                
-                if pcb_info["success"]:
-                    logging.debug("DEBUG: Info extracted successfully")
-                    print(json.dumps(pcb_info))
-                else:
-                    print(json.dumps(pcb_info))
-                    sys.exit(1)
+        try:
+            payload = json.dumps(response)
+        except (TypeError, ValueError) as e:
+            payload = json.dumps({"id": response["id"], "result": {"success": False, "error": f"Result not serializable: {str(e)}"}})
+        responses.write(payload + "\n")
+        responses.flush()
 
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during info extraction",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during info extraction: {str(e)}")
-                print(json.dumps(error_result))
-                sys.exit(1)
-
-        elif method_name == "extract_zones":
-            project_path = params["project_path"]
-        
-            #load current board
-            logging.debug("DEBUG: Loading board for...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
 
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--worker":
+        serve()
+    else:
+        output = claim_stdout()
+        if len(sys.argv) > 1:
+            params = json.loads(sys.argv[2]) if len(sys.argv) > 2 else {}
+            result = dispatch(sys.argv[1], params)
+        else:
+            result = {"success": False, "error": "No method given"}
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+
+'''
+
+
+class KiCadWorker:
+    """One long-lived KiCad Python process running the subprocess script in worker mode.
+
+    Requests are serialized per worker; a crashed worker is restarted on the
+    next request and a worker that exceeds the request timeout is killed.
+    """
+
+    def __init__(self, kicad_python: str, script_path: str):
+        self.kicad_python = kicad_python
+        self.script_path = script_path
+        self.process: Optional[subprocess.Popen] = None
+        self.responses: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+        self.lock = threading.Lock()
+        self.request_id = 0
+        self.starts = 0
+        self.requests = 0
+        self.timeouts = 0
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def _start(self) -> None:
+        self.process = subprocess.Popen(
+            [self.kicad_python, self.script_path, "--worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        self.responses = queue.Queue()
+        self.starts += 1
+        threading.Thread(target=self._read_responses, args=(self.process, self.responses), daemon=True).start()
+        threading.Thread(target=self._drain_stderr, args=(self.process,), daemon=True).start()
+        logging.info(f"Started KiCad worker (pid {self.process.pid})")
+
+    @staticmethod
+    def _read_responses(process: subprocess.Popen, responses: queue.Queue) -> None:
+        for line in process.stdout:
             try:
-                pcb_info = board_manager.get_zones()
-                
-                if pcb_info["success"]:
-                    logging.debug("DEBUG: Info extracted successfully")
-                    print(json.dumps(pcb_info))
-                else:
-                    print(json.dumps(pcb_info))
-                    sys.exit(1)
+                responses.put(json.loads(line))
+            except ValueError:
+                logging.debug(f"KiCad worker {process.pid}: {line.rstrip()}")
+        # EOF: the worker exited
+        responses.put(None)
+
+    @staticmethod
+    def _drain_stderr(process: subprocess.Popen) -> None:
+        for line in process.stderr:
+            logging.debug(f"KiCad worker {process.pid}: {line.rstrip()}")
+
+    def call(self, method_name: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Send one request and wait for its response.
+
+        Args:
+            method_name: Method name understood by the subprocess script
+            params: JSON-serializable parameters
+            timeout: Seconds to wait before the worker is killed
+
+        Returns:
+            The method's result dict, or an error dict
+        """
+        with self.lock:
+            if not self.is_alive():
+                self._start()
 
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during info extraction",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during info extraction: {str(e)}")
-                print(json.dumps(error_result))
-                sys.exit(1)
-
-
-        elif method_name == "extract_basic_info":
-            project_path = params["project_path"]
-        
-            #load current board
-            logging.debug("DEBUG: Loading board for...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
+            self.request_id += 1
+            request_id = self.request_id
+            self.requests += 1
 
             try:
-                pcb_info = board_manager.basic_board_info()
-                
-                if pcb_info["success"]:
-                    logging.debug("DEBUG: Info extracted successfully")
-                    print(json.dumps(pcb_info))
-                else:
-                    print(json.dumps(pcb_info))
-                    sys.exit(1)
+                self.process.stdin.write(json.dumps({"id": request_id, "method": method_name, "params": params}) + "\n")
+                self.process.stdin.flush()
+            except OSError as e:
+                self.stop(graceful=False)
+                return {"success": False, "error": f"KiCad worker is not accepting requests: {str(e)}"}
+
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    message = self.responses.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    self.timeouts += 1
+                    self.stop(graceful=False)
+                    return {"success": False, "error": f"Command timeout after {timeout:g} seconds"}
+
+                if message is None:
+                    returncode = self.process.wait()
+                    self.stop(graceful=False)
+                    return {"success": False, "error": f"KiCad worker exited with return code {returncode}"}
+
+                if message.get("id") == request_id:
+                    return message.get("result") or {"success": False, "error": "Empty response from KiCad worker"}
+
+    def stop(self, graceful: bool = True) -> None:
+        """Stop the worker process; ``graceful`` asks it to exit before killing it."""
+        process, self.process = self.process, None
+        if process is None or process.poll() is not None:
+            return
+
+        try:
+            if graceful:
+                process.stdin.write(json.dumps({"method": "shutdown"}) + "\n")
+                process.stdin.flush()
+                process.stdin.close()
+                process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pid": self.process.pid if self.is_alive() else None,
+            "starts": self.starts,
+            "requests": self.requests,
+            "timeouts": self.timeouts,
+        }
+
+
+class KiCadWorkerPool:
+    """Size-bounded pool of KiCad workers.
+
+    Requests for the same board always go to the same worker, which keeps that
+    worker's board warm and serializes writes to one file.
+    """
+
+    def __init__(self, kicad_python: str, script_path: str, size: int):
+        self.workers = [KiCadWorker(kicad_python, script_path) for _ in range(size)]
+
+    def worker_for(self, project_path: str) -> KiCadWorker:
+        key = os.path.normcase(os.path.abspath(project_path or ""))
+        return self.workers[zlib.crc32(key.encode("utf-8")) % len(self.workers)]
+
+    def call(self, method_name: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        return self.worker_for(params.get("project_path")).call(method_name, params, timeout)
+
+    def shutdown(self) -> None:
+        for worker in self.workers:
+            worker.stop()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [worker.stats() for worker in self.workers]
+
+
+# Pools are shared by every KiCadBridge using the same interpreter and script
+_pools: Dict[Tuple[str, str], KiCadWorkerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_worker_pool(kicad_python: str, script_path: str) -> Optional[KiCadWorkerPool]:
+    """Return the shared worker pool, or None when KICAD_MCP_WORKERS is 0."""
+    size = _env_int("KICAD_MCP_WORKERS", DEFAULT_WORKER_COUNT)
+    if size <= 0:
+        return None
+
+    with _pools_lock:
+        key = (kicad_python, script_path)
+        if key not in _pools:
+            _pools[key] = KiCadWorkerPool(kicad_python, script_path, size)
+        return _pools[key]
+
+
+def shutdown_worker_pools() -> None:
+    """Stop every KiCad worker process."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
+
+
+atexit.register(shutdown_worker_pools)
 
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during info extraction",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during info extraction: {str(e)}")
-                print(json.dumps(error_result))
-                sys.exit(1)
-        
-        else:
-            print(json.dumps({{"success": False, "error": f"Unknown method: {{method_name}}"}}))
-            
-    except Exception as e:
-        print(json.dumps({{"success": False, "error": str(e)}}))
 
+class KiCadBridge:
+    """Bridge between MCP server and KiCad Python environment."""
 
-    
-'''
+    def __init__(self):
+        self.kicad_python = self._find_kicad_python()
+        self.script_path = self._create_subprocess_script()
+        self.timeout = _env_int("KICAD_MCP_WORKER_TIMEOUT", DEFAULT_REQUEST_TIMEOUT)
+        self.pool = get_worker_pool(self.kicad_python, self.script_path)
+
+    def _find_kicad_python(self) -> str:
+        """Find KiCad Python executable."""
+        paths = [
+            #Edit
+            os.path.join(os.getenv('ProgramFiles'), 'KiCad', '9.0', 'bin', 'python.exe'),
+            os.path.join(os.getenv('LOCALAPPDATA'), 'Programs', 'KiCad', '9.0', 'bin', 'python.exe')
+        ]
+
+        for path in paths:
+            if os.path.exists(path):
+                return path
+
+        raise FileNotFoundError("KiCad Python not found")
+
+    def _create_subprocess_script(self) -> str:
+        """Create the subprocess script that uses your existing files."""
+
+        # Get current directory
+        current_dir = Path(__file__).parent
 
         project_root_path = str(current_dir).replace('\\', '/')
-        formatted_script = script_content.replace("{project_root}", project_root_path) 
+        formatted_script = SUBPROCESS_SCRIPT.replace("{project_root}", project_root_path)
 
         # Save script
         script_path = current_dir / "kicad_script_subprocess.py"
         script_path.write_text(formatted_script)
         return str(script_path)
-    
+
 
     def _run_subprocess(self, method_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a method in a pooled KiCad worker (or a fresh process if the pool is disabled)."""
+        if params.get("project_path"):
+            # Only for the in-process caches (board_parses, list_snapshots, drc_results);
+            # the worker validates its loaded boards by mtime and size itself
+            watch_file_directory(params["project_path"])
+        if self.pool is not None:
+            try:
+                return self.pool.call(method_name, params, self.timeout)
+            except Exception as e:
+                return {"success": False, "error": f"KiCad worker call failed: {str(e)}"}
+
+        return self._run_once(method_name, params)
+
+    def _run_once(self, method_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Run subprocess with method and parameters."""
-        try:             
+        try:
             result = subprocess.run([
-                self.kicad_python, 
-                self.script_path, 
-                method_name, 
+                self.kicad_python,
+                self.script_path,
+                method_name,
                 json.dumps(params)],
 
                 capture_output=True,
                 text=True,
-                stdin=subprocess.DEVNULL, 
-                timeout=60
+                stdin=subprocess.DEVNULL,
+                timeout=self.timeout
             )
 
             if result.returncode != 0:
@@ -596,7 +652,7 @@ if __name__ == "__main__":
                     "stdout": result.stdout,
                     "stderr": result.stderr
                 }
-            
+
             # Parse the JSON output
             try:
                 return json.loads(result.stdout)
@@ -607,20 +663,28 @@ if __name__ == "__main__":
                     "stdout": result.stdout,
                     "stderr": result.stderr
                 }
-            
+
         except subprocess.TimeoutExpired:
-            return {"success": False, "error": "Command timeout after 60 seconds"}
+            return {"success": False, "error": f"Command timeout after {self.timeout} seconds"}
         except Exception as e:
             return {"success": False, "error": f"Subprocess execution failed: {str(e)}"}
-        
+
+    def worker_stats(self) -> List[Dict[str, Any]]:
+        """Per-worker process statistics (empty when the pool is disabled)."""
+        return self.pool.stats() if self.pool is not None else []
+
+    def board_cache_stats(self, project_path: str = "") -> Dict[str, Any]:
+        """Board cache statistics of the worker that serves ``project_path``."""
+        return self._run_subprocess("board_cache_stats", {"project_path": project_path})
+
     #functions that are called by tools
 
     def load_board(self, project_path: str) -> Dict[str, Any]:
         return self._run_subprocess("load_board", {"project_path": project_path})
-    
-    def place_component(self, project_path: str, component_id: str, position: Dict[str, Any],  library: str, 
+
+    def place_component(self, project_path: str, component_id: str, position: Dict[str, Any],  library: str,
                        reference: Optional[str] = None, value: Optional[str] = None,
-                       rotation: float = 0, layer: str = "F.Cu", 
+                       rotation: float = 0, layer: str = "F.Cu",
                        output_path: Optional[str] = None) -> Dict[str, Any]:
         """Place a single component (load -> place -> save)."""
         return self._run_subprocess("place_component_full", {
@@ -634,9 +698,9 @@ if __name__ == "__main__":
             "layer": layer,
             "output_path": output_path
         })
-    
 
-    def move_component(self, project_path: str, reference: str, position: Dict[str, Any], 
+
+    def move_component(self, project_path: str, reference: str, position: Dict[str, Any],
                       rotation: Optional[float] = None) -> Dict[str, Any]:
         """Move a component to a new position (load -> move -> save)."""
         return self._run_subprocess("move_component", {
@@ -645,25 +709,56 @@ if __name__ == "__main__":
             "position": position,
             "rotation": rotation
         })
-    
+
+    def apply_transaction(self, project_path: str, operations: List[Dict[str, Any]],
+                          output_path: Optional[str] = None) -> Dict[str, Any]:
+        """Apply place/move/rotate/route operations and save once (load -> edit all -> save).
+
+        The whole batch is rolled back if any operation fails.
+        """
+        return self._run_subprocess("apply_transaction", {
+            "project_path": project_path,
+            "operations": operations,
+            "output_path": output_path
+        })
+
     def get_net_pcb(self, project_path: str) -> Dict[str, Any]:
         """
         Extract Net List
         """
         return self._run_subprocess("get_net_pcb", {
             "project_path": project_path})
-    
+
     def track_pcb_routes(self, project_path: str, route: Dict[str, Any]) -> Dict[str, Any]:
        """
        place routes on pcb board
        """
        return self._run_subprocess("track_pcb_routes", {
         "project_path": project_path,
-        "route": route  
+        "route": route
     })
 
 
-    #extract board info: 
+    #extract board info:
+
+    def batch(self, project_path: str, methods: Optional[List[str]] = None,
+              options: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Load the board once and run several read-only extractions.
+
+        Args:
+            project_path: Path to the .kicad_pcb file
+            methods: Getter names (basic_info, design_rules, layers, pads,
+                tracks_vias, zones, nets, geometry); all of them if omitted
+            options: Keyword arguments per getter, e.g. {"pads": {"layout": "nested"}}
+
+        Returns:
+            Dict with one result per requested method under "results"
+        """
+        return self._run_subprocess("batch", {
+        "project_path": project_path,
+        "methods": methods,
+        "options": options or {}
+    })
 
     def extract_basic_info(self, project_path: str) -> Dict[str, Any]:
         return self._run_subprocess("extract_basic_info", {
@@ -680,9 +775,11 @@ if __name__ == "__main__":
         "project_path": project_path
     })
 
-    def extract_pads(self, project_path: str) -> Dict[str, Any]:
+    def extract_pads(self, project_path: str, layout: str = "normalized") -> Dict[str, Any]:
+        """Extract footprints and pads ("normalized" or the per-pad "nested" layout)."""
         return self._run_subprocess("extract_pads", {
-        "project_path": project_path
+        "project_path": project_path,
+        "options": {"layout": layout}
     })
 
     def extract_track_vias(self, project_path: str) -> Dict[str, Any]:
@@ -695,14 +792,35 @@ if __name__ == "__main__":
         "project_path": project_path
     })
 
+    def extract_geometry(self, project_path: str, kinds: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Extract pad, track and via geometry as compressed typed columns (see geometry_columns)."""
+        return self._run_subprocess("extract_geometry", {
+        "project_path": project_path,
+        "options": {"kinds": kinds}
+    })
 
 
-
-    
-
-    
-
+_bridge: Optional[KiCadBridge] = None
+_bridge_failed = False
+_bridge_lock = threading.Lock()
 
 
+def get_kicad_bridge() -> Optional[KiCadBridge]:
+    """Return the shared KiCadBridge, created on first use.
 
+    Creating the bridge looks up KiCad's Python and writes the worker script,
+    so it is deferred until a tool needs KiCad instead of running at import.
 
+    Returns:
+        The bridge, or None if it could not be created (the error is logged once)
+    """
+    global _bridge, _bridge_failed
+    with _bridge_lock:
+        if _bridge is None and not _bridge_failed:
+            try:
+                _bridge = KiCadBridge()
+                logging.info("KiCadBridge initialized successfully")
+            except Exception as e:
+                logging.error(f"Failed to initialize KiCadBridge: {e}")
+                _bridge_failed = True
+        return _bridge
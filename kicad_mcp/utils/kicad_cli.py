@@ -0,0 +1,181 @@
+"""
+Shared asynchronous runner for kicad-cli.
+
+kicad-cli runs (DRC, exports) can take tens of seconds. They are started
+with ``asyncio.create_subprocess_exec`` so the event loop keeps serving other
+requests, limited to ``KICAD_MCP_CLI_CONCURRENCY`` concurrent processes, and
+killed when they time out or the calling request is cancelled.
+"""
+import os
+import shutil
+import asyncio
+import logging
+import weakref
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+from mcp.server.fastmcp import Context
+
+from kicad_mcp.config import KICAD_APP_PATH, system
+
+# kicad-cli processes allowed to run at the same time
+DEFAULT_CLI_CONCURRENCY = 2
+
+# Seconds a kicad-cli run may take when the caller sets no timeout
+DEFAULT_CLI_TIMEOUT = 300
+
+# One semaphore per event loop (asyncio primitives are bound to their loop)
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+@dataclass
+class CliResult:
+    """Outcome of a kicad-cli run."""
+    returncode: int
+    stdout: str
+    stderr: str
+
+
+def find_kicad_cli() -> Optional[str]:
+    """Find the kicad-cli executable.
+
+    Looks in the configured KiCad installation first, then on PATH, then in
+    common installation locations.
+
+    Returns:
+        Path to kicad-cli if found, None otherwise
+    """
+    if system == "Darwin":
+        candidates = [os.path.join(KICAD_APP_PATH, "Contents/MacOS/kicad-cli")]
+    elif system == "Windows":
+        candidates = [os.path.join(KICAD_APP_PATH, "bin", "kicad-cli.exe")]
+    else:
+        candidates = []
+
+    for name in ("kicad-cli.exe", "kicad-cli") if system == "Windows" else ("kicad-cli",):
+        found = shutil.which(name)
+        if found:
+            candidates.append(found)
+
+    if system == "Windows":
+        candidates += [
+            r"C:\Program Files\KiCad\bin\kicad-cli.exe",
+            r"C:\Program Files (x86)\KiCad\bin\kicad-cli.exe"
+        ]
+    elif system == "Darwin":
+        candidates += [
+            "/Applications/KiCad/KiCad.app/Contents/MacOS/kicad-cli",
+            "/Applications/KiCad/kicad-cli"
+        ]
+    else:
+        candidates += [
+            "/usr/bin/kicad-cli",
+            "/usr/local/bin/kicad-cli",
+            "/opt/kicad/bin/kicad-cli"
+        ]
+
+    for path in candidates:
+        if os.path.isfile(path) and os.access(path, os.X_OK):
+            return os.path.normpath(path)
+    return None
+
+
+def _semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(1, _env_int("KICAD_MCP_CLI_CONCURRENCY", DEFAULT_CLI_CONCURRENCY)))
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+async def _read_stream(stream: asyncio.StreamReader, lines: List[str], ctx: Optional[Context]) -> None:
+    """Collect a pipe's lines, forwarding each one to the client when a context is given."""
+    while True:
+        raw = await stream.readline()
+        if not raw:
+            break
+        line = raw.decode(errors="replace")
+        lines.append(line)
+        text = line.strip()
+        if ctx is not None and text:
+            try:
+                await ctx.info(f"kicad-cli: {text}")
+            except Exception as e:
+                # Progress messages are best effort; never fail the run over them
+                logging.debug(f"Could not forward kicad-cli output: {e}")
+
+
+async def _kill(process: asyncio.subprocess.Process) -> None:
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+    await process.wait()
+
+
+async def run_kicad_cli(args: Sequence[str], ctx: Optional[Context] = None,
+                        timeout: Optional[float] = None, kicad_cli: Optional[str] = None) -> CliResult:
+    """Run kicad-cli without blocking the event loop.
+
+    Waits for a free slot if KICAD_MCP_CLI_CONCURRENCY runs are already in
+    progress. stderr lines are streamed to ``ctx.info`` as they arrive.
+
+    Args:
+        args: Arguments after the executable, e.g. ["pcb", "drc", ...]
+        ctx: MCP context to stream progress messages to
+        timeout: Seconds before the process is killed (default: KICAD_MCP_CLI_TIMEOUT)
+        kicad_cli: Executable to run (default: find_kicad_cli())
+
+    Returns:
+        CliResult with the exit code and captured output
+
+    Raises:
+        FileNotFoundError: If kicad-cli cannot be found
+        asyncio.TimeoutError: If the run exceeds the timeout (the process is killed)
+        asyncio.CancelledError: If the caller is cancelled (the process is killed)
+    """
+    executable = kicad_cli or find_kicad_cli()
+    if not executable:
+        raise FileNotFoundError("kicad-cli not found. Please ensure KiCad 9.0+ is installed and kicad-cli is available.")
+    if timeout is None:
+        timeout = _env_int("KICAD_MCP_CLI_TIMEOUT", DEFAULT_CLI_TIMEOUT)
+
+    async with _semaphore():
+        logging.debug(f"Running: {executable} {' '.join(args)}")
+        process = await asyncio.create_subprocess_exec(
+            executable, *args,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout: List[str] = []
+        stderr: List[str] = []
+        tasks = [
+            asyncio.ensure_future(_read_stream(process.stdout, stdout, None)),
+            asyncio.ensure_future(_read_stream(process.stderr, stderr, ctx)),
+            asyncio.ensure_future(process.wait())
+        ]
+
+        try:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            if pending:
+                logging.warning(f"kicad-cli timed out after {timeout} s: {' '.join(args)}")
+                raise asyncio.TimeoutError()
+        finally:
+            if process.returncode is None:
+                # Timed out or cancelled: do not leave kicad-cli running
+                await asyncio.shield(_kill(process))
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    return CliResult(process.returncode, "".join(stdout), "".join(stderr))
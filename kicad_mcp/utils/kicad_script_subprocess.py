@@ -26,504 +26,341 @@ try:
     from utils.set_components_utils import ComponentManager
     from utils.board_utils import BoardManager
     UTILS_AVAILABLE = True
-except ImportError as e:
-    print(json.dumps({{"success": False, "error": f"Utils import failed: {{str(e)}}"}}, indent=2))
+    UTILS_ERROR = None
+except Exception as e:
     UTILS_AVAILABLE = False
+    UTILS_ERROR = f"Utils import failed: {str(e)}"
+    logging.error(UTILS_ERROR)
 
-# Global instances
+# Global instances, kept alive between requests in worker mode
 if UTILS_AVAILABLE:
     board_manager = BoardManager()
     component_manager = ComponentManager()
 
-if __name__ == "__main__":
+
+def load_board(params):
+    """Load the board named in params and hand it to the component manager."""
+    logging.debug("DEBUG: Loading board...")
+    result = board_manager.load_board(params["project_path"])
+    if result["success"]:
+        component_manager.set_board(board_manager.get_board())
+        logging.debug("DEBUG: Board loaded successfully")
+    return result
+
+
+def place_component_full(params):
+    load_result = load_board(params)
+    if not load_result["success"]:
+        return load_result
+
+    logging.debug("DEBUG: Placing component...")
+    footprint = component_manager.create_footprint(
+        component_id=params["component_id"],
+        position=params["position"],
+        library=params["library"],
+        reference=params.get("reference"),
+        value=params.get("value"),
+        rotation=params.get("rotation", 0),
+        layer=params.get("layer", "F.Cu"),
+    )
+    component_info = component_manager.place_footprint(footprint)
+    logging.debug("DEBUG: Component placed successfully")
+
+    logging.debug("DEBUG: Saving board...")
+    save_result = board_manager.save_board(params.get("output_path"))
+    if not save_result["success"]:
+        return save_result
+    logging.debug("DEBUG: Board saved successfully")
+
+    return {
+        "success": True,
+        "message": f"Component placed and saved: {params['component_id']}",
+        "component": {
+            "reference": component_info.reference,
+            "value": component_info.value,
+            "footprint": component_info.footprint,
+            "position": component_info.position,
+            "rotation": component_info.rotation,
+            "layer": component_info.layer,
+        },
+        "board_info": load_result.get("board_info", {}),
+        "save_info": save_result
+    }
+
+
+def move_component(params):
+    reference = params.get("reference")
+    position = params["position"]
+    rotation = params.get("rotation")
+
+    load_result = load_board(params)
+    if not load_result["success"]:
+        return load_result
+
+    logging.debug("DEBUG: Moving component ...")
     try:
-        if not UTILS_AVAILABLE:
-            print(json.dumps({{"success": False, "error": "Utils not available"}}))
-            sys.exit(1)
-            
-        method_name = sys.argv[1]
-        params = json.loads(sys.argv[2]) if len(sys.argv) > 2 else {{}}
-        
-        if method_name == "load_board":
-            result = board_manager.load_board(params["project_path"])
-            if result["success"]:
-                component_manager.set_board(board_manager.get_board())
-                logging.debug(json.dumps(result))
-
-            print(json.dumps(result))
-           
-        
-        elif method_name == "place_component_full":
-            project_path = params["project_path"]
-            
-            # Step 1: Load board
-            logging.debug("DEBUG: Loading board...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
-            
-            # Step 2: Place component
-            logging.debug("DEBUG: Placing component...")
-            footprint = component_manager.create_footprint(
-                component_id=params["component_id"],
-                position=params["position"],
-                library=params["library"],
-                reference=params.get("reference"),
-                value=params.get("value"),
-                rotation=params.get("rotation", 0),
-                layer=params.get("layer", "F.Cu"),
-            )
-            component_info = component_manager.place_footprint(footprint)
-            logging.debug("DEBUG: Component placed successfully")
-            
-            # Step 3: Save board
-            logging.debug("DEBUG: Saving board...")
-            save_result = board_manager.save_board(params.get("output_path"))
-            if not save_result["success"]:
-                print(json.dumps(save_result))
-                sys.exit(1)
-            
-            logging.debug("DEBUG: Board saved successfully")
-            
-            result = {{
-                "success": True,
-                "message": f"Component placed and saved: {{params['component_id']}}",
-                "component": {{
-                    "reference": component_info.reference,
-                    "value": component_info.value,
-                    "footprint": component_info.footprint,
-                    "position": component_info.position,
-                    "rotation": component_info.rotation,
-                    "layer": component_info.layer,
-                }},
-                "board_info": load_result.get("board_info", {{}}),
-                "save_info": save_result
-            }}
-            logging.debug(json.dumps(result))
-            print(json.dumps(result))
-
-        elif method_name == "move_component":
-            project_path = params["project_path"]
-            reference = params.get("reference")
-            position = params["position"]
-            rotation = params.get("rotation")
-            
-            # Step 1: Load board
-            logging.debug("DEBUG: Loading board for move operation...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
-            
-            # Step 2: Move component
-            logging.debug("DEBUG: Moving component ...")
-            try:
-                move_result = component_manager.move_component(
-                    reference=reference,
-                    position=position,
-                    rotation=rotation
-                )
-                
-                logging.debug(move_result.reference)    
-                logging.debug("DEBUG: Component moved successfully")
-                
-                # Step 3: Save board
-                logging.debug("DEBUG: Saving board...")
-                save_result = board_manager.save_board()
-                if not save_result["success"]:
-                    print(json.dumps(save_result))
-                    sys.exit(1)
-                
-                logging.debug("DEBUG: Board saved successfully")
-                
-                # Return combined result
-                result = {{
-                    "success": True,
-                    "message": "Component moved successfully",
-                    "component": {{
-                        "reference": reference,
-                        "position": position,
-                        "rotation": rotation
-                    }},
-                    "board_info": load_result.get("board_info", {{}}),
-                    "save_info": save_result
-                }}
-                logging.debug(json.dumps(result))
-                print(json.dumps(result))
-                
-            except Exception as e:
-                error_result = {{
-                    "success": False,
-                    "error": f"Failed to move component: {{str(e)}}"
-                }}
-                logging.error(json.dumps(error_result))
-                print(json.dumps(error_result))
-
-        elif method_name == "get_net_pcb":
-            project_path = params["project_path"]
-
-            logging.debug("DEBUG: Loading board...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
-
-            logging.debug("DEBUG: Extracting Nets ...")
-            
-            try:
-                net_extract = board_manager.get_net_list()
-                
-                if net_extract["success"]:
-                    logging.debug("DEBUG: Nets extracted successfully")
-                    print(json.dumps(net_extract))
-                else:
-                    print(json.dumps(net_extract))
-                    sys.exit(1)
-                    
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during net extraction",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during net extraction: {str(e)}")
-                print(json.dumps(error_result))
-                sys.exit(1)
-
-        elif method_name == "track_pcb_routes":
-            project_path = params["project_path"]
-        
-            logging.debug("DEBUG: Loading board...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
-
-            #Set track 
-            all_results = [] 
-            try:
-                routes = params["route"]
-
-                for route in routes:
-                    start = route.get("start")
-                    end = route.get("end")
-                    layer = route.get("layer")
-                    width = route.get("width")
-                    net = route.get("net")
-
-                    # Validate the route parameters
-                    if not all([start, end, layer, width, net]):
-                        error_result = {
-                            "success": False,
-                            "message": "Missing required route parameters",
-                            "route": route
-                        }
-                        logging.error(f"ERROR: Missing required parameters for route: {route}")
-                        all_results.append(error_result)
-                        continue
-
-                    # Trace track for this route
-                    trace_track = board_manager.trace_routes(start=start, end=end, layer=layer, width=width, net=net)
-
-                    if not trace_track["success"]:
-                        logging.error(f"ERROR: Failed to route: {trace_track.get('message', 'Unknown error')}")
-                        all_results.append(trace_track)
-                        continue
-
-                    all_results.append(trace_track)
-
-
-                # Step 3: Save board
-                logging.debug("DEBUG: Saving board...")
-                save_result = board_manager.save_board()
-                
-                if not save_result["success"]:
-                    print(json.dumps(save_result))
-                    sys.exit(1)
-
-                logging.debug("DEBUG: Board saved successfully")
-
-                result = {
-                    "success": True,
-                    "message": "Routing operation completed",
-                    "routes": all_results,  # Include the results for each route
-                    "save_info": save_result
-                }
-
-                logging.debug(json.dumps(result))
-                print(json.dumps(result))
-
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during routing",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during routing: {str(e)}")
-                all_results.append(error_result)
-                logging.debug(json.dumps(result))
-                print(json.dumps(result))
-
-        elif method_name == "extract_basic_info":
-            project_path = params["project_path"]
-        
-            logging.debug("DEBUG: Loading board for...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
-
-            try:
-                pcb_info = board_manager.basic_board_info()
-                
-                if pcb_info["success"]:
-                    logging.debug("DEBUG: Info extracted successfully")
-                    print(json.dumps(pcb_info))
-                else:
-                    print(json.dumps(pcb_info))
-                    sys.exit(1)
-
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during info extraction",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during info extraction: {str(e)}")
-                print(json.dumps(error_result))
-                sys.exit(1)
-
-        elif method_name == "extract_designRules":
-            project_path = params["project_path"]
-        
-            #load current board
-            logging.debug("DEBUG: Loading board for...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
-
-            try:
-                pcb_info = board_manager.get_design_rules()
-                
-                if pcb_info["success"]:
-                    logging.debug("DEBUG: Info extracted successfully")
-                    print(json.dumps(pcb_info))
-                else:
-                    print(json.dumps(pcb_info))
-                    sys.exit(1)
-
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during info extraction",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during info extraction: {str(e)}")
-                print(json.dumps(error_result))
-                sys.exit(1)
-
-        elif method_name == "extract_layers":
-            project_path = params["project_path"]
-        
-            #load current board
-            logging.debug("DEBUG: Loading board for...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
-
-            try:
-                pcb_info = board_manager.get_layers()
-                
-                if pcb_info["success"]:
-                    logging.debug("DEBUG: Info extracted successfully")
-                    print(json.dumps(pcb_info))
-                else:
-                    print(json.dumps(pcb_info))
-                    sys.exit(1)
-
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during info extraction",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during info extraction: {str(e)}")
-                print(json.dumps(error_result))
-                sys.exit(1)
-
-        elif method_name == "extract_pads":
-            project_path = params["project_path"]
-        
-            #load current board
-            logging.debug("DEBUG: Loading board for...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
-
-            try:
-                pcb_info = board_manager.get_footprints_pads()
-                
-                if pcb_info["success"]:
-                    logging.debug("DEBUG: Info extracted successfully")
-                    print(json.dumps(pcb_info))
-                else:
-                    print(json.dumps(pcb_info))
-                    sys.exit(1)
-
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during info extraction",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during info extraction: {str(e)}")
-                print(json.dumps(error_result))
-                sys.exit(1)
-
-
-        elif method_name == "extract_track_vias":
-            project_path = params["project_path"]
-        
-            logging.debug("DEBUG: Loading board for...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
-
-            try:
-                pcb_info = board_manager.get_tracks_vias()
-                
-                if pcb_info["success"]:
-                    logging.debug("DEBUG: Info extracted successfully")
-                    print(json.dumps(pcb_info))
-                else:
-                    print(json.dumps(pcb_info))
-                    sys.exit(1)
-
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during info extraction",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during info extraction: {str(e)}")
-                print(json.dumps(error_result))
-                sys.exit(1)
-
-        elif method_name == "extract_zones":
-            project_path = params["project_path"]
-        
-            #load current board
-            logging.debug("DEBUG: Loading board for...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
-
-            try:
-                pcb_info = board_manager.get_zones()
-                
-                if pcb_info["success"]:
-                    logging.debug("DEBUG: Info extracted successfully")
-                    print(json.dumps(pcb_info))
-                else:
-                    print(json.dumps(pcb_info))
-                    sys.exit(1)
-
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during info extraction",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during info extraction: {str(e)}")
-                print(json.dumps(error_result))
-                sys.exit(1)
-
-
-        elif method_name == "extract_basic_info":
-            project_path = params["project_path"]
-        
-            #load current board
-            logging.debug("DEBUG: Loading board for...")
-            load_result = board_manager.load_board(project_path)
-            if not load_result["success"]:
-                print(json.dumps(load_result))
-                sys.exit(1)
-            
-            # Set board in component manager
-            component_manager.set_board(board_manager.get_board())
-            logging.debug("DEBUG: Board loaded successfully")
-
-            try:
-                pcb_info = board_manager.basic_board_info()
-                
-                if pcb_info["success"]:
-                    logging.debug("DEBUG: Info extracted successfully")
-                    print(json.dumps(pcb_info))
-                else:
-                    print(json.dumps(pcb_info))
-                    sys.exit(1)
-
-            except Exception as e:
-                error_result = {
-                    "success": False,
-                    "message": "Exception occurred during info extraction",
-                    "error": str(e)
-                }
-                logging.error(f"ERROR: Exception during info extraction: {str(e)}")
-                print(json.dumps(error_result))
-                sys.exit(1)
-        
-        else:
-            print(json.dumps({{"success": False, "error": f"Unknown method: {{method_name}}"}}))
-            
+        move_result = component_manager.move_component(
+            reference=reference,
+            position=position,
+            rotation=rotation
+        )
+        logging.debug(move_result.reference)
+        logging.debug("DEBUG: Component moved successfully")
+    except Exception as e:
+        error_result = {
+            "success": False,
+            "error": f"Failed to move component: {str(e)}"
+        }
+        logging.error(json.dumps(error_result))
+        return error_result
+
+    logging.debug("DEBUG: Saving board...")
+    save_result = board_manager.save_board()
+    if not save_result["success"]:
+        return save_result
+    logging.debug("DEBUG: Board saved successfully")
+
+    return {
+        "success": True,
+        "message": "Component moved successfully",
+        "component": {
+            "reference": reference,
+            "position": position,
+            "rotation": rotation
+        },
+        "board_info": load_result.get("board_info", {}),
+        "save_info": save_result
+    }
+
+
+def track_pcb_routes(params):
+    load_result = load_board(params)
+    if not load_result["success"]:
+        return load_result
+
+    all_results = []
+    for route in params["route"]:
+        start = route.get("start")
+        end = route.get("end")
+        layer = route.get("layer")
+        width = route.get("width")
+        net = route.get("net")
+
+        # Validate the route parameters
+        if not all([start, end, layer, width, net]):
+            logging.error(f"ERROR: Missing required parameters for route: {route}")
+            all_results.append({
+                "success": False,
+                "message": "Missing required route parameters",
+                "route": route
+            })
+            continue
+
+        trace_track = board_manager.trace_routes(start=start, end=end, layer=layer, width=width, net=net)
+        if not trace_track["success"]:
+            logging.error(f"ERROR: Failed to route: {trace_track.get('message', 'Unknown error')}")
+        all_results.append(trace_track)
+
+    logging.debug("DEBUG: Saving board...")
+    save_result = board_manager.save_board()
+    if not save_result["success"]:
+        return save_result
+    logging.debug("DEBUG: Board saved successfully")
+
+    return {
+        "success": True,
+        "message": "Routing operation completed",
+        "routes": all_results,  # Include the results for each route
+        "save_info": save_result
+    }
+
+
+def apply_transaction(params):
+    """Apply a list of edits to one in-memory board and save once.
+
+    If any operation fails nothing is saved and the edited board is dropped
+    from the cache, so the file on disk is left exactly as it was.
+    """
+    load_result = load_board(params)
+    if not load_result["success"]:
+        return load_result
+
+    applied = component_manager.apply_operations(
+        params.get("operations") or [],
+        route_handler=board_manager.trace_routes
+    )
+    if not applied["success"]:
+        board_manager.discard_board()
+        applied["rolled_back"] = True
+        return applied
+
+    logging.debug("DEBUG: Saving board...")
+    save_result = board_manager.save_board(params.get("output_path"))
+    if not save_result["success"]:
+        return save_result
+    logging.debug("DEBUG: Board saved successfully")
+
+    return {
+        "success": True,
+        "message": f"Applied {len(applied['results'])} operations and saved once",
+        "results": applied["results"],
+        "board_info": load_result.get("board_info", {}),
+        "save_info": save_result
+    }
+
+
+def board_getter(getter_name):
+    """Build a handler that loads the board and returns one BoardManager getter."""
+    def handler(params):
+        load_result = load_board(params)
+        if not load_result["success"]:
+            return load_result
+        result = getattr(board_manager, getter_name)(**(params.get("options") or {}))
+        if result["success"]:
+            logging.debug(f"DEBUG: {getter_name} extracted successfully")
+        return result
+    return handler
+
+
+# Read-only BoardManager getters that can be combined in one batch call
+BATCH_GETTERS = {
+    "basic_info": "basic_board_info",
+    "design_rules": "get_design_rules",
+    "layers": "get_layers",
+    "pads": "get_footprints_pads",
+    "tracks_vias": "get_tracks_vias",
+    "zones": "get_zones",
+    "nets": "get_net_list",
+    "geometry": "get_geometry_columns",
+}
+
+
+def batch(params):
+    """Load the board once and run several getters against it."""
+    methods = params.get("methods") or list(BATCH_GETTERS)
+    unknown = [name for name in methods if name not in BATCH_GETTERS]
+    if unknown:
+        return {
+            "success": False,
+            "error": f"Unknown batch methods: {', '.join(unknown)}",
+            "available": list(BATCH_GETTERS)
+        }
+
+    load_result = load_board(params)
+    if not load_result["success"]:
+        return load_result
+
+    options = params.get("options") or {}
+    results = {}
+    for name in methods:
+        try:
+            results[name] = getattr(board_manager, BATCH_GETTERS[name])(**(options.get(name) or {}))
+        except Exception as e:
+            logging.exception(f"ERROR: batch getter {name} failed")
+            results[name] = {"success": False, "error": str(e)}
+
+    return {
+        "success": all(result.get("success") for result in results.values()),
+        "board_info": load_result.get("board_info", {}),
+        "results": results
+    }
+
+
+METHODS = {
+    "load_board": load_board,
+    "batch": batch,
+    "place_component_full": place_component_full,
+    "move_component": move_component,
+    "track_pcb_routes": track_pcb_routes,
+    "apply_transaction": apply_transaction,
+    "get_net_pcb": board_getter("get_net_list"),
+    "extract_basic_info": board_getter("basic_board_info"),
+    "extract_designRules": board_getter("get_design_rules"),
+    "extract_layers": board_getter("get_layers"),
+    "extract_pads": board_getter("get_footprints_pads"),
+    "extract_track_vias": board_getter("get_tracks_vias"),
+    "extract_zones": board_getter("get_zones"),
+    "extract_geometry": board_getter("get_geometry_columns"),
+    "board_cache_stats": lambda params: {"success": True, "data": board_manager.cache.stats()},
+}
+
+# Methods that mutate the board; a failure leaves the cached board out of sync with disk
+WRITE_METHODS = {"place_component_full", "move_component", "track_pcb_routes", "apply_transaction"}
+
+
+def dispatch(method_name, params):
+    """Run one method and always return a JSON-serializable result dict."""
+    if not UTILS_AVAILABLE:
+        return {"success": False, "error": UTILS_ERROR or "Utils not available"}
+
+    handler = METHODS.get(method_name)
+    if handler is None:
+        return {"success": False, "error": f"Unknown method: {method_name}"}
+
+    try:
+        result = handler(params)
     except Exception as e:
-        print(json.dumps({{"success": False, "error": str(e)}}))
+        logging.exception(f"ERROR: {method_name} failed")
+        result = {"success": False, "error": str(e)}
+
+    if method_name in WRITE_METHODS and not result.get("success"):
+        board_manager.discard_board()
+    return result
+
+
+def claim_stdout():
+    """Return a private handle on the real stdout and point fd 1 at stderr.
+
+    Prints from pcbnew or the utils then land on stderr and can never corrupt
+    the JSON written back to the bridge.
+    """
+    responses = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    return responses
 
 
-    
+def serve():
+    """Worker mode: answer one JSON request per stdin line until EOF or shutdown.
+
+    Requests are ``{"id": ..., "method": ..., "params": {...}}`` and each
+    response is written as a single line ``{"id": ..., "result": {...}}``.
+    """
+    responses = claim_stdout()
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            response = {"id": None, "result": {"success": False, "error": f"Invalid request: {str(e)}"}}
+        else:
+            if request.get("method") == "shutdown":
+                break
+            result = dispatch(request.get("method"), request.get("params") or {})
+            response = {"id": request.get("id"), "result": result}
+
+        try:
+            payload = json.dumps(response)
+        except (TypeError, ValueError) as e:
+            payload = json.dumps({"id": response["id"], "result": {"success": False, "error": f"Result not serializable: {str(e)}"}})
+        responses.write(payload + "\n")
+        responses.flush()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--worker":
+        serve()
+    else:
+        output = claim_stdout()
+        if len(sys.argv) > 1:
+            params = json.loads(sys.argv[2]) if len(sys.argv) > 2 else {}
+            result = dispatch(sys.argv[1], params)
+        else:
+            result = {"success": False, "error": "No method given"}
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+
@@ -8,6 +8,7 @@ import sys # Add sys import
 from typing import Dict, List, Any
 
 from kicad_mcp.config import KICAD_USER_DIR, KICAD_APP_PATH, KICAD_EXTENSIONS, ADDITIONAL_SEARCH_PATHS
+from kicad_mcp.utils.project_index import get_project_index
 
 # Get PID for logging - Removed, handled by logging config
 # _PID = os.getpid()
@@ -18,7 +19,6 @@ def find_kicad_projects() -> List[Dict[str, Any]]:
     Returns:
         List of dictionaries with project information
     """
-    projects = []
     logging.info("Attempting to find KiCad projects...") # Log start
     # Search directories to look for KiCad projects
     raw_search_dirs = [KICAD_USER_DIR] + ADDITIONAL_SEARCH_PATHS
@@ -36,38 +36,14 @@ def find_kicad_projects() -> List[Dict[str, Any]]:
             
     logging.info(f"Expanded search directories: {expanded_search_dirs}")
 
-    for search_dir in expanded_search_dirs:
-        if not os.path.exists(search_dir):
-            logging.warning(f"Expanded search directory does not exist: {search_dir}") # Use warning level
-            continue
-        
-        logging.info(f"Scanning expanded directory: {search_dir}")
-        # Use followlinks=True to follow symlinks if needed
-        for root, _, files in os.walk(search_dir, followlinks=True):
-            for file in files:
-                if file.endswith(KICAD_EXTENSIONS["project"]):
-                    project_path = os.path.join(root, file)
-                    # Check if it's a real file and not a broken symlink
-                    if not os.path.isfile(project_path):
-                        logging.info(f"Skipping non-file/broken symlink: {project_path}")
-                        continue
-                    
-                    try:
-                        # Attempt to get modification time to ensure file is accessible
-                        mod_time = os.path.getmtime(project_path)
-                        rel_path = os.path.relpath(project_path, search_dir)
-                        project_name = get_project_name_from_path(project_path)
-
-                        logging.info(f"Found accessible KiCad project: {project_path}")
-                        projects.append({
-                            "name": project_name,
-                            "path": project_path,
-                            "relative_path": rel_path,
-                            "modified": mod_time
-                        })
-                    except OSError as e:
-                        logging.error(f"Error accessing project file {project_path}: {e}") # Use error level
-                        continue # Skip if we can't access it
+    # Only directories changed since the last call are listed again
+    index = get_project_index()
+    if os.environ.get("KICAD_MCP_PROJECT_WATCH", "").strip().lower() in ("1", "true", "yes") \
+            and index.watched_roots != tuple(expanded_search_dirs):
+        index.start_watching(expanded_search_dirs)
+    projects = index.find_projects(expanded_search_dirs)
+    logging.info(f"Scanned {index.last_scan['directories']} directories, listed {index.last_scan['listed']} "
+                 f"in {index.last_scan['seconds']:.2f}s")
     
     logging.info(f"Found {len(projects)} KiCad projects after scanning.")
     return projects
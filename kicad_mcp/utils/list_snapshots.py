@@ -0,0 +1,320 @@
+"""
+Paged, filtered and projected access to large list results.
+
+Tools that return long lists (pads, tracks, zones, netlist components and
+nets) keep the full extraction as a snapshot, keyed by the query and
+validated against the files it was built from. The first page builds the
+snapshot; later pages, and queries with a different filter or projection,
+are served from it. The item indices matching a filter are computed once
+per snapshot, so a later page costs only the items it returns.
+
+A cursor is an opaque token holding the snapshot key and version, the
+offset and the filter and fields of the query. It stops working when one
+of the snapshot's files changes.
+
+Cached snapshots are shared between callers and must be treated as
+read-only.
+"""
+import os
+import json
+import base64
+import fnmatch
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from kicad_mcp.utils.cache_registry import cache_registry
+
+# Items per page when the caller does not pass a limit
+DEFAULT_PAGE_SIZE = 200
+
+# Memory budget for cached snapshots
+DEFAULT_SNAPSHOT_CACHE_MB = 128
+
+# Rough ratio of a snapshot's in-memory size to the size of its files
+SNAPSHOT_MEMORY_FACTOR = 4
+
+# Filtered index lists kept per snapshot
+MAX_VIEWS_PER_SNAPSHOT = 8
+
+# Filter keys; "reference" matches a prefix, "net" and "layer" a glob pattern
+FILTER_KEYS = ("net", "layer", "reference")
+
+# Functions returning the values of one filter key for an item
+FilterFields = Dict[str, Callable[[Dict[str, Any]], Iterable[str]]]
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _file_state(paths: Sequence[str]) -> Optional[Dict[str, Tuple[int, int]]]:
+    """Return (mtime_ns, size) per file, or None if one of them cannot be read."""
+    state = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        state[os.path.normcase(os.path.abspath(path))] = (stat.st_mtime_ns, stat.st_size)
+    return state
+
+
+def _version(state: Dict[str, Tuple[int, int]]) -> str:
+    return hashlib.sha1(json.dumps(sorted(state.items())).encode()).hexdigest()[:16]
+
+
+@dataclass
+class Snapshot:
+    """The items of one query, the data returned with every page, and the files they came from."""
+    key: str
+    items: List[Dict[str, Any]]
+    summary: Dict[str, Any]
+    files: Dict[str, Tuple[int, int]]
+    version: str
+    cost: int
+    views: "OrderedDict[str, List[int]]" = field(default_factory=OrderedDict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def view(self, filters: Dict[str, str], filter_fields: FilterFields) -> List[int]:
+        """Return the indices of the items matching ``filters`` (computed once per filter)."""
+        view_key = json.dumps(filters, sort_keys=True)
+        with self.lock:
+            indices = self.views.get(view_key)
+            if indices is not None:
+                self.views.move_to_end(view_key)
+                return indices
+
+        checks = [(filter_fields[name], name == "reference", pattern) for name, pattern in filters.items()]
+        indices = [
+            index for index, item in enumerate(self.items)
+            if all(_matches(values(item), pattern, prefix) for values, prefix, pattern in checks)
+        ]
+
+        with self.lock:
+            self.views[view_key] = indices
+            while len(self.views) > MAX_VIEWS_PER_SNAPSHOT:
+                self.views.popitem(last=False)
+        return indices
+
+
+def _matches(values: Iterable[str], pattern: str, prefix: bool) -> bool:
+    if prefix:
+        return any(value and value.startswith(pattern) for value in values)
+    return any(value and fnmatch.fnmatchcase(value, pattern) for value in values)
+
+
+class SnapshotCache:
+    """LRU cache of list snapshots validated by the state of their files.
+
+    The memory budget is enforced on an estimate of each snapshot's size
+    (size of its files times SNAPSHOT_MEMORY_FACTOR).
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        if max_bytes is None:
+            max_bytes = _env_int("KICAD_MCP_SNAPSHOT_CACHE_MB", DEFAULT_SNAPSHOT_CACHE_MB) * 1024 * 1024
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[str, Snapshot]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get_or_build(self, key: str, files: Sequence[str],
+                     build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Return the snapshot for ``key``, building it if missing or outdated.
+
+        A cached snapshot is validated against every file it was built from,
+        including the files ``build`` reported in addition to ``files``.
+
+        Args:
+            key: Identifies the query (tool, path and options)
+            files: Files the result is known to depend on before it is built
+            build: Returns {"success": True, "items": [...], "summary": {...}}
+                or an error dictionary; an optional "files" entry lists further
+                files the result was built from (e.g. sub-sheets)
+
+        Returns:
+            {"success": True, "snapshot": Snapshot} or the error from ``build``
+        """
+        with self.lock:
+            snapshot = self.entries.get(key)
+        if snapshot is not None:
+            if _file_state(list(snapshot.files)) == snapshot.files:
+                with self.lock:
+                    if key in self.entries:
+                        self.entries.move_to_end(key)
+                    self.hits += 1
+                return {"success": True, "snapshot": snapshot}
+            with self.lock:
+                if self.entries.get(key) is snapshot:
+                    self._remove(key)
+
+        with self.lock:
+            self.misses += 1
+        # Taken before the build, so a file changed during the build invalidates the result
+        state = _file_state(files)
+        result = build()
+        if not result.get("success"):
+            return result
+
+        if state is not None and result.get("files"):
+            built_from = _file_state(result["files"])
+            state = None if built_from is None else {**built_from, **state}
+        state = state or {}
+        cost = sum(size for _, size in state.values()) * SNAPSHOT_MEMORY_FACTOR
+        snapshot = Snapshot(key, result["items"], result.get("summary", {}), state, _version(state), cost)
+        if state and cost <= self.max_bytes:
+            with self.lock:
+                self._remove(key)
+                while self.entries and self.total_bytes + cost > self.max_bytes:
+                    _, evicted = self.entries.popitem(last=False)
+                    self.total_bytes -= evicted.cost
+                self.entries[key] = snapshot
+                self.total_bytes += cost
+        else:
+            logging.debug(f"Snapshot not cached: {key}")
+        return {"success": True, "snapshot": snapshot}
+
+    def _remove(self, key: str) -> None:
+        snapshot = self.entries.pop(key, None)
+        if snapshot is not None:
+            self.total_bytes -= snapshot.cost
+
+    def invalidate(self, path: str) -> None:
+        """Drop every snapshot built from ``path``."""
+        path = os.path.normcase(os.path.abspath(path))
+        with self.lock:
+            for key in [key for key, snapshot in self.entries.items() if path in snapshot.files]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "estimated_bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+_snapshot_cache: Optional[SnapshotCache] = None
+_snapshot_cache_lock = threading.Lock()
+
+
+def get_snapshot_cache() -> SnapshotCache:
+    """Return the process-wide list snapshot cache."""
+    global _snapshot_cache
+    with _snapshot_cache_lock:
+        if _snapshot_cache is None:
+            _snapshot_cache = SnapshotCache()
+            cache_registry.register("list_snapshots", _snapshot_cache.invalidate, (".kicad_pcb", ".kicad_sch"),
+                                    clear=_snapshot_cache.clear, stats=_snapshot_cache.stats)
+        return _snapshot_cache
+
+
+def encode_cursor(key: str, version: str, offset: int, filters: Dict[str, str],
+                  fields: Optional[List[str]]) -> str:
+    token = json.dumps({"k": key, "v": version, "o": offset, "q": filters, "f": fields}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(token.encode()).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Return the query stored in a cursor; raises ValueError if it is malformed."""
+    try:
+        token = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return {"key": token["k"], "version": token["v"], "offset": int(token["o"]),
+                "filters": dict(token["q"]), "fields": token["f"]}
+    except (ValueError, TypeError, KeyError, AttributeError) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+
+def _project(item: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    if not fields:
+        return item
+    return {name: item[name] for name in fields if name in item}
+
+
+def get_page(key: str, files: Sequence[str], build: Callable[[], Dict[str, Any]], filter_fields: FilterFields,
+             filters: Optional[Dict[str, str]] = None, fields: Optional[List[str]] = None,
+             limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """Return one page of a list result.
+
+    Args:
+        key: Identifies the query (tool, path and options)
+        files: Files the result is known to depend on before it is built
+        build: Extraction returning {"success": True, "items": [...], "summary": {...}},
+            optionally with the further "files" it read
+        filter_fields: Filter keys this list supports, with the item values they match
+        filters: Filter by "net" (glob), "layer" (glob) or "reference" (prefix)
+        fields: Item keys to return (default: all)
+        limit: Items per page (default: KICAD_MCP_PAGE_SIZE; 0 returns all remaining items)
+        cursor: "next_cursor" of the previous page; its filter and fields replace the arguments
+
+    Returns:
+        Dictionary with the summary, the items and a "page" entry holding
+        the totals and the next cursor, or an error dictionary
+    """
+    offset = 0
+    filters = {name: pattern for name, pattern in (filters or {}).items() if pattern not in (None, "")}
+    if cursor:
+        try:
+            query = decode_cursor(cursor)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+        if query["key"] != key:
+            return {"success": False, "error": "Cursor belongs to a different query; pass the same path and options"}
+        offset, filters, fields = query["offset"], query["filters"], query["fields"]
+
+    unsupported = [name for name in filters if name not in filter_fields]
+    if unsupported:
+        return {"success": False,
+                "error": f"Unsupported filter keys: {', '.join(unsupported)}",
+                "supported_filters": list(filter_fields)}
+
+    if limit is None:
+        limit = _env_int("KICAD_MCP_PAGE_SIZE", DEFAULT_PAGE_SIZE)
+    if limit < 0:
+        return {"success": False, "error": "limit must be 0 (no limit) or positive"}
+
+    result = get_snapshot_cache().get_or_build(key, files, build)
+    if not result.get("success"):
+        return result
+    snapshot: Snapshot = result["snapshot"]
+
+    if cursor and query["version"] != snapshot.version:
+        return {"success": False,
+                "error": "The file changed since this cursor was issued; request the first page again"}
+
+    indices = snapshot.view(filters, filter_fields) if filters else range(len(snapshot.items))
+    end = len(indices) if limit == 0 else min(offset + limit, len(indices))
+    items = [_project(snapshot.items[index], fields) for index in indices[offset:end]]
+
+    return {
+        "success": True,
+        **snapshot.summary,
+        "items": items,
+        "page": {
+            "total": len(indices),
+            "offset": offset,
+            "returned": len(items),
+            "filter": filters,
+            "fields": fields,
+            "next_cursor": encode_cursor(key, snapshot.version, end, filters, fields) if end < len(indices) else None,
+        },
+    }
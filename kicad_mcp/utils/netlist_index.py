@@ -0,0 +1,99 @@
+"""
+Component/net adjacency index for netlists.
+
+``extract_netlist`` returns nets as ``{net name: [pins]}``. Finding the nets
+of one component in that shape means scanning every pin of every net; the
+NetlistIndex inverts it once so both directions are dictionary lookups.
+"""
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Iterable, List, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class IdentityCache(Generic[T]):
+    """Small LRU of values derived from a dict, keyed by the dict's identity.
+
+    Parsed netlists are shared read-only through the parse cache, so the same
+    dict objects are passed to every analysis of one schematic. Each entry
+    keeps a reference to its source dict, so the id cannot be reused while
+    the entry is alive; the length check catches callers that mutate it.
+    """
+
+    def __init__(self, build: Callable[[Dict[str, Any]], T], size: int = 8):
+        self.build = build
+        self.size = size
+        self.entries: "OrderedDict[int, Tuple[Dict[str, Any], int, T]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, source: Dict[str, Any]) -> T:
+        key = id(source)
+        with self.lock:
+            cached = self.entries.get(key)
+            if cached is not None and cached[0] is source and cached[1] == len(source):
+                self.entries.move_to_end(key)
+                return cached[2]
+
+        value = self.build(source)
+        with self.lock:
+            self.entries[key] = (source, len(source), value)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+        return value
+
+
+class NetlistIndex:
+    """Bipartite component <-> net index built from a nets dictionary."""
+
+    def __init__(self, nets: Dict[str, List[Dict[str, Any]]]):
+        self.nets = nets
+        self.net_components: Dict[str, List[str]] = {}
+        component_nets: Dict[str, Dict[str, None]] = {}
+
+        for net_name, pins in nets.items():
+            refs = []
+            for pin in pins:
+                ref = pin.get('component')
+                if ref:
+                    refs.append(ref)
+                    component_nets.setdefault(ref, {})[net_name] = None
+            self.net_components[net_name] = refs
+
+        # Nets per component in netlist order, plus a set for membership tests
+        self.component_nets: Dict[str, List[str]] = {ref: list(names) for ref, names in component_nets.items()}
+        self.component_net_sets: Dict[str, Set[str]] = {ref: set(names) for ref, names in component_nets.items()}
+        self.upper_names: List[Tuple[str, str]] = [(name, name.upper()) for name in nets]
+
+    def nets_of(self, ref: str) -> List[str]:
+        """Names of the nets a component is connected to, in netlist order."""
+        return self.component_nets.get(ref, [])
+
+    def components_on(self, net_name: str) -> List[str]:
+        """References on a net, one per pin, in pin order."""
+        return self.net_components.get(net_name, [])
+
+    def connects(self, ref: str, net_name: str) -> bool:
+        """Whether any pin of ``ref`` is on ``net_name``."""
+        return net_name in self.component_net_sets.get(ref, ())
+
+    def nets_containing(self, fragments: Iterable[str]) -> List[str]:
+        """Nets whose upper-cased name contains any of ``fragments``, in netlist order."""
+        pattern = re.compile("|".join(re.escape(fragment) for fragment in fragments))
+        return [name for name, upper in self.upper_names if pattern.search(upper)]
+
+
+_netlist_indexes: IdentityCache[NetlistIndex] = IdentityCache(NetlistIndex)
+
+
+def get_netlist_index(nets: Dict[str, List[Dict[str, Any]]]) -> NetlistIndex:
+    """Return the (cached) NetlistIndex for a nets dictionary.
+
+    Args:
+        nets: Dictionary of nets from netlist
+
+    Returns:
+        NetlistIndex for the nets
+    """
+    return _netlist_indexes.get(nets)
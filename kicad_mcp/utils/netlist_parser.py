@@ -3,9 +3,45 @@ KiCad schematic netlist extraction utilities.
 """
 import os
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 from collections import defaultdict
 
+from kicad_mcp.utils.connectivity import SegmentGrid, UnionFind, snap, transform_pin
+from kicad_mcp.utils.disk_cache import DiskCache, content_hash
+from kicad_mcp.utils.file_watcher import watch_file_directory
+from kicad_mcp.utils.parse_cache import get_parse_cache
+from kicad_mcp.utils.sexpr_parser import Content, SExpr, Symbol, dispatch_nodes, mapped_file, release_pages
+
+# Net naming priority of each driver kind, highest first (as in KiCad)
+NET_DRIVER_PRIORITY = {'global': 0, 'power': 1, 'local': 2, 'hierarchical': 3, 'sheet_pin': 4}
+
+# Bump whenever the parse result changes shape so persisted results are discarded
+PARSER_VERSION = 1
+
+# Parse results persisted across server restarts, keyed by file content
+schematic_disk_cache = DiskCache("schematic", PARSER_VERSION)
+
+
+def auto_net_name(pins: List[Tuple[str, str, str]]) -> str:
+    """KiCad-style name for a net without labels, e.g. ``Net-(R1-Pad2)``.
+
+    Args:
+        pins: (reference, pin number, pin name) of every pin on the net
+
+    Returns:
+        The name of the net, taken from its lowest reference and pin
+    """
+    def sort_key(pin):
+        match = re.match(r'^(.*?)(\d*)$', pin[0])
+        return (match.group(1), int(match.group(2) or 0), pin[1])
+
+    reference, number, name = min(pins, key=sort_key)
+    if not name or name in ('~', number):
+        name = f"Pad{number}"
+    prefix = 'Net' if len(pins) > 1 else 'unconnected'
+    return f"{prefix}-({reference}-{name})"
+
+
 class SchematicParser:
     """Parser for KiCad schematic files to extract netlist information."""
     
@@ -16,7 +52,6 @@ class SchematicParser:
             schematic_path: Path to the KiCad schematic file (.kicad_sch)
         """
         self.schematic_path = schematic_path
-        self.content = ""
         self.components = []
         self.labels = []
         self.wires = []
@@ -25,56 +60,56 @@ class SchematicParser:
         self.power_symbols = []
         self.hierarchical_labels = []
         self.global_labels = []
+        self.lib_symbols = {}  # lib_id -> embedded library symbol definition
+        self.placements = []  # Every placed symbol unit, including power symbols
+        self.sheets = []  # Sub-sheet instances placed on this sheet
+        self.uuid = None
+        self.instance_references = {}  # component_ref -> {instance path: reference}
         
         # Netlist information
         self.nets = defaultdict(list)  # Net name -> connected pins
         self.component_pins = {}  # (component_ref, pin_num) -> net_name
+        self.net_scopes = {}  # Net name -> global, power, local, hierarchical, sheet_pin or auto
+        self.hierarchical_nets = {}  # Hierarchical label text -> net name
         
         # Component information
         self.component_info = {}  # component_ref -> component details
         
-        # Load the file
-        self._load_schematic()
-
-    def _load_schematic(self) -> None:
-        """Load the schematic file content."""
         if not os.path.exists(self.schematic_path):
-            #print(f"Schematic file not found: {self.schematic_path}")
             raise FileNotFoundError(f"Schematic file not found: {self.schematic_path}")
-        
-        try:
-            with open(self.schematic_path, 'r') as f:
-                self.content = f.read()
-                #print(f"Successfully loaded schematic: {self.schematic_path}")
-        except Exception as e:
-            #print(f"Error reading schematic file: {str(e)}")
-            raise
 
-    def parse(self) -> Dict[str, Any]:
+    def parse(self, content: Optional[Content] = None) -> Dict[str, Any]:
         """Parse the schematic to extract netlist information.
         
+        The file is walked once; every top-level node is sent to its handler
+        as soon as it has been read. By default the file is memory-mapped and
+        tokenized as raw bytes, so it is never held in memory as a whole, and
+        the mapping is released as soon as the walk ends.
+        
+        Args:
+            content: File content (text, bytes or a memory map) if the caller
+                already has it open
+        
         Returns:
             Dictionary with parsed netlist information
         """
-        #print("Starting schematic parsing")
-        
-        # Extract symbols (components)
-        self._extract_components()
-        
-        # Extract wires
-        self._extract_wires()
-        
-        # Extract junctions
-        self._extract_junctions()
-        
-        # Extract labels
-        self._extract_labels()
-        
-        # Extract power symbols
-        self._extract_power_symbols()
-        
-        # Extract no-connects
-        self._extract_no_connects()
+        handlers = {
+            "lib_symbols": self._handle_lib_symbols,
+            "symbol": self._handle_symbol,
+            "wire": self._handle_wire,
+            "junction": self._handle_junction,
+            "label": self._handle_label,
+            "global_label": self._handle_label,
+            "hierarchical_label": self._handle_label,
+            "no_connect": self._handle_no_connect,
+            "sheet": self._handle_sheet,
+            "uuid": self._handle_uuid,
+        }
+        if content is None:
+            with mapped_file(self.schematic_path) as content:
+                dispatch_nodes(content, handlers)
+        else:
+            dispatch_nodes(content, handlers)
         
         # Build netlist
         self._build_netlist()
@@ -83,82 +118,103 @@ class SchematicParser:
         result = {
             "components": self.component_info,
             "nets": dict(self.nets),
+            "net_scopes": self.net_scopes,
             "labels": self.labels,
+            "global_labels": self.global_labels,
+            "hierarchical_labels": self.hierarchical_labels,
             "wires": self.wires,
             "junctions": self.junctions,
+            "no_connects": self.no_connects,
             "power_symbols": self.power_symbols,
+            "sheets": self.sheets,
+            "hierarchical_nets": self.hierarchical_nets,
+            "instance_references": self.instance_references,
+            "uuid": self.uuid,
             "component_count": len(self.component_info),
             "net_count": len(self.nets)
         }
         
-        #print(f"Schematic parsing complete: found {len(self.component_info)} components and {len(self.nets)} nets")
         return result
 
-    def _extract_s_expressions(self, pattern: str) -> List[str]:
-        """Extract all matching S-expressions from the schematic content.
+    @staticmethod
+    def _position(node: Optional[SExpr]) -> Optional[Dict[str, float]]:
+        """Convert an ``(at x y [angle])`` node into a position dictionary."""
+        if node is None or len(node) < 3:
+            return None
+        return {
+            'x': float(node[1]),
+            'y': float(node[2]),
+            'angle': float(node[3]) if len(node) > 3 and isinstance(node[3], (int, float)) else 0.0
+        }
+
+    def _handle_lib_symbols(self, node: SExpr) -> None:
+        """Record the pin definitions of every embedded library symbol.
         
         Args:
-            pattern: Regex pattern to match the start of S-expressions
-            
-        Returns:
-            List of matching S-expressions
+            node: The top-level ``(lib_symbols ...)`` node
         """
-        matches = []
-        positions = []
-        
-        # Find all starting positions of matches
-        for match in re.finditer(pattern, self.content):
-            positions.append(match.start())
-        
-        # Extract full S-expressions for each match
-        for pos in positions:
-            # Start from the matching position
-            current_pos = pos
-            depth = 0
-            s_exp = ""
+        for symbol in node.find_all("symbol"):
+            name = symbol[1] if len(symbol) > 1 else None
+            if not isinstance(name, str):
+                continue
             
-            # Extract the full S-expression by tracking parentheses
-            while current_pos < len(self.content):
-                char = self.content[current_pos]
-                s_exp += char
+            pins = []
+            # Pins live in unit sub-symbols named "<name>_<unit>_<body style>"
+            for unit_symbol in symbol.find_all("symbol"):
+                unit, body_style = 0, 0
+                parts = str(unit_symbol[1]).rsplit("_", 2) if len(unit_symbol) > 1 else []
+                if len(parts) == 3 and parts[1].isdigit() and parts[2].isdigit():
+                    unit, body_style = int(parts[1]), int(parts[2])
                 
-                if char == '(':
-                    depth += 1
-                elif char == ')':
-                    depth -= 1
-                    if depth == 0:
-                        # Found the end of the S-expression
-                        break
-                
-                current_pos += 1
+                for pin in unit_symbol.find_all("pin"):
+                    number_node = pin.find("number")
+                    name_node = pin.find("name")
+                    pins.append({
+                        'num': str(number_node[1]) if number_node is not None and len(number_node) > 1 else '',
+                        'name': str(name_node[1]) if name_node is not None and len(name_node) > 1 else '',
+                        'type': str(pin[1]) if len(pin) > 1 and isinstance(pin[1], Symbol) else '',
+                        'position': self._position(pin.find("at")),
+                        'unit': unit,
+                        'body_style': body_style,
+                        # KiCad 7 writes a bare "hide" atom, KiCad 8+ writes "(hide yes)"
+                        'hidden': 'hide' in pin.atoms() or pin.value("hide") == 'yes'
+                    })
             
-            matches.append(s_exp)
-        
-        return matches
+            self.lib_symbols[name] = {
+                'pins': pins,
+                'extends': symbol.value("extends"),
+                'power': symbol.find("power") is not None
+            }
 
-    def _extract_components(self) -> None:
-        """Extract component information from schematic."""
-        #print("Extracting components")
-        
-        # Extract all symbol expressions (components)
-        symbols = self._extract_s_expressions(r'\(symbol\s+')
-        
-        for symbol in symbols:
-            component = self._parse_component(symbol)
-            if component:
-                self.components.append(component)
-                
-                # Add to component info dictionary
-                ref = component.get('reference', 'Unknown')
-                self.component_info[ref] = component
+    def _handle_symbol(self, node: SExpr) -> None:
+        """Handle a placed symbol (component or power symbol).
         
-        #print(f"Extracted {len(self.components)} components")
+        Args:
+            node: A top-level ``(symbol ...)`` node
+        """
+        component = self._parse_component(node)
+        if not component:
+            return
+        
+        self._record_placement(node, component)
+        self.components.append(component)
+        
+        # Add to component info dictionary
+        ref = component.get('reference', 'Unknown')
+        self.component_info[ref] = component
+        
+        lib_id = component.get('lib_id', '')
+        if lib_id.startswith('power:') and 'position' in component:
+            self.power_symbols.append({
+                'type': lib_id[len('power:'):],
+                'position': component['position']
+            })
 
-    def _parse_component(self, symbol_expr: str) -> Dict[str, Any]:
-        """Parse a component from a symbol S-expression.
+    def _parse_component(self, symbol: SExpr) -> Dict[str, Any]:
+        """Parse a component from a placed symbol node.
         
         Args:
-            symbol_expr: Symbol S-expression
+            symbol: Symbol S-expression node
             
         Returns:
             Component information dictionary
@@ -166,15 +222,17 @@ class SchematicParser:
         component = {}
         
         # Extract library component ID
-        lib_id_match = re.search(r'\(lib_id\s+"([^"]+)"\)', symbol_expr)
-        if lib_id_match:
-            component['lib_id'] = lib_id_match.group(1)
-        
-        # Extract reference (e.g., R1, C2)
-        property_matches = re.finditer(r'\(property\s+"([^"]+)"\s+"([^"]+)"', symbol_expr)
-        for match in property_matches:
-            prop_name = match.group(1)
-            prop_value = match.group(2)
+        lib_id = symbol.value("lib_id")
+        if isinstance(lib_id, str):
+            component['lib_id'] = lib_id
+        
+        # Extract reference (e.g., R1, C2) and the other properties
+        for prop in symbol.find_all("property"):
+            if len(prop) < 3 or not isinstance(prop[1], str) or not isinstance(prop[2], str):
+                continue
+            prop_name, prop_value = prop[1], prop[2]
+            if not prop_name or not prop_value:
+                continue
             
             if prop_name == "Reference":
                 component['reference'] = prop_value
@@ -184,245 +242,328 @@ class SchematicParser:
                 component['footprint'] = prop_value
             else:
                 # Store other properties
-                if 'properties' not in component:
-                    component['properties'] = {}
-                component['properties'][prop_name] = prop_value
+                component.setdefault('properties', {})[prop_name] = prop_value
         
         # Extract position
-        pos_match = re.search(r'\(at\s+([\d\.-]+)\s+([\d\.-]+)(\s+[\d\.-]+)?\)', symbol_expr)
-        if pos_match:
-            component['position'] = {
-                'x': float(pos_match.group(1)),
-                'y': float(pos_match.group(2)),
-                'angle': float(pos_match.group(3).strip() if pos_match.group(3) else 0)
-            }
-
-
-        # Extract symbol definition pins (with names)
-        symbol_pins = []
-        symbol_pin_matches = re.finditer(r'\(pin\s+\w+\s+\w+.*?\(name\s+"([^"]+)".*?\)\s*\(number\s+"([^"]+)"', symbol_expr, re.DOTALL)
-        for match in symbol_pin_matches:
-            pin_name = match.group(1)
-            pin_num = match.group(2)
-            symbol_pins.append({
-                'num': pin_num,
-                'name': pin_name
-            })
+        position = self._position(symbol.find("at"))
+        if position:
+            component['position'] = position
+        
+        unit = symbol.value("unit")
+        if isinstance(unit, int):
+            component['unit'] = unit
+        
+        # Symbol definition pins (with names) come from the embedded library
+        lib_symbol = self.lib_symbols.get(component.get('lib_id'))
+        if lib_symbol and lib_symbol['pins']:
+            component['symbol_pins'] = [
+                {'num': pin['num'], 'name': pin['name']} for pin in lib_symbol['pins']
+            ]
         
         # Extract instance pins (with UUIDs)
         instance_pins = []
-        instance_pin_matches = re.finditer(r'\(pin\s+"([^"]+)"\s*\(uuid\s+"([^"]+)"\)', symbol_expr, re.DOTALL)
-        for match in instance_pin_matches:
-            pin_num = match.group(1)
-            pin_uuid = match.group(2)
-            instance_pins.append({
-                'num': pin_num,
-                'uuid': pin_uuid
-            })
-    
-        # Add both pin lists to component
-        if symbol_pins:
-            component['symbol_pins'] = symbol_pins
+        for pin in symbol.find_all("pin"):
+            if len(pin) > 1 and isinstance(pin[1], str):
+                instance_pins.append({
+                    'num': pin[1],
+                    'uuid': pin.value("uuid", '')
+                })
         
         if instance_pins:
             component['instance_pins'] = instance_pins
         
-        return component
-        
-        
-    def _extract_wires(self) -> None:
-        """Extract wire information from schematic."""
-        #print("Extracting wires")
+        # Per-instance references of symbols on sheets used more than once
+        instances = symbol.find("instances")
+        if instances is not None and component.get('reference'):
+            paths = self.instance_references.setdefault(component['reference'], {})
+            for project in instances.find_all("project"):
+                for path in project.find_all("path"):
+                    reference = path.value("reference")
+                    if len(path) > 1 and isinstance(path[1], str) and isinstance(reference, str):
+                        paths[path[1]] = reference
         
-        # Extract all wire expressions
-        wires = self._extract_s_expressions('\(wire\s+')
-        
-        for wire in wires:
-            # Extract the wire coordinates
-            pts_match = re.search(r'\(pts\s*\(xy\s+([\d\.-]+)\s+([\d\.-]+)\)\s*\(xy\s+([\d\.-]+)\s+([\d\.-]+)\)', wire, re.DOTALL)
+        return component
 
-            if pts_match:
-                self.wires.append({
-                    'start': {
-                        'x': float(pts_match.group(1)),
-                        'y': float(pts_match.group(2))
-                    },
-                    'end': {
-                        'x': float(pts_match.group(3)),
-                        'y': float(pts_match.group(4))
-                    }
-                })
-        
-      #  print(f"Extracted {len(self.wires)} wires")
+    def _record_placement(self, node: SExpr, component: Dict[str, Any]) -> None:
+        """Remember where a symbol unit sits so its pins can be connected later."""
+        position = component.get('position')
+        if not position or 'lib_id' not in component:
+            return
+        
+        body_style = node.value("body_style", node.value("convert", 1))
+        self.placements.append({
+            'reference': component.get('reference', ''),
+            'lib_id': component['lib_id'],
+            'value': component.get('value', ''),
+            'position': position,
+            'mirror': str(node.value("mirror", '')),
+            'unit': component.get('unit', 1),
+            'body_style': body_style if isinstance(body_style, int) else 1
+        })
 
-    def _extract_junctions(self) -> None:
-        """Extract junction information from schematic."""
-        #print("Extracting junctions")
-        
-        # Extract all junction expressions
-        junctions = self._extract_s_expressions(r'\(junction\s+')
-        
-        for junction in junctions:
-            # Extract the junction coordinates
-            xy_match = re.search(r'\(junction.*?\(at\s+([\d\.-]+)\s+([\d\.-]+)\)', junction, re.DOTALL)
-            if xy_match:
-                self.junctions.append({
-                    'x': float(xy_match.group(1)),
-                    'y': float(xy_match.group(2))
-                })
-        
-        #print(f"Extracted {len(self.junctions)} junctions")
-
-    def _extract_labels(self) -> None:
-        """Extract label information from schematic."""
-       # print("Extracting labels")
-        
-        # Extract local labels
-        local_labels = self._extract_s_expressions(r'\(label\s+')
-        
-        for label in local_labels:
-            # Extract label text and position
-            label_match = re.search(r'\(label\s+"([^"]+)"\s+\(at\s+([\d\.-]+)\s+([\d\.-]+)(\s+[\d\.-]+)?\)', label)
-            if label_match:
-                self.labels.append({
-                    'type': 'local',
-                    'text': label_match.group(1),
-                    'position': {
-                        'x': float(label_match.group(2)),
-                        'y': float(label_match.group(3)),
-                        'angle': float(label_match.group(4).strip() if label_match.group(4) else 0)
-                    }
-                })
-        
-        # Extract global labels
-        global_labels = self._extract_s_expressions(r'\(global_label\s+')
-        
-        for label in global_labels:
-            # Extract global label text and position
-            label_match = re.search(r'\(global_label\s+"([^"]+)"\s+\(shape\s+([^\s\)]+)\)\s+\(at\s+([\d\.-]+)\s+([\d\.-]+)(\s+[\d\.-]+)?\)', label)
-            if label_match:
-                self.global_labels.append({
-                    'type': 'global',
-                    'text': label_match.group(1),
-                    'shape': label_match.group(2),
-                    'position': {
-                        'x': float(label_match.group(3)),
-                        'y': float(label_match.group(4)),
-                        'angle': float(label_match.group(5).strip() if label_match.group(5) else 0)
-                    }
-                })
-        
-        # Extract hierarchical labels
-        hierarchical_labels = self._extract_s_expressions(r'\(hierarchical_label\s+')
-        
-        for label in hierarchical_labels:
-            # Extract hierarchical label text and position
-            label_match = re.search(r'\(hierarchical_label\s+"([^"]+)"\s+\(shape\s+([^\s\)]+)\)\s+\(at\s+([\d\.-]+)\s+([\d\.-]+)(\s+[\d\.-]+)?\)', label)
-            if label_match:
-                self.hierarchical_labels.append({
-                    'type': 'hierarchical',
-                    'text': label_match.group(1),
-                    'shape': label_match.group(2),
-                    'position': {
-                        'x': float(label_match.group(3)),
-                        'y': float(label_match.group(4)),
-                        'angle': float(label_match.group(5).strip() if label_match.group(5) else 0)
-                    }
-                })
-        
-       # print(f"Extracted {len(self.labels)} local labels, {len(self.global_labels)} global labels, and {len(self.hierarchical_labels)} hierarchical labels")
+    def _handle_wire(self, node: SExpr) -> None:
+        """Extract wire end points."""
+        pts = node.find("pts")
+        if pts is None:
+            return
+        
+        points = pts.find_all("xy")
+        if len(points) >= 2 and len(points[0]) >= 3 and len(points[1]) >= 3:
+            self.wires.append({
+                'start': {'x': float(points[0][1]), 'y': float(points[0][2])},
+                'end': {'x': float(points[1][1]), 'y': float(points[1][2])}
+            })
 
-    def _extract_power_symbols(self) -> None:
-        """Extract power symbol information from schematic."""
-       # print("Extracting power symbols")
-        
-        # Extract all power symbol expressions
-        power_symbols = self._extract_s_expressions(r'\(symbol\s+\(lib_id\s+"power:')
-        
-        for symbol in power_symbols:
-            # Extract power symbol type and position
-            type_match = re.search(r'\(lib_id\s+"power:([^"]+)"\)', symbol)
-            pos_match = re.search(r'\(at\s+([\d\.-]+)\s+([\d\.-]+)(\s+[\d\.-]+)?\)', symbol)
-            
-            if type_match and pos_match:
-                self.power_symbols.append({
-                    'type': type_match.group(1),
-                    'position': {
-                        'x': float(pos_match.group(1)),
-                        'y': float(pos_match.group(2)),
-                        'angle': float(pos_match.group(3).strip() if pos_match.group(3) else 0)
-                    }
-                })
-        
-       # print(f"Extracted {len(self.power_symbols)} power symbols")
+    def _handle_junction(self, node: SExpr) -> None:
+        """Extract junction coordinates."""
+        position = self._position(node.find("at"))
+        if position:
+            self.junctions.append({'x': position['x'], 'y': position['y']})
 
-    def _extract_no_connects(self) -> None:
-        """Extract no-connect information from schematic."""
-        #print("Extracting no-connects")
-        
-        # Extract all no-connect expressions
-        no_connects = self._extract_s_expressions(r'\(no_connect\s+')
+    def _handle_label(self, node: SExpr) -> None:
+        """Extract local, global and hierarchical labels."""
+        if len(node) < 2 or not isinstance(node[1], str):
+            return
+        
+        position = self._position(node.find("at"))
+        if not position:
+            return
+        
+        if node.tag == "label":
+            self.labels.append({
+                'type': 'local',
+                'text': node[1],
+                'position': position
+            })
+            return
         
-        for no_connect in no_connects:
-            # Extract the no-connect coordinates
-            xy_match = re.search(r'\(no_connect\s+\(at\s+([\d\.-]+)\s+([\d\.-]+)\)', no_connect)
-            if xy_match:
-                self.no_connects.append({
-                    'x': float(xy_match.group(1)),
-                    'y': float(xy_match.group(2))
+        label = {
+            'type': 'global' if node.tag == "global_label" else 'hierarchical',
+            'text': node[1],
+            'shape': str(node.value("shape", '')),
+            'position': position
+        }
+        if node.tag == "global_label":
+            self.global_labels.append(label)
+        else:
+            self.hierarchical_labels.append(label)
+
+    def _handle_uuid(self, node: SExpr) -> None:
+        """Record the sheet's own UUID (the root of instance paths)."""
+        if len(node) > 1:
+            self.uuid = str(node[1])
+
+    def _handle_sheet(self, node: SExpr) -> None:
+        """Extract a sub-sheet instance with its file and sheet pins."""
+        properties = {}
+        for prop in node.find_all("property"):
+            if len(prop) >= 3 and isinstance(prop[1], str) and isinstance(prop[2], str):
+                properties[prop[1]] = prop[2]
+        
+        # KiCad 6 used "Sheet name" / "Sheet file"
+        sheet_file = properties.get("Sheetfile") or properties.get("Sheet file")
+        if not sheet_file:
+            return
+        
+        pins = []
+        for pin in node.find_all("pin"):
+            position = self._position(pin.find("at"))
+            if len(pin) > 1 and isinstance(pin[1], str) and position:
+                pins.append({
+                    'name': pin[1],
+                    'type': str(pin[2]) if len(pin) > 2 and isinstance(pin[2], Symbol) else '',
+                    'position': position
                 })
         
-       # print(f"Extracted {len(self.no_connects)} no-connects")
+        self.sheets.append({
+            'name': properties.get("Sheetname") or properties.get("Sheet name") or '',
+            'file': sheet_file,
+            'uuid': str(node.value("uuid", '')),
+            'pins': pins
+        })
+
+    def _handle_no_connect(self, node: SExpr) -> None:
+        """Extract no-connect markers."""
+        position = self._position(node.find("at"))
+        if position:
+            self.no_connects.append({'x': position['x'], 'y': position['y']})
+
+    def _lib_pins(self, lib_id: str) -> List[Dict[str, Any]]:
+        """Return the pins of a library symbol, following ``extends`` to its parent."""
+        lib_symbol = self.lib_symbols.get(lib_id)
+        seen = set()
+        while lib_symbol and not lib_symbol['pins'] and lib_symbol.get('extends') and lib_id not in seen:
+            seen.add(lib_id)
+            prefix = lib_id.split(':', 1)[0] + ':' if ':' in lib_id else ''
+            lib_id = prefix + lib_symbol['extends']
+            lib_symbol = self.lib_symbols.get(lib_id)
+        return lib_symbol['pins'] if lib_symbol else []
+
+    def _placed_pins(self, placement: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Compute the sheet position of every pin of one placed symbol unit."""
+        position = placement['position']
+        pins = []
+        for pin in self._lib_pins(placement['lib_id']):
+            if pin['unit'] not in (0, placement['unit']):
+                continue
+            if pin['body_style'] not in (0, placement['body_style']):
+                continue
+            if not pin['position']:
+                continue
+            x, y = transform_pin(
+                pin['position']['x'], pin['position']['y'],
+                position['x'], position['y'], position['angle'], placement['mirror']
+            )
+            pins.append({'pin': pin, 'point': snap(x, y)})
+        return pins
 
     def _build_netlist(self) -> None:
-        """Build the netlist from extracted components and connections."""
-        #print("Building netlist from schematic data")
-        
-        # TODO: Implement netlist building algorithm
-        # This is a complex task that involves:
-        # 1. Tracking connections between components via wires
-        # 2. Handling labels (local, global, hierarchical)
-        # 3. Processing power symbols
-        # 4. Resolving junctions
-        
-        # For now, we'll implement a basic version that creates a list of nets
-        # based on component references and pin numbers
-        
-        # Process global labels as nets
-        for label in self.global_labels:
-            net_name = label['text']
-            self.nets[net_name] = []  # Initialize empty list for this net
-        
-        # Process power symbols as nets
-        for power in self.power_symbols:
-            net_name = power['type']
-            if net_name not in self.nets:
-                self.nets[net_name] = []
-        
-        # In a full implementation, we would now trace connections between
-        # components, but that requires a more complex algorithm to follow wires
-        # and detect connected pins
-        
-        # For demonstration, we'll add a placeholder note
-        #print("Note: Full netlist building requires complex connectivity tracing")
-        #print(f"Found {len(self.nets)} potential nets from labels and power symbols")
+        """Build the netlist by tracing connectivity on the sheet.
+        
+        Wire end points, junctions, label anchors and placed pin positions are
+        snapped to a grid and joined with a union-find: items sharing a point
+        are merged, and points lying on a wire (found through a spatial hash of
+        the wire segments) are merged with that wire. Labels and power symbols
+        with the same name are then merged and used to name the nets; unnamed
+        nets get KiCad-style ``Net-(REF-PadN)`` names.
+        """
+        uf = UnionFind()
+        grid = SegmentGrid()
+        point_items = {}  # grid point -> first item placed there
+        wire_items = []  # segment index -> item
+        
+        def attach(point, item):
+            owner = point_items.setdefault(point, item)
+            if owner != item:
+                uf.union(owner, item)
+        
+        # Wires: one item per segment, reachable from both end points
+        for wire in self.wires:
+            item = uf.add()
+            start = snap(wire['start']['x'], wire['start']['y'])
+            end = snap(wire['end']['x'], wire['end']['y'])
+            grid.add(start, end)
+            wire_items.append(item)
+            attach(start, item)
+            attach(end, item)
+        
+        for junction in self.junctions:
+            attach(snap(junction['x'], junction['y']), uf.add())
+        
+        # Named drivers: (item, kind, name)
+        drivers = []
+        for kind, labels in (('local', self.labels), ('global', self.global_labels),
+                             ('hierarchical', self.hierarchical_labels)):
+            for label in labels:
+                item = uf.add()
+                attach(snap(label['position']['x'], label['position']['y']), item)
+                drivers.append((item, kind, label['text']))
+        
+        # Sheet pins connect the parent sheet to a sub-sheet's hierarchical labels
+        sheet_pin_items = []  # (item, sheet pin)
+        for sheet in self.sheets:
+            for pin in sheet['pins']:
+                item = uf.add()
+                attach(snap(pin['position']['x'], pin['position']['y']), item)
+                drivers.append((item, 'sheet_pin', f"/{sheet['name']}/{pin['name']}"))
+                sheet_pin_items.append((item, pin))
+        
+        # Pins of every placed symbol unit
+        pin_items = []  # (item, reference, pin definition)
+        for placement in self.placements:
+            lib_symbol = self.lib_symbols.get(placement['lib_id'], {})
+            is_power_symbol = lib_symbol.get('power') or placement['lib_id'].startswith('power:')
+            for placed in self._placed_pins(placement):
+                item = uf.add()
+                attach(placed['point'], item)
+                pin = placed['pin']
+                if is_power_symbol:
+                    # The power symbol's value is the net name it drives
+                    drivers.append((item, 'power', placement['value'] or pin['name']))
+                elif pin['hidden'] and pin['type'] == 'power_in' and pin['name']:
+                    # Hidden power input pins join the global net of their name
+                    drivers.append((item, 'power', pin['name']))
+                pin_items.append((item, placement['reference'], pin))
+        
+        # Any point lying on a wire (including mid-segment) joins that wire
+        for point, item in point_items.items():
+            for segment in grid.at(point):
+                uf.union(item, wire_items[segment])
+        
+        # Labels and power symbols with the same name form one net
+        by_name = {}
+        for item, kind, name in drivers:
+            if kind == 'sheet_pin':
+                continue
+            scope = 'global' if kind in ('global', 'power') else kind
+            key = (scope, name)
+            if key in by_name:
+                uf.union(by_name[key], item)
+            else:
+                by_name[key] = item
+        
+        # Pick the name of each connected group
+        best_driver = {}
+        for item, kind, name in drivers:
+            root = uf.find(item)
+            rank = (NET_DRIVER_PRIORITY[kind], name)
+            if root not in best_driver or rank < best_driver[root][0]:
+                best_driver[root] = (rank, kind, name)
+        
+        group_pins = defaultdict(list)
+        for item, reference, pin in pin_items:
+            if reference.startswith('#'):
+                continue
+            group_pins[uf.find(item)].append((reference, pin))
+        
+        root_names = {}
+        for root in set(best_driver) | set(group_pins):
+            pins = group_pins.get(root, [])
+            if root in best_driver:
+                _, kind, net_name = best_driver[root]
+            elif pins:
+                kind = 'auto'
+                net_name = self._auto_net_name(pins)
+            else:
+                continue
+            
+            root_names[root] = net_name
+            net_pins = self.nets[net_name]
+            if net_name not in self.net_scopes:
+                self.net_scopes[net_name] = kind
+            for reference, pin in pins:
+                if (reference, pin['num']) in self.component_pins:
+                    continue
+                self.component_pins[(reference, pin['num'])] = net_name
+                net_pins.append({'component': reference, 'pin': pin['num']})
+        
+        # Record which net each hierarchical connection point ended up in
+        for item, kind, name in drivers:
+            if kind == 'hierarchical':
+                self.hierarchical_nets[name] = root_names[uf.find(item)]
+        for item, pin in sheet_pin_items:
+            pin['net'] = root_names[uf.find(item)]
 
+    @staticmethod
+    def _auto_net_name(pins: List[Any]) -> str:
+        """KiCad-style name for a net without labels, e.g. ``Net-(R1-Pad2)``."""
+        return auto_net_name([(reference, pin['num'], pin['name']) for reference, pin in pins])
 
-def extract_netlist(schematic_path: str) -> Dict[str, Any]:
-    
-    """Extract netlist information from a KiCad schematic file.
-    
-    Args:
-        schematic_path: Path to the KiCad schematic file (.kicad_sch)
-        
-    Returns:
-        Dictionary with netlist information
-    """
+
+def _parse_schematic(schematic_path: str) -> Dict[str, Any]:
     try:
         parser = SchematicParser(schematic_path)
-        return parser.parse()
+        with mapped_file(schematic_path) as content:
+            key = content_hash(content)
+            # Hashing read every page; drop them before the parse reads them again
+            release_pages(content)
+            result = schematic_disk_cache.get(key)
+            if result is not None:
+                return result
+            result = parser.parse(content)
+        schematic_disk_cache.put(key, result)
+        return result
     except Exception as e:
-       # print(f"Error extracting netlist: {str(e)}")
         return {
             "error": str(e),
             "components": {},
@@ -432,6 +573,25 @@ def extract_netlist(schematic_path: str) -> Dict[str, Any]:
         }
 
 
+def extract_netlist(schematic_path: str, use_cache: bool = True) -> Dict[str, Any]:
+    """Extract netlist information from a KiCad schematic file.
+
+    Results are shared through the process-wide parse cache, so callers must
+    not modify the returned dictionary.
+
+    Args:
+        schematic_path: Path to the KiCad schematic file (.kicad_sch)
+        use_cache: Reuse a previous parse if the file is unchanged
+
+    Returns:
+        Dictionary with netlist information
+    """
+    if not use_cache:
+        return _parse_schematic(schematic_path)
+    watch_file_directory(schematic_path)
+    return get_parse_cache().get_or_parse(schematic_path, _parse_schematic)
+
+
 def analyze_netlist(netlist_data: Dict[str, Any]) -> Dict[str, Any]:
     """Analyze netlist data to provide insights.
     
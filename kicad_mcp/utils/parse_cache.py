@@ -0,0 +1,173 @@
+"""
+Process-wide cache of parsed schematic netlists.
+
+Tools and resources often parse the same schematic several times in a row
+(netlist extraction, pattern recognition, connection lookups). Parsed
+results are kept in an LRU keyed by path and validated against the file's
+mtime and size, so an edit on disk is picked up on the next call.
+
+Cached results are shared between callers and must be treated as read-only.
+"""
+import os
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from kicad_mcp.utils.cache_registry import cache_registry
+
+# Default memory budget for parsed schematics
+DEFAULT_PARSE_CACHE_MB = 128
+
+# Rough ratio of a parsed netlist's in-memory size to the file size
+PARSE_MEMORY_FACTOR = 4
+
+
+@dataclass
+class CachedParse:
+    result: Dict[str, Any]
+    mtime_ns: int
+    size: int
+    cost: int
+
+
+def _cache_key(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path))
+
+
+class ParseCache:
+    """LRU cache of parse results keyed by path and validated by mtime and size.
+
+    The memory budget is enforced on an estimate of each result's size
+    (file size times PARSE_MEMORY_FACTOR).
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        if max_bytes is None:
+            try:
+                max_mb = int(os.environ.get("KICAD_MCP_PARSE_CACHE_MB", DEFAULT_PARSE_CACHE_MB))
+            except ValueError:
+                max_mb = DEFAULT_PARSE_CACHE_MB
+            max_bytes = max_mb * 1024 * 1024
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[str, CachedParse]" = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get_or_parse(self, path: str, parse: Callable[[str], Dict[str, Any]]) -> Dict[str, Any]:
+        """Return the cached result for ``path``, parsing the file on a miss.
+
+        Results containing an "error" key are returned but not cached.
+
+        Args:
+            path: Path to the file
+            parse: Callable producing the result from the path
+
+        Returns:
+            The parse result
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+
+        result = self._lookup(_cache_key(path), stat)
+        if result is not None:
+            return result
+
+        result = parse(path)
+        if stat is not None:
+            self.put(path, result, stat)
+        return result
+
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for ``path`` if the file is unchanged, else None."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+        return self._lookup(_cache_key(path), stat)
+
+    def put(self, path: str, result: Dict[str, Any], stat: Optional[os.stat_result] = None) -> None:
+        """Store a result parsed elsewhere (e.g. in a worker process).
+
+        Args:
+            path: Path to the parsed file
+            result: Parse result; results containing an "error" key are not cached
+            stat: The file's stat taken before it was parsed (default: now)
+        """
+        if stat is None:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return
+        if "error" not in result:
+            self._put(_cache_key(path), result, stat)
+
+    def _lookup(self, key: str, stat: Optional[os.stat_result]) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if stat is not None and (stat.st_mtime_ns, stat.st_size) == (entry.mtime_ns, entry.size):
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return entry.result
+                self._remove(key)
+            self.misses += 1
+        return None
+
+    def _put(self, key: str, result: Dict[str, Any], stat: os.stat_result) -> None:
+        cost = stat.st_size * PARSE_MEMORY_FACTOR
+        if cost > self.max_bytes:
+            logging.debug(f"Parse result too large to cache: {key}")
+            return
+
+        with self.lock:
+            self._remove(key)
+            while self.entries and self.total_bytes + cost > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= evicted.cost
+            self.entries[key] = CachedParse(result, stat.st_mtime_ns, stat.st_size, cost)
+            self.total_bytes += cost
+
+    def _remove(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.cost
+
+    def invalidate(self, path: str) -> None:
+        with self.lock:
+            self._remove(_cache_key(path))
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "estimated_bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+_parse_cache: Optional[ParseCache] = None
+
+
+def get_parse_cache() -> ParseCache:
+    """Return the process-wide schematic parse cache."""
+    global _parse_cache
+    if _parse_cache is None:
+        _parse_cache = ParseCache()
+        cache_registry.register("schematic_parses", _parse_cache.invalidate, (".kicad_sch",),
+                                clear=_parse_cache.clear, stats=_parse_cache.stats)
+    return _parse_cache
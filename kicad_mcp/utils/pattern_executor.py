@@ -0,0 +1,126 @@
+"""
+Runs the circuit pattern identifiers off the event loop.
+
+The identifiers are independent of each other, so they are submitted to a
+shared executor together and their results are collected as they finish.
+``KICAD_MCP_PATTERN_EXECUTOR`` selects a thread pool (default; the component
+and net indexes are shared between identifiers) or a process pool (true
+parallelism for very large netlists, at the cost of copying the netlist to
+each worker).
+"""
+import os
+import atexit
+import asyncio
+import logging
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from kicad_mcp.utils.netlist_index import get_netlist_index
+from kicad_mcp.utils.pattern_recognition import (
+    get_component_index,
+    identify_power_supplies,
+    identify_amplifiers,
+    identify_filters,
+    identify_oscillators,
+    identify_digital_interfaces,
+    identify_microcontrollers,
+    identify_sensor_interfaces
+)
+
+# "thread" or "process"
+DEFAULT_PATTERN_EXECUTOR = "thread"
+
+# Result category -> identifier
+PATTERN_IDENTIFIERS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], List[Dict[str, Any]]]] = {
+    "power_supply_circuits": identify_power_supplies,
+    "amplifier_circuits": identify_amplifiers,
+    "filter_circuits": identify_filters,
+    "oscillator_circuits": identify_oscillators,
+    "digital_interface_circuits": identify_digital_interfaces,
+    "microcontroller_circuits": lambda components, nets: identify_microcontrollers(components),
+    "sensor_interface_circuits": identify_sensor_interfaces,
+}
+
+_executor: Optional[Executor] = None
+_executor_lock = threading.Lock()
+
+
+def run_identifier(category: str, components: Dict[str, Any], nets: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Run one identifier by category (module-level so process pools can pickle it)."""
+    return PATTERN_IDENTIFIERS[category](components, nets)
+
+
+def _build_indexes(components: Dict[str, Any], nets: Dict[str, Any]) -> None:
+    get_component_index(components)
+    get_netlist_index(nets)
+
+
+def get_pattern_executor() -> Executor:
+    """Return the shared executor selected by KICAD_MCP_PATTERN_EXECUTOR."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            kind = os.environ.get("KICAD_MCP_PATTERN_EXECUTOR", DEFAULT_PATTERN_EXECUTOR).strip().lower()
+            workers = min(len(PATTERN_IDENTIFIERS), os.cpu_count() or 1)
+            if kind == "process":
+                try:
+                    _executor = ProcessPoolExecutor(max_workers=workers)
+                except (OSError, RuntimeError, NotImplementedError) as e:
+                    logging.warning(f"Process pool unavailable, identifying patterns in threads: {e}")
+            elif kind != "thread":
+                logging.warning(f"Unknown KICAD_MCP_PATTERN_EXECUTOR '{kind}', using threads")
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=len(PATTERN_IDENTIFIERS),
+                                               thread_name_prefix="kicad-patterns")
+        return _executor
+
+
+def shutdown_pattern_executor() -> None:
+    """Stop the shared executor (a new one is created on next use)."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_pattern_executor)
+
+
+async def identify_all_patterns(
+    components: Dict[str, Any],
+    nets: Dict[str, Any],
+    on_complete: Optional[Callable[[str, int, int], Awaitable[None]]] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Run every pattern identifier concurrently without blocking the event loop.
+
+    Args:
+        components: Dictionary of components from netlist
+        nets: Dictionary of nets from netlist
+        on_complete: Awaited with (category, finished count, total) as each identifier finishes
+
+    Returns:
+        Dictionary mapping each result category to its identified patterns,
+        in PATTERN_IDENTIFIERS order
+    """
+    loop = asyncio.get_running_loop()
+    executor = get_pattern_executor()
+
+    if isinstance(executor, ThreadPoolExecutor):
+        # Build the shared indexes once instead of racing to build them in every thread
+        await loop.run_in_executor(executor, _build_indexes, components, nets)
+
+    async def run(category: str):
+        result = await loop.run_in_executor(executor, run_identifier, category, components, nets)
+        return category, result
+
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    total = len(PATTERN_IDENTIFIERS)
+    for finished in asyncio.as_completed([run(category) for category in PATTERN_IDENTIFIERS]):
+        category, result = await finished
+        results[category] = result
+        if on_complete is not None:
+            await on_complete(category, len(results), total)
+
+    return {category: results[category] for category in PATTERN_IDENTIFIERS}
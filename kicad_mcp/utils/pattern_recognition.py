@@ -1,10 +1,190 @@
 """
 Circuit pattern recognition functions for KiCad schematics.
+
+Component part-number patterns are compiled once at import time. Each
+component's value and lib_id are classified against all of them in a single
+pass (memoized per distinct value/lib_id pair) and the results are kept in a
+ComponentIndex, so the identifiers below only visit components that matched.
 """
 
 import re
-from typing import Dict, List, Any
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Any, Pattern, Tuple
 from kicad_mcp.utils.component_utils import extract_voltage_from_regulator, extract_frequency_from_value
+from kicad_mcp.utils.netlist_index import IdentityCache, get_netlist_index
+
+
+def _compile(patterns: Dict[str, str]) -> Dict[str, Pattern]:
+    return {name: re.compile(pattern, re.IGNORECASE) for name, pattern in patterns.items()}
+
+
+# Linear voltage regulators
+REGULATOR_PATTERNS = _compile({
+    "78xx": r"78\d\d|LM78\d\d|MC78\d\d",  # 7805, 7812, etc.
+    "79xx": r"79\d\d|LM79\d\d|MC79\d\d",  # 7905, 7912, etc.
+    "LDO": r"LM\d{3}|LD\d{3}|AMS\d{4}|LT\d{4}|TLV\d{3}|AP\d{4}|MIC\d{4}|NCP\d{3}|LP\d{4}|L\d{2}|TPS\d{5}"
+})
+
+# Switching regulator controllers
+SWITCHING_PATTERNS = _compile({
+    "buck": r"LM\d{4}|TPS\d{4}|MP\d{4}|RT\d{4}|LT\d{4}|MC\d{4}|NCP\d{4}|TL\d{4}|LTC\d{4}",
+    "boost": r"MC\d{4}|LT\d{4}|TPS\d{4}|MAX\d{4}|NCP\d{4}|LTC\d{4}",
+    "buck_boost": r"LTC\d{4}|LM\d{4}|TPS\d{4}|MAX\d{4}"
+})
+
+# Op-amps by part number and by generic name
+OPAMP_PATTERNS = _compile({
+    "part": r"LM\d{3}|TL\d{3}|NE\d{3}|LF\d{3}|OP\d{2}|MCP\d{3}|AD\d{3}|LT\d{4}|OPA\d{3}",
+    "generic": r"Opamp|Op-Amp|OpAmp|Operational Amplifier"
+})
+
+AUDIO_AMP_PATTERNS = _compile({
+    "audio": r"LM386|LM383|LM380|LM1875|LM3886|TDA\d{4}|TPA\d{4}|SSM\d{4}|PAM\d{4}|TAS\d{4}"
+})
+
+SENSOR_PATTERNS = _compile({
+    "temperature": r"LM35|DS18B20|DHT11|DHT22|BME280|BMP280|TMP\d+|MCP9808|MAX31855|MAX6675|SI7021|HTU21|SHT[0123]\d|PCT2075",
+    "humidity": r"DHT11|DHT22|BME280|SI7021|HTU21|SHT[0123]\d|HDC1080",
+    "pressure": r"BMP\d+|BME280|LPS\d+|MS5611|DPS310|MPL3115|SPL06",
+    "accelerometer": r"ADXL\d+|LIS3DH|MMA\d+|MPU\d+|LSM\d+|BMI\d+|BMA\d+|KX\d+",
+    "gyroscope": r"L3G\d+|MPU\d+|BMI\d+|LSM\d+|ICM\d+",
+    "magnetometer": r"HMC\d+|QMC\d+|LSM\d+|MMC\d+|RM\d+",
+    "proximity": r"APDS9960|VL53L0X|VL6180|GP2Y|VCNL4040|VCNL4010",
+    "light": r"BH1750|TSL\d+|MAX4\d+|VEML\d+|APDS9960|LTR329|OPT\d+",
+    "air_quality": r"CCS811|BME680|SGP\d+|SEN\d+|MQ\d+|MiCS",
+    "current": r"ACS\d+|INA\d+|MAX\d+|ZXCT\d+",
+    "voltage": r"INA\d+|MCP\d+|ADS\d+",
+    "ADC": r"ADS\d+|MCP33\d+|MCP32\d+|LTC\d+|NAU7802|HX711",
+    "GPS": r"NEO-[67]M|L80|MTK\d+|SIM\d+|SAM-M8Q|MAX-M8"
+})
+
+MCU_PATTERNS = _compile({
+    "AVR": r"ATMEGA\d+|ATTINY\d+|AT90\w+",
+    "STM32": r"STM32\w+",
+    "PIC": r"PIC\d+\w+",
+    "ESP": r"ESP32|ESP8266",
+    "Arduino": r"ARDUINO",
+    "MSP430": r"MSP430\w+",
+    "RP2040": r"RP2040|PICO",
+    "NXP": r"LPC\d+|IMXRT\d+|MK\d+",
+    "SAM": r"SAMD\d+|SAM\w+",
+    "ARM Cortex": r"CORTEX|ARM",
+    "8051": r"8051|AT89"
+})
+
+DEV_BOARD_PATTERNS = _compile({
+    "Arduino": r"ARDUINO|UNO|NANO|MEGA|LEONARDO|DUE",
+    "ESP32 Dev Board": r"ESP32-DEVKIT|NODEMCU-32S|ESP-WROOM-32",
+    "ESP8266 Dev Board": r"NODEMCU|WEMOS|D1_MINI|ESP-01",
+    "STM32 Dev Board": r"NUCLEO|DISCOVERY|BLUEPILL",
+    "Raspberry Pi": r"RASPBERRY|RPI|RPICO|PICO"
+})
+
+# Patterns checked against the component value only
+VALUE_PATTERNS = _compile({
+    "filter_opamp": OPAMP_PATTERNS["part"].pattern,
+    "timer_555": r"NE555|LM555|ICM7555|TLC555",
+    "usb_ic": r"FT232|CH340|CP210|MCP2200|TUSB|FT231|FT201",
+    "ethernet_phy": r"W5500|ENC28J60|LAN87|KSZ80|DP83|RTL8|AX88",
+})
+
+# (rule, pattern, also match lib_id); a rule is "<family>:<name>"
+COMPONENT_RULES: List[Tuple[str, Pattern, bool]] = [
+    *((f"regulator:{name}", pattern, True) for name, pattern in REGULATOR_PATTERNS.items()),
+    *((f"switching:{name}", pattern, True) for name, pattern in SWITCHING_PATTERNS.items()),
+    *((f"opamp:{name}", pattern, True) for name, pattern in OPAMP_PATTERNS.items()),
+    *((f"audio_amp:{name}", pattern, True) for name, pattern in AUDIO_AMP_PATTERNS.items()),
+    *((f"sensor:{name}", pattern, True) for name, pattern in SENSOR_PATTERNS.items()),
+    *((f"mcu:{name}", pattern, True) for name, pattern in MCU_PATTERNS.items()),
+    *((f"dev_board:{name}", pattern, True) for name, pattern in DEV_BOARD_PATTERNS.items()),
+    *((f"{name}:{name}", pattern, False) for name, pattern in VALUE_PATTERNS.items()),
+]
+
+# Matches whenever any rule could match, so plain passives are rejected with one search
+_PREFILTER = re.compile("|".join(f"(?:{pattern.pattern})" for _, pattern, _ in COMPONENT_RULES), re.IGNORECASE)
+
+
+@lru_cache(maxsize=8192)
+def classify_component(value: str, lib_id: str) -> FrozenSet[str]:
+    """Return the rules matched by an (upper-cased) value and lib_id.
+
+    Args:
+        value: Component value, upper-cased
+        lib_id: Component lib_id, upper-cased
+
+    Returns:
+        Set of matched "<family>:<name>" rules
+    """
+    value_hit = _PREFILTER.search(value) is not None
+    lib_hit = _PREFILTER.search(lib_id) is not None
+    if not value_hit and not lib_hit:
+        return frozenset()
+
+    return frozenset(
+        rule for rule, pattern, check_lib in COMPONENT_RULES
+        if (value_hit and pattern.search(value)) or (check_lib and lib_hit and pattern.search(lib_id))
+    )
+
+
+@dataclass
+class IndexedComponent:
+    """A component with its upper-cased value/lib_id and matched rules."""
+    ref: str
+    value: str
+    lib: str
+    rules: FrozenSet[str]
+
+    def matches(self, family: str, name: str) -> bool:
+        return f"{family}:{name}" in self.rules
+
+
+class ComponentIndex:
+    """Components classified once, indexed by rule family and reference prefix."""
+
+    def __init__(self, components: Dict[str, Any]):
+        self.entries: List[IndexedComponent] = []
+        self.by_family: Dict[str, List[IndexedComponent]] = defaultdict(list)
+        self.by_prefix: Dict[str, List[IndexedComponent]] = defaultdict(list)
+        self.position: Dict[str, int] = {}
+
+        for ref, component in components.items():
+            value = component.get('value', '').upper()
+            lib = component.get('lib_id', '').upper()
+            entry = IndexedComponent(ref, value, lib, classify_component(value, lib))
+            self.position[ref] = len(self.entries)
+            self.entries.append(entry)
+            self.by_prefix[re.match(r'[A-Za-z_#]*', ref).group(0)].append(entry)
+            for family in {rule.split(":", 1)[0] for rule in entry.rules}:
+                self.by_family[family].append(entry)
+
+    def family(self, family: str) -> List[IndexedComponent]:
+        """Components matching any rule of ``family``, in netlist order."""
+        return self.by_family.get(family, [])
+
+    def with_prefix(self, *prefixes: str) -> List[IndexedComponent]:
+        """Components whose reference starts with any of ``prefixes``, in netlist order."""
+        # Keys are the reference's leading letters, so a letter prefix of the
+        # reference is always a prefix of its key
+        found = [entry for key, group in self.by_prefix.items() if key.startswith(prefixes) for entry in group]
+        return sorted(found, key=lambda entry: self.position[entry.ref])
+
+
+_component_indexes: IdentityCache[ComponentIndex] = IdentityCache(ComponentIndex)
+
+
+def get_component_index(components: Dict[str, Any]) -> ComponentIndex:
+    """Return the (cached) ComponentIndex for a components dict.
+
+    Args:
+        components: Dictionary of components from netlist
+
+    Returns:
+        ComponentIndex for the components
+    """
+    return _component_indexes.get(components)
+
 
 def identify_power_supplies(components: Dict[str, Any], nets: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Identify power supply circuits in the schematic.
@@ -18,60 +198,44 @@ def identify_power_supplies(components: Dict[str, Any], nets: Dict[str, Any]) ->
     """
     power_supplies = []
     
+    index = get_component_index(components)
+
     # Look for voltage regulators (Linear)
-    regulator_patterns = {
-        "78xx": r"78\d\d|LM78\d\d|MC78\d\d",  # 7805, 7812, etc.
-        "79xx": r"79\d\d|LM79\d\d|MC79\d\d",  # 7905, 7912, etc.
-        "LDO": r"LM\d{3}|LD\d{3}|AMS\d{4}|LT\d{4}|TLV\d{3}|AP\d{4}|MIC\d{4}|NCP\d{3}|LP\d{4}|L\d{2}|TPS\d{5}"
-    }
-    
-    for ref, component in components.items():
-        # Check for voltage regulators by part value or lib_id
-        component_value = component.get('value', '').upper()
-        component_lib = component.get('lib_id', '').upper()
-        
-        for reg_type, pattern in regulator_patterns.items():
-            if re.search(pattern, component_value, re.IGNORECASE) or re.search(pattern, component_lib, re.IGNORECASE):
+    for entry in index.family("regulator"):
+        for reg_type in REGULATOR_PATTERNS:
+            if entry.matches("regulator", reg_type):
                 # Found a regulator, look for associated components
                 power_supplies.append({
                     "type": "linear_regulator",
                     "subtype": reg_type,
-                    "main_component": ref,
-                    "value": component_value,
+                    "main_component": entry.ref,
+                    "value": entry.value,
                     "input_voltage": "unknown",  # Would need more analysis to determine
-                    "output_voltage": extract_voltage_from_regulator(component_value),
+                    "output_voltage": extract_voltage_from_regulator(entry.value),
                     "associated_components": []  # Would need connection analysis to find these
                 })
-    
-    # Look for switching regulators
-    switching_patterns = {
-        "buck": r"LM\d{4}|TPS\d{4}|MP\d{4}|RT\d{4}|LT\d{4}|MC\d{4}|NCP\d{4}|TL\d{4}|LTC\d{4}",
-        "boost": r"MC\d{4}|LT\d{4}|TPS\d{4}|MAX\d{4}|NCP\d{4}|LTC\d{4}",
-        "buck_boost": r"LTC\d{4}|LM\d{4}|TPS\d{4}|MAX\d{4}"
-    }
-    
-    for ref, component in components.items():
-        component_value = component.get('value', '').upper()
-        component_lib = component.get('lib_id', '').upper()
-        
-        # Check for inductor (key component in switching supplies)
-        if ref.startswith('L') or 'Inductor' in component_lib:
-            # Look for nearby ICs that might be switching controllers
-            for ic_ref, ic_component in components.items():
-                if ic_ref.startswith('U') or ic_ref.startswith('IC'):
-                    ic_value = ic_component.get('value', '').upper()
-                    ic_lib = ic_component.get('lib_id', '').upper()
-                    
-                    for converter_type, pattern in switching_patterns.items():
-                        if re.search(pattern, ic_value, re.IGNORECASE) or re.search(pattern, ic_lib, re.IGNORECASE):
-                            power_supplies.append({
-                                "type": "switching_regulator",
-                                "subtype": converter_type,
-                                "main_component": ic_ref,
-                                "inductor": ref,
-                                "value": ic_value
-                            })
-    
+
+    # Look for switching regulators: ICs that could be switching controllers...
+    controllers = [
+        (entry, converter_type)
+        for entry in index.family("switching")
+        if entry.ref.startswith('U') or entry.ref.startswith('IC')
+        for converter_type in SWITCHING_PATTERNS
+        if entry.matches("switching", converter_type)
+    ]
+
+    # ...paired with each inductor (key component in switching supplies)
+    for entry in index.entries:
+        if entry.ref.startswith('L') or 'Inductor' in entry.lib:
+            for ic, converter_type in controllers:
+                power_supplies.append({
+                    "type": "switching_regulator",
+                    "subtype": converter_type,
+                    "main_component": ic.ref,
+                    "inductor": entry.ref,
+                    "value": ic.value
+                })
+
     return power_supplies
 
 
@@ -87,19 +251,14 @@ def identify_amplifiers(components: Dict[str, Any], nets: Dict[str, Any]) -> Lis
     """
     amplifiers = []
     
+    index = get_component_index(components)
+
     # Look for op-amps
-    opamp_patterns = [
-        r"LM\d{3}|TL\d{3}|NE\d{3}|LF\d{3}|OP\d{2}|MCP\d{3}|AD\d{3}|LT\d{4}|OPA\d{3}",
-        r"Opamp|Op-Amp|OpAmp|Operational Amplifier"
-    ]
-    
-    for ref, component in components.items():
-        component_value = component.get('value', '').upper()
-        component_lib = component.get('lib_id', '').upper()
-        
-        # Check for op-amps
-        for pattern in opamp_patterns:
-            if re.search(pattern, component_value, re.IGNORECASE) or re.search(pattern, component_lib, re.IGNORECASE):
+    for entry in index.family("opamp"):
+        ref, component_value = entry.ref, entry.value
+
+        for pattern_name in OPAMP_PATTERNS:
+            if entry.matches("opamp", pattern_name):
                 # Common op-amps
                 if re.search(r"LM358|LM324|TL072|TL082|NE5532|LF353|MCP6002|AD8620|OPA2134", component_value, re.IGNORECASE):
                     amplifiers.append({
@@ -133,23 +292,19 @@ def identify_amplifiers(components: Dict[str, Any], nets: Dict[str, Any]) -> Lis
                     })
     
     # Look for transistor amplifiers
-    transistor_refs = [ref for ref in components.keys() if ref.startswith('Q')]
-    
-    for ref in transistor_refs:
+    netlist = get_netlist_index(nets)
+    for entry in index.with_prefix('Q'):
+        ref, component_lib = entry.ref, entry.lib
         component = components[ref]
-        component_lib = component.get('lib_id', '').upper()
         
         # Check if it's a BJT or FET
         if 'BJT' in component_lib or 'NPN' in component_lib or 'PNP' in component_lib:
             # Look for resistors connected to transistor (biasing network)
-            has_biasing = False
-            for net_name, pins in nets.items():
-                # Check if this net connects to our transistor
-                if any(pin.get('component') == ref for pin in pins):
-                    # Check if the net also connects to resistors
-                    if any(pin.get('component', '').startswith('R') for pin in pins):
-                        has_biasing = True
-                        break
+            has_biasing = any(
+                other.startswith('R')
+                for net_name in netlist.nets_of(ref)
+                for other in netlist.components_on(net_name)
+            )
             
             if has_biasing:
                 amplifiers.append({
@@ -161,12 +316,11 @@ def identify_amplifiers(components: Dict[str, Any], nets: Dict[str, Any]) -> Lis
         
         elif 'FET' in component_lib or 'MOSFET' in component_lib or 'JFET' in component_lib:
             # Similar check for FET amplifiers
-            has_biasing = False
-            for net_name, pins in nets.items():
-                if any(pin.get('component') == ref for pin in pins):
-                    if any(pin.get('component', '').startswith('R') for pin in pins):
-                        has_biasing = True
-                        break
+            has_biasing = any(
+                other.startswith('R')
+                for net_name in netlist.nets_of(ref)
+                for other in netlist.components_on(net_name)
+            )
             
             if has_biasing:
                 amplifiers.append({
@@ -177,21 +331,12 @@ def identify_amplifiers(components: Dict[str, Any], nets: Dict[str, Any]) -> Lis
                 })
     
     # Look for audio amplifier ICs
-    audio_amp_patterns = [
-        r"LM386|LM383|LM380|LM1875|LM3886|TDA\d{4}|TPA\d{4}|SSM\d{4}|PAM\d{4}|TAS\d{4}"
-    ]
-    
-    for ref, component in components.items():
-        component_value = component.get('value', '').upper()
-        component_lib = component.get('lib_id', '').upper()
-        
-        for pattern in audio_amp_patterns:
-            if re.search(pattern, component_value, re.IGNORECASE) or re.search(pattern, component_lib, re.IGNORECASE):
-                amplifiers.append({
-                    "type": "audio_amplifier_ic",
-                    "component": ref,
-                    "value": component_value
-                })
+    for entry in index.family("audio_amp"):
+        amplifiers.append({
+            "type": "audio_amplifier_ic",
+            "component": entry.ref,
+            "value": entry.value
+        })
     
     return amplifiers
 
@@ -210,36 +355,22 @@ def identify_filters(components: Dict[str, Any], nets: Dict[str, Any]) -> List[D
     
     # Look for RC low-pass filters
     # These typically have a resistor followed by a capacitor to ground
-    resistor_refs = [ref for ref in components.keys() if ref.startswith('R')]
-    capacitor_refs = [ref for ref in components.keys() if ref.startswith('C')]
+    index = get_component_index(components)
+    netlist = get_netlist_index(nets)
+    resistor_refs = [entry.ref for entry in index.with_prefix('R')]
     
     for r_ref in resistor_refs:
-        r_nets = []
-        # Find which nets this resistor is connected to
-        for net_name, pins in nets.items():
-            if any(pin.get('component') == r_ref for pin in pins):
-                r_nets.append(net_name)
-        
-        # For each net, check if there's a capacitor connected to it
-        for net_name in r_nets:
+        # For each net of this resistor, check if there's a capacitor connected to it
+        for net_name in netlist.nets_of(r_ref):
             # Find capacitors connected to this net
-            connected_caps = []
-            for pin in nets.get(net_name, []):
-                comp = pin.get('component')
-                if comp and comp.startswith('C'):
-                    connected_caps.append(comp)
+            connected_caps = [comp for comp in netlist.components_on(net_name) if comp.startswith('C')]
             
             if connected_caps:
                 # Check if the other side of the capacitor goes to ground
                 for c_ref in connected_caps:
-                    c_is_to_ground = False
-                    for gnd_name in ['GND', 'AGND', 'DGND', 'VSS']:
-                        for pin in nets.get(gnd_name, []):
-                            if pin.get('component') == c_ref:
-                                c_is_to_ground = True
-                                break
-                        if c_is_to_ground:
-                            break
+                    c_is_to_ground = any(
+                        netlist.connects(c_ref, gnd_name) for gnd_name in ['GND', 'AGND', 'DGND', 'VSS']
+                    )
                     
                     if c_is_to_ground:
                         filters.append({
@@ -249,15 +380,10 @@ def identify_filters(components: Dict[str, Any], nets: Dict[str, Any]) -> List[D
                         })
     
     # Look for active filters (op-amp with feedback RC components)
-    opamp_refs = []
-    
-    for ref, component in components.items():
-        component_value = component.get('value', '').upper()
-        component_lib = component.get('lib_id', '').upper()
-        
-        if re.search(r"LM\d{3}|TL\d{3}|NE\d{3}|LF\d{3}|OP\d{2}|MCP\d{3}|AD\d{3}|LT\d{4}|OPA\d{3}", 
-                     component_value, re.IGNORECASE) or "OP_AMP" in component_lib:
-            opamp_refs.append(ref)
+    opamp_refs = [
+        entry.ref for entry in index.entries
+        if entry.matches("filter_opamp", "filter_opamp") or "OP_AMP" in entry.lib
+    ]
     
     for op_ref in opamp_refs:
         # Find op-amp output
@@ -266,17 +392,16 @@ def identify_filters(components: Dict[str, Any], nets: Dict[str, Any]) -> List[D
         has_feedback_r = False
         has_feedback_c = False
         
-        for net_name, pins in nets.items():
-            # If this net connects to our op-amp
-            if any(pin.get('component') == op_ref for pin in pins):
-                # Check if it also connects to resistors and capacitors
-                connects_to_r = any(pin.get('component', '').startswith('R') for pin in pins)
-                connects_to_c = any(pin.get('component', '').startswith('C') for pin in pins)
-                
-                if connects_to_r:
-                    has_feedback_r = True
-                if connects_to_c:
-                    has_feedback_c = True
+        for net_name in netlist.nets_of(op_ref):
+            # Check if this net also connects to resistors and capacitors
+            on_net = netlist.components_on(net_name)
+            connects_to_r = any(comp.startswith('R') for comp in on_net)
+            connects_to_c = any(comp.startswith('C') for comp in on_net)
+            
+            if connects_to_r:
+                has_feedback_r = True
+            if connects_to_c:
+                has_feedback_c = True
         
         if has_feedback_r and has_feedback_c:
             filters.append({
@@ -286,9 +411,8 @@ def identify_filters(components: Dict[str, Any], nets: Dict[str, Any]) -> List[D
             })
     
     # Look for crystal filters or ceramic filters
-    for ref, component in components.items():
-        component_value = component.get('value', '').upper()
-        component_lib = component.get('lib_id', '').upper()
+    for entry in index.entries:
+        ref, component_value, component_lib = entry.ref, entry.value, entry.lib
         
         if ref.startswith('Y') or ref.startswith('X') or "CRYSTAL" in component_lib or "XTAL" in component_lib:
             filters.append({
@@ -319,30 +443,22 @@ def identify_oscillators(components: Dict[str, Any], nets: Dict[str, Any]) -> Li
     """
     oscillators = []
     
+    index = get_component_index(components)
+    netlist = get_netlist_index(nets)
+
     # Look for crystal oscillators
-    for ref, component in components.items():
-        component_value = component.get('value', '').upper()
-        component_lib = component.get('lib_id', '').upper()
+    for entry in index.entries:
+        ref, component_value, component_lib = entry.ref, entry.value, entry.lib
         
         # Crystals
         if ref.startswith('Y') or ref.startswith('X') or "CRYSTAL" in component_lib or "XTAL" in component_lib:
             # Check if the crystal has load capacitors
-            has_load_caps = False
-            crystal_nets = []
-            
-            for net_name, pins in nets.items():
-                if any(pin.get('component') == ref for pin in pins):
-                    crystal_nets.append(net_name)
-            
             # Look for capacitors connected to the crystal nets
-            for net_name in crystal_nets:
-                for pin in nets.get(net_name, []):
-                    comp = pin.get('component')
-                    if comp and comp.startswith('C'):
-                        has_load_caps = True
-                        break
-                if has_load_caps:
-                    break
+            has_load_caps = any(
+                comp.startswith('C')
+                for net_name in netlist.nets_of(ref)
+                for comp in netlist.components_on(net_name)
+            )
             
             oscillators.append({
                 "type": "crystal_oscillator",
@@ -353,7 +469,7 @@ def identify_oscillators(components: Dict[str, Any], nets: Dict[str, Any]) -> Li
             })
         
         # Oscillator ICs
-        if "OSC" in component_lib or "OSCILLATOR" in component_lib or re.search(r"OSC|OSCILLATOR", component_value, re.IGNORECASE):
+        if "OSC" in component_lib or "OSC" in component_value:
             oscillators.append({
                 "type": "oscillator_ic",
                 "component": ref,
@@ -362,7 +478,7 @@ def identify_oscillators(components: Dict[str, Any], nets: Dict[str, Any]) -> Li
             })
         
         # RC oscillators (555 timer, etc)
-        if re.search(r"NE555|LM555|ICM7555|TLC555", component_value, re.IGNORECASE) or "555" in component_lib:
+        if entry.matches("timer_555", "timer_555") or "555" in component_lib:
             oscillators.append({
                 "type": "rc_oscillator",
                 "subtype": "555_timer",
@@ -384,94 +500,47 @@ def identify_digital_interfaces(components: Dict[str, Any], nets: Dict[str, Any]
         List of identified digital interface circuits
     """
     interfaces = []
+    index = get_component_index(components)
+    netlist = get_netlist_index(nets)
     
     # I2C interface detection
-    i2c_signals = {"SCL", "SDA", "I2C_SCL", "I2C_SDA"}
-    has_i2c = False
-    
-    for net_name in nets.keys():
-        if any(signal in net_name.upper() for signal in i2c_signals):
-            has_i2c = True
-            break
-    
-    if has_i2c:
+    i2c_nets = netlist.nets_containing({"SCL", "SDA", "I2C_SCL", "I2C_SDA"})
+    if i2c_nets:
         interfaces.append({
             "type": "i2c_interface",
-            "signals_found": [net for net in nets.keys() if any(signal in net.upper() for signal in i2c_signals)]
+            "signals_found": i2c_nets
         })
     
     # SPI interface detection
-    spi_signals = {"MOSI", "MISO", "SCK", "SS", "SPI_MOSI", "SPI_MISO", "SPI_SCK", "SPI_CS"}
-    has_spi = False
-    
-    for net_name in nets.keys():
-        if any(signal in net_name.upper() for signal in spi_signals):
-            has_spi = True
-            break
-    
-    if has_spi:
+    spi_nets = netlist.nets_containing({"MOSI", "MISO", "SCK", "SS", "SPI_MOSI", "SPI_MISO", "SPI_SCK", "SPI_CS"})
+    if spi_nets:
         interfaces.append({
             "type": "spi_interface",
-            "signals_found": [net for net in nets.keys() if any(signal in net.upper() for signal in spi_signals)]
+            "signals_found": spi_nets
         })
     
     # UART interface detection
-    uart_signals = {"TX", "RX", "TXD", "RXD", "UART_TX", "UART_RX"}
-    has_uart = False
-    
-    for net_name in nets.keys():
-        if any(signal in net_name.upper() for signal in uart_signals):
-            has_uart = True
-            break
-    
-    if has_uart:
+    uart_nets = netlist.nets_containing({"TX", "RX", "TXD", "RXD", "UART_TX", "UART_RX"})
+    if uart_nets:
         interfaces.append({
             "type": "uart_interface",
-            "signals_found": [net for net in nets.keys() if any(signal in net.upper() for signal in uart_signals)]
+            "signals_found": uart_nets
         })
     
-    # USB interface detection
-    usb_signals = {"USB_D+", "USB_D-", "USB_DP", "USB_DM", "D+", "D-", "DP", "DM", "VBUS"}
-    has_usb = False
-    
-    for net_name in nets.keys():
-        if any(signal in net_name.upper() for signal in usb_signals):
-            has_usb = True
-            break
-    
-    # Also check for USB interface ICs
-    for ref, component in components.items():
-        component_value = component.get('value', '').upper()
-        if re.search(r"FT232|CH340|CP210|MCP2200|TUSB|FT231|FT201", component_value, re.IGNORECASE):
-            has_usb = True
-            break
-    
-    if has_usb:
+    # USB interface detection (signals or USB interface ICs)
+    usb_nets = netlist.nets_containing({"USB_D+", "USB_D-", "USB_DP", "USB_DM", "D+", "D-", "DP", "DM", "VBUS"})
+    if usb_nets or index.family("usb_ic"):
         interfaces.append({
             "type": "usb_interface",
-            "signals_found": [net for net in nets.keys() if any(signal in net.upper() for signal in usb_signals)]
+            "signals_found": usb_nets
         })
     
-    # Ethernet interface detection
-    ethernet_signals = {"TX+", "TX-", "RX+", "RX-", "MDI", "MDIO", "ETH"}
-    has_ethernet = False
-    
-    for net_name in nets.keys():
-        if any(signal in net_name.upper() for signal in ethernet_signals):
-            has_ethernet = True
-            break
-    
-    # Also check for Ethernet PHY ICs
-    for ref, component in components.items():
-        component_value = component.get('value', '').upper()
-        if re.search(r"W5500|ENC28J60|LAN87|KSZ80|DP83|RTL8|AX88", component_value, re.IGNORECASE):
-            has_ethernet = True
-            break
-    
-    if has_ethernet:
+    # Ethernet interface detection (signals or Ethernet PHY ICs)
+    ethernet_nets = netlist.nets_containing({"TX+", "TX-", "RX+", "RX-", "MDI", "MDIO", "ETH"})
+    if ethernet_nets or index.family("ethernet_phy"):
         interfaces.append({
             "type": "ethernet_interface",
-            "signals_found": [net for net in nets.keys() if any(signal in net.upper() for signal in ethernet_signals)]
+            "signals_found": ethernet_nets
         })
     
     return interfaces
@@ -489,29 +558,13 @@ def identify_sensor_interfaces(components: Dict[str, Any], nets: Dict[str, Any])
     """
     sensor_interfaces = []
     
-    # Common sensor IC patterns
-    sensor_patterns = {
-        "temperature": r"LM35|DS18B20|DHT11|DHT22|BME280|BMP280|TMP\d+|MCP9808|MAX31855|MAX6675|SI7021|HTU21|SHT[0123]\d|PCT2075",
-        "humidity": r"DHT11|DHT22|BME280|SI7021|HTU21|SHT[0123]\d|HDC1080",
-        "pressure": r"BMP\d+|BME280|LPS\d+|MS5611|DPS310|MPL3115|SPL06",
-        "accelerometer": r"ADXL\d+|LIS3DH|MMA\d+|MPU\d+|LSM\d+|BMI\d+|BMA\d+|KX\d+",
-        "gyroscope": r"L3G\d+|MPU\d+|BMI\d+|LSM\d+|ICM\d+",
-        "magnetometer": r"HMC\d+|QMC\d+|LSM\d+|MMC\d+|RM\d+",
-        "proximity": r"APDS9960|VL53L0X|VL6180|GP2Y|VCNL4040|VCNL4010",
-        "light": r"BH1750|TSL\d+|MAX4\d+|VEML\d+|APDS9960|LTR329|OPT\d+",
-        "air_quality": r"CCS811|BME680|SGP\d+|SEN\d+|MQ\d+|MiCS",
-        "current": r"ACS\d+|INA\d+|MAX\d+|ZXCT\d+",
-        "voltage": r"INA\d+|MCP\d+|ADS\d+",
-        "ADC": r"ADS\d+|MCP33\d+|MCP32\d+|LTC\d+|NAU7802|HX711",
-        "GPS": r"NEO-[67]M|L80|MTK\d+|SIM\d+|SAM-M8Q|MAX-M8"
-    }
-    
-    for ref, component in components.items():
-        component_value = component.get('value', '').upper()
-        component_lib = component.get('lib_id', '').upper()
+    index = get_component_index(components)
+
+    for entry in index.family("sensor"):
+        ref, component_value = entry.ref, entry.value
         
-        for sensor_type, pattern in sensor_patterns.items():
-            if re.search(pattern, component_value, re.IGNORECASE) or re.search(pattern, component_lib, re.IGNORECASE):
+        for sensor_type in SENSOR_PATTERNS:
+            if entry.matches("sensor", sensor_type):
                 # Identify specific sensors
                 
                 # Temperature sensors
@@ -656,7 +709,7 @@ def identify_sensor_interfaces(components: Dict[str, Any], nets: Dict[str, Any])
     
     # Look for common analog sensors
     # These often don't have specific ICs but have designators like "RT" for thermistors
-    thermistor_refs = [ref for ref in components.keys() if ref.startswith('RT') or ref.startswith('TH')]
+    thermistor_refs = [entry.ref for entry in index.with_prefix('RT', 'TH')]
     for ref in thermistor_refs:
         component = components[ref]
         sensor_interfaces.append({
@@ -668,7 +721,7 @@ def identify_sensor_interfaces(components: Dict[str, Any], nets: Dict[str, Any])
         })
     
     # Look for photodiodes, photoresistors (LDRs)
-    photosensor_refs = [ref for ref in components.keys() if ref.startswith('PD') or ref.startswith('LDR')]
+    photosensor_refs = [entry.ref for entry in index.with_prefix('PD', 'LDR')]
     for ref in photosensor_refs:
         component = components[ref]
         sensor_interfaces.append({
@@ -680,7 +733,7 @@ def identify_sensor_interfaces(components: Dict[str, Any], nets: Dict[str, Any])
         })
     
     # Look for potentiometers (often used for manual sensing/control)
-    pot_refs = [ref for ref in components.keys() if ref.startswith('RV') or ref.startswith('POT')]
+    pot_refs = [entry.ref for entry in index.with_prefix('RV', 'POT')]
     for ref in pot_refs:
         component = components[ref]
         sensor_interfaces.append({
@@ -705,27 +758,13 @@ def identify_microcontrollers(components: Dict[str, Any]) -> List[Dict[str, Any]
     """
     microcontrollers = []
     
-    # Common microcontroller families
-    mcu_patterns = {
-        "AVR": r"ATMEGA\d+|ATTINY\d+|AT90\w+",
-        "STM32": r"STM32\w+",
-        "PIC": r"PIC\d+\w+",
-        "ESP": r"ESP32|ESP8266",
-        "Arduino": r"ARDUINO",
-        "MSP430": r"MSP430\w+",
-        "RP2040": r"RP2040|PICO",
-        "NXP": r"LPC\d+|IMXRT\d+|MK\d+",
-        "SAM": r"SAMD\d+|SAM\w+",
-        "ARM Cortex": r"CORTEX|ARM",
-        "8051": r"8051|AT89"
-    }
-    
-    for ref, component in components.items():
-        component_value = component.get('value', '').upper()
-        component_lib = component.get('lib_id', '').upper()
+    index = get_component_index(components)
+
+    for entry in index.family("mcu"):
+        ref, component_value = entry.ref, entry.value
         
-        for family, pattern in mcu_patterns.items():
-            if re.search(pattern, component_value, re.IGNORECASE) or re.search(pattern, component_lib, re.IGNORECASE):
+        for family in MCU_PATTERNS:
+            if entry.matches("mcu", family):
                 # Identify specific models
                 identified = False
                 
@@ -834,25 +873,14 @@ def identify_microcontrollers(components: Dict[str, Any]) -> List[Dict[str, Any]
                 break
     
     # Look for microcontroller development boards
-    dev_board_patterns = {
-        "Arduino": r"ARDUINO|UNO|NANO|MEGA|LEONARDO|DUE",
-        "ESP32 Dev Board": r"ESP32-DEVKIT|NODEMCU-32S|ESP-WROOM-32",
-        "ESP8266 Dev Board": r"NODEMCU|WEMOS|D1_MINI|ESP-01",
-        "STM32 Dev Board": r"NUCLEO|DISCOVERY|BLUEPILL",
-        "Raspberry Pi": r"RASPBERRY|RPI|RPICO|PICO"
-    }
-    
-    for ref, component in components.items():
-        component_value = component.get('value', '').upper()
-        component_lib = component.get('lib_id', '').upper()
-        
-        for board_type, pattern in dev_board_patterns.items():
-            if re.search(pattern, component_value, re.IGNORECASE) or re.search(pattern, component_lib, re.IGNORECASE):
+    for entry in index.family("dev_board"):
+        for board_type in DEV_BOARD_PATTERNS:
+            if entry.matches("dev_board", board_type):
                 microcontrollers.append({
                     "type": "development_board",
                     "board_type": board_type,
-                    "component": ref,
-                    "value": component_value
+                    "component": entry.ref,
+                    "value": entry.value
                 })
                 break
     
@@ -0,0 +1,620 @@
+"""
+In-process reader for .kicad_pcb files.
+
+Read-only board queries do not need pcbnew: the board file is an
+S-expression document, streamed once through ``sexpr_parser.iter_nodes``
+into compact per-item tuples. ``PcbBoard`` answers the read-only
+BoardManager getters (``basic_board_info``, ``get_layers``,
+``get_footprints_pads``, ``get_tracks_vias``, ``get_zones``,
+``get_net_list`` and ``get_geometry_columns``) with the same data shapes, so
+tools can use either source. Parsed boards are shared through a parse cache
+validated by file mtime and size, and are never modified after parsing, so
+concurrent readers are safe.
+
+``read_board_sections`` is the entry point for tools: it serves what it can
+natively and forwards the remaining sections (design rules) to the KiCad
+worker. ``KICAD_MCP_PCB_READER=pcbnew`` sends every section to the worker.
+The worker stays responsible for all board modifications.
+"""
+import os
+import math
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from kicad_mcp.utils.cache_registry import cache_registry
+from kicad_mcp.utils.geometry_columns import GEOMETRY_KINDS, encode_columns, new_columns
+from kicad_mcp.utils.kicad_bridge import get_kicad_bridge
+from kicad_mcp.utils.parse_cache import ParseCache
+from kicad_mcp.utils.sexpr_parser import Content, SExpr, iter_nodes, mapped_file
+
+# Board sections by batch name, with the PcbBoard/BoardManager getter serving them
+NATIVE_SECTIONS = {
+    "basic_info": "basic_board_info",
+    "layers": "get_layers",
+    "pads": "get_footprints_pads",
+    "tracks_vias": "get_tracks_vias",
+    "zones": "get_zones",
+    "nets": "get_net_list",
+    "geometry": "get_geometry_columns",
+}
+
+# Every section of a board snapshot; the ones not listed above need pcbnew
+BOARD_SECTIONS = ["basic_info", "design_rules", "layers", "pads", "tracks_vias", "zones", "nets", "geometry"]
+
+# Largest board (in pads) returned in the nested layout, as in board_utils
+# (not imported from there: that module loads pcbnew if it is installed)
+MAX_NESTED_PADS = 2000
+
+# LAYER_T values reported by pcbnew's BOARD.GetLayerType
+LAYER_TYPES = {"signal": 0, "power": 1, "mixed": 2, "jumper": 3}
+LAYER_TYPE_UNDEFINED = -1
+
+# PAD_SHAPE values reported by pcbnew's PAD.GetShape
+PAD_SHAPES = {"circle": 0, "rect": 1, "oval": 2, "trapezoid": 3, "roundrect": 4, "custom": 6}
+PAD_SHAPE_CHAMFERED_RECT = 5
+
+# Footprint and board drawings that count towards the board bounding box
+_FOOTPRINT_GRAPHICS = ("fp_line", "fp_rect", "fp_circle", "fp_arc", "fp_poly", "fp_curve")
+_BOARD_GRAPHICS = frozenset(("gr_line", "gr_rect", "gr_circle", "gr_arc", "gr_poly", "gr_curve", "gr_text_box"))
+
+# Pad: number, x, y, size_x, size_y, shape, drill, net code (positions absolute, in mm)
+Pad = Tuple[str, float, float, float, float, int, float, int]
+
+
+def _mm(value: float) -> float:
+    return round(value, 6)
+
+
+def _nm(value: float) -> int:
+    return int(round(value * 1e6))
+
+
+def _rotate(x: float, y: float, angle: float) -> Tuple[float, float]:
+    """Rotate like KiCad's RotatePoint (degrees, Y axis pointing down)."""
+    if not angle:
+        return x, y
+    rad = math.radians(angle)
+    cos, sin = math.cos(rad), math.sin(rad)
+    return x * cos + y * sin, y * cos - x * sin
+
+
+def _xy(node: Optional[SExpr]) -> Tuple[float, float, float]:
+    """Return x, y and the optional angle of an (at/start/end/xy x y [angle]) node."""
+    if node is None:
+        return 0.0, 0.0, 0.0
+    return float(node[1]), float(node[2]), float(node[3]) if len(node) > 3 and not isinstance(node[3], str) else 0.0
+
+
+def _arc_length(start: Tuple[float, float], mid: Tuple[float, float], end: Tuple[float, float]) -> float:
+    """Length of the circular arc through three points."""
+    (ax, ay), (bx, by), (cx, cy) = start, mid, end
+    d = 2 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+    if abs(d) < 1e-12:
+        return math.hypot(cx - ax, cy - ay)
+    ux = ((ax * ax + ay * ay) * (by - cy) + (bx * bx + by * by) * (cy - ay) + (cx * cx + cy * cy) * (ay - by)) / d
+    uy = ((ax * ax + ay * ay) * (cx - bx) + (bx * bx + by * by) * (ax - cx) + (cx * cx + cy * cy) * (bx - ax)) / d
+    radius = math.hypot(ax - ux, ay - uy)
+    a_start = math.atan2(ay - uy, ax - ux)
+    sweep_end = (math.atan2(cy - uy, cx - ux) - a_start) % (2 * math.pi)
+    sweep_mid = (math.atan2(by - uy, bx - ux) - a_start) % (2 * math.pi)
+    sweep = sweep_end if sweep_mid <= sweep_end else 2 * math.pi - sweep_end
+    return radius * sweep
+
+
+def _polygon_area(points: List[Tuple[float, float]]) -> float:
+    area = 0.0
+    for (x1, y1), (x2, y2) in zip(points, points[1:] + points[:1]):
+        area += x1 * y2 - x2 * y1
+    return abs(area) / 2
+
+
+def _points(node: Optional[SExpr]) -> List[Tuple[float, float]]:
+    """The (xy x y) vertices of a (pts ...) child; arc vertices are approximated by their ends."""
+    pts = node.find("pts") if node is not None else None
+    if pts is None:
+        return []
+    result = []
+    for item in pts.children():
+        if item[0] == "xy":
+            result.append((float(item[1]), float(item[2])))
+        elif item[0] == "arc":
+            for tag in ("start", "end"):
+                x, y, _ = _xy(item.find(tag))
+                result.append((x, y))
+    return result
+
+
+class _BoundingBox:
+    def __init__(self):
+        self.min_x = self.min_y = math.inf
+        self.max_x = self.max_y = -math.inf
+
+    def add(self, x: float, y: float, margin: float = 0.0) -> None:
+        self.min_x = min(self.min_x, x - margin)
+        self.min_y = min(self.min_y, y - margin)
+        self.max_x = max(self.max_x, x + margin)
+        self.max_y = max(self.max_y, y + margin)
+
+    def add_graphic(self, node: SExpr, place=None) -> None:
+        """Add the points of a gr_*/fp_* drawing; ``place`` maps footprint to board coordinates."""
+        place = place or (lambda x, y: (x, y))
+        if node[0] in ("gr_circle", "fp_circle"):
+            cx, cy, _ = _xy(node.find("center"))
+            ex, ey, _ = _xy(node.find("end"))
+            self.add(*place(cx, cy), math.hypot(ex - cx, ey - cy))
+            return
+        for tag in ("start", "end", "mid"):
+            child = node.find(tag)
+            if child is not None:
+                self.add(*place(*_xy(child)[:2]))
+        for x, y in _points(node):
+            self.add(*place(x, y))
+
+    def as_dict(self) -> Dict[str, float]:
+        if self.min_x > self.max_x:
+            return {"x": 0.0, "y": 0.0, "width": 0.0, "height": 0.0}
+        return {
+            "x": _mm(self.min_x),
+            "y": _mm(self.min_y),
+            "width": _mm(self.max_x - self.min_x),
+            "height": _mm(self.max_y - self.min_y),
+        }
+
+
+class PcbBoard:
+    """A parsed .kicad_pcb file answering the read-only BoardManager getters.
+
+    Args:
+        path: Path to the .kicad_pcb file
+        text: File content (text or bytes); by default the file is
+            memory-mapped for the duration of the parse
+
+    Raises:
+        ValueError: If the content is not a well-formed KiCad board
+    """
+
+    def __init__(self, path: str, text: Optional[Content] = None):
+        self.path = os.path.abspath(path)
+
+        # layer id -> (canonical name, type, display name)
+        self.layers: Dict[int, Tuple[str, str, str]] = {}
+        self.layer_ids: Dict[str, int] = {}
+        self.nets: Dict[int, str] = {}
+        self.net_codes: Dict[str, int] = {}
+        # reference, value, library id, x, y, layer id, pads
+        self.footprints: List[Tuple[str, str, str, float, float, int, List[Pad]]] = []
+        # start_x, start_y, end_x, end_y, width, length, layer id, net code
+        self.tracks: List[Tuple[float, float, float, float, float, float, int, int]] = []
+        # x, y, size, drill, top layer id, bottom layer id, net code
+        self.vias: List[Tuple[float, float, float, float, int, int, int]] = []
+        self.zones: List[Dict[str, Any]] = []
+        self.bbox = _BoundingBox()
+
+        if text is None:
+            with mapped_file(path) as content:
+                self._read(content)
+        else:
+            self._read(text)
+
+    def _read(self, content: Content) -> None:
+        magic = "(kicad_pcb" if isinstance(content, str) else b"(kicad_pcb"
+        if not content[:256].lstrip().startswith(magic):
+            raise ValueError("Not a KiCad PCB file")
+
+        handlers = {
+            "layers": self._read_layers,
+            "net": self._read_net,
+            "footprint": self._read_footprint,
+            "module": self._read_footprint,
+            "segment": self._read_segment,
+            "arc": self._read_arc,
+            "via": self._read_via,
+            "zone": self._read_zone,
+        }
+        # Everything else (setup, text, dimensions, groups, ...) is skipped unbuilt
+        for node in iter_nodes(content, tags=handlers.keys() | _BOARD_GRAPHICS):
+            handler = handlers.get(node.tag)
+            if handler is not None:
+                handler(node)
+            else:
+                self.bbox.add_graphic(node)
+
+    # --- parsing -----------------------------------------------------------------
+
+    def _layer_id(self, name: Any) -> int:
+        name = str(name)
+        if name not in self.layer_ids and "&" in name:
+            # "F&B.Cu" wildcard of a two-sided zone or pad: its first layer
+            name = name.replace("F&B", "F")
+        return self.layer_ids.get(name, self.layer_ids.get(name.replace("*", "F"), -1))
+
+    def _net_code(self, node: Optional[SExpr]) -> int:
+        if node is None or len(node) < 2:
+            return 0
+        if isinstance(node[1], int):
+            return node[1]
+        # Boards referring to nets by name only
+        return self.net_codes.get(str(node[1]), 0)
+
+    def _read_layers(self, node: SExpr) -> None:
+        for layer in node.children():
+            if len(layer) < 3:
+                continue
+            layer_id, name, layer_type = int(layer[0]), str(layer[1]), str(layer[2])
+            display = str(layer[3]) if len(layer) > 3 and isinstance(layer[3], str) else name
+            self.layers[layer_id] = (name, layer_type, display)
+            self.layer_ids[name] = layer_id
+
+    def _read_net(self, node: SExpr) -> None:
+        if len(node) >= 3:
+            self.nets[int(node[1])] = str(node[2])
+            self.net_codes[str(node[2])] = int(node[1])
+
+    def _read_footprint(self, node: SExpr) -> None:
+        x0, y0, angle = _xy(node.find("at"))
+        reference = value = ""
+        for prop in node.find_all("property"):
+            if len(prop) > 2 and prop[1] == "Reference":
+                reference = str(prop[2])
+            elif len(prop) > 2 and prop[1] == "Value":
+                value = str(prop[2])
+        for text in node.find_all("fp_text"):
+            if len(text) > 2 and text[1] == "reference" and not reference:
+                reference = str(text[2])
+            elif len(text) > 2 and text[1] == "value" and not value:
+                value = str(text[2])
+
+        def place(lx: float, ly: float) -> Tuple[float, float]:
+            rx, ry = _rotate(lx, ly, angle)
+            return x0 + rx, y0 + ry
+
+        pads = []
+        for pad in node.find_all("pad"):
+            px, py = place(*_xy(pad.find("at"))[:2])
+            size = pad.find("size")
+            size_x, size_y = (float(size[1]), float(size[2])) if size is not None and len(size) > 2 else (0.0, 0.0)
+            shape = PAD_SHAPES.get(str(pad[3]) if len(pad) > 3 else "", 0)
+            chamfer = pad.find("chamfer")
+            if shape == PAD_SHAPES["roundrect"] and chamfer is not None and len(chamfer) > 1:
+                shape = PAD_SHAPE_CHAMFERED_RECT
+            drill = pad.find("drill")
+            drill_x = next((float(item) for item in drill[1:] if isinstance(item, (int, float))), 0.0) \
+                if drill is not None else 0.0
+            pads.append((str(pad[1]), px, py, size_x, size_y, shape, drill_x, self._net_code(pad.find("net"))))
+            self.bbox.add(px, py, max(size_x, size_y) / 2)
+
+        for graphic in node.children():
+            if graphic[0] in _FOOTPRINT_GRAPHICS:
+                self.bbox.add_graphic(graphic, place)
+
+        self.footprints.append((reference, value, str(node[1]) if len(node) > 1 else "",
+                                x0, y0, self._layer_id(node.value("layer", "F.Cu")), pads))
+
+    def _read_segment(self, node: SExpr) -> None:
+        sx, sy, _ = _xy(node.find("start"))
+        ex, ey, _ = _xy(node.find("end"))
+        width = float(node.value("width", 0))
+        self.tracks.append((sx, sy, ex, ey, width, math.hypot(ex - sx, ey - sy),
+                            self._layer_id(node.value("layer", "")), self._net_code(node.find("net"))))
+        self.bbox.add(sx, sy, width / 2)
+        self.bbox.add(ex, ey, width / 2)
+
+    def _read_arc(self, node: SExpr) -> None:
+        sx, sy, _ = _xy(node.find("start"))
+        mx, my, _ = _xy(node.find("mid"))
+        ex, ey, _ = _xy(node.find("end"))
+        width = float(node.value("width", 0))
+        self.tracks.append((sx, sy, ex, ey, width, _arc_length((sx, sy), (mx, my), (ex, ey)),
+                            self._layer_id(node.value("layer", "")), self._net_code(node.find("net"))))
+        for x, y in ((sx, sy), (mx, my), (ex, ey)):
+            self.bbox.add(x, y, width / 2)
+
+    def _read_via(self, node: SExpr) -> None:
+        x, y, _ = _xy(node.find("at"))
+        size = float(node.value("size", 0))
+        layers = node.find("layers")
+        top, bottom = (layers[1], layers[-1]) if layers is not None and len(layers) > 2 else ("F.Cu", "B.Cu")
+        self.vias.append((x, y, size, float(node.value("drill", 0)), self._layer_id(top), self._layer_id(bottom),
+                          self._net_code(node.find("net"))))
+        self.bbox.add(x, y, size / 2)
+
+    def _read_zone(self, node: SExpr) -> None:
+        layer = node.value("layer")
+        if layer is None:
+            layers = node.find("layers")
+            layer = layers[1] if layers is not None and len(layers) > 1 else ""
+        layer_id = self._layer_id(layer)
+        fill = node.find("fill")
+        outline = _points(node.find("polygon"))
+        for x, y in outline:
+            self.bbox.add(x, y)
+        filled = sum(_polygon_area(_points(polygon)) for polygon in node.find_all("filled_polygon"))
+        net_code = self._net_code(node.find("net"))
+        self.zones.append({
+            "net_name": str(node.value("net_name", self.nets.get(net_code, ""))),
+            "net_code": net_code,
+            "layer": layer_id,
+            "layer_name": self.layer_name(layer_id),
+            # As reported through pcbnew: filled area in internal units squared, divided by 1e6
+            "area": round(filled * 1e6, 3),
+            "min_thickness": _mm(float(node.value("min_thickness", 0))),
+            "thermal_relief_gap": _mm(float(fill.value("thermal_gap", 0))) if fill is not None else 0.0,
+            "thermal_relief_copper_bridge": _mm(float(fill.value("thermal_bridge_width", 0))) if fill is not None else 0.0,
+            "zone_name": str(node.value("name", "")),
+        })
+
+    # --- BoardManager getters ----------------------------------------------------
+
+    def layer_name(self, layer_id: int) -> str:
+        layer = self.layers.get(layer_id)
+        return layer[2] if layer else ""
+
+    def basic_board_info(self) -> Dict[str, Any]:
+        """Filename, bounding box of all items and net count (net 0 included, as in pcbnew)."""
+        return {
+            "success": True,
+            "data": {
+                "filename": self.path,
+                "bounding_box": self.bbox.as_dict(),
+                "net_count": len(self.nets),
+            }
+        }
+
+    def get_layers(self) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "data": {
+                layer_id: {"name": display, "type": LAYER_TYPES.get(layer_type, LAYER_TYPE_UNDEFINED)}
+                for layer_id, (_, layer_type, display) in sorted(self.layers.items())
+            }
+        }
+
+    def get_net_list(self) -> Dict[str, Any]:
+        return {"success": True, "net_info": {name: code for code, name in sorted(self.nets.items())}}
+
+    def _footprint_info(self, footprint) -> Dict[str, Any]:
+        reference, value, lib_id, x, y, layer_id, _ = footprint
+        return {
+            "reference": reference,
+            "value": value,
+            "footprint_id": lib_id,
+            "position": {"x": _mm(x), "y": _mm(y)},
+            "layer": layer_id,
+            "layer_name": self.layer_name(layer_id),
+        }
+
+    @staticmethod
+    def _pad_info(pad: Pad) -> Dict[str, Any]:
+        number, x, y, size_x, size_y, shape, drill, net_code = pad
+        return {
+            "number": number,
+            "position": {"x": _mm(x), "y": _mm(y)},
+            "size": {"x": _mm(size_x), "y": _mm(size_y)},
+            "shape": shape,
+            "drill_size": _mm(drill),
+            "net_code": net_code,
+        }
+
+    def get_footprints_pads(self, layout: str = "normalized", max_nested_pads: int = MAX_NESTED_PADS) -> Dict[str, Any]:
+        """Footprints, pads and nets in the "normalized" or "nested" layout (see BoardManager)."""
+        if layout not in ("normalized", "nested"):
+            return {"success": False, "message": f"Unknown pad layout '{layout}', use 'normalized' or 'nested'"}
+
+        if layout == "nested":
+            pad_count = sum(len(footprint[6]) for footprint in self.footprints)
+            if pad_count > max_nested_pads:
+                return {
+                    "success": False,
+                    "message": f"Board has {pad_count} pads; the nested layout is limited to "
+                               f"{max_nested_pads}. Use the normalized layout."
+                }
+            return self._nested_pads()
+
+        footprints = []
+        pads = []
+        nets: Dict[int, List[int]] = {}
+        for footprint_id, footprint in enumerate(self.footprints):
+            pad_ids = []
+            for pad in footprint[6]:
+                pad_id = len(pads)
+                pads.append({"id": pad_id, "footprint": footprint_id, **self._pad_info(pad)})
+                pad_ids.append(pad_id)
+                if pad[7] > 0:  # net code 0 is "no net"
+                    nets.setdefault(pad[7], []).append(pad_id)
+            footprints.append({"id": footprint_id, **self._footprint_info(footprint), "pads": pad_ids})
+
+        return {
+            "success": True,
+            "data": {
+                "layout": "normalized",
+                "footprints": footprints,
+                "pads": pads,
+                "nets": [{"code": code, "name": self.nets.get(code, ""), "pads": pad_ids}
+                         for code, pad_ids in sorted(nets.items())]
+            }
+        }
+
+    def _nested_pads(self) -> Dict[str, Any]:
+        net_members: Dict[str, List[Tuple[Pad, Dict[str, str]]]] = {}
+        for footprint in self.footprints:
+            for pad in footprint[6]:
+                netname = self.nets.get(pad[7], "")
+                if netname:
+                    net_members.setdefault(netname, []).append((pad, {"pad_number": pad[0], "net_name": netname}))
+
+        components = []
+        for footprint in self.footprints:
+            component = self._footprint_info(footprint)
+            component["pads"] = []
+            for pad in footprint[6]:
+                netname = self.nets.get(pad[7], "")
+                pad_info = self._pad_info(pad)
+                pad_info["net_name"] = netname
+                pad_info["net_code"] = pad_info.pop("net_code")
+                pad_info["connected_items"] = [item for other_pad, item in net_members.get(netname, ())
+                                               if other_pad is not pad]
+                component["pads"].append(pad_info)
+            components.append(component)
+        return {"success": True, "data": {"layout": "nested", "components": components}}
+
+    def get_tracks_vias(self) -> Dict[str, Any]:
+        tracks = [{
+            "start": {"x": _mm(sx), "y": _mm(sy)},
+            "end": {"x": _mm(ex), "y": _mm(ey)},
+            "length": _mm(length),
+            "width": _mm(width),
+            "layer_name": self.layer_name(layer_id),
+            "net_name": self.nets.get(net_code, ""),
+            "net_code": net_code,
+        } for sx, sy, ex, ey, width, length, layer_id, net_code in self.tracks]
+        vias = [{
+            "position": {"x": _mm(x), "y": _mm(y)},
+            "drill": _mm(drill),
+            "width": _mm(size),
+            "layers": [self.layer_name(top), self.layer_name(bottom)],
+            "net_name": self.nets.get(net_code, ""),
+            "net_code": net_code,
+        } for x, y, size, drill, top, bottom, net_code in self.vias]
+        return {"success": True, "data": {"tracks": tracks, "vias": vias}}
+
+    def get_zones(self) -> Dict[str, Any]:
+        return {"success": True, "data": [dict(zone) for zone in self.zones]}
+
+    def get_geometry_columns(self, kinds: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Pad, track and via geometry as typed columns (see geometry_columns)."""
+        kinds = list(kinds or GEOMETRY_KINDS)
+        unknown = [kind for kind in kinds if kind not in GEOMETRY_KINDS]
+        if unknown:
+            return {"success": False, "message": f"Unknown geometry kinds: {', '.join(unknown)}"}
+
+        data: Dict[str, Any] = {}
+        net_codes = set()
+        if "pads" in kinds:
+            columns = new_columns(GEOMETRY_KINDS["pads"])
+            for index, footprint in enumerate(self.footprints):
+                for _, x, y, size_x, size_y, _, drill, net_code in footprint[6]:
+                    for name, value in (("x", _nm(x)), ("y", _nm(y)), ("size_x", _nm(size_x)),
+                                        ("size_y", _nm(size_y)), ("drill", _nm(drill)), ("layer", footprint[5]),
+                                        ("net_code", net_code), ("footprint", index)):
+                        columns[name].append(value)
+            net_codes.update(columns["net_code"])
+            data["pads"] = encode_columns(columns)
+        if "tracks" in kinds:
+            columns = new_columns(GEOMETRY_KINDS["tracks"])
+            for sx, sy, ex, ey, width, length, layer_id, net_code in self.tracks:
+                for name, value in (("start_x", _nm(sx)), ("start_y", _nm(sy)), ("end_x", _nm(ex)),
+                                    ("end_y", _nm(ey)), ("width", _nm(width)), ("length", length * 1e6),
+                                    ("layer", layer_id), ("net_code", net_code)):
+                    columns[name].append(value)
+            net_codes.update(columns["net_code"])
+            data["tracks"] = encode_columns(columns)
+        if "vias" in kinds:
+            columns = new_columns(GEOMETRY_KINDS["vias"])
+            for x, y, size, drill, _, _, net_code in self.vias:
+                for name, value in (("x", _nm(x)), ("y", _nm(y)), ("width", _nm(size)), ("drill", _nm(drill)),
+                                    ("net_code", net_code)):
+                    columns[name].append(value)
+            net_codes.update(columns["net_code"])
+            data["vias"] = encode_columns(columns)
+
+        data["nets"] = {str(code): self.nets.get(code, "") for code in sorted(net_codes)}
+        data["layers"] = {str(layer_id): layer[2] for layer_id, layer in sorted(self.layers.items())}
+        return {"success": True, "data": data}
+
+
+def _parse_board(path: str) -> Dict[str, Any]:
+    try:
+        return {"board": PcbBoard(path)}
+    except (OSError, ValueError, IndexError, TypeError) as e:
+        logging.warning(f"Could not read board {path}: {e}")
+        return {"error": f"Could not read board: {e}"}
+
+
+_board_cache: Optional[ParseCache] = None
+_board_cache_lock = threading.Lock()
+
+
+def get_board_parse_cache() -> ParseCache:
+    """Return the process-wide cache of parsed boards."""
+    global _board_cache
+    with _board_cache_lock:
+        if _board_cache is None:
+            _board_cache = ParseCache()
+            cache_registry.register("board_parses", _board_cache.invalidate, (".kicad_pcb",),
+                                    clear=_board_cache.clear, stats=_board_cache.stats)
+        return _board_cache
+
+
+def load_pcb(path: str) -> Dict[str, Any]:
+    """Return {"board": PcbBoard} for ``path`` (parsed once per file version) or {"error": ...}."""
+    return get_board_parse_cache().get_or_parse(path, _parse_board)
+
+
+def native_reader_enabled() -> bool:
+    return os.environ.get("KICAD_MCP_PCB_READER", "native").strip().lower() != "pcbnew"
+
+
+def read_board_sections(pcb_path: str, sections: Optional[List[str]] = None,
+                        options: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Run read-only board getters, in-process where possible.
+
+    Sections in NATIVE_SECTIONS are answered by PcbBoard; the others, and
+    all of them if the file cannot be read natively or
+    ``KICAD_MCP_PCB_READER=pcbnew``, go to the KiCad worker in one batch.
+
+    Args:
+        pcb_path: Path to the .kicad_pcb file
+        sections: Section names (see BOARD_SECTIONS); all of them if omitted
+        options: Keyword arguments per section, e.g. {"pads": {"layout": "nested"}}
+
+    Returns:
+        Dict with one result per section under "results", like KiCadBridge.batch
+    """
+    sections = list(sections or BOARD_SECTIONS)
+    options = options or {}
+    unknown = [name for name in sections if name not in BOARD_SECTIONS]
+    if unknown:
+        return {
+            "success": False,
+            "error": f"Unknown board sections: {', '.join(unknown)}",
+            "available": BOARD_SECTIONS
+        }
+    if not os.path.exists(pcb_path):
+        return {"success": False, "error": f"PCB file not found: {pcb_path}"}
+
+    results: Dict[str, Any] = {}
+    board_info: Dict[str, Any] = {"pcb_path": pcb_path}
+    native = [name for name in sections if name in NATIVE_SECTIONS] if native_reader_enabled() else []
+    if native:
+        loaded = load_pcb(pcb_path)
+        if "board" in loaded:
+            board_info["reader"] = "native"
+            for name in native:
+                try:
+                    results[name] = getattr(loaded["board"], NATIVE_SECTIONS[name])(**(options.get(name) or {}))
+                except Exception as e:
+                    logging.exception(f"Native board getter {name} failed")
+                    results[name] = {"success": False, "error": str(e)}
+        else:
+            logging.info(f"Falling back to pcbnew for {pcb_path}: {loaded['error']}")
+
+    remaining = [name for name in sections if name not in results]
+    if remaining:
+        bridge = get_kicad_bridge()
+        if bridge is None:
+            error = {"success": False, "error": "KiCadBridge not initialized"}
+            results.update((name, error) for name in remaining)
+        else:
+            batch = bridge.batch(pcb_path, remaining, {name: options[name] for name in remaining if name in options})
+            if "results" in batch:
+                results.update(batch["results"])
+                board_info.update(batch.get("board_info", {}), worker_sections=remaining)
+            else:
+                results.update((name, batch) for name in remaining)
+
+    return {
+        "success": all(results[name].get("success") for name in sections),
+        "board_info": board_info,
+        "results": {name: results[name] for name in sections}
+    }
@@ -0,0 +1,309 @@
+"""
+Persistent index of the KiCad projects under the search directories.
+
+A full ``os.walk`` of large or network-mounted trees on every
+``list_projects`` call is slow. The index remembers, per directory, its
+modification time, subdirectories and project files, and is saved to
+``CACHE_DIR/project_index.json``. A refresh only lists directories whose
+mtime changed (adding or removing an entry changes the mtime of the
+directory that holds it); unchanged directories cost one ``stat``.
+Directories of one tree level are scanned in parallel, and each directory is
+visited once per root, identified by device and inode, so symlink loops end.
+
+With ``KICAD_MCP_PROJECT_WATCH=1`` and change notifications available from
+the shared file watcher (optional ``watchdog`` package), changed directories
+are marked as they change, so a refresh does not need to stat unchanged
+directories at all.
+"""
+import os
+import json
+import time
+import logging
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from kicad_mcp.config import CACHE_DIR, KICAD_EXTENSIONS
+from kicad_mcp.utils.cache_registry import cache_registry
+from kicad_mcp.utils.file_watcher import get_file_watcher
+
+# Bump when the index file format changes
+PROJECT_INDEX_VERSION = 1
+
+# Directories scanned in parallel
+DEFAULT_SCAN_WORKERS = 8
+
+# Directory mtimes newer than this (seconds) are not trusted: a change in the
+# same clock tick as the scan would not change the recorded mtime
+MTIME_SETTLE_SECONDS = 2.0
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _scan_directory(path: str, cached: Optional[Dict[str, Any]],
+                    trust_cached: bool) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """Return the index entry of one directory, listing it only if it changed.
+
+    Args:
+        path: Directory to scan
+        cached: Entry from the previous scan, if any
+        trust_cached: Reuse ``cached`` without checking the directory (watcher mode)
+
+    Returns:
+        Tuple of the entry (None if the directory cannot be read) and whether
+        the directory was listed
+    """
+    if cached is not None and trust_cached:
+        return cached, False
+
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        logging.warning(f"Cannot access directory {path}: {e}")
+        return None, False
+
+    listed = cached is None or cached["mtime_ns"] != stat.st_mtime_ns
+    if not listed:
+        entry = dict(cached, dev_ino=[stat.st_dev, stat.st_ino])
+    else:
+        subdirs = []
+        project_files = []
+        try:
+            with os.scandir(path) as entries:
+                for item in entries:
+                    try:
+                        if item.is_dir():  # follows symlinks, like os.walk(followlinks=True)
+                            subdirs.append(item.name)
+                        elif item.name.endswith(KICAD_EXTENSIONS["project"]) and item.is_file():
+                            project_files.append(item.name)
+                    except OSError:
+                        continue
+        except OSError as e:
+            logging.warning(f"Cannot list directory {path}: {e}")
+            return None, False
+
+        # Do not record an mtime that could still change within the same tick
+        recent = time.time() - stat.st_mtime < MTIME_SETTLE_SECONDS
+        entry = {
+            "mtime_ns": -1 if recent else stat.st_mtime_ns,
+            "dev_ino": [stat.st_dev, stat.st_ino],
+            "subdirs": sorted(subdirs),
+            "projects": dict.fromkeys(sorted(project_files)),
+        }
+
+    # Project files are edited in place, which does not change the directory mtime
+    projects = {}
+    for name in entry["projects"]:
+        try:
+            projects[name] = os.path.getmtime(os.path.join(path, name))
+        except OSError as e:
+            logging.error(f"Error accessing project file {os.path.join(path, name)}: {e}")
+            # List the directory again next time instead of forgetting the project
+            entry["mtime_ns"] = -1
+    entry["projects"] = projects
+    return entry, listed
+
+
+class ProjectIndex:
+    """Directory index of KiCad projects, persisted between server runs.
+
+    Args:
+        index_path: JSON file holding the index (default: CACHE_DIR/project_index.json)
+        workers: Directories scanned in parallel (default: KICAD_MCP_SCAN_WORKERS)
+    """
+
+    def __init__(self, index_path: Optional[str] = None, workers: Optional[int] = None):
+        self.index_path = index_path or os.path.join(CACHE_DIR, "project_index.json")
+        self.workers = max(1, workers or _env_int("KICAD_MCP_SCAN_WORKERS", DEFAULT_SCAN_WORKERS))
+        self.directories: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+        self.loaded = False
+        self.watching = False
+        self.watched_roots: Tuple[str, ...] = ()
+        self.dirty: Set[str] = set()
+        self.dirty_lock = threading.Lock()
+        self.watch_primed = False
+        self.last_scan = {"directories": 0, "listed": 0, "seconds": 0.0}
+
+    def _load(self) -> None:
+        if self.loaded:
+            return
+        self.loaded = True
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == PROJECT_INDEX_VERSION:
+                self.directories = data.get("directories", {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable project index {self.index_path}: {e}")
+
+    def _save(self) -> None:
+        try:
+            directory = os.path.dirname(self.index_path)
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"version": PROJECT_INDEX_VERSION, "directories": self.directories}, f)
+                os.replace(temp_path, self.index_path)
+            except BaseException:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            logging.warning(f"Could not save project index {self.index_path}: {e}")
+
+    def _walk(self, root: str, previous: Dict[str, Dict[str, Any]], dirty: Optional[Set[str]],
+              executor: ThreadPoolExecutor, scanned: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Walk one root level by level and return its projects."""
+        projects = []
+        visited: Set[Tuple[int, int]] = set()
+        level = [root]
+
+        def scan(path: str):
+            if path in scanned:
+                # Already scanned under another root
+                return path, scanned[path], False
+            return (path,) + _scan_directory(path, previous.get(path), dirty is not None and os.path.normcase(path) not in dirty)
+
+        while level:
+            next_level = []
+            for path, entry, listed in executor.map(scan, level):
+                if entry is None:
+                    continue
+                self.last_scan["directories"] += 1
+                self.last_scan["listed"] += listed
+                scanned[path] = entry
+
+                # Symlink loop guard: each directory once per root
+                identity = tuple(entry["dev_ino"])
+                if identity in visited:
+                    logging.info(f"Skipping already visited directory (symlink loop?): {path}")
+                    continue
+                visited.add(identity)
+
+                for name, mod_time in entry["projects"].items():
+                    project_path = os.path.join(path, name)
+                    projects.append({
+                        "name": name[:-len(KICAD_EXTENSIONS["project"])],
+                        "path": project_path,
+                        "relative_path": os.path.relpath(project_path, root),
+                        "modified": mod_time
+                    })
+                next_level.extend(os.path.join(path, name) for name in entry["subdirs"])
+            level = next_level
+
+        return projects
+
+    def find_projects(self, roots: List[str]) -> List[Dict[str, Any]]:
+        """Return the projects under ``roots``, rescanning only changed directories.
+
+        Args:
+            roots: Directories to search (already expanded, without duplicates)
+
+        Returns:
+            List of dictionaries with project information
+        """
+        with self.lock:
+            self._load()
+            start = time.perf_counter()
+
+            # With a primed watcher only directories it reported are checked
+            watching = self.watching and self.watched_roots == tuple(roots)
+            dirty = None
+            if watching:
+                with self.dirty_lock:
+                    pending, self.dirty = self.dirty, set()
+                if self.watch_primed:
+                    dirty = pending
+
+            previous = self.directories
+            scanned: Dict[str, Dict[str, Any]] = {}
+            projects = []
+            self.last_scan = {"directories": 0, "listed": 0, "seconds": 0.0}
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="kicad-scan") as executor:
+                for root in roots:
+                    if not os.path.exists(root):
+                        logging.warning(f"Expanded search directory does not exist: {root}")
+                        continue
+                    logging.info(f"Scanning expanded directory: {root}")
+                    projects.extend(self._walk(root, previous, dirty, executor, scanned))
+
+            self.last_scan["seconds"] = time.perf_counter() - start
+            self.watch_primed = watching
+
+            # Directories no longer reachable from a root are dropped
+            changed = scanned != previous
+            self.directories = scanned
+            if changed:
+                self._save()
+            return projects
+
+    def mark_changed(self, path: str) -> None:
+        """Record a change reported by the file watcher."""
+        path = os.path.normcase(path)
+        with self.dirty_lock:
+            # The directory holding the entry, and the entry itself if it is a directory
+            self.dirty.add(os.path.dirname(path))
+            self.dirty.add(path)
+
+    def start_watching(self, roots: List[str]) -> bool:
+        """Keep the index live with the shared file watcher.
+
+        Args:
+            roots: Directories to watch recursively
+
+        Returns:
+            True if change notifications are delivered, False if the watcher
+            cannot watch trees (watchdog not installed or watching disabled)
+        """
+        self.stop_watching()
+        with self.lock:
+            self.watched_roots = tuple(roots)
+            self.watch_primed = False
+
+        watcher = get_file_watcher()
+        if not watcher.live:
+            # Remember the roots so the attempt is not repeated on every call
+            logging.info("File change notifications unavailable; the project index is refreshed by scanning")
+            return False
+
+        cache_registry.register("project_index", self.mark_changed)
+        watched = [watcher.watch(root, recursive=True) for root in roots if os.path.isdir(root)]
+        if not all(watched):
+            cache_registry.unregister("project_index")
+            return False
+
+        with self.lock:
+            # Changes before the watcher started are caught by one full check
+            self.watching = True
+        return True
+
+    def stop_watching(self) -> None:
+        with self.lock:
+            self.watching = False
+        cache_registry.unregister("project_index")
+
+
+_project_index: Optional[ProjectIndex] = None
+_project_index_lock = threading.Lock()
+
+
+def get_project_index() -> ProjectIndex:
+    """Return the shared project index."""
+    global _project_index
+    with _project_index_lock:
+        if _project_index is None:
+            _project_index = ProjectIndex()
+        return _project_index
+
@@ -0,0 +1,276 @@
+"""
+Project-level netlist resolution for hierarchical KiCad schematics.
+
+Starting from the root schematic, the resolver follows ``(sheet ...)``
+instances, parses every distinct sheet file once (in a process pool when
+there are several), and then flattens the hierarchy: each sheet instance
+gets its own copy of the sheet's nets, symbols take their per-instance
+references, and sheet pins are stitched to the matching hierarchical labels.
+"""
+import os
+import atexit
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from kicad_mcp.utils.connectivity import UnionFind
+from kicad_mcp.utils.file_watcher import watch_file_directory
+from kicad_mcp.utils.netlist_parser import NET_DRIVER_PRIORITY, auto_net_name, extract_netlist
+from kicad_mcp.utils.parse_cache import get_parse_cache
+
+_sheet_pool: Optional[ProcessPoolExecutor] = None
+_sheet_pool_size = 0
+_sheet_pool_lock = threading.Lock()
+
+
+def parse_sheet(schematic_path: str) -> Dict[str, Any]:
+    """Parse one sheet file (runs in a worker process).
+
+    The worker's own parse cache would die with the process, so it is
+    bypassed; the parent stores the result in its cache instead.
+
+    Args:
+        schematic_path: Path to a .kicad_sch file
+
+    Returns:
+        The SchematicParser result, or a dict with an "error" key
+    """
+    return extract_netlist(schematic_path, use_cache=False)
+
+
+def _get_sheet_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared sheet parser pool, grown to at least ``workers`` processes."""
+    global _sheet_pool, _sheet_pool_size
+    with _sheet_pool_lock:
+        if _sheet_pool is None or _sheet_pool_size < workers:
+            if _sheet_pool is not None:
+                _sheet_pool.shutdown(wait=False)
+            _sheet_pool = ProcessPoolExecutor(max_workers=workers)
+            _sheet_pool_size = workers
+        return _sheet_pool
+
+
+def shutdown_sheet_pool() -> None:
+    """Stop the shared sheet parser pool (a new one is created on next use)."""
+    global _sheet_pool, _sheet_pool_size
+    with _sheet_pool_lock:
+        pool, _sheet_pool, _sheet_pool_size = _sheet_pool, None, 0
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(shutdown_sheet_pool)
+
+
+def _parse_sheets(paths: List[str], max_workers: Optional[int]) -> Dict[str, Dict[str, Any]]:
+    """Parse several sheet files, in parallel when it pays off.
+
+    Sheets still in the parse cache are not parsed again, and fresh results
+    are added to it.
+    """
+    cache = get_parse_cache()
+    results: Dict[str, Dict[str, Any]] = {}
+    missing: Dict[str, Optional[os.stat_result]] = {}
+    for path in paths:
+        watch_file_directory(path)
+        cached = cache.get(path)
+        if cached is not None:
+            results[path] = cached
+            continue
+        try:
+            missing[path] = os.stat(path)
+        except OSError:
+            missing[path] = None
+
+    parsed = None
+    workers = min(len(missing), max_workers or os.cpu_count() or 1)
+    if workers > 1:
+        try:
+            parsed = list(_get_sheet_pool(workers).map(parse_sheet, missing))
+        except (OSError, RuntimeError) as e:
+            # Process pools are unavailable in some sandboxes; parse in-process
+            logging.debug(f"Sheet parser pool unavailable: {e}")
+            shutdown_sheet_pool()
+    if parsed is None:
+        parsed = [parse_sheet(path) for path in missing]
+
+    for (path, stat), result in zip(missing.items(), parsed):
+        if stat is not None:
+            cache.put(path, result, stat)
+        results[path] = result
+    return results
+
+
+def _instance_reference(sheet: Dict[str, Any], reference: str, path: str) -> str:
+    """Reference of a symbol in one sheet instance (falls back to the local one)."""
+    return sheet.get("instance_references", {}).get(reference, {}).get(path, reference)
+
+
+def resolve_project_netlist(root_schematic: str, max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """Build a flat netlist for a hierarchical schematic.
+
+    Args:
+        root_schematic: Path to the project's root .kicad_sch file
+        max_workers: Upper bound on parser processes (default: CPU count)
+
+    Returns:
+        Dictionary with flattened components and nets, the sheet instances
+        that were visited, the absolute paths of every sheet file parsed and
+        any problems found along the way
+    """
+    root_schematic = os.path.abspath(root_schematic)
+    parsed: Dict[str, Dict[str, Any]] = {}
+    errors: List[Dict[str, str]] = []
+
+    # Walk the hierarchy level by level so each level's new files parse in parallel.
+    # An instance is (instance path, sheet path, file, parent instance index, sheet entry).
+    instances: List[Tuple[str, str, str, Optional[int], Optional[Dict[str, Any]]]] = []
+    level = [(None, root_schematic, "/", None, None)]
+    while level:
+        new_files = sorted({entry[1] for entry in level if entry[1] not in parsed})
+        parsed.update(_parse_sheets(new_files, max_workers))
+
+        next_level = []
+        for parent_path, schematic_path, sheet_path, parent_index, sheet_entry in level:
+            sheet = parsed[schematic_path]
+            if "error" in sheet:
+                errors.append({"file": schematic_path, "error": sheet["error"]})
+                continue
+
+            if parent_path is None:
+                instance_path = f"/{sheet.get('uuid') or ''}"
+            else:
+                instance_path = f"{parent_path}/{sheet_entry['uuid']}"
+
+            index = len(instances)
+            instances.append((instance_path, sheet_path, schematic_path, parent_index, sheet_entry))
+
+            ancestors = set()
+            cursor = index
+            while cursor is not None:
+                ancestors.add(instances[cursor][2])
+                cursor = instances[cursor][3]
+
+            for child in sheet.get("sheets", []):
+                child_file = os.path.abspath(os.path.join(os.path.dirname(schematic_path), child["file"]))
+                if child_file in ancestors:
+                    errors.append({"file": child_file, "error": "Recursive sheet reference"})
+                    continue
+                if not os.path.exists(child_file):
+                    errors.append({"file": child_file, "error": "Sheet file not found"})
+                    continue
+                next_level.append((instance_path, child_file, f"{sheet_path}{child['name']}/", index, child))
+        level = next_level
+
+    # One union-find item per (instance, local net)
+    uf = UnionFind()
+    net_items: List[Dict[str, int]] = []
+    drivers = []  # (item, rank, name)
+    named_items: Dict[str, int] = {}
+    components: Dict[str, Dict[str, Any]] = {}
+    placed_units = set()  # (flat reference, unit)
+    duplicates: List[str] = []
+    group_pins: List[Tuple[int, Dict[str, str], str]] = []  # (item, pin, pin name)
+
+    for index, (instance_path, sheet_path, schematic_path, _, _) in enumerate(instances):
+        sheet = parsed[schematic_path]
+        depth = sheet_path.count("/")
+        items = {}
+        for net_name in sheet.get("nets", {}):
+            item = uf.add()
+            items[net_name] = item
+
+            scope = sheet.get("net_scopes", {}).get(net_name, "auto")
+            if scope in ("global", "power"):
+                flat_name = net_name
+            elif scope == "auto":
+                continue
+            else:
+                flat_name = f"{sheet_path}{net_name.lstrip('/')}" if scope == "sheet_pin" else f"{sheet_path}{net_name}"
+
+            # Global names join across sheets; local names are unique per instance
+            if scope in ("global", "power"):
+                if flat_name in named_items:
+                    uf.union(named_items[flat_name], item)
+                else:
+                    named_items[flat_name] = item
+            drivers.append((item, (NET_DRIVER_PRIORITY.get(scope, 5), depth, flat_name), flat_name))
+        net_items.append(items)
+
+        for reference, component in sheet.get("components", {}).items():
+            flat_reference = _instance_reference(sheet, reference, instance_path)
+            # Units of one multi-unit symbol may sit on different sheets
+            unit = (flat_reference, component.get("unit", 1))
+            if unit in placed_units:
+                duplicates.append(flat_reference)
+                continue
+            placed_units.add(unit)
+            if flat_reference not in components:
+                components[flat_reference] = dict(component, reference=flat_reference, sheet_path=sheet_path)
+
+        pin_names = {
+            reference: {pin['num']: pin['name'] for pin in component.get('symbol_pins', [])}
+            for reference, component in sheet.get("components", {}).items()
+        }
+        for net_name, pins in sheet.get("nets", {}).items():
+            for pin in pins:
+                group_pins.append((items[net_name], {
+                    'component': _instance_reference(sheet, pin['component'], instance_path),
+                    'pin': pin['pin']
+                }, pin_names.get(pin['component'], {}).get(pin['pin'], '')))
+
+    # Stitch each sheet pin in the parent to the child's hierarchical label
+    for index, (_, sheet_path, schematic_path, parent_index, sheet_entry) in enumerate(instances):
+        if parent_index is None:
+            continue
+        child = parsed[schematic_path]
+        for pin in sheet_entry.get("pins", []):
+            parent_net = pin.get("net")
+            child_net = child.get("hierarchical_nets", {}).get(pin["name"])
+            if parent_net in net_items[parent_index] and child_net in net_items[index]:
+                uf.union(net_items[parent_index][parent_net], net_items[index][child_net])
+            else:
+                errors.append({
+                    "file": schematic_path,
+                    "error": f"Sheet pin '{pin['name']}' has no matching hierarchical label"
+                })
+
+    best = {}
+    for item, rank, name in drivers:
+        root = uf.find(item)
+        if root not in best or rank < best[root][0]:
+            best[root] = (rank, name)
+
+    pins_by_root: Dict[int, List[Tuple[Dict[str, str], str]]] = {}
+    for item, pin, pin_name in group_pins:
+        pins_by_root.setdefault(uf.find(item), []).append((pin, pin_name))
+
+    nets: Dict[str, List[Dict[str, str]]] = {}
+    for root in set(best) | set(pins_by_root):
+        pins = pins_by_root.get(root, [])
+        if root in best:
+            name = best[root][1]
+        elif pins:
+            # Named as SchematicParser names it, so both tools agree
+            name = auto_net_name([(pin['component'], pin['pin'], pin_name) for pin, pin_name in pins])
+        else:
+            continue
+
+        unique = {(pin['component'], pin['pin']): pin for pin, _ in pins}
+        nets.setdefault(name, []).extend(unique.values())
+
+    return {
+        "components": components,
+        "nets": nets,
+        "component_count": len(components),
+        "net_count": len(nets),
+        "sheets": [
+            {"path": sheet_path, "file": os.path.basename(schematic_path), "instance": instance_path}
+            for instance_path, sheet_path, schematic_path, _, _ in instances
+        ],
+        "sheet_files_parsed": len(parsed),
+        "files": sorted(parsed),
+        "duplicate_references": sorted(set(duplicates)),
+        "errors": errors,
+    }
@@ -3,8 +3,8 @@ Component-related utility functions for KiCad operations.
 """
 import sys
 import logging
-from typing import Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from dataclasses import dataclass, asdict
 
 logger = logging.getLogger(__name__)
 
@@ -237,4 +237,124 @@ class ComponentManager:
             rotation=float(footprint.GetOrientation().AsDegrees()),
             layer=self.board.GetLayerName(footprint.GetLayer())
         )
-    
\ No newline at end of file
+    
+
+    def rotate_component(self, reference: str, rotation: float, relative: bool = False) -> ComponentInfo:
+        """Rotate an existing component in place.
+
+        Args:
+            reference: Component reference
+            rotation: Rotation in degrees
+            relative: Add ``rotation`` to the current orientation instead of setting it
+
+        Returns:
+            ComponentInfo with updated component details
+
+        Raises:
+            ValueError: If component not found
+        """
+        footprint = self.find_component(reference)
+        if not footprint:
+            raise ValueError(f"Component {reference} not found")
+
+        if relative:
+            rotation = float(footprint.GetOrientation().AsDegrees()) + rotation
+        footprint.SetOrientation(pcbnew.EDA_ANGLE(rotation, pcbnew.DEGREES_T))
+
+        pos = footprint.GetPosition()
+        return ComponentInfo(
+            reference=reference,
+            value=footprint.GetValue(),
+            footprint=str(footprint.GetFPID().GetLibItemName()),
+            position=self.convert_position_from_nanometers(pos.x, pos.y, "mm"),
+            rotation=float(footprint.GetOrientation().AsDegrees()),
+            layer=self.board.GetLayerName(footprint.GetLayer())
+        )
+
+    def apply_operations(self, operations: List[Dict[str, Any]],
+                         route_handler: Optional[Callable[..., Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Apply an ordered list of edits to the in-memory board.
+
+        Each operation is a dict with an ``op`` key:
+
+        - ``place``: component_id, library, position, and optional reference, value, rotation, layer
+        - ``move``: reference, position, optional rotation
+        - ``rotate``: reference, rotation, optional relative
+        - ``route``: start, end, layer, width, net (needs ``route_handler``)
+
+        Processing stops at the first failing operation. Nothing is saved here;
+        the caller saves once on success and discards the board on failure.
+
+        Args:
+            operations: Operations to apply, in order
+            route_handler: Callable creating a track, e.g. BoardManager.trace_routes
+
+        Returns:
+            Dict with per-operation results and, on failure, the failing index
+        """
+        if not self.board:
+            return {"success": False, "error": "Board not set", "results": []}
+
+        results = []
+        for index, operation in enumerate(operations):
+            op = operation.get("op")
+            try:
+                if op == "place":
+                    footprint = self.create_footprint(
+                        component_id=operation["component_id"],
+                        position=operation["position"],
+                        library=operation["library"],
+                        reference=operation.get("reference"),
+                        value=operation.get("value"),
+                        rotation=operation.get("rotation", 0),
+                        layer=operation.get("layer", "F.Cu"),
+                    )
+                    result = {"component": asdict(self.place_footprint(footprint))}
+                elif op == "move":
+                    info = self.move_component(
+                        reference=operation["reference"],
+                        position=operation["position"],
+                        rotation=operation.get("rotation"),
+                    )
+                    result = {"component": asdict(info)}
+                elif op == "rotate":
+                    info = self.rotate_component(
+                        reference=operation["reference"],
+                        rotation=operation["rotation"],
+                        relative=operation.get("relative", False),
+                    )
+                    result = {"component": asdict(info)}
+                elif op == "route":
+                    if route_handler is None:
+                        raise ValueError("Routing is not available")
+                    result = route_handler(
+                        start=operation["start"],
+                        end=operation["end"],
+                        layer=operation.get("layer", "F.Cu"),
+                        width=operation["width"],
+                        net=operation["net"],
+                    )
+                    if not result.get("success"):
+                        raise ValueError(result.get("message") or result.get("error") or "Route failed")
+                    result = {"track": result.get("track_info")}
+                else:
+                    raise ValueError(f"Unknown operation: {op}")
+
+            except KeyError as e:
+                error = f"Missing parameter {e} for '{op}' operation"
+            except Exception as e:
+                error = str(e)
+            else:
+                results.append({"index": index, "op": op, "success": True, **result})
+                continue
+
+            logger.error(f"Operation {index} ({op}) failed: {error}")
+            results.append({"index": index, "op": op, "success": False, "error": error})
+            return {
+                "success": False,
+                "error": f"Operation {index} ({op}) failed: {error}",
+                "failed_index": index,
+                "results": results
+            }
+
+        return {"success": True, "results": results}
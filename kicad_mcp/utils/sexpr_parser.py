@@ -0,0 +1,276 @@
+"""
+Single-pass S-expression tokenizer for KiCad files (.kicad_sch, .kicad_pcb).
+
+The tokenizer walks the input exactly once and builds a typed tree:
+
+- ``SExpr``: a list node; ``node.tag`` is its leading symbol (``"wire"``, ``"at"``, ...)
+- ``Symbol``: a bare (unquoted) atom such as ``yes``, ``F.Cu`` or ``passive``
+- ``str``: a quoted string, with KiCad escape sequences resolved
+- ``int`` / ``float``: numeric atoms
+
+Children of the root node can be streamed to handlers as soon as they are
+closed, so callers never need to rescan the file per element type.
+"""
+import re
+import mmap
+import logging
+from contextlib import contextmanager
+from typing import Any, Callable, Collection, Dict, Iterator, List, Optional, Union
+
+# File content: decoded text, or raw UTF-8 bytes (bytes or a memory map)
+Content = Union[str, bytes, mmap.mmap]
+
+# One alternation for every token kind; ``lastindex`` tells them apart.
+_TOKEN_PATTERN = (
+    r'(\()'                                             # 1: open paren
+    r'|(\))'                                            # 2: close paren
+    r'|"((?:[^"\\]|\\.)*)"'                             # 3: quoted string
+    r'|(-?\d+)(?=[\s()]|$)'                             # 4: integer
+    r'|(-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)(?=[\s()]|$)'  # 5: decimal number
+    r'|([^\s()"]+)'                                     # 6: bare symbol
+)
+_TOKEN_RE = re.compile(_TOKEN_PATTERN, re.DOTALL)
+# The same tokens in undecoded file content (bytes or a memory map)
+_BYTES_TOKEN_RE = re.compile(_TOKEN_PATTERN.encode("ascii"), re.DOTALL)
+
+# Distinct bare symbols reused per parse (tags, layer names, flags repeat throughout a file)
+MAX_SHARED_SYMBOLS = 4096
+
+# Consumed pages of a memory-mapped file are dropped once this many bytes were read
+RELEASE_STEP = 8 * 1024 * 1024
+
+_ESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r"}
+
+
+class Symbol(str):
+    """A bare (unquoted) S-expression atom."""
+    __slots__ = ()
+
+
+class SExpr(list):
+    """A parsed S-expression list node.
+
+    The node behaves like a plain list of its items; the first item is usually
+    the node's tag symbol.
+    """
+    __slots__ = ()
+
+    @property
+    def tag(self) -> Optional[str]:
+        """Leading symbol of the node, or None for anonymous lists."""
+        if self and isinstance(self[0], Symbol):
+            return self[0]
+        return None
+
+    def find(self, tag: str) -> Optional["SExpr"]:
+        """Return the first direct child node with the given tag."""
+        for item in self:
+            if type(item) is SExpr and item and item[0] == tag:
+                return item
+        return None
+
+    def find_all(self, tag: str) -> List["SExpr"]:
+        """Return every direct child node with the given tag."""
+        return [item for item in self if type(item) is SExpr and item and item[0] == tag]
+
+    def children(self) -> Iterator["SExpr"]:
+        """Iterate over direct child nodes, skipping atoms."""
+        for item in self:
+            if type(item) is SExpr:
+                yield item
+
+    def value(self, tag: str, default: Any = None) -> Any:
+        """Return the first atom of the child node ``(tag atom ...)``."""
+        node = self.find(tag)
+        if node is not None and len(node) > 1:
+            return node[1]
+        return default
+
+    def atoms(self) -> List[Any]:
+        """Return the non-node items following the tag."""
+        return [item for item in self[1:] if type(item) is not SExpr]
+
+
+def _unescape(raw: str) -> str:
+    """Resolve KiCad string escapes (``\\"``, ``\\\\``, ``\\n``)."""
+    if "\\" not in raw:
+        return raw
+    return _ESCAPE_RE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), raw)
+
+
+@contextmanager
+def mapped_file(path: str) -> Iterator[Content]:
+    """Map a file read-only for the duration of the block.
+
+    The tokenizer reads the raw bytes directly, so the file is never held
+    as one decoded string; the mapping is closed when the block ends.
+
+    Args:
+        path: File to map
+
+    Yields:
+        The memory map (``b""`` for an empty file, which cannot be mapped)
+    """
+    with open(path, "rb") as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            yield b""
+            return
+    try:
+        yield buffer
+    finally:
+        try:
+            buffer.close()
+        except BufferError:
+            # Still referenced by an interrupted tokenizer; closed when that is collected
+            logging.debug(f"Memory map of {path} still in use")
+
+
+def release_pages(content: Content, end: Optional[int] = None) -> None:
+    """Drop already read pages of a memory-mapped file from memory.
+
+    They are read from the file again if accessed later. A no-op for
+    strings, bytes and platforms without ``madvise``.
+
+    Args:
+        content: Content passed to the tokenizer
+        end: Offset up to which the content was read (default: all of it)
+    """
+    if not isinstance(content, mmap.mmap) or not hasattr(mmap, "MADV_DONTNEED") or content.closed:
+        return
+    length = len(content) if end is None else end
+    length -= length % mmap.PAGESIZE
+    if length > 0:
+        try:
+            content.madvise(mmap.MADV_DONTNEED, 0, length)
+        except OSError as e:
+            logging.debug(f"madvise failed: {e}")
+
+
+def iter_nodes(text: Content, depth: int = 1, tags: Optional[Collection[str]] = None) -> Iterator[SExpr]:
+    """Stream the nodes found at ``depth`` as soon as each one is closed.
+
+    With the default ``depth=1`` this yields every child of the root node
+    (e.g. each ``symbol``, ``wire`` and ``label`` of a schematic). Yielded
+    nodes are not attached to their parent, so memory stays bounded by the
+    largest single node rather than by the whole file.
+
+    Raw bytes are tokenized without decoding the file; only quoted strings
+    and symbols of the nodes that are built are decoded. Pages of a memory
+    map are released as the tokenizer moves past them.
+
+    Args:
+        text: S-expression source, as text or as UTF-8 bytes / memory map
+        depth: Nesting level of the nodes to yield (0 yields the root itself)
+        tags: If given, nodes at ``depth`` with other tags are skipped
+            without being built
+
+    Yields:
+        Fully built ``SExpr`` nodes in file order
+
+    Raises:
+        ValueError: If the parentheses are unbalanced
+    """
+    raw = not isinstance(text, str)
+    stack: List[SExpr] = []
+    current: Optional[SExpr] = None
+    skipping = 0
+    released = 0
+    symbols: Dict[Any, Symbol] = {}
+
+    for match in (_BYTES_TOKEN_RE if raw else _TOKEN_RE).finditer(text):
+        kind = match.lastindex
+        if skipping:
+            # Inside a node that is not wanted: only keep track of the nesting
+            if kind == 1:
+                skipping += 1
+            elif kind == 2:
+                skipping -= 1
+            continue
+        if kind == 1:
+            node = SExpr()
+            if current is not None:
+                stack.append(current)
+            current = node
+        elif kind == 2:
+            if current is None:
+                raise ValueError(f"Unbalanced ')' at offset {match.start()}")
+            node = current
+            node_depth = len(stack)
+            current = stack.pop() if stack else None
+            if node_depth == depth:
+                yield node
+                if raw and match.end() - released >= RELEASE_STEP:
+                    released = match.end()
+                    release_pages(text, released)
+            elif current is not None:
+                current.append(node)
+        elif current is None:
+            # Atoms outside any list are not valid KiCad content; ignore them.
+            continue
+        elif kind == 3:
+            value = match.group(3)
+            current.append(_unescape(value.decode("utf-8", "replace") if raw else value))
+        elif kind == 4:
+            current.append(int(match.group(4)))
+        elif kind == 5:
+            current.append(float(match.group(5)))
+        else:
+            token = match.group(6)
+            symbol = symbols.get(token)
+            if symbol is None:
+                symbol = Symbol(token.decode("utf-8", "replace") if raw else token)
+                if len(symbols) < MAX_SHARED_SYMBOLS:
+                    symbols[token] = symbol
+            if tags is not None and not current and len(stack) == depth and symbol not in tags:
+                current = stack.pop() if stack else None
+                skipping = 1
+                continue
+            current.append(symbol)
+
+    if current is not None or skipping:
+        raise ValueError("Unbalanced S-expression: missing ')'")
+
+
+def parse_sexpr(text: Content) -> SExpr:
+    """Parse S-expression text into a single tree.
+
+    Args:
+        text: S-expression source, as text or as UTF-8 bytes
+
+    Returns:
+        The root ``SExpr`` node
+
+    Raises:
+        ValueError: If the text contains no S-expression or is unbalanced
+    """
+    for root in iter_nodes(text, depth=0):
+        return root
+    raise ValueError("No S-expression found")
+
+
+def dispatch_nodes(text: Content, handlers: Dict[str, Callable[[SExpr], None]],
+                   default: Optional[Callable[[SExpr], None]] = None) -> int:
+    """Walk ``text`` once and send each top-level node to its handler.
+
+    Without a ``default`` handler, nodes whose tag has no handler are
+    skipped without being built.
+
+    Args:
+        text: S-expression source (e.g. the content of a .kicad_sch file),
+            as text or as UTF-8 bytes / memory map
+        handlers: Mapping of node tag to handler callable
+        default: Optional handler for tags without an entry in ``handlers``
+
+    Returns:
+        Number of top-level nodes handled
+    """
+    count = 0
+    for node in iter_nodes(text, tags=None if default is not None else handlers):
+        count += 1
+        handler = handlers.get(node.tag, default)
+        if handler is not None:
+            handler(node)
+    return count
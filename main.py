@@ -16,7 +16,7 @@ server = create_server()
 
 
 # --- Setup Logging --- 
-log_file = os.path.join(os.path.dirname(__file__), 'kicad-mcp.log') 
+log_file = os.environ.get('KICAD_MCP_LOG_FILE') or os.path.join(os.path.dirname(__file__), 'kicad-mcp.log')
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - [PID:%(process)d] - %(message)s',
@@ -0,0 +1,148 @@
+"""
+Tests for the streaming BOM reader and analysis (bom_table.py).
+
+The expected analyses are those of the former pandas-based analyze_bom_data
+for the same files; only the currency differs (see test_currency_of_the_cost_cells).
+"""
+from kicad_mcp.tools.bom_tools import analyze_bom_data, parse_bom_file
+from kicad_mcp.utils.bom_table import BomTable, analyze_bom_table, read_bom_table
+
+KICAD_CSV = """\ufeffReference,Value,Footprint,Quantity,Cost
+R1,10k,R_0603,2,$0.10
+R3,10k,R_0603,1,$0.10
+C1,100n,C_0603,x,"$1,000.50"
+U1,LM358,SOIC-8,1,n/a
+"""
+
+ALTIUM_CSV = """Designator,Comment,Qty
+"R1, R2, C1",10k,3
+D1,LED,1
+U1,MCU,
+SW1,BTN,2
+"""
+
+SEMICOLON_CSV = """Designator;Comment;Qty
+D1;LED;1
+D2;LED;4
+"""
+
+XML_BOM = """<export><components>
+<comp ref="X"/>
+<component ref="R1"><value>1k</value><footprint>R_0402</footprint></component>
+<component ref="R2"><value>1k</value><footprint>R_0402</footprint></component>
+<component ref="C9"><value>1u</value><footprint>C_0805</footprint></component>
+</components></export>
+"""
+
+JSON_BOM = """{"components": [{"ref": "R1", "value": "1k", "lib": "Device"},
+                {"ref": "Q1", "value": "BC547", "lib": "Transistor"},
+                {"ref": "Q2", "value": "BC547", "lib": "Transistor"}]}
+"""
+
+
+def _read(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return read_bom_table(str(path))
+
+
+def test_kicad_csv(tmp_path):
+    table, info = _read(tmp_path, "bom.csv", KICAD_CSV)
+    assert info["detected_format"] == "kicad"
+    assert info["delimiter"] == ","
+    assert info["header_fields"] == ["Reference", "Value", "Footprint", "Quantity", "Cost"]
+    assert table.column("Cost")[2] == "$1,000.50"
+
+    # Footprints are the categories; quantities that are not numbers count as 1
+    assert analyze_bom_table(table) == {
+        "unique_component_count": 4,
+        "total_component_count": 5,
+        "categories": {"R_0603": 2, "C_0603": 1, "SOIC-8": 1},
+        "has_cost_data": True,
+        "total_cost": 1000.8,
+        "currency": "USD",
+        "most_common_values": {"10k": 2, "100n": 1, "LM358": 1},
+    }
+
+
+def test_references_give_the_categories(tmp_path):
+    table, info = _read(tmp_path, "bom.csv", ALTIUM_CSV)
+    assert info["detected_format"] == "altium"
+
+    # Every reference of a multi-reference cell is counted
+    assert analyze_bom_table(table) == {
+        "unique_component_count": 4,
+        "total_component_count": 7,
+        "categories": {"Resistors": 2, "Capacitors": 1, "Diodes": 1, "ICs": 1, "Switches": 1},
+        "has_cost_data": False,
+    }
+
+
+def test_semicolon_delimiter(tmp_path):
+    table, info = _read(tmp_path, "bom.csv", SEMICOLON_CSV)
+    assert info["delimiter"] == ";"
+    assert list(table.records()) == [{"Designator": "D1", "Comment": "LED", "Qty": "1"},
+                                     {"Designator": "D2", "Comment": "LED", "Qty": "4"}]
+    assert analyze_bom_table(table)["total_component_count"] == 5
+
+
+def test_xml(tmp_path):
+    table, info = _read(tmp_path, "bom.xml", XML_BOM)
+    assert info["detected_format"] == "xml"
+    assert info["sample_fields"] == ["ref", "value", "footprint"]
+    assert analyze_bom_table(table) == {
+        "unique_component_count": 3,
+        "total_component_count": 3,
+        "categories": {"R_0402": 2, "C_0805": 1},
+        "has_cost_data": False,
+        "most_common_values": {"1k": 2, "1u": 1},
+    }
+
+
+def test_json(tmp_path):
+    table, info = _read(tmp_path, "bom.json", JSON_BOM)
+    assert info["detected_format"] == "json"
+    assert analyze_bom_table(table) == {
+        "unique_component_count": 3,
+        "total_component_count": 3,
+        "categories": {"Transistor": 2, "Device": 1},
+        "has_cost_data": False,
+        "most_common_values": {"BC547": 2, "1k": 1},
+    }
+
+
+def test_currency_of_the_cost_cells(tmp_path):
+    # The pandas version read the currency after converting the cells to
+    # numbers and reported USD here
+    table, _ = _read(tmp_path, "bom.csv", "Reference,Value,Cost\nR1,1k,€0.50\nR2,2k,0.25\nR3,2k,\n")
+    result = analyze_bom_table(table)
+    assert (result["has_cost_data"], result["total_cost"], result["currency"]) == (True, 0.25, "EUR")
+
+
+def test_rows_with_different_keys_keep_their_own_keys():
+    rows = [{"ref": "R1", "value": "1k"}, {"ref": "C1", "voltage": "16V"}, {"ref": "U1", "value": None}]
+    table = BomTable().extend(rows)
+    assert len(table) == 3
+    assert list(table.records()) == rows
+    assert list(table.records(limit=1)) == rows[:1]
+
+
+def test_wrappers_match_the_table(tmp_path):
+    path = tmp_path / "bom.csv"
+    path.write_text(KICAD_CSV, encoding="utf-8")
+    components, info = parse_bom_file(str(path))
+    table, _ = read_bom_table(str(path))
+    assert components == list(table.records())
+    assert analyze_bom_data(components, info) == analyze_bom_table(table)
+
+
+def test_empty_broken_and_unknown_files(tmp_path):
+    table, info = _read(tmp_path, "empty.csv", "Reference,Value\n")
+    assert len(table) == 0 and "sample_fields" not in info
+    assert analyze_bom_table(table)["unique_component_count"] == 0
+
+    table, info = _read(tmp_path, "broken.json", "{not json")
+    assert len(table) == 0 and list(info) == ["error"]
+
+    table, info = _read(tmp_path, "bom.txt", "Reference,Value\nR1,1k\n")
+    assert info["detected_format"] == "unknown_csv" and len(table) == 1
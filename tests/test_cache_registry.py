@@ -0,0 +1,85 @@
+"""
+Tests for routing file changes to the caches that depend on them (cache_registry.py).
+"""
+import os
+
+from kicad_mcp.utils.cache_registry import CacheRegistry
+
+
+class Recorder:
+    def __init__(self):
+        self.paths = []
+        self.cleared = 0
+
+    def invalidate(self, path):
+        self.paths.append(path)
+
+    def clear(self):
+        self.cleared += 1
+
+
+def _registry():
+    registry = CacheRegistry()
+    caches = {name: Recorder() for name in ("boards", "schematics", "everything")}
+    registry.register("boards", caches["boards"].invalidate, (".kicad_pcb",), clear=caches["boards"].clear,
+                      stats=lambda: {"entries": 3})
+    registry.register("schematics", caches["schematics"].invalidate, (".kicad_sch", ".kicad_pro"))
+    registry.register("everything", caches["everything"].invalidate)
+    return registry, caches
+
+
+def test_changes_reach_the_caches_for_their_extension(tmp_path):
+    registry, caches = _registry()
+    board = str(tmp_path / "board.kicad_pcb")
+
+    assert sorted(registry.invalidate_path(board)) == ["boards", "everything"]
+    assert sorted(registry.invalidate_path(str(tmp_path / "Sheet.KICAD_SCH"))) == ["everything", "schematics"]
+    assert registry.invalidate_path(str(tmp_path / "notes.txt")) == ["everything"]
+
+    assert caches["boards"].paths == [board]
+    assert len(caches["schematics"].paths) == 1
+    assert len(caches["everything"].paths) == 3
+
+
+def test_paths_are_made_absolute(tmp_path, monkeypatch):
+    registry, caches = _registry()
+    monkeypatch.chdir(tmp_path)
+    registry.invalidate_path("board.kicad_pcb")
+    assert caches["boards"].paths == [os.path.join(str(tmp_path), "board.kicad_pcb")]
+
+
+def test_extensions_of_all_subscriptions():
+    registry, _ = _registry()
+    assert registry.extensions is None          # one cache depends on every file
+    registry.unregister("everything")
+    assert registry.extensions == {".kicad_pcb", ".kicad_sch", ".kicad_pro"}
+
+
+def test_a_failing_cache_does_not_stop_the_others(tmp_path):
+    registry, caches = _registry()
+
+    def broken(path):
+        raise RuntimeError("broken")
+
+    registry.register("broken", broken, (".kicad_pcb",))
+    assert sorted(registry.invalidate_path(str(tmp_path / "a.kicad_pcb"))) == ["boards", "everything"]
+    assert len(caches["boards"].paths) == 1
+
+
+def test_reregistering_replaces_the_subscription(tmp_path):
+    registry, caches = _registry()
+    replacement = Recorder()
+    registry.register("boards", replacement.invalidate, (".kicad_pcb",))
+    registry.invalidate_path(str(tmp_path / "a.kicad_pcb"))
+    assert caches["boards"].paths == [] and len(replacement.paths) == 1
+
+
+def test_clear_all_and_stats(tmp_path):
+    registry, caches = _registry()
+    registry.invalidate_path(str(tmp_path / "a.kicad_pcb"))
+    registry.clear_all()
+    assert caches["boards"].cleared == 1
+
+    stats = registry.stats()
+    assert stats["boards"] == {"extensions": [".kicad_pcb"], "invalidations": 1, "entries": 3}
+    assert stats["schematics"]["invalidations"] == 0
@@ -0,0 +1,102 @@
+"""
+Tests for applying a batch of component edits (ComponentManager.apply_operations).
+
+pcbnew is not needed: the board methods are replaced by a recording fake.
+"""
+from kicad_mcp.utils.set_components_utils import ComponentInfo, ComponentManager
+
+
+class FakeManager(ComponentManager):
+    """Records the edits instead of changing a pcbnew board."""
+
+    def __init__(self, references=("R1", "R2", "R3")):
+        super().__init__(board=object())
+        self.references = set(references)
+        self.calls = []
+
+    def _info(self, reference, rotation=0.0):
+        if reference not in self.references:
+            raise ValueError(f"Component {reference} not found")
+        return ComponentInfo(reference=reference, value="10k", footprint="R_0603",
+                             position={"x": 1.0, "y": 2.0, "unit": "mm"}, rotation=rotation, layer="F.Cu")
+
+    def create_footprint(self, component_id, position, library, reference=None, value=None,
+                         rotation=0, layer="F.Cu"):
+        self.calls.append(("create", reference))
+        return reference
+
+    def place_footprint(self, footprint):
+        self.references.add(footprint)
+        return self._info(footprint)
+
+    def move_component(self, reference, position, rotation=None):
+        self.calls.append(("move", reference))
+        return self._info(reference, rotation or 0.0)
+
+    def rotate_component(self, reference, rotation, relative=False):
+        self.calls.append(("rotate", reference))
+        return self._info(reference, rotation)
+
+
+def route(start, end, layer, width, net):
+    if net == "missing":
+        return {"success": False, "message": f"Net {net} not found"}
+    return {"success": True, "track_info": {"net": net, "layer": layer, "width": width}}
+
+
+POSITION = {"x": 1, "y": 2, "unit": "mm"}
+
+
+def test_all_operations_succeed():
+    manager = FakeManager()
+    result = manager.apply_operations([
+        {"op": "place", "component_id": "R_0603", "library": "Resistor_SMD", "position": POSITION,
+         "reference": "R4"},
+        {"op": "move", "reference": "R1", "position": POSITION, "rotation": 90},
+        {"op": "rotate", "reference": "R2", "rotation": 45},
+        {"op": "route", "start": POSITION, "end": POSITION, "width": 0.25, "net": "GND"},
+    ], route_handler=route)
+
+    assert result["success"] and "failed_index" not in result
+    assert [(entry["index"], entry["op"], entry["success"]) for entry in result["results"]] == [
+        (0, "place", True), (1, "move", True), (2, "rotate", True), (3, "route", True)]
+    assert result["results"][0]["component"]["reference"] == "R4"
+    assert result["results"][1]["component"]["rotation"] == 90
+    assert result["results"][3]["track"] == {"net": "GND", "layer": "F.Cu", "width": 0.25}
+
+
+def test_processing_stops_at_the_first_failure():
+    manager = FakeManager()
+    result = manager.apply_operations([
+        {"op": "move", "reference": "R1", "position": POSITION},
+        {"op": "rotate", "reference": "R9", "rotation": 90},
+        {"op": "move", "reference": "R3", "position": POSITION},
+    ])
+
+    assert result["success"] is False
+    assert result["failed_index"] == 1
+    assert result["error"] == "Operation 1 (rotate) failed: Component R9 not found"
+    assert result["results"][-1] == {"index": 1, "op": "rotate", "success": False,
+                                     "error": "Component R9 not found"}
+    assert len(result["results"]) == 2
+    # The operation after the failure was never attempted
+    assert manager.calls == [("move", "R1"), ("rotate", "R9")]
+
+
+def test_invalid_operations_fail():
+    manager = FakeManager()
+    missing = manager.apply_operations([{"op": "move", "position": POSITION}])
+    assert missing["results"][0]["error"] == "Missing parameter 'reference' for 'move' operation"
+
+    unknown = manager.apply_operations([{"op": "delete"}])
+    assert unknown["error"] == "Operation 0 (delete) failed: Unknown operation: delete"
+
+    unroutable = {"op": "route", "start": POSITION, "end": POSITION, "width": 0.25, "net": "missing"}
+    assert manager.apply_operations([unroutable])["results"][0]["error"] == "Routing is not available"
+    assert manager.apply_operations([unroutable], route_handler=route)["results"][0]["error"] == \
+        "Net missing not found"
+
+
+def test_without_a_board():
+    manager = ComponentManager()
+    assert manager.apply_operations([{"op": "move"}]) == {"success": False, "error": "Board not set", "results": []}
@@ -0,0 +1,240 @@
+"""
+Tests for the schematic connectivity engine (connectivity.py and SchematicParser._build_netlist).
+"""
+import pytest
+
+from kicad_mcp.utils.connectivity import SegmentGrid, UnionFind, snap, transform_pin
+from kicad_mcp.utils.netlist_parser import NET_DRIVER_PRIORITY, SchematicParser
+
+LIB_SYMBOLS = """
+  (lib_symbols
+    (symbol "Device:R"
+      (symbol "R_1_1"
+        (pin passive line (at 0 3.81 270) (length 1.27) (name "~") (number "1"))
+        (pin passive line (at 0 -3.81 90) (length 1.27) (name "~") (number "2"))))
+    (symbol "power:GND" (power)
+      (symbol "GND_1_1"
+        (pin power_in line (at 0 0 270) (length 0) hide (name "GND") (number "1"))))
+    (symbol "Test:U"
+      (symbol "U_1_1"
+        (pin input line (at -5.08 0 0) (length 2.54) (name "IN") (number "1"))
+        (pin power_in line (at 0 5.08 270) (length 2.54) (hide yes) (name "VCC") (number "2")))))
+"""
+
+
+def symbol(lib_id, reference, x, y, angle=0, mirror=None, value=None):
+    mirror = f" (mirror {mirror})" if mirror else ""
+    return (f'(symbol (lib_id "{lib_id}") (at {x} {y} {angle}){mirror} (unit 1)'
+            f' (property "Reference" "{reference}" (at {x} {y} 0))'
+            f' (property "Value" "{value or reference}" (at {x} {y} 0)))')
+
+
+def wire(x1, y1, x2, y2):
+    return f"(wire (pts (xy {x1} {y1}) (xy {x2} {y2})))"
+
+
+def label(text, x, y, kind="label"):
+    return f'({kind} "{text}" (at {x} {y} 0))'
+
+
+def junction(x, y):
+    return f"(junction (at {x} {y}) (diameter 0))"
+
+
+def parse(tmp_path, *items):
+    path = tmp_path / "test.kicad_sch"
+    path.write_text("(kicad_sch (version 20231120)" + LIB_SYMBOLS + "\n".join(items) + ")", encoding="utf-8")
+    return SchematicParser(str(path)).parse()
+
+
+def net_of(result, reference, pin):
+    for name, pins in result["nets"].items():
+        if {"component": reference, "pin": pin} in pins:
+            return name
+    return None
+
+
+# --- geometry helpers ---------------------------------------------------------------
+
+@pytest.mark.parametrize("angle, mirror, expected", [
+    (0, "", (10.0, 16.19)),       # library Y-up becomes sheet Y-down
+    (90, "", (6.19, 20.0)),       # rotated counter-clockwise: the top pin moves left
+    (180, "", (10.0, 23.81)),
+    (270, "", (13.81, 20.0)),
+    (0, "x", (10.0, 23.81)),      # mirrored about the X axis: flipped vertically
+    (90, "y", (13.81, 20.0)),     # rotated, then flipped horizontally
+])
+def test_transform_pin_rotation_and_mirror(angle, mirror, expected):
+    x, y = transform_pin(0, 3.81, 10, 20, angle, mirror)
+    assert (round(x, 4), round(y, 4)) == expected
+
+
+def test_transform_pin_mirror_y_flips_horizontal_offset():
+    assert transform_pin(2.54, 0, 10, 20, 0, "y") == (7.46, 20)
+
+
+def test_segment_grid_finds_points_inside_segments():
+    grid = SegmentGrid()
+    horizontal = grid.add(snap(0, 0), snap(20, 0))
+    diagonal = grid.add(snap(0, 0), snap(10, 10))
+
+    assert list(grid.at(snap(12.7, 0))) == [horizontal]      # T-junction in the middle of a wire
+    assert list(grid.at(snap(5, 5))) == [diagonal]
+    assert sorted(grid.at(snap(0, 0))) == [horizontal, diagonal]
+    assert list(grid.at(snap(25, 0))) == []
+    assert list(grid.at(snap(5, 1))) == []
+
+
+def test_segment_grid_spans_several_cells():
+    grid = SegmentGrid(cell_size=1000)
+    index = grid.add((0, 0), (0, 10000))
+    assert list(grid.at((0, 5500))) == [index]
+
+
+def test_union_find_groups():
+    uf = UnionFind()
+    items = [uf.add() for _ in range(5)]
+    uf.union(items[0], items[1])
+    uf.union(items[3], items[1])
+    groups = sorted(sorted(group) for group in uf.groups().values())
+    assert groups == [[0, 1, 3], [2], [4]]
+
+
+# --- netlist building -----------------------------------------------------------------
+
+def test_t_junction_joins_wire_ending_mid_segment(tmp_path):
+    result = parse(
+        tmp_path,
+        symbol("Device:R", "R1", 0, 3.81),        # pin 1 at (0, 0)
+        symbol("Device:R", "R2", 10.16, 13.97),   # pin 1 at (10.16, 10.16)
+        wire(0, 0, 20.32, 0),
+        wire(10.16, 0, 10.16, 10.16),             # ends on the middle of the first wire
+    )
+    assert net_of(result, "R1", "1") == net_of(result, "R2", "1")
+
+
+def test_crossing_wires_without_junction_stay_separate(tmp_path):
+    items = [
+        symbol("Device:R", "R1", 0, 3.81),        # pin 1 at (0, 0)
+        symbol("Device:R", "R2", 10.16, 13.97),   # pin 1 at (10.16, 10.16)
+        wire(0, 0, 20.32, 0),
+        wire(10.16, -10.16, 10.16, 10.16),        # crosses the first wire at (10.16, 0)
+    ]
+    result = parse(tmp_path, *items)
+    assert net_of(result, "R1", "1") != net_of(result, "R2", "1")
+
+    result = parse(tmp_path, *items, junction(10.16, 0))
+    assert net_of(result, "R1", "1") == net_of(result, "R2", "1")
+
+
+def test_rotated_symbol_pins_connect(tmp_path):
+    result = parse(
+        tmp_path,
+        symbol("Device:R", "R1", 10, 0, angle=90),   # pins at (6.19, 0) and (13.81, 0)
+        symbol("Device:R", "R2", 0, 3.81),           # pin 1 at (0, 0)
+        wire(0, 0, 6.19, 0),
+    )
+    assert net_of(result, "R1", "1") == net_of(result, "R2", "1")
+    assert net_of(result, "R1", "2") != net_of(result, "R2", "1")
+
+
+def test_mirrored_symbol_pins_connect(tmp_path):
+    result = parse(
+        tmp_path,
+        symbol("Device:R", "R1", 0, 0, mirror="x"),  # pin 1 moves to (0, 3.81)
+        symbol("Device:R", "R2", 0, 7.62),           # pin 1 at (0, 3.81)
+    )
+    assert net_of(result, "R1", "1") == net_of(result, "R2", "1")
+
+
+def test_power_symbol_names_its_net(tmp_path):
+    result = parse(
+        tmp_path,
+        symbol("Device:R", "R1", 0, 0),                     # pin 2 at (0, 3.81)
+        symbol("power:GND", "#PWR01", 0, 3.81, value="GND"),
+        symbol("Device:R", "R2", 20, 0),
+        symbol("power:GND", "#PWR02", 20, 3.81, value="GND"),
+    )
+    assert net_of(result, "R1", "2") == "GND"
+    assert net_of(result, "R2", "2") == "GND"
+    assert result["net_scopes"]["GND"] == "power"
+    # Power symbols are not listed as net members
+    assert all(not pin["component"].startswith("#") for pin in result["nets"]["GND"])
+
+
+def test_hidden_power_input_pin_joins_global_net(tmp_path):
+    result = parse(
+        tmp_path,
+        symbol("Test:U", "U1", 50, 50),           # hidden VCC pin, not wired
+        symbol("Device:R", "R1", 0, 3.81),        # pin 1 at (0, 0)
+        label("VCC", 0, 0, "global_label"),
+    )
+    assert net_of(result, "U1", "2") == "VCC"
+    assert net_of(result, "R1", "1") == "VCC"
+
+
+def test_local_labels_merge_within_the_sheet(tmp_path):
+    result = parse(
+        tmp_path,
+        symbol("Device:R", "R1", 0, 3.81),
+        symbol("Device:R", "R2", 50, 3.81),
+        label("SIG", 0, 0),
+        label("SIG", 50, 0),
+    )
+    assert net_of(result, "R1", "1") == net_of(result, "R2", "1") == "SIG"
+    assert result["net_scopes"]["SIG"] == "local"
+
+
+def test_global_and_hierarchical_labels_merge_by_name(tmp_path):
+    result = parse(
+        tmp_path,
+        symbol("Device:R", "R1", 0, 3.81),
+        symbol("Device:R", "R2", 50, 3.81),
+        symbol("Device:R", "R3", 100, 3.81),
+        symbol("Device:R", "R4", 150, 3.81),
+        label("BUS", 0, 0, "global_label"),
+        label("BUS", 50, 0, "global_label"),
+        label("IN", 100, 0, "hierarchical_label"),
+        label("IN", 150, 0, "hierarchical_label"),
+    )
+    assert net_of(result, "R1", "1") == net_of(result, "R2", "1") == "BUS"
+    assert net_of(result, "R3", "1") == net_of(result, "R4", "1") == "IN"
+    assert result["hierarchical_nets"] == {"IN": "IN"}
+
+
+@pytest.mark.parametrize("first, second, expected", [
+    (("LOCAL", "label"), ("GLOB", "global_label"), "GLOB"),
+    (("LOCAL", "label"), ("UP", "hierarchical_label"), "LOCAL"),
+    (("B_NAME", "label"), ("A_NAME", "label"), "A_NAME"),   # same priority: lowest name
+])
+def test_net_driver_priority_picks_the_name(tmp_path, first, second, expected):
+    result = parse(
+        tmp_path,
+        symbol("Device:R", "R1", 0, 3.81),        # pin 1 at (0, 0)
+        wire(0, 0, 20, 0),
+        label(first[0], 0, 0, first[1]),
+        label(second[0], 20, 0, second[1]),
+    )
+    assert net_of(result, "R1", "1") == expected
+
+
+def test_power_symbol_outranks_local_label(tmp_path):
+    assert NET_DRIVER_PRIORITY["power"] < NET_DRIVER_PRIORITY["local"]
+    result = parse(
+        tmp_path,
+        symbol("Device:R", "R1", 0, 0),                     # pin 2 at (0, 3.81)
+        symbol("power:GND", "#PWR01", 0, 3.81, value="GND"),
+        label("LOCAL_GND", 0, 3.81),
+    )
+    assert net_of(result, "R1", "2") == "GND"
+
+
+def test_unlabelled_net_gets_kicad_style_name(tmp_path):
+    result = parse(
+        tmp_path,
+        symbol("Device:R", "R2", 0, 3.81),
+        symbol("Device:R", "R10", 10, 3.81),
+        wire(0, 0, 10, 0),
+    )
+    assert net_of(result, "R2", "1") == "Net-(R2-Pad1)"
+    assert net_of(result, "R2", "2") == "unconnected-(R2-Pad2)"
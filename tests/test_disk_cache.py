@@ -0,0 +1,50 @@
+"""
+Tests for the on-disk parse cache (disk_cache.py).
+"""
+import os
+
+from kicad_mcp.utils.disk_cache import DiskCache, content_hash
+
+
+def test_disk_cache_round_trip(tmp_path):
+    cache = DiskCache("schematic", 1, root=str(tmp_path), max_bytes=1 << 20)
+    key = content_hash(b"(kicad_sch)")
+
+    assert cache.get(key) is None
+    cache.put(key, {"components": {"R1": {}}})
+    assert cache.get(key) == {"components": {"R1": {}}}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Edited content hashes to a different key
+    assert cache.get(content_hash(b"(kicad_sch )")) is None
+
+    cache.clear()
+    assert cache.get(key) is None
+
+
+def test_disk_cache_drops_other_versions(tmp_path):
+    key = content_hash(b"(kicad_sch)")
+    DiskCache("schematic", 1, root=str(tmp_path), max_bytes=1 << 20).put(key, "old")
+
+    cache = DiskCache("schematic", 2, root=str(tmp_path), max_bytes=1 << 20)
+    assert cache.get(key) is None
+    assert not os.path.exists(os.path.join(str(tmp_path), "schematic-v1"))
+
+
+def test_disk_cache_discards_corrupt_entries(tmp_path):
+    cache = DiskCache("schematic", 1, root=str(tmp_path), max_bytes=1 << 20)
+    key = content_hash(b"(kicad_sch)")
+    cache.put(key, "value")
+    with open(cache._path(key), "wb") as f:
+        f.write(b"not a pickle")
+
+    assert cache.get(key) is None
+    assert not os.path.exists(cache._path(key))
+
+
+def test_disabled_disk_cache_stores_nothing(tmp_path):
+    cache = DiskCache("schematic", 1, root=str(tmp_path), max_bytes=0)
+    key = content_hash(b"(kicad_sch)")
+    cache.put(key, "value")
+    assert cache.get(key) is None
+    assert os.listdir(str(tmp_path)) == []
@@ -0,0 +1,129 @@
+"""
+Tests for the append-only DRC history (drc_history.py).
+"""
+import json
+import os
+
+import pytest
+
+from kicad_mcp.utils import drc_history
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setattr(drc_history, "DRC_HISTORY_DIR", str(tmp_path / "history"))
+    monkeypatch.delenv("KICAD_MCP_DRC_HISTORY_MAX_RUNS", raising=False)
+    return str(tmp_path / "board.kicad_pro")
+
+
+def violation(message, x=0.0, uuid="u1", kind="clearance"):
+    return {"type": kind, "message": message, "severity": "error",
+            "items": [{"uuid": uuid, "description": message, "pos": {"x": x, "y": 1.0}}]}
+
+
+def result(*violations):
+    categories = {}
+    for item in violations:
+        categories[item["type"]] = categories.get(item["type"], 0) + 1
+    return {"success": True, "total_violations": len(violations), "violation_categories": categories,
+            "violations": list(violations)}
+
+
+def records(project):
+    with open(drc_history.get_project_history_path(project), encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_history_path_is_stable(project):
+    path = drc_history.get_project_history_path(project)
+    assert path == drc_history.get_project_history_path(os.path.join(os.path.dirname(project), ".",
+                                                                     "board.kicad_pro"))
+    assert os.path.basename(path).startswith("board.kicad_pro_")
+    assert path.endswith("_drc_history.jsonl")
+
+
+def test_violation_key_ignores_item_order_and_float_noise():
+    a = {"type": "clearance", "message": "m", "items": [
+        {"uuid": "1", "pos": {"x": 1.0, "y": 2.0}}, {"uuid": "2", "pos": {"x": 3.0, "y": 4.0}}]}
+    b = {"type": "clearance", "message": "m", "items": [
+        {"uuid": "2", "pos": {"x": 3.00000001, "y": 4.0}}, {"uuid": "1", "pos": {"x": 1.0, "y": 2.0}}]}
+    assert drc_history.violation_key(a) == drc_history.violation_key(b)
+    assert drc_history.violation_key(a) != drc_history.violation_key(dict(a, message="other"))
+
+
+def test_each_violation_is_written_once(project):
+    shared = violation("shared")
+    drc_history.save_drc_result(project, result(shared, violation("first", uuid="u2")))
+    drc_history.save_drc_result(project, result(shared))
+
+    kinds = [record["record"] for record in records(project)]
+    assert kinds == ["violation", "violation", "run", "run"]
+
+    history = drc_history.get_drc_history(project, include_violations=True)
+    assert [entry["total_violations"] for entry in history] == [1, 2]   # newest first
+    assert history[0]["violations"] == [shared]
+
+
+def test_damaged_lines_are_skipped_and_compacted_away(project):
+    drc_history.save_drc_result(project, result(violation("a")))
+    path = drc_history.get_project_history_path(project)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"record": "run", "timesta')      # cut short by a crash
+
+    assert len(drc_history.get_drc_history(project)) == 1
+
+    # The next save terminates the damaged line and compacts the file
+    drc_history.save_drc_result(project, result())
+    assert len(drc_history.get_drc_history(project)) == 2
+    assert all(record["record"] in ("violation", "run") for record in records(project))
+
+
+def test_compaction_keeps_the_newest_runs(project):
+    for index in range(4):
+        drc_history.save_drc_result(project, result(violation(f"v{index}", uuid=f"u{index}")))
+
+    summary = drc_history.compact_drc_history(project, max_runs=2)
+    assert summary == {"runs_kept": 2, "runs_removed": 2, "violations_kept": 2, "violations_removed": 2,
+                       "damaged_lines_removed": 0}
+    history = drc_history.get_drc_history(project, include_violations=True)
+    assert [entry["violations"][0]["message"] for entry in history] == ["v3", "v2"]
+
+
+def test_max_runs_setting_compacts_on_save(project, monkeypatch):
+    monkeypatch.setenv("KICAD_MCP_DRC_HISTORY_MAX_RUNS", "2")
+    for index in range(3):
+        drc_history.save_drc_result(project, result(violation(f"v{index}", uuid=f"u{index}")))
+    assert len(drc_history.get_drc_history(project)) == 2
+
+
+def test_compare_lists_new_and_resolved_violations(project):
+    kept, fixed, added = violation("kept"), violation("fixed", uuid="u2"), violation("added", uuid="u3", kind="track")
+    assert drc_history.compare_with_previous(project, result(kept, fixed)) is None
+
+    drc_history.save_drc_result(project, result(kept, fixed))
+    comparison = drc_history.compare_with_previous(project, result(kept, added))
+
+    assert comparison["change"] == 0
+    assert comparison["new_violations"] == [added]
+    assert comparison["resolved_violations"] == [fixed]
+    assert (comparison["new_violation_count"], comparison["resolved_violation_count"],
+            comparison["unchanged_violation_count"]) == (1, 1, 1)
+    assert comparison["new_categories"] == {"track": 1}
+    assert comparison["changed_categories"] == {"clearance": {"current": 1, "previous": 2, "change": -1}}
+
+
+def test_compare_uses_the_newest_run(project):
+    drc_history.save_drc_result(project, result(violation("a"), violation("b", uuid="u2")))
+    drc_history.save_drc_result(project, result(violation("a")))
+    comparison = drc_history.compare_with_previous(project, result())
+    assert comparison["previous_violations"] == 1
+    assert [item["message"] for item in comparison["resolved_violations"]] == ["a"]
+
+
+def test_unreadable_history_is_logged(project, caplog):
+    os.makedirs(drc_history.DRC_HISTORY_DIR)
+    with open(drc_history.get_project_history_path(project), "wb") as f:
+        f.write(b"\xff\xfe not utf-8\n")
+    assert drc_history.compare_with_previous(project, result()) is None
+    assert drc_history.get_drc_history(project) == []
+    assert "Error reading DRC history" in caplog.text
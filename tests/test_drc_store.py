@@ -0,0 +1,128 @@
+"""
+Tests for stored DRC results (drc_store.py) and how run_drc_check records them in the history.
+"""
+import asyncio
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from kicad_mcp.tools.drc_tools import register_drc_tools
+from kicad_mcp.utils import drc_history, drc_store
+from kicad_mcp.utils.disk_cache import DiskCache
+
+
+class FakeCtx:
+    async def info(self, message):
+        return None
+
+    async def report_progress(self, progress, total):
+        return None
+
+
+class FakeCli:
+    """Stands in for kicad-cli: one violation per line of the board file."""
+
+    def __init__(self):
+        self.runs = 0
+
+    async def __call__(self, pcb_file, ctx=None):
+        self.runs += 1
+        with open(pcb_file, encoding="utf-8") as f:
+            lines = [line.strip() for line in f if line.strip()]
+        violations = [{"type": "clearance", "message": line, "items": []} for line in lines]
+        return {"success": True, "method": "cli", "pcb_file": pcb_file, "total_violations": len(violations),
+                "violation_categories": {"clearance": len(violations)} if violations else {},
+                "violations": violations}
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setenv("KICAD_MCP_FILE_WATCHER", "off")
+    monkeypatch.setattr(drc_store, "drc_store", DiskCache("drc", 1, root=str(tmp_path / "store"), max_bytes=1 << 20))
+    monkeypatch.setattr(drc_history, "DRC_HISTORY_DIR", str(tmp_path / "history"))
+    drc_store._clear_file_hashes()
+    cli = FakeCli()
+    monkeypatch.setattr(drc_store, "run_drc_via_cli", cli)
+
+    project_path = tmp_path / "board.kicad_pro"
+    project_path.write_text("{}")
+    return str(project_path), tmp_path / "board.kicad_pcb", cli
+
+
+def _set_board(pcb_path, *violations):
+    pcb_path.write_text("\n".join(violations) + "\n", encoding="utf-8")
+    drc_store._clear_file_hashes()
+
+
+def _run_drc_check(project_path):
+    mcp = FastMCP("test")
+    register_drc_tools(mcp)
+    tool = mcp._tool_manager.get_tool("run_drc_check").fn
+    return asyncio.run(tool(project_path, FakeCtx()))
+
+
+def test_stored_result_hits_until_the_board_changes(project):
+    project_path, pcb_path, cli = project
+    _set_board(pcb_path, "a")
+
+    first = asyncio.run(drc_store.get_drc_results(str(pcb_path), project_path=project_path))
+    again = asyncio.run(drc_store.get_drc_results(str(pcb_path), project_path=project_path))
+    assert (first["cached"], again["cached"], cli.runs) == (False, True, 1)
+    assert again["drc_inputs_hash"] == first["drc_inputs_hash"]
+
+    _set_board(pcb_path, "a", "b")
+    changed = asyncio.run(drc_store.get_drc_results(str(pcb_path), project_path=project_path))
+    assert (changed["cached"], cli.runs) == (False, 2)
+    assert changed["drc_inputs_hash"] != first["drc_inputs_hash"]
+
+    forced = asyncio.run(drc_store.get_drc_results(str(pcb_path), project_path=project_path, force=True))
+    assert (forced["cached"], cli.runs) == (False, 3)
+
+
+def test_repeat_check_is_not_recorded_again(project):
+    project_path, pcb_path, cli = project
+    _set_board(pcb_path, "a")
+
+    assert "comparison" not in _run_drc_check(project_path)
+    repeat = _run_drc_check(project_path)
+    assert repeat["cached"]
+    # Compared with the run before the repeated one: there is none
+    assert "comparison" not in repeat
+    assert len(drc_history.get_drc_history(project_path)) == 1
+
+
+def test_board_reverted_to_a_stored_state(project):
+    project_path, pcb_path, cli = project
+
+    _set_board(pcb_path, "a")                   # state A
+    _run_drc_check(project_path)
+    _set_board(pcb_path, "a", "b")              # state B
+    _run_drc_check(project_path)
+    _set_board(pcb_path, "a")                   # back to A, served from the store
+    reverted = _run_drc_check(project_path)
+
+    assert reverted["cached"] and cli.runs == 2
+    comparison = reverted["comparison"]
+    assert (comparison["previous_violations"], comparison["current_violations"]) == (2, 1)
+    assert [violation["message"] for violation in comparison["resolved_violations"]] == ["b"]
+
+    # The revert is recorded as a run of its own
+    history = drc_history.get_drc_history(project_path)
+    assert [entry["total_violations"] for entry in history] == [1, 2, 1]
+
+
+def test_history_cleared_while_the_result_is_stored(project):
+    project_path, pcb_path, cli = project
+    _set_board(pcb_path, "a")
+    _run_drc_check(project_path)
+
+    _set_board(pcb_path, "a", "b")
+    _run_drc_check(project_path)
+    # Only the run of state B is left in the history
+    drc_history.compact_drc_history(project_path, max_runs=1)
+
+    _set_board(pcb_path, "a")
+    reverted = _run_drc_check(project_path)
+    assert reverted["cached"]
+    assert reverted["comparison"]["previous_violations"] == 2
+    assert [entry["total_violations"] for entry in drc_history.get_drc_history(project_path)] == [1, 2]
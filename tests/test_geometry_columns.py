@@ -0,0 +1,88 @@
+"""
+Tests for columnar board geometry (geometry_columns.py).
+"""
+import json
+import sys
+from array import array
+
+import pytest
+
+from kicad_mcp.utils.geometry_columns import (
+    PAD_COLUMNS, TRACK_COLUMNS, VIA_COLUMNS, decode_columns, encode_columns, geometry_stats, new_columns,
+)
+
+
+def _tracks():
+    columns = new_columns(TRACK_COLUMNS)
+    for row in ((0, 0, 3_000_000, 4_000_000, 250_000, 5_000_000.0, 0, 1),
+                (3_000_000, 4_000_000, 3_000_000, 10_000_000, 250_000, 6_000_000.0, 31, 1),
+                (-1_000_000, 0, 1_000_000, 0, 500_000, 2_000_000.0, 0, 2)):
+        for name, value in zip(TRACK_COLUMNS, row):
+            columns[name].append(value)
+    return columns
+
+
+def test_round_trip_through_json():
+    columns = _tracks()
+    payload = json.loads(json.dumps(encode_columns(columns)))
+    assert payload["count"] == 3
+    assert payload["byteorder"] == sys.byteorder
+    assert decode_columns(payload) == columns
+    assert {name: values.typecode for name, values in decode_columns(payload).items()} == TRACK_COLUMNS
+
+
+def test_empty_columns():
+    payload = encode_columns(new_columns(VIA_COLUMNS))
+    assert payload["count"] == 0
+    assert decode_columns(payload) == new_columns(VIA_COLUMNS)
+    assert encode_columns({})["count"] == 0
+
+
+def test_columns_from_the_other_byte_order_are_swapped():
+    columns = _tracks()
+    # Encode as a machine of the other byte order would
+    swapped = {name: array(values.typecode, values) for name, values in columns.items()}
+    for values in swapped.values():
+        values.byteswap()
+    payload = encode_columns(swapped)
+    payload["byteorder"] = "big" if sys.byteorder == "little" else "little"
+
+    assert decode_columns(payload) == columns
+
+
+def test_damaged_payloads_are_rejected():
+    payload = encode_columns(_tracks())
+    with pytest.raises(ValueError):
+        decode_columns(dict(payload, encoding="gzip"))
+    with pytest.raises(ValueError):
+        decode_columns(dict(payload, count=4))
+
+
+def test_statistics():
+    vias = new_columns(VIA_COLUMNS)
+    for row in ((0, 0, 600_000, 300_000, 1), (2_000_000, 1_000_000, 600_000, 300_000, 2),
+                (1_000_000, 0, 800_000, 400_000, 1)):
+        for name, value in zip(VIA_COLUMNS, row):
+            vias[name].append(value)
+    pads = new_columns(PAD_COLUMNS)
+    for row in ((0, 0, 1_000_000, 1_000_000, 0, 0, 1, 0), (1_000_000, 0, 1_000_000, 1_000_000, 0, 0, 0, 0),
+                (5_000_000, 5_000_000, 1_700_000, 1_700_000, 1_000_000, 0, 2, 1)):
+        for name, value in zip(PAD_COLUMNS, row):
+            pads[name].append(value)
+    data = {"tracks": encode_columns(_tracks()), "vias": encode_columns(vias), "pads": encode_columns(pads),
+            "nets": {"1": "GND", "2": "/SIG"}, "layers": {"0": "F.Cu", "31": "B.Cu"}}
+
+    stats = json.loads(json.dumps(geometry_stats(data, top=1)))
+    assert stats["tracks"] == {
+        "count": 3,
+        "total_length_mm": 13.0,
+        "length_by_layer_mm": {"F.Cu": 7.0, "B.Cu": 6.0},
+        "width_mm_counts": {"0.25": 2, "0.5": 1},
+        "longest_nets": [{"net_code": 1, "net_name": "GND", "count": 2, "length_mm": 11.0}],
+        "bounding_box_mm": {"min_x": -1.0, "min_y": 0.0, "max_x": 3.0, "max_y": 10.0},
+    }
+    assert stats["vias"]["drill_mm_counts"] == {"0.3": 2, "0.4": 1}
+    assert stats["vias"]["nets_with_most_vias"] == [{"net_code": 1, "net_name": "GND", "count": 2}]
+    assert {key: stats["pads"][key] for key in ("count", "through_hole", "smd", "without_net", "footprints")} == \
+        {"count": 3, "through_hole": 1, "smd": 2, "without_net": 1, "footprints": 2}
+    assert geometry_stats({"nets": {}}) == {}
@@ -0,0 +1,153 @@
+"""
+Tests for paged, filtered and projected list results (list_snapshots.py).
+"""
+import os
+
+import pytest
+
+from kicad_mcp.utils import list_snapshots
+from kicad_mcp.utils.list_snapshots import SnapshotCache, decode_cursor, encode_cursor, get_page
+
+FILTER_FIELDS = {
+    "net": lambda item: [item["net"]],
+    "layer": lambda item: [item["layer"]],
+    "reference": lambda item: [item["reference"]],
+}
+
+
+@pytest.fixture
+def board(tmp_path, monkeypatch):
+    monkeypatch.setattr(list_snapshots, "_snapshot_cache", SnapshotCache(max_bytes=1 << 20))
+    path = tmp_path / "board.kicad_pcb"
+    path.write_text("(kicad_pcb)")
+    return path
+
+
+class Build:
+    """Extraction of ten pads, counting how often it runs."""
+
+    def __init__(self, files=None):
+        self.calls = 0
+        self.files = files
+
+    def __call__(self):
+        self.calls += 1
+        items = [{"reference": f"{'R' if index < 6 else 'C'}{index}", "net": "GND" if index % 2 else f"/N{index}",
+                  "layer": "F.Cu" if index < 8 else "B.Cu", "number": str(index)} for index in range(10)]
+        result = {"success": True, "items": items, "summary": {"board": "test"}}
+        if self.files:
+            result["files"] = self.files
+        return result
+
+
+def _page(board, build, **options):
+    return get_page("pads:" + str(board), [str(board)], build, FILTER_FIELDS, **options)
+
+
+def _touch(path, text):
+    path.write_text(text)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("pads:/b.kicad_pcb", "abc", 40, {"net": "GND"}, ["number"])
+    assert decode_cursor(cursor) == {"key": "pads:/b.kicad_pcb", "version": "abc", "offset": 40,
+                                     "filters": {"net": "GND"}, "fields": ["number"]}
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", "e30=", encode_cursor("k", "v", 0, {}, None)[:-4]])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_pages_are_served_from_one_snapshot(board):
+    build = Build()
+    first = _page(board, build, limit=4)
+    assert first["board"] == "test"
+    assert [item["number"] for item in first["items"]] == ["0", "1", "2", "3"]
+    assert first["page"]["total"] == 10
+
+    second = _page(board, build, limit=4, cursor=first["page"]["next_cursor"])
+    assert [item["number"] for item in second["items"]] == ["4", "5", "6", "7"]
+    last = _page(board, build, limit=4, cursor=second["page"]["next_cursor"])
+    assert [item["number"] for item in last["items"]] == ["8", "9"]
+    assert last["page"]["next_cursor"] is None
+    assert build.calls == 1
+
+
+def test_filters_and_fields(board):
+    build = Build()
+    page = _page(board, build, filters={"net": "GND", "layer": "F.*", "reference": "R"}, fields=["number", "net"])
+    assert page["items"] == [{"number": "1", "net": "GND"}, {"number": "3", "net": "GND"},
+                             {"number": "5", "net": "GND"}]
+    assert page["page"]["filter"] == {"net": "GND", "layer": "F.*", "reference": "R"}
+
+    # Empty filter values are ignored; limit 0 returns everything
+    assert _page(board, build, filters={"net": ""}, limit=0)["page"]["returned"] == 10
+    assert build.calls == 1
+
+
+def test_cursor_keeps_the_filter_and_fields_of_its_query(board):
+    build = Build()
+    first = _page(board, build, filters={"net": "/N*"}, fields=["number"], limit=2)
+    second = _page(board, build, filters={"net": "GND"}, limit=2, cursor=first["page"]["next_cursor"])
+    assert second["items"] == [{"number": "4"}, {"number": "6"}]
+    assert second["page"]["filter"] == {"net": "/N*"}
+
+
+def test_unsupported_filters_and_limits_are_rejected(board):
+    result = _page(board, Build(), filters={"value": "10k"})
+    assert not result["success"] and result["supported_filters"] == list(FILTER_FIELDS)
+    assert not _page(board, Build(), limit=-1)["success"]
+
+
+def test_cursor_of_another_query_is_rejected(board):
+    cursor = _page(board, Build(), limit=2)["page"]["next_cursor"]
+    result = get_page("tracks:" + str(board), [str(board)], Build(), FILTER_FIELDS, cursor=cursor)
+    assert not result["success"]
+
+
+def test_stale_cursor_is_rejected_after_an_edit(board):
+    build = Build()
+    cursor = _page(board, build, limit=2)["page"]["next_cursor"]
+
+    _touch(board, "(kicad_pcb )")
+    result = _page(board, build, cursor=cursor)
+    assert not result["success"]
+    assert "changed" in result["error"]
+    assert build.calls == 2
+
+
+def test_files_reported_by_the_build_invalidate_the_snapshot(board, tmp_path):
+    sheet = tmp_path / "sub" / "sheet.kicad_sch"
+    sheet.parent.mkdir()
+    sheet.write_text("(kicad_sch)")
+    build = Build(files=[str(sheet)])
+    cursor = _page(board, build, limit=2)["page"]["next_cursor"]
+    assert _page(board, build, cursor=cursor)["success"]
+
+    _touch(sheet, "(kicad_sch )")
+    assert not _page(board, build, cursor=cursor)["success"]
+    assert build.calls == 2
+
+
+def test_build_errors_are_returned_and_not_cached(board):
+    calls = []
+
+    def failing():
+        calls.append(1)
+        return {"success": False, "error": "no board"}
+
+    assert _page(board, failing) == {"success": False, "error": "no board"}
+    assert _page(board, failing)["error"] == "no board"
+    assert len(calls) == 2
+
+
+def test_invalidate_drops_snapshots_of_a_file(board):
+    build = Build()
+    _page(board, build)
+    list_snapshots.get_snapshot_cache().invalidate(str(board))
+    _page(board, build)
+    assert build.calls == 2
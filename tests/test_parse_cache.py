@@ -0,0 +1,110 @@
+"""
+Tests for the in-memory parse cache (parse_cache.py).
+"""
+import os
+
+from kicad_mcp.utils.parse_cache import ParseCache
+
+
+class CountingParser:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path):
+        self.calls += 1
+        with open(path) as f:
+            return {"content": f.read()}
+
+
+def _write(path, text, mtime_ns):
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_unchanged_file_is_parsed_once(tmp_path):
+    path = tmp_path / "a.kicad_sch"
+    _write(path, "one", 1_000_000_000)
+    cache, parse = ParseCache(max_bytes=1 << 20), CountingParser()
+
+    assert cache.get_or_parse(str(path), parse) == {"content": "one"}
+    assert cache.get_or_parse(str(path), parse) == {"content": "one"}
+    assert parse.calls == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_changed_mtime_is_parsed_again(tmp_path):
+    path = tmp_path / "a.kicad_sch"
+    _write(path, "one", 1_000_000_000)
+    cache, parse = ParseCache(max_bytes=1 << 20), CountingParser()
+    cache.get_or_parse(str(path), parse)
+
+    # Same size, new modification time
+    _write(path, "two", 2_000_000_000)
+    assert cache.get_or_parse(str(path), parse) == {"content": "two"}
+    assert parse.calls == 2
+
+
+def test_changed_size_is_parsed_again(tmp_path):
+    path = tmp_path / "a.kicad_sch"
+    _write(path, "one", 1_000_000_000)
+    cache, parse = ParseCache(max_bytes=1 << 20), CountingParser()
+    cache.get_or_parse(str(path), parse)
+
+    # Same modification time, new size
+    _write(path, "three", 1_000_000_000)
+    assert cache.get_or_parse(str(path), parse) == {"content": "three"}
+    assert parse.calls == 2
+
+
+def test_get_and_put(tmp_path):
+    path = tmp_path / "a.kicad_sch"
+    _write(path, "one", 1_000_000_000)
+    stat = os.stat(path)
+    cache = ParseCache(max_bytes=1 << 20)
+
+    assert cache.get(str(path)) is None
+    cache.put(str(path), {"content": "one"}, stat)
+    assert cache.get(str(path)) == {"content": "one"}
+
+    # A result stored with the stat taken before an edit is stale
+    _write(path, "edited", 2_000_000_000)
+    assert cache.get(str(path)) is None
+
+    cache.put(str(path), {"error": "broken"})
+    assert cache.get(str(path)) is None
+
+
+def test_errors_and_missing_files_are_not_cached(tmp_path):
+    cache = ParseCache(max_bytes=1 << 20)
+    path = tmp_path / "a.kicad_sch"
+    _write(path, "one", 1_000_000_000)
+    calls = []
+
+    def failing(p):
+        calls.append(p)
+        return {"error": "broken"}
+
+    cache.get_or_parse(str(path), failing)
+    cache.get_or_parse(str(path), failing)
+    assert len(calls) == 2
+
+    missing = str(tmp_path / "missing.kicad_sch")
+    cache.get_or_parse(missing, failing)
+    assert cache.get(missing) is None
+
+
+def test_invalidate_and_budget(tmp_path):
+    paths = []
+    for name in "abc":
+        path = tmp_path / f"{name}.kicad_sch"
+        _write(path, "x" * 100, 1_000_000_000)
+        paths.append(str(path))
+    # Room for two results of 100 bytes * PARSE_MEMORY_FACTOR
+    cache, parse = ParseCache(max_bytes=800), CountingParser()
+    for path in paths:
+        cache.get_or_parse(path, parse)
+
+    assert cache.get(paths[0]) is None          # least recently used, evicted
+    assert cache.get(paths[2]) is not None
+    cache.invalidate(paths[2])
+    assert cache.get(paths[2]) is None
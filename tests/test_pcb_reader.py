@@ -0,0 +1,148 @@
+"""
+Tests for the native board reader (pcb_reader.py) against a small checked-in board.
+
+The expected dictionaries follow the shapes returned by BoardManager in the
+KiCad worker, so tools can use either source.
+"""
+import os
+
+import pytest
+
+from kicad_mcp.utils.pcb_reader import PAD_SHAPES, PcbBoard, load_pcb
+
+BOARD = os.path.join(os.path.dirname(__file__), "fixtures", "small.kicad_pcb")
+
+# Keys of the BoardManager results, per item
+FOOTPRINT_KEYS = {"reference", "value", "footprint_id", "position", "layer", "layer_name"}
+PAD_KEYS = {"number", "position", "size", "shape", "drill_size", "net_code"}
+TRACK_KEYS = {"start", "end", "length", "width", "layer_name", "net_name", "net_code"}
+VIA_KEYS = {"position", "drill", "width", "layers", "net_name", "net_code"}
+ZONE_KEYS = {"net_name", "net_code", "layer", "layer_name", "area", "min_thickness",
+             "thermal_relief_gap", "thermal_relief_copper_bridge", "zone_name"}
+
+
+@pytest.fixture(scope="module")
+def board():
+    return PcbBoard(BOARD)
+
+
+def test_basic_board_info(board):
+    assert board.basic_board_info() == {
+        "success": True,
+        "data": {
+            "filename": os.path.abspath(BOARD),
+            "bounding_box": {"x": 90.0, "y": 40.0, "width": 30.0, "height": 20.0},
+            "net_count": 3,
+        }
+    }
+
+
+def test_get_layers(board):
+    # Display names as pcbnew reports them, LAYER_T values for the type
+    assert board.get_layers() == {
+        "success": True,
+        "data": {
+            0: {"name": "F.Cu", "type": 0},
+            31: {"name": "Ground", "type": 1},
+            44: {"name": "Edge.Cuts", "type": -1},
+        }
+    }
+
+
+def test_get_net_list(board):
+    assert board.get_net_list() == {"success": True, "net_info": {"": 0, "GND": 1, "/SIG": 2}}
+
+
+def test_get_footprints_pads_normalized(board):
+    result = board.get_footprints_pads()
+    assert result["success"]
+    data = result["data"]
+    assert data["layout"] == "normalized"
+
+    r1, tp1 = data["footprints"]
+    assert set(r1) == FOOTPRINT_KEYS | {"id", "pads"}
+    assert r1 == {
+        "id": 0, "reference": "R1", "value": "10k", "footprint_id": "Resistor_SMD:R_0603_1608Metric",
+        "position": {"x": 100.0, "y": 50.0}, "layer": 0, "layer_name": "F.Cu", "pads": [0, 1],
+    }
+    # Reference and value from fp_text in older boards
+    assert (tp1["reference"], tp1["value"], tp1["layer_name"]) == ("TP1", "TestPoint", "Ground")
+
+    pads = data["pads"]
+    assert all(set(pad) == PAD_KEYS | {"id", "footprint"} for pad in pads)
+    # Pad positions are absolute, rotated with the footprint
+    assert pads[0]["position"] == {"x": 100.0, "y": 50.8}
+    assert pads[1]["position"] == {"x": 100.0, "y": 49.2}
+    assert pads[0]["shape"] == PAD_SHAPES["roundrect"]
+    assert pads[2]["shape"] == PAD_SHAPES["circle"]
+    assert pads[2]["drill_size"] == 0.8
+
+    assert data["nets"] == [
+        {"code": 1, "name": "GND", "pads": [1]},
+        {"code": 2, "name": "/SIG", "pads": [0, 2]},
+    ]
+
+
+def test_get_footprints_pads_nested(board):
+    result = board.get_footprints_pads(layout="nested")
+    assert result["success"]
+    r1 = result["data"]["components"][0]
+    assert set(r1) == FOOTPRINT_KEYS | {"pads"}
+    pad = r1["pads"][0]
+    assert set(pad) == PAD_KEYS | {"net_name", "connected_items"}
+    assert pad["net_name"] == "/SIG"
+    assert pad["connected_items"] == [{"pad_number": "1", "net_name": "/SIG"}]
+
+
+def test_get_footprints_pads_limits(board):
+    assert not board.get_footprints_pads(layout="nested", max_nested_pads=2)["success"]
+    assert not board.get_footprints_pads(layout="flat")["success"]
+
+
+def test_get_tracks_vias(board):
+    result = board.get_tracks_vias()
+    assert result["success"]
+    segment, arc = result["data"]["tracks"]
+    assert set(segment) == set(arc) == TRACK_KEYS
+    assert segment == {
+        "start": {"x": 100.0, "y": 49.2}, "end": {"x": 106.0, "y": 49.2}, "length": 6.0, "width": 0.25,
+        "layer_name": "F.Cu", "net_name": "/SIG", "net_code": 2,
+    }
+    # Arcs report their arc length, not the chord
+    assert arc["length"] == pytest.approx(3.3322, abs=1e-3)
+
+    (via,) = result["data"]["vias"]
+    assert via == {
+        "position": {"x": 110.0, "y": 50.0}, "drill": 0.4, "width": 0.8, "layers": ["F.Cu", "Ground"],
+        "net_name": "/SIG", "net_code": 2,
+    }
+    assert set(via) == VIA_KEYS
+
+
+def test_get_zones(board):
+    result = board.get_zones()
+    assert result["success"]
+    (zone,) = result["data"]
+    assert set(zone) == ZONE_KEYS
+    assert zone == {
+        "net_name": "GND", "net_code": 1, "layer": 31, "layer_name": "Ground",
+        # Filled area in internal units squared / 1e6, as pcbnew's GetArea() / 1e6
+        "area": 100 * 1e6, "min_thickness": 0.25, "thermal_relief_gap": 0.5,
+        "thermal_relief_copper_bridge": 0.5, "zone_name": "ground",
+    }
+
+
+def test_bytes_and_file_give_the_same_board(board):
+    with open(BOARD, "rb") as f:
+        from_bytes = PcbBoard(BOARD, f.read())
+    for getter in ("basic_board_info", "get_layers", "get_net_list", "get_footprints_pads",
+                   "get_tracks_vias", "get_zones"):
+        assert getattr(from_bytes, getter)() == getattr(board, getter)()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not_a_board.kicad_pcb"
+    path.write_text("(kicad_sch (version 1))")
+    with pytest.raises(ValueError):
+        PcbBoard(str(path))
+    assert "error" in load_pcb(str(path))
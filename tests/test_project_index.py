@@ -0,0 +1,120 @@
+"""
+Tests for the persistent incremental project index (project_index.py).
+"""
+import os
+import time
+
+import pytest
+
+from kicad_mcp.utils.project_index import ProjectIndex
+
+# Directory mtimes must be older than MTIME_SETTLE_SECONDS to be trusted
+OLD = time.time() - 3600
+
+
+def _age(*paths, offset=0):
+    for path in paths:
+        os.utime(path, (OLD + offset, OLD + offset))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "projects"
+    for relative in ("alpha", "group/beta", "group/empty"):
+        (root / relative).mkdir(parents=True)
+    (root / "alpha" / "alpha.kicad_pro").write_text("{}")
+    (root / "alpha" / "alpha.kicad_pcb").write_text("")
+    (root / "group" / "beta" / "beta.kicad_pro").write_text("{}")
+    _age(root, root / "alpha", root / "group", root / "group" / "beta", root / "group" / "empty")
+    return root
+
+
+def _names(projects):
+    return sorted(project["relative_path"] for project in projects)
+
+
+def _index(tmp_path):
+    return ProjectIndex(index_path=str(tmp_path / "cache" / "project_index.json"), workers=2)
+
+
+def test_first_scan_lists_every_directory(tree, tmp_path):
+    index = _index(tmp_path)
+    projects = index.find_projects([str(tree)])
+    assert _names(projects) == [os.path.join("alpha", "alpha.kicad_pro"),
+                                os.path.join("group", "beta", "beta.kicad_pro")]
+    assert projects[0]["name"] in ("alpha", "beta")
+    assert index.last_scan["directories"] == index.last_scan["listed"] == 5
+
+
+def test_unchanged_directories_are_not_listed_again(tree, tmp_path):
+    index = _index(tmp_path)
+    first = index.find_projects([str(tree)])
+    second = index.find_projects([str(tree)])
+    assert _names(second) == _names(first)
+    assert (index.last_scan["directories"], index.last_scan["listed"]) == (5, 0)
+
+
+def test_index_is_reused_after_a_restart(tree, tmp_path):
+    _index(tmp_path).find_projects([str(tree)])
+    assert os.path.exists(tmp_path / "cache" / "project_index.json")
+
+    restarted = _index(tmp_path)
+    assert len(restarted.find_projects([str(tree)])) == 2
+    assert restarted.last_scan["listed"] == 0
+
+
+def test_only_changed_directories_are_listed(tree, tmp_path):
+    index = _index(tmp_path)
+    index.find_projects([str(tree)])
+
+    (tree / "group" / "empty" / "gamma.kicad_pro").write_text("{}")
+    _age(tree / "group" / "empty", offset=60)
+    projects = index.find_projects([str(tree)])
+    assert os.path.join("group", "empty", "gamma.kicad_pro") in _names(projects)
+    assert index.last_scan["listed"] == 1
+
+    # Removing a directory drops its projects
+    for name in os.listdir(tree / "alpha"):
+        os.remove(tree / "alpha" / name)
+    os.rmdir(tree / "alpha")
+    _age(tree, offset=120)
+    assert _names(index.find_projects([str(tree)])) == [os.path.join("group", "beta", "beta.kicad_pro"),
+                                                        os.path.join("group", "empty", "gamma.kicad_pro")]
+    assert index.last_scan["listed"] == 1
+
+
+def test_project_modification_time_is_refreshed(tree, tmp_path):
+    index = _index(tmp_path)
+    index.find_projects([str(tree)])
+
+    # Saving a project in place does not change its directory's mtime
+    project = tree / "alpha" / "alpha.kicad_pro"
+    os.utime(project, (OLD + 600, OLD + 600))
+    modified = {p["name"]: p["modified"] for p in index.find_projects([str(tree)])}
+    assert modified["alpha"] == OLD + 600
+    assert index.last_scan["listed"] == 0
+
+
+def test_recent_directories_are_listed_until_they_settle(tree, tmp_path):
+    index = _index(tmp_path)
+    index.find_projects([str(tree)])
+    (tree / "alpha" / "new.kicad_pro").write_text("{}")   # alpha's mtime is now recent
+
+    assert len(index.find_projects([str(tree)])) == 3
+    assert len(index.find_projects([str(tree)])) == 3
+    assert index.last_scan["listed"] == 1
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symlinks not supported")
+def test_symlink_loops_end(tree, tmp_path):
+    try:
+        os.symlink(tree, tree / "group" / "loop", target_is_directory=True)
+    except OSError:
+        pytest.skip("cannot create symlinks")
+    _age(tree / "group")
+    assert len(_index(tmp_path).find_projects([str(tree)])) == 2
+
+
+def test_missing_root_is_skipped(tree, tmp_path):
+    index = _index(tmp_path)
+    assert len(index.find_projects([str(tmp_path / "missing"), str(tree)])) == 2
@@ -0,0 +1,127 @@
+"""
+Tests for flattening hierarchical schematics into one netlist (project_netlist.py).
+"""
+import os
+
+import pytest
+
+from kicad_mcp.utils import netlist_parser
+from kicad_mcp.utils.disk_cache import DiskCache
+from kicad_mcp.utils.parse_cache import get_parse_cache
+from kicad_mcp.utils.project_netlist import resolve_project_netlist
+
+LIB_SYMBOLS = """
+  (lib_symbols
+    (symbol "Device:R"
+      (symbol "R_1_1"
+        (pin passive line (at 0 3.81 270) (length 1.27) (name "~") (number "1"))
+        (pin passive line (at 0 -3.81 90) (length 1.27) (name "~") (number "2"))))
+    (symbol "power:GND" (power)
+      (symbol "GND_1_1"
+        (pin power_in line (at 0 0 270) (length 0) hide (name "GND") (number "1")))))
+"""
+
+
+def symbol(lib_id, reference, x, y, value=None, instances=None):
+    """A symbol; ``instances`` maps instance paths to references."""
+    paths = "".join(f' (path "{path}" (reference "{ref}") (unit 1))' for path, ref in (instances or {}).items())
+    return (f'(symbol (lib_id "{lib_id}") (at {x} {y} 0) (unit 1)'
+            f' (property "Reference" "{reference}" (at {x} {y} 0))'
+            f' (property "Value" "{value or reference}" (at {x} {y} 0))'
+            f' (instances (project "test"{paths})))')
+
+
+def sheet(name, uuid, pin_x, pin_y):
+    return (f'(sheet (at {pin_x} {pin_y - 5}) (size 20 10) (uuid "{uuid}")'
+            f' (property "Sheetname" "{name}" (at 0 0 0)) (property "Sheetfile" "sub/amp.kicad_sch" (at 0 0 0))'
+            f' (pin "IN" input (at {pin_x} {pin_y} 180)))')
+
+
+def write_sheet(path, uuid, *items):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f'(kicad_sch (version 20231120) (uuid "{uuid}")' + LIB_SYMBOLS + "\n".join(items) + ")",
+                    encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setenv("KICAD_MCP_FILE_WATCHER", "off")
+    monkeypatch.setattr(netlist_parser, "schematic_disk_cache",
+                        DiskCache("schematic", 1, root=str(tmp_path / "cache"), max_bytes=1 << 20))
+    get_parse_cache().clear()
+
+    # Root: R1 pin 1 drives the IN pin of two instances of sub/amp.kicad_sch; pin 2 is on GND
+    root = write_sheet(
+        tmp_path / "board.kicad_sch", "root",
+        symbol("Device:R", "R1", 0, 3.81),                       # pins at (0, 0) and (0, 7.62)
+        symbol("power:GND", "#PWR01", 0, 7.62, value="GND"),
+        "(wire (pts (xy 0 0) (xy 20 0)))",
+        "(wire (pts (xy 20 0) (xy 20 20)))",
+        sheet("Amp1", "s1", 20, 0),
+        sheet("Amp2", "s2", 20, 20),
+    )
+    # Sub-sheet: IN reaches R10 pin 1, R10 pin 2 is the local net OUT; R20 pin 2 is on GND
+    write_sheet(
+        tmp_path / "sub" / "amp.kicad_sch", "amp",
+        '(hierarchical_label "IN" (at 0 0 0))',
+        symbol("Device:R", "R10", 0, 3.81, instances={"/root/s1": "R10", "/root/s2": "R11"}),
+        '(label "OUT" (at 0 7.62 0))',
+        symbol("Device:R", "R20", 20, 3.81, instances={"/root/s1": "R20", "/root/s2": "R21"}),
+        symbol("power:GND", "#PWR02", 20, 7.62, value="GND",
+               instances={"/root/s1": "#PWR02", "/root/s2": "#PWR03"}),
+    )
+    yield root
+    get_parse_cache().clear()
+
+
+def _pins(pins):
+    return sorted((pin["component"], pin["pin"]) for pin in pins)
+
+
+def _net_of(result, reference, pin):
+    return next(name for name, pins in result["nets"].items()
+                if {"component": reference, "pin": pin} in pins)
+
+
+def test_sheet_instances_are_flattened(project):
+    result = resolve_project_netlist(project, max_workers=1)
+
+    assert result["errors"] == []
+    assert [(entry["path"], entry["file"], entry["instance"]) for entry in result["sheets"]] == [
+        ("/", "board.kicad_sch", "/root"),
+        ("/Amp1/", "amp.kicad_sch", "/root/s1"),
+        ("/Amp2/", "amp.kicad_sch", "/root/s2"),
+    ]
+    # The sub-sheet file is parsed once for both instances
+    assert result["sheet_files_parsed"] == 2
+    assert result["files"] == sorted([project, os.path.join(os.path.dirname(project), "sub", "amp.kicad_sch")])
+
+    # Each instance has its own references
+    assert {"R1", "R10", "R11", "R20", "R21"} <= set(result["components"])
+    assert result["components"]["R11"]["sheet_path"] == "/Amp2/"
+    assert result["duplicate_references"] == []
+
+
+def test_sheet_pins_join_hierarchical_labels(project):
+    result = resolve_project_netlist(project, max_workers=1)
+
+    # The root net continues into both instances through their sheet pins
+    shared = _net_of(result, "R1", "1")
+    assert _pins(result["nets"][shared]) == [("R1", "1"), ("R10", "1"), ("R11", "1")]
+
+    # Global nets join across sheets, local nets stay per instance
+    assert _pins(result["nets"]["GND"]) == [("R1", "2"), ("R20", "2"), ("R21", "2")]
+    assert _pins(result["nets"]["/Amp1/OUT"]) == [("R10", "2")]
+    assert _pins(result["nets"]["/Amp2/OUT"]) == [("R11", "2")]
+    assert _net_of(result, "R20", "1") != _net_of(result, "R21", "1")
+
+
+def test_missing_sheet_file_is_reported(project):
+    os.remove(os.path.join(os.path.dirname(project), "sub", "amp.kicad_sch"))
+    get_parse_cache().clear()
+    result = resolve_project_netlist(project, max_workers=1)
+
+    assert [entry["path"] for entry in result["sheets"]] == ["/"]
+    assert [error["error"] for error in result["errors"]] == ["Sheet file not found"] * 2
+    assert _pins(result["nets"]["GND"]) == [("R1", "2")]
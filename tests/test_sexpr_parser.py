@@ -0,0 +1,141 @@
+"""
+Tests for the streaming S-expression tokenizer (sexpr_parser.py).
+"""
+import mmap
+
+import pytest
+
+from kicad_mcp.utils.sexpr_parser import (
+    SExpr, Symbol, dispatch_nodes, iter_nodes, mapped_file, parse_sexpr, release_pages,
+)
+
+SOURCE = r'''(kicad_sch (version 20231120)
+  (wire (pts (xy 0 0) (xy 2.54 -1.27)))
+  (label "A \"quoted\" name" (at 1 2 0))
+  (text "line one\nline two" (at 3 4 0))
+  (label "Ω µ" (at 5 6 0))
+  (junction (at 1.5 2) (diameter 0))
+)'''
+
+
+def _inputs(tmp_path):
+    """The same source as str, bytes and a memory map."""
+    path = tmp_path / "source.kicad_sch"
+    path.write_bytes(SOURCE.encode("utf-8"))
+    yield SOURCE
+    yield SOURCE.encode("utf-8")
+    with mapped_file(str(path)) as content:
+        assert isinstance(content, mmap.mmap)
+        yield content
+
+
+def test_str_bytes_and_mmap_give_the_same_nodes(tmp_path):
+    results = [list(iter_nodes(content)) for content in _inputs(tmp_path)]
+    assert results[0] == results[1] == results[2]
+    assert [node.tag for node in results[0]] == ["version", "wire", "label", "text", "label", "junction"]
+
+
+@pytest.mark.parametrize("index, expected", [
+    (2, 'A "quoted" name'),
+    (3, "line one\nline two"),
+    (4, "Ω µ"),
+])
+def test_quoted_strings_are_unescaped(tmp_path, index, expected):
+    for content in _inputs(tmp_path):
+        assert list(iter_nodes(content))[index][1] == expected
+
+
+def test_atoms_are_typed(tmp_path):
+    for content in _inputs(tmp_path):
+        wire = list(iter_nodes(content))[1]
+        assert isinstance(wire[0], Symbol)
+        assert wire.find("pts").find_all("xy")[1].atoms() == [2.54, -1.27]
+        version = list(iter_nodes(content))[0]
+        assert version[1] == 20231120 and isinstance(version[1], int)
+
+
+def test_symbols_are_not_strings_with_the_same_text():
+    root = parse_sexpr('(node sym "sym")')
+    assert isinstance(root[1], Symbol)
+    assert not isinstance(root[2], Symbol)
+    assert root[1] == root[2] == "sym"
+
+
+def test_tags_skip_unwanted_nodes(tmp_path):
+    for content in _inputs(tmp_path):
+        nodes = list(iter_nodes(content, tags={"label", "junction"}))
+        assert [node.tag for node in nodes] == ["label", "label", "junction"]
+
+
+def test_depth_two_yields_grandchildren():
+    nodes = list(iter_nodes("(root (a (b 1) (c 2)) (d (e 3)))", depth=2))
+    assert [node.tag for node in nodes] == ["b", "c", "e"]
+
+
+def test_dispatch_nodes_skips_tags_without_handler(tmp_path):
+    for content in _inputs(tmp_path):
+        seen = []
+        count = dispatch_nodes(content, {"label": lambda node: seen.append(node[1])})
+        assert count == 2
+        assert seen == ['A "quoted" name', "Ω µ"]
+
+
+def test_dispatch_nodes_default_receives_the_rest():
+    labels, other = [], []
+    count = dispatch_nodes(SOURCE, {"label": labels.append}, default=other.append)
+    assert count == 6
+    assert len(labels) == 2
+    assert [node.tag for node in other] == ["version", "wire", "text", "junction"]
+
+
+def test_sexpr_helpers():
+    root = parse_sexpr('(symbol (lib_id "Device:R") (at 1 2 90) (property "Reference" "R1") (property "Value" "10k"))')
+    assert isinstance(root, SExpr)
+    assert root.tag == "symbol"
+    assert root.value("lib_id") == "Device:R"
+    assert root.value("missing", "default") == "default"
+    assert root.find("at").atoms() == [1, 2, 90]
+    assert [prop[2] for prop in root.find_all("property")] == ["R1", "10k"]
+
+
+@pytest.mark.parametrize("text", ["(a (b 1)", "(a))", "(a (b"])
+def test_unbalanced_parentheses_raise(text):
+    with pytest.raises(ValueError):
+        list(iter_nodes(text))
+
+
+def test_parse_sexpr_rejects_empty_input():
+    with pytest.raises(ValueError):
+        parse_sexpr("   ")
+
+
+def test_empty_file_maps_to_empty_bytes(tmp_path):
+    path = tmp_path / "empty.kicad_sch"
+    path.write_bytes(b"")
+    with mapped_file(str(path)) as content:
+        assert content == b""
+        assert list(iter_nodes(content)) == []
+
+
+def test_mapping_is_closed_after_the_block(tmp_path):
+    path = tmp_path / "source.kicad_sch"
+    path.write_bytes(SOURCE.encode("utf-8"))
+    with mapped_file(str(path)) as content:
+        pass
+    assert content.closed
+
+
+def test_release_pages(tmp_path):
+    # No-op for text and bytes
+    release_pages(SOURCE)
+    release_pages(SOURCE.encode("utf-8"), 10)
+
+    path = tmp_path / "large.kicad_sch"
+    path.write_bytes(b"(root " + b"(item 1) " * (3 * mmap.PAGESIZE) + b")")
+    with mapped_file(str(path)) as content:
+        release_pages(content, 2 * mmap.PAGESIZE + 1)
+        release_pages(content)
+        # Released pages are read from the file again
+        assert sum(1 for _ in iter_nodes(content)) == 3 * mmap.PAGESIZE
+    # Safe on a closed mapping
+    release_pages(content)